@@ -0,0 +1,230 @@
+/**
+*
+* @authors Andrei Novikov (pyclustering@yandex.ru)
+* @date 2014-2019
+* @copyright GNU Public License
+*
+* GNU_PUBLIC_LICENSE
+*   pyclustering is free software: you can redistribute it and/or modify
+*   it under the terms of the GNU General Public License as published by
+*   the Free Software Foundation, either version 3 of the License, or
+*   (at your option) any later version.
+*
+*   pyclustering is distributed in the hope that it will be useful,
+*   but WITHOUT ANY WARRANTY; without even the implied warranty of
+*   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+*   GNU General Public License for more details.
+*
+*   You should have received a copy of the GNU General Public License
+*   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+*
+*/
+
+#include "interface/batch_interface.h"
+
+#include "cluster/dbscan.hpp"
+#include "cluster/kmeans.hpp"
+#include "cluster/kmeans_plus_plus.hpp"
+#include "cluster/kmedoids.hpp"
+#include "cluster/xmeans.hpp"
+
+#include "parallel/parallel.hpp"
+
+#include "utils/metric.hpp"
+
+#include <algorithm>
+
+
+using namespace ccore::clst;
+using namespace ccore::parallel;
+using namespace ccore::utils::metric;
+
+
+using batch_labels = std::vector<long>;
+
+
+static std::size_t batch_size(const pyclustering_package * const p_offsets) {
+    return (p_offsets->size > 0) ? p_offsets->size - 1 : 0;
+}
+
+
+static void batch_extract(const pyclustering_package * const p_sample,
+                          const std::size_t p_dimension,
+                          const std::size_t p_begin,
+                          const std::size_t p_end,
+                          dataset & p_data)
+{
+    const double * const sample = (const double *) p_sample->data;
+
+    p_data.reserve(p_end - p_begin);
+    for (std::size_t index = p_begin; index < p_end; index++) {
+        p_data.emplace_back(sample + index * p_dimension, sample + (index + 1) * p_dimension);
+    }
+}
+
+
+static void batch_initial_centers(const pyclustering_package * const p_centers,
+                                  const pyclustering_package * const p_center_offsets,
+                                  const std::size_t p_dimension,
+                                  const std::size_t p_index,
+                                  const dataset & p_data,
+                                  dataset & p_initial_centers)
+{
+    const std::size_t begin = p_center_offsets->at<std::size_t>(p_index);
+    const std::size_t end = p_center_offsets->at<std::size_t>(p_index + 1);
+
+    if (p_centers->size > 0) {
+        batch_extract(p_centers, p_dimension, begin, end, p_initial_centers);
+    }
+    else {
+        const std::size_t amount = std::min(end - begin, p_data.size());
+        kmeans_plus_plus(amount).initialize(p_data, p_initial_centers);
+    }
+}
+
+
+static void batch_assign(const cluster_sequence & p_clusters, const std::size_t p_begin, batch_labels & p_labels) {
+    for (std::size_t index_cluster = 0; index_cluster < p_clusters.size(); index_cluster++) {
+        for (const auto index_point : p_clusters[index_cluster]) {
+            p_labels[p_begin + index_point] = (long) index_cluster;
+        }
+    }
+}
+
+
+template <typename TypeAction>
+static pyclustering_package * batch_process(const pyclustering_package * const p_sample,
+                                            const std::size_t p_dimension,
+                                            const pyclustering_package * const p_offsets,
+                                            const TypeAction & p_action)
+{
+    const std::size_t amount_points = (p_dimension > 0) ? p_sample->size / p_dimension : 0;
+    batch_labels labels(amount_points, -1);
+
+    parallel_for(std::size_t(0), batch_size(p_offsets), [&p_sample, &p_dimension, &p_offsets, &p_action, &labels](const std::size_t p_index) {
+        const std::size_t begin = p_offsets->at<std::size_t>(p_index);
+        const std::size_t end = p_offsets->at<std::size_t>(p_index + 1);
+
+        if (begin == end) {
+            return;
+        }
+
+        dataset data;
+        batch_extract(p_sample, p_dimension, begin, end, data);
+
+        cluster_sequence clusters;
+        p_action(p_index, data, clusters);
+
+        batch_assign(clusters, begin, labels);
+    });
+
+    return create_package(&labels);
+}
+
+
+pyclustering_package * kmeans_batch_algorithm(const pyclustering_package * const p_sample,
+                                              const std::size_t p_dimension,
+                                              const pyclustering_package * const p_offsets,
+                                              const pyclustering_package * const p_centers,
+                                              const pyclustering_package * const p_center_offsets,
+                                              const double p_tolerance,
+                                              const void * const p_metric)
+{
+    distance_metric<point> * metric = ((distance_metric<point> *) p_metric);
+    distance_metric<point> default_metric = distance_metric_factory<point>::euclidean_square();
+
+    if (!metric)
+        metric = &default_metric;
+
+    return batch_process(p_sample, p_dimension, p_offsets, [&](const std::size_t p_index, const dataset & p_data, cluster_sequence & p_clusters) {
+        dataset initial_centers;
+        batch_initial_centers(p_centers, p_center_offsets, p_dimension, p_index, p_data, initial_centers);
+
+        kmeans_data result;
+        kmeans(initial_centers, p_tolerance, *metric).process(p_data, result);
+
+        p_clusters = std::move(result.clusters());
+    });
+}
+
+
+pyclustering_package * kmedoids_batch_algorithm(const pyclustering_package * const p_sample,
+                                                const std::size_t p_dimension,
+                                                const pyclustering_package * const p_offsets,
+                                                const pyclustering_package * const p_medoids,
+                                                const pyclustering_package * const p_medoid_offsets,
+                                                const double p_tolerance,
+                                                const void * const p_metric)
+{
+    distance_metric<point> * metric = ((distance_metric<point> *) p_metric);
+    distance_metric<point> default_metric = distance_metric_factory<point>::euclidean_square();
+
+    if (!metric)
+        metric = &default_metric;
+
+    return batch_process(p_sample, p_dimension, p_offsets, [&](const std::size_t p_index, const dataset & p_data, cluster_sequence & p_clusters) {
+        const std::size_t begin = p_medoid_offsets->at<std::size_t>(p_index);
+        const std::size_t end = p_medoid_offsets->at<std::size_t>(p_index + 1);
+
+        medoid_sequence initial_medoids;
+        if (p_medoids->size > 0) {
+            for (std::size_t index = begin; index < end; index++) {
+                initial_medoids.push_back(p_medoids->at<std::size_t>(index));
+            }
+        }
+        else {
+            /* K-Means++ chooses centers among points, therefore the nearest point is the chosen one */
+            dataset initial_centers;
+            kmeans_plus_plus(std::min(end - begin, p_data.size())).initialize(p_data, initial_centers);
+
+            for (const auto & center : initial_centers) {
+                auto nearest = std::min_element(p_data.begin(), p_data.end(), [&center](const point & p_point1, const point & p_point2) {
+                    return euclidean_distance_square(p_point1, center) < euclidean_distance_square(p_point2, center);
+                });
+
+                initial_medoids.push_back((std::size_t) std::distance(p_data.begin(), nearest));
+            }
+        }
+
+        kmedoids_data result;
+        kmedoids(initial_medoids, p_tolerance, *metric).process(p_data, kmedoids_data_t::POINTS, result);
+
+        p_clusters = std::move(result.clusters());
+    });
+}
+
+
+pyclustering_package * dbscan_batch_algorithm(const pyclustering_package * const p_sample,
+                                              const std::size_t p_dimension,
+                                              const pyclustering_package * const p_offsets,
+                                              const double p_radius,
+                                              const std::size_t p_minumum_neighbors)
+{
+    return batch_process(p_sample, p_dimension, p_offsets, [&](const std::size_t, const dataset & p_data, cluster_sequence & p_clusters) {
+        dbscan_data result;
+        dbscan(p_radius, p_minumum_neighbors).process(p_data, result);
+
+        p_clusters = std::move(result.clusters());
+    });
+}
+
+
+pyclustering_package * xmeans_batch_algorithm(const pyclustering_package * const p_sample,
+                                              const std::size_t p_dimension,
+                                              const pyclustering_package * const p_offsets,
+                                              const pyclustering_package * const p_centers,
+                                              const pyclustering_package * const p_center_offsets,
+                                              const std::size_t p_kmax,
+                                              const double p_tolerance,
+                                              const unsigned int p_criterion)
+{
+    return batch_process(p_sample, p_dimension, p_offsets, [&](const std::size_t p_index, const dataset & p_data, cluster_sequence & p_clusters) {
+        dataset initial_centers;
+        batch_initial_centers(p_centers, p_center_offsets, p_dimension, p_index, p_data, initial_centers);
+
+        xmeans_data result;
+        xmeans(initial_centers, p_kmax, p_tolerance, (splitting_type) p_criterion).process(p_data, result);
+
+        p_clusters = std::move(result.clusters());
+    });
+}
@@ -0,0 +1,133 @@
+/**
+*
+* @authors Andrei Novikov (pyclustering@yandex.ru)
+* @date 2014-2019
+* @copyright GNU Public License
+*
+* GNU_PUBLIC_LICENSE
+*   pyclustering is free software: you can redistribute it and/or modify
+*   it under the terms of the GNU General Public License as published by
+*   the Free Software Foundation, either version 3 of the License, or
+*   (at your option) any later version.
+*
+*   pyclustering is distributed in the hope that it will be useful,
+*   but WITHOUT ANY WARRANTY; without even the implied warranty of
+*   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+*   GNU General Public License for more details.
+*
+*   You should have received a copy of the GNU General Public License
+*   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+*
+*/
+
+#pragma once
+
+
+#include "interface/pyclustering_package.hpp"
+
+#include "definitions.hpp"
+
+
+/**
+ *
+ * @brief   Clustering algorithm K-Means is applied to each dataset of the batch, all datasets are processed by one call.
+ * @details Datasets of the batch are stored one after another in the flat sample, dataset with index 'i' is formed by
+ *           points [p_offsets[i], p_offsets[i + 1]). Caller should destroy returned result in 'pyclustering_package'.
+ *
+ * @param[in] p_sample: flat input data of all datasets - coordinates of points one after another.
+ * @param[in] p_dimension: dimension of each point.
+ * @param[in] p_offsets: offsets of datasets in the flat sample (in points), amount of offsets is size of batch plus one.
+ * @param[in] p_centers: flat initial cluster centers of all datasets, if it is empty then centers are initialized
+ *             by K-Means++ for each dataset.
+ * @param[in] p_center_offsets: offsets of initial centers of each dataset (in centers), amount of offsets is size of
+ *             batch plus one.
+ * @param[in] p_tolerance: stop condition - when changes of centers are less then tolerance value.
+ * @param[in] p_metric: pointer to distance metric 'distance_metric' that is used for distance calculation between two points.
+ *
+ * @return  Returns flat array of labels (long) of all points, label is an index of cluster in scope of its dataset.
+ *
+ */
+extern "C" DECLARATION pyclustering_package * kmeans_batch_algorithm(const pyclustering_package * const p_sample,
+                                                                     const std::size_t p_dimension,
+                                                                     const pyclustering_package * const p_offsets,
+                                                                     const pyclustering_package * const p_centers,
+                                                                     const pyclustering_package * const p_center_offsets,
+                                                                     const double p_tolerance,
+                                                                     const void * const p_metric);
+
+
+/**
+ *
+ * @brief   Clustering algorithm K-Medoids is applied to each dataset of the batch, all datasets are processed by one call.
+ * @details Caller should destroy returned result in 'pyclustering_package'.
+ *
+ * @param[in] p_sample: flat input data of all datasets - coordinates of points one after another.
+ * @param[in] p_dimension: dimension of each point.
+ * @param[in] p_offsets: offsets of datasets in the flat sample (in points), amount of offsets is size of batch plus one.
+ * @param[in] p_medoids: flat initial medoids of all datasets (indexes of points in scope of its dataset), if it is
+ *             empty then medoids are initialized by K-Means++ for each dataset.
+ * @param[in] p_medoid_offsets: offsets of initial medoids of each dataset, amount of offsets is size of batch plus one.
+ * @param[in] p_tolerance: stop condition - when changes of medoids are less then tolerance value.
+ * @param[in] p_metric: pointer to distance metric 'distance_metric' that is used for distance calculation between two points.
+ *
+ * @return  Returns flat array of labels (long) of all points, label is an index of cluster in scope of its dataset.
+ *
+ */
+extern "C" DECLARATION pyclustering_package * kmedoids_batch_algorithm(const pyclustering_package * const p_sample,
+                                                                       const std::size_t p_dimension,
+                                                                       const pyclustering_package * const p_offsets,
+                                                                       const pyclustering_package * const p_medoids,
+                                                                       const pyclustering_package * const p_medoid_offsets,
+                                                                       const double p_tolerance,
+                                                                       const void * const p_metric);
+
+
+/**
+ *
+ * @brief   Clustering algorithm DBSCAN is applied to each dataset of the batch, all datasets are processed by one call.
+ * @details Caller should destroy returned result in 'pyclustering_package'.
+ *
+ * @param[in] p_sample: flat input data of all datasets - coordinates of points one after another.
+ * @param[in] p_dimension: dimension of each point.
+ * @param[in] p_offsets: offsets of datasets in the flat sample (in points), amount of offsets is size of batch plus one.
+ * @param[in] p_radius: connectivity radius between points, points may be connected if distance between them less than the radius.
+ * @param[in] p_minumum_neighbors: minimum number of shared neighbors that is required for establish links between points.
+ *
+ * @return  Returns flat array of labels (long) of all points, label is an index of cluster in scope of its dataset,
+ *           noise is marked by '-1'.
+ *
+ */
+extern "C" DECLARATION pyclustering_package * dbscan_batch_algorithm(const pyclustering_package * const p_sample,
+                                                                     const std::size_t p_dimension,
+                                                                     const pyclustering_package * const p_offsets,
+                                                                     const double p_radius,
+                                                                     const std::size_t p_minumum_neighbors);
+
+
+/**
+ *
+ * @brief   Clustering algorithm X-Means is applied to each dataset of the batch, all datasets are processed by one call.
+ * @details Caller should destroy returned result in 'pyclustering_package'.
+ *
+ * @param[in] p_sample: flat input data of all datasets - coordinates of points one after another.
+ * @param[in] p_dimension: dimension of each point.
+ * @param[in] p_offsets: offsets of datasets in the flat sample (in points), amount of offsets is size of batch plus one.
+ * @param[in] p_centers: flat initial cluster centers of all datasets, if it is empty then centers are initialized
+ *             by K-Means++ for each dataset.
+ * @param[in] p_center_offsets: offsets of initial centers of each dataset (in centers), amount of offsets is size of
+ *             batch plus one.
+ * @param[in] p_kmax: maximum number of clusters that can be allocated in each dataset.
+ * @param[in] p_tolerance: stop condition for each K-Means iteration.
+ * @param[in] p_criterion: splitting criterion that is used to decide whether cluster should be splitted.
+ *
+ * @return  Returns flat array of labels (long) of all points, label is an index of cluster in scope of its dataset.
+ *
+ */
+extern "C" DECLARATION pyclustering_package * xmeans_batch_algorithm(const pyclustering_package * const p_sample,
+                                                                     const std::size_t p_dimension,
+                                                                     const pyclustering_package * const p_offsets,
+                                                                     const pyclustering_package * const p_centers,
+                                                                     const pyclustering_package * const p_center_offsets,
+                                                                     const std::size_t p_kmax,
+                                                                     const double p_tolerance,
+                                                                     const unsigned int p_criterion);
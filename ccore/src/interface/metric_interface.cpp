@@ -73,6 +73,24 @@ void * metric_create(const std::size_t p_type,
             return new distance_metric<point>(std::move(metric));
         }
 
+        case WEIGHTED_MINKOWSKI: {
+            std::vector<double> arguments;
+            p_arguments->extract(arguments);
+
+            std::vector<double> weights(arguments.begin() + 1, arguments.end());
+
+            distance_metric<point> metric = distance_metric_factory<point>::weighted_minkowski(arguments[0], weights);
+            return new distance_metric<point>(std::move(metric));
+        }
+
+        case MAHALANOBIS: {
+            std::vector<double> arguments;
+            p_arguments->extract(arguments);
+
+            distance_metric<point> metric = distance_metric_factory<point>::mahalanobis(arguments);
+            return new distance_metric<point>(std::move(metric));
+        }
+
         case USER_DEFINED: {
             auto functor_wrapper = [p_solver](const point & p1, const point & p2) {
                 pyclustering_package * point1 = create_package(&p1);
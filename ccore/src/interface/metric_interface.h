@@ -37,6 +37,8 @@ enum metric_t {
     MINKOWSKI,
     CANBERRA,
     CHI_SQUARE,
+    WEIGHTED_MINKOWSKI,
+    MAHALANOBIS,
     USER_DEFINED = 1000
 };
 
@@ -46,7 +48,9 @@ enum metric_t {
  * @brief   Create distance metric for calculation distance between two points.
  *
  * @param[in] p_type: metric type that is require to create.
- * @param[in] p_arguments: additional arguments, for example, degree in case of minkowski distance.
+ * @param[in] p_arguments: additional arguments, for example, degree in case of minkowski distance, degree and
+ *             weights in case of weighted minkowski distance, inverse covariance matrix (row by row) in case of
+ *             mahalanobis distance.
  * @param[in] p_solver: pointer to user-defined function that should be used for calculation, used only
  *             in case of 'USER_DEFINED' metric type.
  *
@@ -168,6 +168,74 @@ double minkowski_distance(const TypeContainer & p_point1, const TypeContainer &
 }
 
 
+/**
+ *
+ * @brief   Calculates weighted Minkowski distance between points.
+ *
+ * @param[in] p_point1: point #1 that is represented by coordinates.
+ * @param[in] p_point2: point #2 that is represented by coordinates.
+ * @param[in] p_degree: degree of Minkownski equation.
+ * @param[in] p_weights: weight of each dimension.
+ *
+ * @return  Returns weighted Minkowski distance between points.
+ *
+ */
+template <typename TypeContainer>
+double weighted_minkowski_distance(const TypeContainer & p_point1, const TypeContainer & p_point2, const double p_degree, const std::vector<double> & p_weights) {
+    double distance = 0.0;
+    typename TypeContainer::const_iterator iter_point1 = p_point1.begin();
+    std::vector<double>::const_iterator iter_weight = p_weights.begin();
+
+    for (const auto & dim_point2 : p_point2) {
+        distance += (*iter_weight) * std::pow(std::abs(*iter_point1 - dim_point2), p_degree);
+
+        iter_point1++;
+        iter_weight++;
+    }
+
+    return std::pow(distance, 1.0 / p_degree);
+}
+
+
+/**
+ *
+ * @brief   Calculates Mahalanobis distance between points.
+ *
+ * @param[in] p_point1: point #1 that is represented by coordinates.
+ * @param[in] p_point2: point #2 that is represented by coordinates.
+ * @param[in] p_matrix: inverse covariance matrix (dimension x dimension) that is stored row by row.
+ *
+ * @return  Returns Mahalanobis distance between points.
+ *
+ */
+template <typename TypeContainer>
+double mahalanobis_distance(const TypeContainer & p_point1, const TypeContainer & p_point2, const std::vector<double> & p_matrix) {
+    std::vector<double> difference;
+    difference.reserve(p_point1.size());
+
+    typename TypeContainer::const_iterator iter_point1 = p_point1.begin();
+    for (const auto & dim_point2 : p_point2) {
+        difference.push_back(*iter_point1 - dim_point2);
+        iter_point1++;
+    }
+
+    double distance = 0.0;
+    std::vector<double>::const_iterator iter_matrix = p_matrix.begin();
+
+    for (const double difference_row : difference) {
+        double row_product = 0.0;
+        for (const double difference_column : difference) {
+            row_product += (*iter_matrix) * difference_column;
+            iter_matrix++;
+        }
+
+        distance += difference_row * row_product;
+    }
+
+    return std::sqrt(std::max(distance, 0.0));
+}
+
+
 /**
  *
  * @brief   Calculates Canberra distance between points.
@@ -383,6 +451,49 @@ public:
 };
 
 
+/**
+ *
+ * @brief   Weighted Minkowski distance metric calculator between two points.
+ *
+ */
+template <typename TypeContainer>
+class weighted_minkowski_distance_metric : public distance_metric<TypeContainer> {
+public:
+  /**
+   *
+   * @brief   Constructor of weighted Minkowski distance metric.
+   *
+   * @param[in] p_degree: degree of Minkowski equation.
+   * @param[in] p_weights: weight of each dimension.
+   *
+   */
+    weighted_minkowski_distance_metric(const double p_degree, const std::vector<double> & p_weights) :
+        distance_metric<TypeContainer>(std::bind(weighted_minkowski_distance<TypeContainer>, std::placeholders::_1, std::placeholders::_2, p_degree, p_weights))
+    { }
+};
+
+
+/**
+ *
+ * @brief   Mahalanobis distance metric calculator between two points.
+ *
+ */
+template <typename TypeContainer>
+class mahalanobis_distance_metric : public distance_metric<TypeContainer> {
+public:
+  /**
+   *
+   * @brief   Constructor of Mahalanobis distance metric.
+   *
+   * @param[in] p_matrix: inverse covariance matrix (dimension x dimension) that is stored row by row.
+   *
+   */
+    mahalanobis_distance_metric(const std::vector<double> & p_matrix) :
+        distance_metric<TypeContainer>(std::bind(mahalanobis_distance<TypeContainer>, std::placeholders::_1, std::placeholders::_2, p_matrix))
+    { }
+};
+
+
 /**
  *
  * @brief   Canberra distance metric calculator between two points.
@@ -476,6 +587,33 @@ public:
         return minkowski_distance_metric<TypeContainer>(p_degree);
     }
 
+   /**
+   *
+   * @brief   Creates weighted Minkowski distance metric.
+   *
+   * @param[in] p_degree: degree of Minkowski equation.
+   * @param[in] p_weights: weight of each dimension.
+   *
+   * @return  Weighted Minkowski distance metric.
+   *
+   */
+    static distance_metric<TypeContainer> weighted_minkowski(const double p_degree, const std::vector<double> & p_weights) {
+        return weighted_minkowski_distance_metric<TypeContainer>(p_degree, p_weights);
+    }
+
+   /**
+   *
+   * @brief   Creates Mahalanobis distance metric.
+   *
+   * @param[in] p_matrix: inverse covariance matrix (dimension x dimension) that is stored row by row.
+   *
+   * @return  Mahalanobis distance metric.
+   *
+   */
+    static distance_metric<TypeContainer> mahalanobis(const std::vector<double> & p_matrix) {
+        return mahalanobis_distance_metric<TypeContainer>(p_matrix);
+    }
+
    /**
    *
    * @brief   Creates Canberra distance metric.
@@ -0,0 +1,145 @@
+/**
+*
+* @authors Andrei Novikov (pyclustering@yandex.ru)
+* @date 2014-2019
+* @copyright GNU Public License
+*
+* GNU_PUBLIC_LICENSE
+*   pyclustering is free software: you can redistribute it and/or modify
+*   it under the terms of the GNU General Public License as published by
+*   the Free Software Foundation, either version 3 of the License, or
+*   (at your option) any later version.
+*
+*   pyclustering is distributed in the hope that it will be useful,
+*   but WITHOUT ANY WARRANTY; without even the implied warranty of
+*   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+*   GNU General Public License for more details.
+*
+*   You should have received a copy of the GNU General Public License
+*   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+*
+*/
+
+#include "gtest/gtest.h"
+
+#include "interface/batch_interface.h"
+#include "interface/pyclustering_package.hpp"
+
+#include "utils/metric.hpp"
+
+#include "utenv_utils.hpp"
+
+#include <memory>
+
+
+using namespace ccore::utils::metric;
+
+
+static void template_batch_labels(const pyclustering_package * const p_result, const std::vector<long> & p_expected) {
+    ASSERT_NE(nullptr, p_result);
+    ASSERT_EQ((unsigned int) PYCLUSTERING_TYPE_LONG, p_result->type);
+    ASSERT_EQ(p_expected.size(), p_result->size);
+
+    for (std::size_t index = 0; index < p_expected.size(); index++) {
+        ASSERT_EQ(p_expected[index], p_result->at<long>(index));
+    }
+}
+
+
+TEST(utest_interface_batch, kmeans_batch_api) {
+    std::shared_ptr<pyclustering_package> sample = pack(std::vector<double>({ 1, 2, 10, 11, 5, 6, 7, 20, 21 }));
+    std::shared_ptr<pyclustering_package> offsets = pack(std::vector<std::size_t>({ 0, 4, 4, 9 }));
+    std::shared_ptr<pyclustering_package> centers = pack(std::vector<double>({ 1, 10, 5, 20 }));
+    std::shared_ptr<pyclustering_package> center_offsets = pack(std::vector<std::size_t>({ 0, 2, 2, 4 }));
+
+    distance_metric<point> metric = distance_metric_factory<point>::euclidean_square();
+
+    pyclustering_package * result = kmeans_batch_algorithm(sample.get(), 1, offsets.get(), centers.get(), center_offsets.get(), 0.001, &metric);
+    template_batch_labels(result, { 0, 0, 1, 1, 0, 0, 0, 1, 1 });
+
+    delete result;
+}
+
+
+TEST(utest_interface_batch, kmeans_batch_initializer_api) {
+    std::shared_ptr<pyclustering_package> sample = pack(std::vector<double>({ 0, 0, 0, 1, 10, 10, 10, 11, 5, 5 }));
+    std::shared_ptr<pyclustering_package> offsets = pack(std::vector<std::size_t>({ 0, 4, 5 }));
+    std::shared_ptr<pyclustering_package> centers = pack(std::vector<double>());
+    std::shared_ptr<pyclustering_package> center_offsets = pack(std::vector<std::size_t>({ 0, 2, 4 }));
+
+    pyclustering_package * result = kmeans_batch_algorithm(sample.get(), 2, offsets.get(), centers.get(), center_offsets.get(), 0.001, nullptr);
+    ASSERT_NE(nullptr, result);
+    ASSERT_EQ(5U, result->size);
+
+    ASSERT_EQ(result->at<long>(0), result->at<long>(1));
+    ASSERT_EQ(result->at<long>(2), result->at<long>(3));
+    ASSERT_NE(result->at<long>(0), result->at<long>(2));
+    ASSERT_EQ(0, result->at<long>(4));
+
+    delete result;
+}
+
+
+TEST(utest_interface_batch, kmedoids_batch_api) {
+    std::shared_ptr<pyclustering_package> sample = pack(std::vector<double>({ 1, 2, 10, 11, 5, 6, 7, 20, 21 }));
+    std::shared_ptr<pyclustering_package> offsets = pack(std::vector<std::size_t>({ 0, 4, 9 }));
+    std::shared_ptr<pyclustering_package> medoids = pack(std::vector<std::size_t>({ 0, 2, 0, 3 }));
+    std::shared_ptr<pyclustering_package> medoid_offsets = pack(std::vector<std::size_t>({ 0, 2, 4 }));
+
+    pyclustering_package * result = kmedoids_batch_algorithm(sample.get(), 1, offsets.get(), medoids.get(), medoid_offsets.get(), 0.001, nullptr);
+    template_batch_labels(result, { 0, 0, 1, 1, 0, 0, 0, 1, 1 });
+
+    delete result;
+
+    std::shared_ptr<pyclustering_package> empty_medoids = pack(std::vector<std::size_t>());
+
+    result = kmedoids_batch_algorithm(sample.get(), 1, offsets.get(), empty_medoids.get(), medoid_offsets.get(), 0.001, nullptr);
+    ASSERT_NE(nullptr, result);
+    ASSERT_EQ(9U, result->size);
+
+    delete result;
+}
+
+
+TEST(utest_interface_batch, dbscan_batch_api) {
+    std::shared_ptr<pyclustering_package> sample = pack(std::vector<double>({ 1, 1.1, 1.2, 50, 3, 3.1, 3.2, 3.3 }));
+    std::shared_ptr<pyclustering_package> offsets = pack(std::vector<std::size_t>({ 0, 4, 8 }));
+
+    pyclustering_package * result = dbscan_batch_algorithm(sample.get(), 1, offsets.get(), 0.5, 2);
+    template_batch_labels(result, { 0, 0, 0, -1, 0, 0, 0, 0 });
+
+    delete result;
+}
+
+
+TEST(utest_interface_batch, xmeans_batch_api) {
+    std::shared_ptr<pyclustering_package> sample = pack(std::vector<double>({ 1, 1.1, 1.2, 1.3, 10, 10.1, 10.2, 10.3, 3, 3.1, 3.2 }));
+    std::shared_ptr<pyclustering_package> offsets = pack(std::vector<std::size_t>({ 0, 8, 11 }));
+    std::shared_ptr<pyclustering_package> centers = pack(std::vector<double>({ 1, 10, 3 }));
+    std::shared_ptr<pyclustering_package> center_offsets = pack(std::vector<std::size_t>({ 0, 2, 3 }));
+
+    pyclustering_package * result = xmeans_batch_algorithm(sample.get(), 1, offsets.get(), centers.get(), center_offsets.get(), 5, 0.001, 0);
+    ASSERT_NE(nullptr, result);
+    ASSERT_EQ(11U, result->size);
+
+    for (std::size_t index = 0; index < 4; index++) {
+        ASSERT_EQ(result->at<long>(0), result->at<long>(index));
+        ASSERT_EQ(result->at<long>(4), result->at<long>(index + 4));
+    }
+
+    ASSERT_NE(result->at<long>(0), result->at<long>(4));
+
+    delete result;
+}
+
+
+TEST(utest_interface_batch, empty_batch_api) {
+    std::shared_ptr<pyclustering_package> sample = pack(std::vector<double>());
+    std::shared_ptr<pyclustering_package> offsets = pack(std::vector<std::size_t>({ 0 }));
+
+    pyclustering_package * result = dbscan_batch_algorithm(sample.get(), 2, offsets.get(), 0.5, 2);
+    ASSERT_NE(nullptr, result);
+    ASSERT_EQ(0U, result->size);
+
+    delete result;
+}
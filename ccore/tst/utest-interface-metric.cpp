@@ -53,3 +53,37 @@ TEST(utest_interface_dbscan, metric_algorithm) {
 
     metric_destroy(metric_pointer);
 }
+
+
+TEST(utest_interface_metric, weighted_minkowski_metric) {
+    std::shared_ptr<pyclustering_package> arguments = pack(std::vector<double>({ 2.0, 1.0, 4.0 }));
+    double (*p_solver)(const void *, const void *) = nullptr;
+
+    void * metric_pointer = metric_create(metric_t::WEIGHTED_MINKOWSKI, arguments.get(), p_solver);
+
+    ASSERT_NE(nullptr, metric_pointer);
+
+    std::shared_ptr<pyclustering_package> point1 = pack(point({0.0, 0.0}));
+    std::shared_ptr<pyclustering_package> point2 = pack(point({3.0, 2.0}));
+
+    ASSERT_EQ(5.0, metric_calculate(metric_pointer, point1.get(), point2.get()));
+
+    metric_destroy(metric_pointer);
+}
+
+
+TEST(utest_interface_metric, mahalanobis_metric) {
+    std::shared_ptr<pyclustering_package> arguments = pack(std::vector<double>({ 2.0, 1.0, 1.0, 2.0 }));
+    double (*p_solver)(const void *, const void *) = nullptr;
+
+    void * metric_pointer = metric_create(metric_t::MAHALANOBIS, arguments.get(), p_solver);
+
+    ASSERT_NE(nullptr, metric_pointer);
+
+    std::shared_ptr<pyclustering_package> point1 = pack(point({0.0, 0.0}));
+    std::shared_ptr<pyclustering_package> point2 = pack(point({1.0, -1.0}));
+
+    ASSERT_EQ(std::sqrt(2.0), metric_calculate(metric_pointer, point1.get(), point2.get()));
+
+    metric_destroy(metric_pointer);
+}
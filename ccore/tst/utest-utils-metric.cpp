@@ -64,6 +64,20 @@ TEST(utest_metric, metric_factory) {
    ASSERT_EQ(2.0, metric({0.0, 0.0}, {1.0, 1.0}));
    ASSERT_EQ(0.5, metric({0.75, 0.75}, {0.25, 0.25}));
 
+   metric = distance_metric_factory<point>::weighted_minkowski(2, { 1.0, 4.0 });
+   ASSERT_EQ(5.0, metric({0.0, 0.0}, {3.0, 2.0}));
+   ASSERT_EQ(5.0, metric({0.0, 0.0}, {-3.0, -2.0}));
+
+   metric = distance_metric_factory<point>::weighted_minkowski(1, { 0.5, 2.0 });
+   ASSERT_EQ(5.0, metric({1.0, 1.0}, {-1.0, 3.0}));
+
+   metric = distance_metric_factory<point>::mahalanobis({ 1.0, 0.0, 0.0, 1.0 });
+   ASSERT_EQ(5.0, metric({0.0, 0.0}, {3.0, 4.0}));
+
+   metric = distance_metric_factory<point>::mahalanobis({ 2.0, 1.0, 1.0, 2.0 });
+   ASSERT_EQ(std::sqrt(6.0), metric({0.0, 0.0}, {1.0, 1.0}));
+   ASSERT_EQ(std::sqrt(2.0), metric({0.0, 0.0}, {1.0, -1.0}));
+
    metric = distance_metric_factory<point>::user_defined([](const point & p1, const point & p2) { return -5.0; } );
    ASSERT_EQ(-5.0, metric({0.0, 0.0}, {1.0, 0.0}));
    ASSERT_EQ(-5.0, metric({0.0, 0.0}, {0.0, 0.0}));
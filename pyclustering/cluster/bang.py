@@ -25,17 +25,16 @@
 """
 
 import itertools
-import warnings
-
-try:
-    import matplotlib
-    import matplotlib.gridspec as gridspec
-    import matplotlib.pyplot as plt
-    import matplotlib.patches as patches
-    import matplotlib.animation as animation
-except Exception as error_instance:
-    warnings.warn("Impossible to import matplotlib (please, install 'matplotlib'), pyclustering's visualization "
-                  "functionality is not available (details: '%s')." % str(error_instance))
+
+import numpy
+
+from pyclustering.utils.lazy_import import lazy_module
+
+matplotlib = lazy_module('matplotlib')
+gridspec = lazy_module('matplotlib.gridspec')
+plt = lazy_module('matplotlib.pyplot')
+patches = lazy_module('matplotlib.patches')
+animation = lazy_module('matplotlib.animation')
 
 from pyclustering.cluster import cluster_visualizer
 from pyclustering.cluster.encoder import type_encoding
@@ -513,7 +512,7 @@ class bang_directory:
         data_block = spatial_block(max_corner, min_corner)
 
         cache_require = (self.__levels == 1)
-        self.__root = bang_block(self.__data, 0, 0, data_block, cache_require)
+        self.__root = bang_block(numpy.asarray(self.__data), 0, 0, data_block, cache_require)
 
         if cache_require:
             self.__leafs.append(self.__root)
@@ -754,15 +753,19 @@ class bang_block:
     @brief BANG-block that represent spatial region in data space.
 
     """
-    def __init__(self, data, region, level, space_block, cache_points=False):
+    def __init__(self, data, region, level, space_block, cache_points=False, point_indexes=None):
         """!
         @brief Create BANG-block.
+        @details Covered points are kept until the block is split, its children examine only these points. If the
+                  block is not a leaf (points are not cached) then they are released after splitting.
 
-        @param[in] data (list): List of points that are processed.
+        @param[in] data (array_like): Points that are processed.
         @param[in] region (uint): Region number - unique value on a level.
         @param[in] level (uint): Level number where block is created.
         @param[in] space_block (spatial_block): Spatial block description in data space.
         @param[in] cache_points (bool): if True then points are stored in memory (used for leaf blocks).
+        @param[in] point_indexes (array_like): Indexes of points that might be covered by the block (usually points of
+                    the parent block), if 'None' then all points are examined.
 
         """
         self.__data = data
@@ -772,8 +775,8 @@ class bang_block:
         self.__cache_points = cache_points
 
         self.__cluster = None
-        self.__points = None
-        self.__amount_points = self.__get_amount_points()
+        self.__points = self.__get_covered_points(point_indexes)
+        self.__amount_points = len(self.__points)
         self.__density = self.__calculate_density(self.__amount_points)
 
 
@@ -805,6 +808,16 @@ class bang_block:
         return self.__region_number
 
 
+    def get_level(self):
+        """!
+        @brief Returns level number of BANG-block where it is located in the directory.
+
+        @return (uint) Level number.
+
+        """
+        return self.__level
+
+
     def get_density(self):
         """!
         @brief Returns density of the BANG-block.
@@ -844,9 +857,9 @@ class bang_block:
 
         """
         if self.__points is None:
-            self.__cache_covered_data()
+            self.__points = self.__get_covered_points(None)
 
-        return self.__points
+        return self.__points.tolist()
 
 
     def set_cluster(self, index):
@@ -886,8 +899,11 @@ class bang_block:
 
         first_spatial_block, second_spatial_block = self.__spatial_block.split(split_dimension)
 
-        left = bang_block(self.__data, left_region_number, self.__level + 1, first_spatial_block, cache_points)
-        right = bang_block(self.__data, right_region_number, self.__level + 1, second_spatial_block, cache_points)
+        left = bang_block(self.__data, left_region_number, self.__level + 1, first_spatial_block, cache_points, self.__points)
+        right = bang_block(self.__data, right_region_number, self.__level + 1, second_spatial_block, cache_points, self.__points)
+
+        if not self.__cache_points:
+            self.__points = None
 
         return left, right
 
@@ -908,47 +924,25 @@ class bang_block:
         return 0.0
 
 
-    def __get_amount_points(self):
+    def __get_covered_points(self, point_indexes):
         """!
-        @brief Count covered points by the BANG-block and if cache is enable then covered points are stored.
+        @brief Finds points that are covered by the BANG-block.
 
-        @return (uint) Amount of covered points.
+        @param[in] point_indexes (array_like): Indexes of points that should be examined, if 'None' then all points are
+                    examined.
 
-        """
-        amount = 0
-        for index in range(len(self.__data)):
-            if self.__data[index] in self.__spatial_block:
-                self.__cache_point(index)
-                amount += 1
-
-        return amount
-
-
-    def __cache_covered_data(self):
-        """!
-        @brief Cache covered data.
+        @return (array_like) Indexes of covered points.
 
         """
-        self.__cache_points = True
-        self.__points = []
-
-        for index_point in range(len(self.__data)):
-            if self.__data[index_point] in self.__spatial_block:
-                self.__cache_point(index_point)
+        data = numpy.asarray(self.__data)
+        if point_indexes is None:
+            point_indexes = numpy.arange(len(data))
 
+        max_corner, min_corner = self.__spatial_block.get_corners()
+        points = data[point_indexes]
 
-    def __cache_point(self, index):
-        """!
-        @brief Store index points.
-
-        @param[in] index (uint): Index point that should be stored.
-
-        """
-        if self.__cache_points:
-            if self.__points is None:
-                self.__points = []
-
-            self.__points.append(index)
+        covered = numpy.all((points >= min_corner) & (points <= max_corner), axis=1)
+        return point_indexes[covered]
 
 
 
@@ -1032,6 +1026,10 @@ class bang:
         self.__density_threshold = kwargs.get('density_threshold', 0.0)
         self.__amount_threshold = kwargs.get('amount_threshold', 0)
         self.__ccore = ccore
+        self.__split_counts = []
+        self.__grid_shifts = []
+        self.__leaf_grid = {}
+        self.__center_cursor = 0
 
         self.__validate_arguments()
 
@@ -1149,6 +1147,9 @@ class bang:
         leaf_blocks = self.__directory.get_leafs()
         unhandled_block_indexes = set([i for i in range(len(leaf_blocks)) if leaf_blocks[i].get_density() > self.__density_threshold])
 
+        self.__create_leaf_grid(leaf_blocks)
+        self.__center_cursor = len(leaf_blocks) - 1
+
         current_block = self.__find_block_center(leaf_blocks, unhandled_block_indexes)
         cluster_index = 0
 
@@ -1215,25 +1216,107 @@ class bang:
     def __find_block_center(self, level_blocks, unhandled_block_indexes):
         """!
         @brief Search block that is cluster center for new cluster.
+        @details Blocks are sorted by density and blocks that are assigned to clusters are never released, therefore
+                  search is continued from the place where the previous center was found.
 
         @return (bang_block) Central block for new cluster, if cluster is not found then None value is returned.
 
         """
-        for i in reversed(range(len(level_blocks))):
-            if level_blocks[i].get_density() <= self.__density_threshold:
+        while self.__center_cursor >= 0:
+            block = level_blocks[self.__center_cursor]
+            if block.get_density() <= self.__density_threshold:
                 return None
 
-            if level_blocks[i].get_cluster() is None:
-                unhandled_block_indexes.remove(i)
-                return level_blocks[i]
+            if block.get_cluster() is None:
+                unhandled_block_indexes.remove(self.__center_cursor)
+                return block
+
+            self.__center_cursor -= 1
 
         return None
 
 
+    def __create_leaf_grid(self, leaf_blocks):
+        """!
+        @brief Creates grid hash of leaf blocks where key is a location of the block's maximum corner on the grid that
+                is formed by the smallest possible blocks.
+        @details Resolution of the grid is restricted in each dimension by precision of the data type: cells should be
+                  much bigger than the distance between adjacent floating point numbers, otherwise location of blocks
+                  on the grid does not correspond to their spatial description.
+
+        @param[in] leaf_blocks (list): Leaf BANG-blocks that are used for neighbor search.
+
+        """
+        dimension = len(self.__data[0])
+
+        self.__split_counts = [0] * dimension
+        for level in range(1, self.__levels):
+            self.__split_counts[level % dimension] += 1
+
+        min_corner, max_corner = data_corners(self.__data)
+
+        self.__grid_shifts = [None] * dimension
+        for index_dimension in range(dimension):
+            extent = max_corner[index_dimension] - min_corner[index_dimension]
+            if extent > 0.0:
+                scale = max(abs(max_corner[index_dimension]), abs(min_corner[index_dimension]))
+                precise_splits = max(0, int(numpy.floor(numpy.log2(extent / (numpy.spacing(scale) * 2 ** 20)))))
+                self.__grid_shifts[index_dimension] = max(0, self.__split_counts[index_dimension] - precise_splits)
+
+        self.__leaf_grid = {}
+        for index_block in range(len(leaf_blocks)):
+            location, _ = self.__get_grid_location(leaf_blocks[index_block])
+            self.__leaf_grid.setdefault(location, []).append(index_block)
+
+
+    def __get_grid_location(self, block):
+        """!
+        @brief Calculates location of the block's maximum corner and block's edge lengths on the grid that is formed by
+                the smallest possible blocks.
+        @details Location is calculated using region number of the block: i-th bit of the region number is set if the
+                  block is the right part on level 'i + 1' where split was performed in dimension '(i + 1) % D'. If
+                  resolution of the grid is restricted in a dimension then the location is rounded down to the cell
+                  that contains the corner.
+
+        @param[in] block (bang_block): BANG-block whose location should be calculated.
+
+        @return (tuple) Pair of maximum corner location (tuple) and edge lengths (list) on the grid.
+
+        """
+        dimension = len(self.__split_counts)
+        region = block.get_region()
+
+        coordinates = [0] * dimension
+        lengths = [2 ** amount for amount in self.__split_counts]
+
+        for level in range(1, block.get_level() + 1):
+            split_dimension = level % dimension
+            lengths[split_dimension] //= 2
+
+            if region & (1 << (level - 1)):
+                coordinates[split_dimension] += lengths[split_dimension]
+
+        location = [0] * dimension
+        for index_dimension in range(dimension):
+            shift = self.__grid_shifts[index_dimension]
+            if shift is None:
+                # all points have the same value in this dimension, all blocks are located at the same place.
+                lengths[index_dimension] = 0
+            else:
+                location[index_dimension] = (coordinates[index_dimension] + lengths[index_dimension]) >> shift
+                lengths[index_dimension] >>= shift
+
+        return tuple(location), lengths
+
+
     def __find_block_neighbors(self, block, level_blocks, unhandled_block_indexes):
         """!
         @brief Search block neighbors that are parts of new clusters (density is greater than threshold and that are
                 not cluster members yet), other neighbors are ignored.
+        @details Neighbors are blocks whose maximum corners are located not further than block edges from the maximum
+                  corner of the specified block. Candidates are taken from grid hash of leafs, if the amount of grid
+                  cells that should be checked is bigger than amount of unhandled blocks then all unhandled blocks are
+                  considered as candidates.
 
         @param[in] block (bang_block): BANG-block for which neighbors should be found (which can be part of cluster).
         @param[in] level_blocks (list): BANG-blocks on specific level.
@@ -1242,22 +1325,40 @@ class bang:
         @return (list) Block neighbors that can become part of cluster.
 
         """
-        neighbors = []
+        location, lengths = self.__get_grid_location(block)
 
-        handled_block_indexes = []
-        for unhandled_index in unhandled_block_indexes:
-            if block.is_neighbor(level_blocks[unhandled_index]):
-                handled_block_indexes.append(unhandled_index)
-                neighbors.append(level_blocks[unhandled_index])
+        # neighborhood is checked with small tolerance, cells of rounded locations are checked additionally.
+        radiuses = []
+        for index_dimension in range(len(lengths)):
+            radius = lengths[index_dimension] + lengths[index_dimension] // 10000
+            if self.__grid_shifts[index_dimension]:
+                radius += 1
+
+            radiuses.append(radius)
+
+        amount_cells = 1
+        for radius in radiuses:
+            amount_cells *= 2 * radius + 1
+
+        if amount_cells < len(unhandled_block_indexes):
+            candidates = []
+            for offset in itertools.product(*[range(-radius, radius + 1) for radius in radiuses]):
+                cell = tuple(location[i] + offset[i] for i in range(len(location)))
+                candidates += [index for index in self.__leaf_grid.get(cell, []) if index in unhandled_block_indexes]
+
+            candidates = sorted(candidates)
+
+        else:
+            candidates = sorted(unhandled_block_indexes)
 
-                # Maximum number of neighbors is eight
-                if len(neighbors) == 8:
-                    break
+        candidates = [index for index in candidates if block.is_neighbor(level_blocks[index])]
 
+        # Maximum number of neighbors is eight
+        handled_block_indexes = candidates[:8]
         for handled_index in handled_block_indexes:
             unhandled_block_indexes.remove(handled_index)
 
-        return neighbors
+        return [level_blocks[index] for index in handled_block_indexes]
 
 
     def __update_cluster_dendrogram(self, index_cluster, blocks):
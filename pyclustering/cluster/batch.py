@@ -0,0 +1,473 @@
+"""!
+
+@brief Batch cluster analysis: K-Means, K-Medoids, DBSCAN and X-Means for many small datasets.
+@details Datasets of a batch are stored in one flat array of points and separated by offsets: dataset 'i' is formed
+          by points 'data[offsets[i]:offsets[i + 1]]'. Whole batch is processed by one call of CCORE library where
+          datasets are processed in parallel, results are returned as flat array of labels with the same offsets.
+
+@authors Andrei Novikov (pyclustering@yandex.ru)
+@date 2014-2019
+@copyright GNU Public License
+
+@cond GNU_PUBLIC_LICENSE
+    PyClustering is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    
+    PyClustering is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+    
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+@endcond
+
+"""
+
+import abc
+import numbers
+import numpy
+
+import pyclustering.core.batch_wrapper as wrapper
+
+from pyclustering.core.wrapper import ccore_library
+from pyclustering.core.metric_wrapper import metric_wrapper
+
+from pyclustering.cluster.center_initializer import kmeans_plusplus_initializer
+from pyclustering.cluster.dbscan import dbscan
+from pyclustering.cluster.kmeans import kmeans
+from pyclustering.cluster.kmedoids import kmedoids
+from pyclustering.cluster.xmeans import xmeans, splitting_type
+
+from pyclustering.utils.metric import distance_metric, type_metric
+
+
+def batch_pack(datasets):
+    """!
+    @brief Packs datasets to the batch representation: flat array of points and offsets of datasets.
+
+    @param[in] datasets (list): List of datasets, each dataset is an array_like of points with the same dimension.
+
+    @return (tuple) Flat array of points (numpy.ndarray) and offsets of datasets (numpy.ndarray).
+
+    """
+    arrays = [ numpy.asarray(dataset, dtype=float) for dataset in datasets ]
+    dimension = next((array.shape[1] for array in arrays if array.ndim == 2 and len(array) > 0), 1)
+
+    offsets = numpy.zeros(len(arrays) + 1, dtype=numpy.int64)
+    numpy.cumsum([ len(array) for array in arrays ], out=offsets[1:])
+
+    data = numpy.empty((offsets[-1], dimension), dtype=float)
+    for index, array in enumerate(arrays):
+        data[offsets[index]:offsets[index + 1]] = array.reshape(len(array), dimension)
+
+    return data, offsets
+
+
+def batch_split(values, offsets):
+    """!
+    @brief Splits flat array (for example, labels of points) of the batch to arrays of each dataset.
+
+    @param[in] values (array_like): Flat array of values of all datasets.
+    @param[in] offsets (array_like): Offsets of datasets in the flat array.
+
+    @return (list) List of arrays (numpy.ndarray), one array per dataset.
+
+    """
+    return numpy.split(numpy.asarray(values), numpy.asarray(offsets)[1:-1])
+
+
+class batch_clustering(abc.ABC):
+    """!
+    @brief Base class of batch cluster analysis that checks batch representation, processes each dataset and
+            collects labels of points.
+    @details Derived class should implement '_process_by_ccore()' that returns flat array of labels and
+              '_process_dataset(index, data)' that returns clusters of a dataset by Python code.
+
+    """
+
+    def __init__(self, data, offsets, ccore):
+        """!
+        @brief Constructor of batch cluster analysis.
+
+        @param[in] data (array_like): Flat array of points of all datasets, each point is represented by array_like.
+        @param[in] offsets (array_like): Offsets of datasets in the flat array of points, amount of offsets is
+                    amount of datasets plus one, the first offset is 0 and the last is amount of points.
+        @param[in] ccore (bool): If True then CCORE library (C++ pyclustering library) is used for clustering.
+
+        """
+        self._data = numpy.asarray(data, dtype=float)
+        if self._data.ndim == 1:
+            self._data = self._data.reshape(len(self._data), 1)
+
+        self._offsets = numpy.asarray(offsets, dtype=numpy.int64)
+        self._labels = None
+        self._ccore = ccore and ccore_library.workable()
+
+        self.__verify_offsets()
+
+
+    def __verify_offsets(self):
+        if self._data.ndim != 2:
+            raise ValueError("Batch data should be presented by array of points (two-dimensional array).")
+
+        if self._offsets.ndim != 1 or len(self._offsets) == 0:
+            raise ValueError("Offsets should be one-dimensional array that contains at least one element.")
+
+        if self._offsets[0] != 0 or self._offsets[-1] != len(self._data) or numpy.any(numpy.diff(self._offsets) < 0):
+            raise ValueError("Offsets should be non-decreasing and start from '0', the last offset should be equal to "
+                             "amount of points '%d'." % len(self._data))
+
+
+    def __len__(self):
+        """!
+        @brief Returns amount of datasets in the batch.
+
+        """
+        return len(self._offsets) - 1
+
+
+    def process(self):
+        """!
+        @brief Performs cluster analysis of each dataset of the batch.
+
+        @return (batch_clustering) Returns itself.
+
+        @remark Results of clustering can be obtained using corresponding get methods.
+
+        @see get_labels()
+        @see get_clusters()
+
+        """
+        if self._ccore is True:
+            self._labels = self._process_by_ccore()
+
+        else:
+            self._labels = numpy.full(len(self._data), -1, dtype=numpy.int64)
+
+            for index in range(len(self)):
+                begin, end = self._offsets[index], self._offsets[index + 1]
+                if begin == end:
+                    continue
+
+                clusters = self._process_dataset(index, self._data[begin:end])
+                for index_cluster, cluster in enumerate(clusters):
+                    self._labels[begin + numpy.asarray(cluster, dtype=numpy.int64)] = index_cluster
+
+        return self
+
+
+    def get_labels(self):
+        """!
+        @brief Returns flat array of labels of points of all datasets, label is an index of cluster in scope of its
+                dataset, points that are not assigned to any cluster (noise) are marked by '-1'.
+
+        @return (numpy.ndarray) Labels of points, offsets of datasets are the same as for input data.
+
+        @see batch_split()
+
+        """
+        return self._labels
+
+
+    def get_offsets(self):
+        """!
+        @brief Returns offsets of datasets in the flat array of points and labels.
+
+        """
+        return self._offsets
+
+
+    def get_clusters(self, index):
+        """!
+        @brief Returns allocated clusters of the specified dataset, each cluster contains indexes of points in
+                scope of the dataset.
+
+        @param[in] index (uint): Index of dataset in the batch.
+
+        @return (list) Allocated clusters of the dataset.
+
+        """
+        labels = self._labels[self._offsets[index]:self._offsets[index + 1]]
+        return [ numpy.flatnonzero(labels == label).tolist() for label in range(labels.max(initial=-1) + 1) ]
+
+
+    @abc.abstractmethod
+    def _process_by_ccore(self):
+        """!
+        @brief Performs cluster analysis of all datasets of the batch using CCORE library.
+
+        @return (numpy.ndarray) Flat array of labels of points of all datasets.
+
+        """
+        pass
+
+
+    @abc.abstractmethod
+    def _process_dataset(self, index, data):
+        """!
+        @brief Performs cluster analysis of a dataset of the batch using Python implementation of the algorithm.
+
+        @param[in] index (uint): Index of the dataset in the batch.
+        @param[in] data (numpy.ndarray): Points of the dataset.
+
+        @return (list) Allocated clusters where each cluster contains indexes of points in scope of the dataset.
+
+        """
+        pass
+
+
+    def _create_initial_centers(self, initial_centers, center_offsets):
+        if isinstance(initial_centers, numbers.Integral):
+            if initial_centers <= 0:
+                raise ValueError("Amount of initial centers '%d' should be greater than 0." % initial_centers)
+
+            self._amount_centers = int(initial_centers)
+            self._centers = numpy.empty((0, self._data.shape[1]), dtype=float)
+            self._center_offsets = numpy.arange(len(self) + 1, dtype=numpy.int64) * self._amount_centers
+            return
+
+        if center_offsets is None:
+            raise ValueError("Offsets of initial centers should be specified if initial centers are specified.")
+
+        self._amount_centers = None
+        self._centers = numpy.asarray(initial_centers, dtype=float).reshape(-1, self._data.shape[1])
+        self._center_offsets = numpy.asarray(center_offsets, dtype=numpy.int64)
+
+        if len(self._center_offsets) != len(self._offsets) or self._center_offsets[0] != 0 or \
+                self._center_offsets[-1] != len(self._centers) or numpy.any(numpy.diff(self._center_offsets) < 0):
+            raise ValueError("Offsets of initial centers should be non-decreasing, start from '0', end by amount of "
+                             "centers and correspond to datasets.")
+
+
+    def _get_initial_centers(self, index, data):
+        if self._amount_centers is not None:
+            return kmeans_plusplus_initializer(data, min(self._amount_centers, len(data))).initialize()
+
+        return self._centers[self._center_offsets[index]:self._center_offsets[index + 1]]
+
+
+class kmeans_batch(batch_clustering):
+    """!
+    @brief Batch cluster analysis by K-Means algorithm: each dataset of the batch is processed independently.
+
+    Example where three datasets are clustered by one call, initial centers are chosen by K-Means++:
+    @code
+        from pyclustering.cluster.batch import kmeans_batch, batch_pack, batch_split
+
+        datasets = [ [[1.0], [1.2], [8.0], [8.3]], [[0.0, 1.0], [0.1, 1.1], [5.0, 5.0]], [[4.0], [4.1]] ]
+
+        # Datasets with different dimensions should be processed by different batches.
+        data, offsets = batch_pack([ datasets[0], datasets[2] ])
+
+        labels = kmeans_batch(data, offsets, 2).process().get_labels()
+        print(batch_split(labels, offsets))
+    @endcode
+
+    @see kmeans
+
+    """
+
+    def __init__(self, data, offsets, initial_centers, center_offsets=None, tolerance=0.001, ccore=True, **kwargs):
+        """!
+        @brief Constructor of batch cluster analysis by K-Means algorithm.
+
+        @param[in] data (array_like): Flat array of points of all datasets.
+        @param[in] offsets (array_like): Offsets of datasets in the flat array of points.
+        @param[in] initial_centers (uint|array_like): Amount of clusters in each dataset (centers are initialized by
+                    K-Means++) or flat array of initial centers of all datasets.
+        @param[in] center_offsets (array_like): Offsets of initial centers of datasets, it should be specified when
+                    initial centers are specified.
+        @param[in] tolerance (double): Stop condition for each dataset (see K-Means algorithm).
+        @param[in] ccore (bool): If True then CCORE library (C++ pyclustering library) is used for clustering.
+        @param[in] **kwargs: Arbitrary keyword arguments (available arguments: 'metric').
+
+        <b>Keyword Args:</b><br>
+            - metric (distance_metric): Metric that is used for distance calculation between two points (by default euclidean square distance).
+
+        """
+        super().__init__(data, offsets, ccore)
+
+        self.__tolerance = tolerance
+        self.__metric = kwargs.get('metric', distance_metric(type_metric.EUCLIDEAN_SQUARE))
+        self._ccore = self._ccore and self.__metric.get_type() != type_metric.USER_DEFINED
+
+        self._create_initial_centers(initial_centers, center_offsets)
+
+
+    def _process_by_ccore(self):
+        ccore_metric = metric_wrapper.create_instance(self.__metric)
+        return wrapper.kmeans_batch(self._data, self._offsets, self._centers, self._center_offsets,
+                                    self.__tolerance, ccore_metric.get_pointer())
+
+
+    def _process_dataset(self, index, data):
+        initial_centers = self._get_initial_centers(index, data)
+        return kmeans(data, initial_centers, self.__tolerance, ccore=False, metric=self.__metric).process().get_clusters()
+
+
+class kmedoids_batch(batch_clustering):
+    """!
+    @brief Batch cluster analysis by K-Medoids algorithm: each dataset of the batch is processed independently.
+
+    @see kmedoids
+
+    """
+
+    def __init__(self, data, offsets, initial_medoids, medoid_offsets=None, tolerance=0.001, ccore=True, **kwargs):
+        """!
+        @brief Constructor of batch cluster analysis by K-Medoids algorithm.
+
+        @param[in] data (array_like): Flat array of points of all datasets.
+        @param[in] offsets (array_like): Offsets of datasets in the flat array of points.
+        @param[in] initial_medoids (uint|array_like): Amount of clusters in each dataset (medoids are initialized by
+                    K-Means++) or flat array of indexes of initial medoids, indexes are in scope of its dataset.
+        @param[in] medoid_offsets (array_like): Offsets of initial medoids of datasets, it should be specified when
+                    initial medoids are specified.
+        @param[in] tolerance (double): Stop condition for each dataset (see K-Medoids algorithm).
+        @param[in] ccore (bool): If True then CCORE library (C++ pyclustering library) is used for clustering.
+        @param[in] **kwargs: Arbitrary keyword arguments (available arguments: 'metric').
+
+        <b>Keyword Args:</b><br>
+            - metric (distance_metric): Metric that is used for distance calculation between two points (by default euclidean square distance).
+
+        """
+        super().__init__(data, offsets, ccore)
+
+        self.__tolerance = tolerance
+        self.__metric = kwargs.get('metric', distance_metric(type_metric.EUCLIDEAN_SQUARE))
+        self._ccore = self._ccore and self.__metric.get_type() != type_metric.USER_DEFINED
+
+        self.__create_initial_medoids(initial_medoids, medoid_offsets)
+
+
+    def __create_initial_medoids(self, initial_medoids, medoid_offsets):
+        if isinstance(initial_medoids, numbers.Integral):
+            if initial_medoids <= 0:
+                raise ValueError("Amount of initial medoids '%d' should be greater than 0." % initial_medoids)
+
+            self.__amount_medoids = int(initial_medoids)
+            self.__medoids = numpy.empty(0, dtype=numpy.int64)
+            self.__medoid_offsets = numpy.arange(len(self) + 1, dtype=numpy.int64) * self.__amount_medoids
+            return
+
+        if medoid_offsets is None:
+            raise ValueError("Offsets of initial medoids should be specified if initial medoids are specified.")
+
+        self.__amount_medoids = None
+        self.__medoids = numpy.asarray(initial_medoids, dtype=numpy.int64)
+        self.__medoid_offsets = numpy.asarray(medoid_offsets, dtype=numpy.int64)
+
+        if len(self.__medoid_offsets) != len(self._offsets) or self.__medoid_offsets[0] != 0 or \
+                self.__medoid_offsets[-1] != len(self.__medoids) or numpy.any(numpy.diff(self.__medoid_offsets) < 0):
+            raise ValueError("Offsets of initial medoids should be non-decreasing, start from '0', end by amount of "
+                             "medoids and correspond to datasets.")
+
+        sizes = numpy.repeat(numpy.diff(self._offsets), numpy.diff(self.__medoid_offsets))
+        if numpy.any(self.__medoids < 0) or numpy.any(self.__medoids >= sizes):
+            raise ValueError("Indexes of initial medoids should be in range of its dataset.")
+
+
+    def _process_by_ccore(self):
+        ccore_metric = metric_wrapper.create_instance(self.__metric)
+        return wrapper.kmedoids_batch(self._data, self._offsets, self.__medoids, self.__medoid_offsets,
+                                      self.__tolerance, ccore_metric.get_pointer())
+
+
+    def _process_dataset(self, index, data):
+        if self.__amount_medoids is not None:
+            amount = min(self.__amount_medoids, len(data))
+            initial_medoids = kmeans_plusplus_initializer(data, amount).initialize(return_index=True)
+        else:
+            initial_medoids = self.__medoids[self.__medoid_offsets[index]:self.__medoid_offsets[index + 1]].tolist()
+
+        instance = kmedoids(data, initial_medoids, self.__tolerance, ccore=False, metric=self.__metric)
+        instance.process()
+
+        return instance.get_clusters()
+
+
+class dbscan_batch(batch_clustering):
+    """!
+    @brief Batch cluster analysis by DBSCAN algorithm: each dataset of the batch is processed independently, noise
+            points are marked by label '-1'.
+
+    @see dbscan
+
+    """
+
+    def __init__(self, data, offsets, eps, neighbors, ccore=True):
+        """!
+        @brief Constructor of batch cluster analysis by DBSCAN algorithm.
+
+        @param[in] data (array_like): Flat array of points of all datasets.
+        @param[in] offsets (array_like): Offsets of datasets in the flat array of points.
+        @param[in] eps (double): Connectivity radius between points.
+        @param[in] neighbors (uint): Minimum number of shared neighbors that is required for establish links between points.
+        @param[in] ccore (bool): If True then CCORE library (C++ pyclustering library) is used for clustering.
+
+        """
+        super().__init__(data, offsets, ccore)
+
+        self.__eps = eps
+        self.__neighbors = neighbors
+
+
+    def _process_by_ccore(self):
+        return wrapper.dbscan_batch(self._data, self._offsets, self.__eps, self.__neighbors)
+
+
+    def _process_dataset(self, index, data):
+        instance = dbscan(data.tolist(), self.__eps, self.__neighbors, ccore=False)
+        instance.process()
+
+        return instance.get_clusters()
+
+
+class xmeans_batch(batch_clustering):
+    """!
+    @brief Batch cluster analysis by X-Means algorithm: each dataset of the batch is processed independently.
+
+    @see xmeans
+
+    """
+
+    def __init__(self, data, offsets, initial_centers=1, center_offsets=None, kmax=20, tolerance=0.025,
+                 criterion=splitting_type.BAYESIAN_INFORMATION_CRITERION, ccore=True):
+        """!
+        @brief Constructor of batch cluster analysis by X-Means algorithm.
+
+        @param[in] data (array_like): Flat array of points of all datasets.
+        @param[in] offsets (array_like): Offsets of datasets in the flat array of points.
+        @param[in] initial_centers (uint|array_like): Amount of initial clusters in each dataset (centers are
+                    initialized by K-Means++) or flat array of initial centers of all datasets.
+        @param[in] center_offsets (array_like): Offsets of initial centers of datasets, it should be specified when
+                    initial centers are specified.
+        @param[in] kmax (uint): Maximum number of clusters that can be allocated in each dataset.
+        @param[in] tolerance (double): Stop condition for each iteration (see X-Means algorithm).
+        @param[in] criterion (splitting_type): Type of splitting creation.
+        @param[in] ccore (bool): If True then CCORE library (C++ pyclustering library) is used for clustering.
+
+        """
+        super().__init__(data, offsets, ccore)
+
+        self.__kmax = kmax
+        self.__tolerance = tolerance
+        self.__criterion = criterion
+
+        self._create_initial_centers(initial_centers, center_offsets)
+
+
+    def _process_by_ccore(self):
+        return wrapper.xmeans_batch(self._data, self._offsets, self._centers, self._center_offsets,
+                                    self.__kmax, self.__tolerance, self.__criterion)
+
+
+    def _process_dataset(self, index, data):
+        initial_centers = numpy.asarray(self._get_initial_centers(index, data)).tolist()
+        instance = xmeans(data.tolist(), initial_centers, self.__kmax, self.__tolerance, self.__criterion, ccore=False)
+        instance.process()
+
+        return instance.get_clusters()
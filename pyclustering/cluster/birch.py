@@ -25,11 +25,12 @@
 """
 
 
-from pyclustering.utils import linear_sum, square_sum;
+import heapq;
+import numpy;
 
 from pyclustering.cluster.encoder import type_encoding;
 
-from pyclustering.container.cftree import cftree, cfentry, measurement_type;
+from pyclustering.container.cftree import cftree, measurement_type;
 
 
 class birch:
@@ -90,6 +91,7 @@ class birch:
         self.__ccore = ccore;
         
         self.__features = None;
+        self.__feature_arrays = None;
         self.__tree = cftree(branching_factor, max_node_entries, initial_diameter, type_measurement);
         
         self.__clusters = [];
@@ -110,16 +112,8 @@ class birch:
         self.__extract_features();
 
         # in line with specification modify hierarchical algorithm should be used for further clustering
-        current_number_clusters = len(self.__features);
+        self.__merge_features();
         
-        while (current_number_clusters > self.__number_clusters):
-            indexes = self.__find_nearest_cluster_features();
-            
-            self.__features[indexes[0]] += self.__features[indexes[1]];
-            self.__features.pop(indexes[1]);
-            
-            current_number_clusters = len(self.__features);
-            
         # decode data
         self.__decode_data();
     
@@ -156,6 +150,8 @@ class birch:
     def __extract_features(self):
         """!
         @brief Extracts features from CF-tree cluster.
+        @details Number of points, linear sums and square sums of the features are also cached as arrays that are used
+                  by hierarchical merging and data decoding.
         
         """
         
@@ -170,21 +166,191 @@ class birch:
             # copy all leaf clustering features
             for node in self.__tree.leafes:
                 self.__features.append(node.feature);
+        
+        number_points = numpy.array([ feature.number_points for feature in self.__features ], dtype = float);
+        linear_sums = numpy.array([ feature.linear_sum for feature in self.__features ], dtype = float).reshape(len(self.__features), -1);
+        square_sums = numpy.array([ feature.square_sum for feature in self.__features ], dtype = float);
+        
+        self.__feature_arrays = (number_points, linear_sums, square_sums);
+    
+    
+    def __merge_features(self):
+        """!
+        @brief Merges the nearest CF entries until required amount of clusters is reached.
+        @details Each feature keeps its nearest neighbor, features are ordered by that distance in a priority queue.
+                  Therefore each merge requires only distances from the merged feature to others instead of all pairs
+                  rescan. Nearest neighbor of a feature is recalculated only if it was one of the merged features.
+        
+        """
+        
+        amount_features = len(self.__features);
+        if (amount_features <= self.__number_clusters):
+            return;
+        
+        number_points, linear_sums, square_sums = self.__feature_arrays;
+        
+        active = numpy.ones(amount_features, dtype = bool);
+        nearest_indexes = numpy.zeros(amount_features, dtype = int);
+        nearest_distances = numpy.zeros(amount_features);
+        versions = [0] * amount_features;
+        
+        for index_feature in range(amount_features):
+            self.__update_nearest_feature(index_feature, active, nearest_indexes, nearest_distances);
+        
+        queue = [ (nearest_distances[index_feature], index_feature, 0) for index_feature in range(amount_features) ];
+        heapq.heapify(queue);
+        
+        current_number_clusters = amount_features;
+        while (current_number_clusters > self.__number_clusters):
+            (_, index_feature, version) = heapq.heappop(queue);
+            if ((active[index_feature] == False) or (versions[index_feature] != version)):
+                continue;   # outdated record, feature has been changed or merged
+            
+            index_target = min(index_feature, nearest_indexes[index_feature]);
+            index_source = max(index_feature, nearest_indexes[index_feature]);
+            
+            self.__features[index_target] += self.__features[index_source];
+            number_points[index_target] += number_points[index_source];
+            linear_sums[index_target] += linear_sums[index_source];
+            square_sums[index_target] += square_sums[index_source];
+            
+            active[index_source] = False;
+            versions[index_target] += 1;
+            current_number_clusters -= 1;
+            
+            if (current_number_clusters <= self.__number_clusters):
+                break;
+            
+            distances = self.__update_nearest_feature(index_target, active, nearest_indexes, nearest_distances);
+            heapq.heappush(queue, (nearest_distances[index_target], index_target, versions[index_target]));
+            
+            # features whose nearest feature was merged should find new one, others can only get closer to the target
+            affected = active & ((nearest_indexes == index_target) | (nearest_indexes == index_source));
+            improved = active & ~affected & (distances < nearest_distances);
+            affected[index_target] = False;
+            
+            for index_changed in numpy.flatnonzero(improved):
+                nearest_indexes[index_changed] = index_target;
+                nearest_distances[index_changed] = distances[index_changed];
+                versions[index_changed] += 1;
+                heapq.heappush(queue, (nearest_distances[index_changed], index_changed, versions[index_changed]));
+            
+            for index_changed in numpy.flatnonzero(affected):
+                self.__update_nearest_feature(index_changed, active, nearest_indexes, nearest_distances);
+                versions[index_changed] += 1;
+                heapq.heappush(queue, (nearest_distances[index_changed], index_changed, versions[index_changed]));
+        
+        self.__features = [ self.__features[index_feature] for index_feature in numpy.flatnonzero(active) ];
+        self.__feature_arrays = (number_points[active], linear_sums[active], square_sums[active]);
+    
+    
+    def __update_nearest_feature(self, index_feature, active, nearest_indexes, nearest_distances):
+        """!
+        @brief Finds nearest active feature for the specified feature and stores it.
+        
+        @param[in] index_feature (uint): Index of feature whose nearest neighbor should be found.
+        @param[in] active (array_like): Mask of features that are not merged yet.
+        @param[in] nearest_indexes (array_like): Indexes of nearest features that are updated.
+        @param[in] nearest_distances (array_like): Distances to nearest features that are updated.
+        
+        @return (array_like) Distances from the specified feature to all features, distance to inactive features is infinite.
+        
+        """
+        
+        number_points, linear_sums, square_sums = self.__feature_arrays;
+        selection = slice(index_feature, index_feature + 1);
+        
+        distances = self.__calculate_distances((number_points[selection], linear_sums[selection], square_sums[selection]), self.__feature_arrays)[0];
+        distances[~active] = float('inf');
+        distances[index_feature] = float('inf');
+        
+        index_nearest = numpy.argmin(distances);
+        nearest_indexes[index_feature] = index_nearest;
+        nearest_distances[index_feature] = distances[index_nearest];
+        
+        return distances;
+    
+    
+    def __calculate_distances(self, features1, features2):
+        """!
+        @brief Calculates distances between two sets of clustering features in line with measurement type.
+        @details Each set of features is represented by tuple of number of points, linear sums and square sums.
+        
+        @param[in] features1 (tuple): The first set of clustering features.
+        @param[in] features2 (tuple): The second set of clustering features.
+        
+        @return (array_like) Matrix of distances where rows correspond to the first set and columns to the second.
+        
+        @see cfentry.get_distance
+        
+        """
+        
+        (number_points1, linear_sums1, square_sums1) = features1;
+        (number_points2, linear_sums2, square_sums2) = features2;
+        
+        if (self.__measurement_type is measurement_type.CENTROID_EUCLIDEAN_DISTANCE):
+            difference = linear_sums1[:, numpy.newaxis, :] / number_points1[:, numpy.newaxis, numpy.newaxis] - linear_sums2 / number_points2[:, numpy.newaxis];
+            return numpy.sum(numpy.square(difference), axis = 2);
+        
+        elif (self.__measurement_type is measurement_type.CENTROID_MANHATTAN_DISTANCE):
+            difference = linear_sums1[:, numpy.newaxis, :] / number_points1[:, numpy.newaxis, numpy.newaxis] - linear_sums2 / number_points2[:, numpy.newaxis];
+            return numpy.sum(numpy.absolute(difference), axis = 2);
+        
+        number_points1 = number_points1[:, numpy.newaxis];
+        square_sums1 = square_sums1[:, numpy.newaxis];
+        
+        if (self.__measurement_type is measurement_type.AVERAGE_INTER_CLUSTER_DISTANCE):
+            linear_part_distance = numpy.dot(linear_sums1, linear_sums2.T);
+            general_part_distance = number_points2 * square_sums1 - 2.0 * linear_part_distance + number_points1 * square_sums2;
+            return numpy.sqrt(numpy.maximum(general_part_distance / (number_points1 * number_points2), 0.0));
+        
+        linear_part_11 = numpy.sum(numpy.square(linear_sums1), axis = 1)[:, numpy.newaxis];
+        linear_part_22 = numpy.sum(numpy.square(linear_sums2), axis = 1);
+        linear_part_12 = linear_part_11 + 2.0 * numpy.dot(linear_sums1, linear_sums2.T) + linear_part_22;
+        number_points12 = number_points1 + number_points2;
+        
+        if (self.__measurement_type is measurement_type.AVERAGE_INTRA_CLUSTER_DISTANCE):
+            general_part_distance = 2.0 * number_points12 * (square_sums1 + square_sums2) - 2.0 * linear_part_12;
+            return numpy.sqrt(numpy.maximum(general_part_distance / (number_points12 * (number_points12 - 1.0)), 0.0));
+        
+        elif (self.__measurement_type is measurement_type.VARIANCE_INCREASE_DISTANCE):
+            variance_part_first = (square_sums1 + square_sums2) - linear_part_12 / number_points12;
+            variance_part_second = -(square_sums1 - linear_part_11 / number_points1);
+            variance_part_third = -(square_sums2 - linear_part_22 / number_points2);
+            return variance_part_first + variance_part_second + variance_part_third;
+        
+        else:
+            assert 0;
     
     
     def __decode_data(self):
         """!
         @brief Decodes data from CF-tree features.
+        @details Each point is assigned to the nearest feature, points are processed by blocks to limit memory usage.
         
         """
         
         self.__clusters = [ [] for _ in range(self.__number_clusters) ];
         self.__noise = [];
         
-        for index_point in range(0, len(self.__pointer_data)):
-            (_, cluster_index) = self.__get_nearest_feature(self.__pointer_data[index_point], self.__features);
+        if (len(self.__pointer_data) == 0):
+            return;
+        
+        points = numpy.asarray(self.__pointer_data, dtype = float).reshape(len(self.__pointer_data), -1);
+        
+        amount_features, dimension = self.__feature_arrays[1].shape;
+        block_size = max(1, 2 ** 20 // (amount_features * dimension));
+        
+        labels = numpy.empty(len(points), dtype = int);
+        for index_begin in range(0, len(points), block_size):
+            block = points[index_begin:index_begin + block_size];
+            block_features = (numpy.ones(len(block)), block, numpy.sum(numpy.square(block), axis = 1));
             
-            self.__clusters[cluster_index].append(index_point);
+            distances = self.__calculate_distances(block_features, self.__feature_arrays);
+            labels[index_begin:index_begin + block_size] = numpy.argmin(distances, axis = 1);
+        
+        for index_point, index_cluster in enumerate(labels):
+            self.__clusters[index_cluster].append(index_point);
     
     
     def __insert_data(self):
@@ -240,55 +406,3 @@ class birch:
             rebuild_result = True;
         
         return tree;
-    
-    
-    def __find_nearest_cluster_features(self):
-        """!
-        @brief Find pair of nearest CF entries.
-        
-        @return (list) List of two nearest enties that are represented by list [index_point1, index_point2].
-        
-        """
-        
-        minimum_distance = float("Inf");
-        index1 = 0;
-        index2 = 0;
-        
-        for index_candidate1 in range(0, len(self.__features)):
-            feature1 = self.__features[index_candidate1];
-            for index_candidate2 in range(index_candidate1 + 1, len(self.__features)):
-                feature2 = self.__features[index_candidate2];
-                
-                distance = feature1.get_distance(feature2, self.__measurement_type);
-                if (distance < minimum_distance):
-                    minimum_distance = distance;
-                    
-                    index1 = index_candidate1;
-                    index2 = index_candidate2;
-        
-        return [index1, index2];
-    
-    
-    def __get_nearest_feature(self, point, feature_collection):
-        """!
-        @brief Find nearest entry for specified point.
-        
-        @param[in] point (list): Pointer to point from input dataset.
-        @param[in] feature_collection (list): Feature collection that is used for obtaining nearest feature for the specified point.
-        
-        @return (double, uint) Tuple of distance to nearest entry to the specified point and index of that entry.
-        
-        """
-        
-        minimum_distance = float("Inf");
-        index_nearest_feature = -1;
-        
-        for index_entry in range(0, len(feature_collection)):
-            point_entry = cfentry(1, linear_sum([ point ]), square_sum([ point ]));
-            
-            distance = feature_collection[index_entry].get_distance(point_entry, self.__measurement_type);
-            if (distance < minimum_distance):
-                minimum_distance = distance;
-                index_nearest_feature = index_entry;
-                
-        return (minimum_distance, index_nearest_feature);
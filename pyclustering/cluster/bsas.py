@@ -24,6 +24,7 @@
 
 """
 
+import numpy;
 
 from pyclustering.core.wrapper import ccore_library;
 from pyclustering.core.bsas_wrapper import bsas as bsas_wrapper;
@@ -223,16 +224,13 @@ class bsas:
         @return (uint, double) Index of nearest cluster and distance to it.
 
         """
-        index_cluster = -1;
-        nearest_distance = float('inf');
+        if len(self._representatives) == 0:
+            return -1, float('inf');
 
-        for index in range(len(self._representatives)):
-            distance = self._metric(point, self._representatives[index]);
-            if distance < nearest_distance:
-                index_cluster = index;
-                nearest_distance = distance;
+        distances = self._metric.pairwise([point], self._representatives)[0];
+        index_cluster = int(numpy.argmin(distances));
 
-        return index_cluster, nearest_distance;
+        return index_cluster, distances[index_cluster];
 
 
     def _update_representative(self, index_cluster, point):
@@ -163,7 +163,7 @@ class kmeans_plusplus_initializer:
     FARTHEST_CENTER_CANDIDATE = "farthest"
 
 
-    def __init__(self, data, amount_centers, amount_candidates = 1):
+    def __init__(self, data, amount_centers, amount_candidates = 1, **kwargs):
         """!
         @brief Creates K-Means++ center initializer instance.
         
@@ -171,15 +171,24 @@ class kmeans_plusplus_initializer:
         @param[in] amount_centers (uint): Amount of centers that should be initialized.
         @param[in] amount_candidates (uint): Amount of candidates that is considered as a center, if the farthest points (with the highest probability) should
                     be considered as centers then special constant should be used 'FARTHEST_CENTER_CANDIDATE'.
+        @param[in] **kwargs: Arbitrary keyword arguments (available arguments: 'weights').
+
+        <b>Keyword Args:</b><br>
+            - weights (array_like): Weight of each point, probability to be a center is proportional to weight of a point
+               multiplied by distance to the closest center, the first center is chosen in line with weights.
 
         @see FARTHEST_CENTER_CANDIDATE
 
         """
         
-        self.__data = numpy.array(data)
+        self.__data = numpy.asarray(data)
         self.__amount = amount_centers
         self.__candidates = amount_candidates
 
+        self.__weights = kwargs.get('weights', None)
+        if self.__weights is not None:
+            self.__weights = numpy.array(self.__weights, dtype=float)
+
         self.__check_parameters()
 
 
@@ -200,93 +209,73 @@ class kmeans_plusplus_initializer:
         if len(self.__data) == 0:
             raise AttributeError("Data is empty.")
 
+        if (self.__weights is not None) and (len(self.__weights) != len(self.__data)):
+            raise AttributeError("Amount of weights '" + str(len(self.__weights)) + "' should be equal to amount of "
+                                 "points in data '" + str(len(self.__data)) + "'.")
+
 
-    def __calculate_shortest_distances(self, data, centers, index_representation):
+    def __calculate_distances(self, index_center):
         """!
-        @brief Calculates distance from each data point to nearest center.
+        @brief Calculates distance from each data point to the specified center.
         
-        @param[in] data (numpy.array): Array of points for that initialization is performed.
-        @param[in] centers (numpy.array): Array of points or indexes that represents centers.
-        @param[in] index_representation (bool): If 'True' then index representation is used in 'centers', otherwise
-                    points itself are used for representation.
+        @param[in] index_center (uint): Index of point that is a center.
         
-        @return (numpy.array) List of distances to closest center for each data point.
+        @return (numpy.array) Euclidean square distance to the center for each data point.
         
         """
 
-        dataset_differences = numpy.zeros((len(centers), len(data)))
-        for index_center in range(len(centers)):
-            if index_representation:
-                center = data[centers[index_center]]
-            else:
-                center = centers[index_center]
+        return numpy.sum(numpy.square(self.__data - self.__data[index_center]), axis=1).astype(float)
 
-            dataset_differences[index_center] = numpy.sum(numpy.square(data - center), axis=1).T
 
-        shortest_distances = numpy.min(dataset_differences, axis=0)
-        return shortest_distances
-
-
-    def __get_next_center(self, centers, return_index):
+    def __get_next_center(self, distances):
         """!
         @brief Calculates the next center for the data.
 
-        @param[in] centers (array_like): Current initialized centers.
-        @param[in] return_index (bool): If True then return center's index instead of point.
+        @param[in] distances (numpy.array): Distances from each point to closest center.
 
-        @return (array_like) Next initialized center.<br>
-                (uint) Index of next initialized center if return_index is True.
+        @return (uint) Index of next initialized center.
 
         """
 
-        distances = self.__calculate_shortest_distances(self.__data, centers, return_index)
+        if self.__weights is not None:
+            distances = distances * self.__weights
 
         if self.__candidates == kmeans_plusplus_initializer.FARTHEST_CENTER_CANDIDATE:
-            center_index = numpy.argmax(distances)
-        else:
-            probabilities = self.__calculate_probabilities(distances)
-            center_index = self.__get_probable_center(distances, probabilities)
+            return int(numpy.argmax(distances))
 
-        if return_index:
-            return center_index
-
-        return self.__data[center_index]
+        probabilities = numpy.cumsum(distances)
+        return self.__get_probable_center(distances, probabilities)
 
 
-    def __get_initial_center(self, return_index):
+    def __get_initial_center(self):
         """!
-        @brief Choose randomly first center.
-
-        @param[in] return_index (bool): If True then return center's index instead of point.
+        @brief Choose randomly first center, with uniform distribution or in line with weights if they are specified.
 
-        @return (array_like) First center.<br>
-                (uint) Index of first center.
+        @return (uint) Index of first center.
 
         """
 
-        index_center = random.randint(0, len(self.__data) - 1)
-        if return_index:
-            return index_center
+        if self.__weights is not None:
+            return self.__search_probable_point(numpy.cumsum(self.__weights))
 
-        return self.__data[index_center]
+        return random.randint(0, len(self.__data) - 1)
 
 
-    def __calculate_probabilities(self, distances):
+    def __search_probable_point(self, probabilities):
         """!
-        @brief Calculates cumulative probabilities of being center of each point.
+        @brief Chooses random point in line with cumulative (not normalized) probabilities using binary search.
 
-        @param[in] distances (array_like): Distances from each point to closest center.
+        @param[in] probabilities (numpy.array): Cumulative probabilities of being center of each point.
 
-        @return (array_like) Cumulative probabilities of being center of each point.
+        @return (uint) Index of chosen point, 0 if all probabilities are zero.
 
         """
 
-        total_distance = numpy.sum(distances)
-        if total_distance != 0.0:
-            probabilities = distances / total_distance
-            return numpy.cumsum(probabilities)
-        else:
-            return numpy.zeros(len(distances))
+        index_point = int(numpy.searchsorted(probabilities, random.random() * probabilities[-1], side='right'))
+        if index_point == len(probabilities):
+            return 0
+
+        return index_point
 
 
     def __get_probable_center(self, distances, probabilities):
@@ -302,13 +291,7 @@ class kmeans_plusplus_initializer:
 
         index_best_candidate = -1
         for _ in range(self.__candidates):
-            candidate_probability = random.random()
-            index_candidate = 0
-
-            for index_object in range(len(probabilities)):
-                if candidate_probability < probabilities[index_object]:
-                    index_candidate = index_object
-                    break
+            index_candidate = self.__search_probable_point(probabilities)
 
             if index_best_candidate == -1:
                 index_best_candidate = index_candidate
@@ -321,6 +304,8 @@ class kmeans_plusplus_initializer:
     def initialize(self, **kwargs):
         """!
         @brief Calculates initial centers using K-Means++ method.
+        @details Distance to the closest center is maintained for each point and it is updated only using the newest
+                  center, therefore complexity of initialization is O(K*N).
 
         @param[in] **kwargs: Arbitrary keyword arguments (available arguments: 'return_index').
 
@@ -334,11 +319,180 @@ class kmeans_plusplus_initializer:
         """
 
         return_index = kwargs.get('return_index', False)
-        centers = [self.__get_initial_center(return_index)]
+
+        index_center = self.__get_initial_center()
+        centers = [index_center]
+        distances = self.__calculate_distances(index_center)
 
         # For each next center
         for _ in range(1, self.__amount):
-            next_center = self.__get_next_center(centers, return_index)
-            centers.append(next_center)
+            index_center = self.__get_next_center(distances)
+            centers.append(index_center)
+            numpy.minimum(distances, self.__calculate_distances(index_center), out=distances)
+
+        if return_index:
+            return centers
+
+        return [self.__data[index_center] for index_center in centers]
+
+
+
+class kmeans_parallel_initializer:
+    r"""!
+    @brief K-Means|| (scalable K-Means++) is an algorithm for choosing the initial centers for algorithms like K-Means.
+    @details K-Means++ requires K passes over data, K-Means|| oversamples candidates in several rounds instead. On each
+              round each point is chosen as a candidate independently with probability that is proportional to the
+              distance to the closest candidate \f$p_{i}=\frac{lD(x_{i})}{\sum_{j=0}^{N}D(x_{j})}\f$, where \f$l\f$ is
+              an oversampling factor. After that each candidate is weighted by amount of points that are closer to it
+              than to other candidates and the required amount of centers is chosen from candidates using weighted
+              K-Means++ where \f$2 + \ln K\f$ candidates are considered on each step.
+              All random choices are defined by module 'random', therefore 'random.seed()' makes result reproducible.
+
+    Code example where initial centers are prepared for K-Means algorithm:
+    @code
+        sample = read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE3)
+
+        # Calculate initial centers using K-Means|| method with 5 rounds of oversampling.
+        centers = kmeans_parallel_initializer(sample, 4, rounds=5).initialize()
+
+        kmeans_instance = kmeans(sample, centers)
+        kmeans_instance.process()
+    @endcode
+
+    @see kmeans_plusplus_initializer
+
+    """
+
+    def __init__(self, data, amount_centers, oversampling = None, rounds = 5):
+        """!
+        @brief Creates K-Means|| center initializer instance.
+
+        @param[in] data (array_like): List of points where each point is represented by list of coordinates.
+        @param[in] amount_centers (uint): Amount of centers that should be initialized.
+        @param[in] oversampling (double): Oversampling factor - expected amount of candidates that are chosen on each
+                    round, if 'None' then doubled amount of centers is used.
+        @param[in] rounds (uint): Amount of rounds of oversampling.
+
+        """
+
+        self.__data = numpy.asarray(data, dtype=float)
+        self.__amount = amount_centers
+        self.__oversampling = oversampling if oversampling is not None else 2.0 * amount_centers
+        self.__rounds = rounds
+
+        self.__check_parameters()
+
+
+    def __check_parameters(self):
+        """!
+        @brief Checks input parameters of the algorithm and if something wrong then corresponding exception is thrown.
+
+        """
+        if len(self.__data) == 0:
+            raise AttributeError("Data is empty.")
+
+        if (self.__amount <= 0) or (self.__amount > len(self.__data)):
+            raise AttributeError("Amount of cluster centers '" + str(self.__amount) + "' should be at least 1 and "
+                                 "should be less or equal to amount of points in data.")
+
+        if self.__oversampling <= 0:
+            raise AttributeError("Oversampling factor '" + str(self.__oversampling) + "' should be positive.")
+
+        if self.__rounds < 0:
+            raise AttributeError("Amount of rounds '" + str(self.__rounds) + "' should not be negative.")
+
+
+    def __calculate_shortest_distances(self, indexes, norms):
+        """!
+        @brief Calculates distance from each data point to the closest point from the specified set.
+        @details Points are processed by blocks to restrict size of matrix of distances.
+
+        @param[in] indexes (numpy.array): Indexes of points from the set.
+        @param[in] norms (numpy.array): Squared norm of each data point.
+
+        @return (tuple) Euclidean square distance to the closest point from the set and position of the point in the set.
+
+        """
+
+        centers = -2.0 * self.__data[indexes].T
+        center_norms = norms[indexes]
+
+        distances = numpy.empty(len(self.__data))
+        closest = numpy.empty(len(self.__data), dtype=numpy.int64)
+
+        block_size = max(1, 262144 // len(indexes))
+        for start in range(0, len(self.__data), block_size):
+            stop = min(start + block_size, len(self.__data))
+
+            # norm of a point doesn't affect the closest point, therefore it is added only to the shortest distance.
+            block_distances = self.__data[start:stop].dot(centers)
+            block_distances += center_norms
+            closest[start:stop] = numpy.argmin(block_distances, axis=1)
+            distances[start:stop] = block_distances[numpy.arange(stop - start), closest[start:stop]]
+
+        distances += norms
+        numpy.maximum(distances, 0.0, out=distances)
+        return distances, closest
+
+
+    def initialize(self, **kwargs):
+        """!
+        @brief Calculates initial centers using K-Means|| method.
+
+        @param[in] **kwargs: Arbitrary keyword arguments (available arguments: 'return_index').
+
+        <b>Keyword Args:</b><br>
+            - return_index (bool): If True then returns indexes of points from input data instead of points itself.
+
+        @return (list) List of initialized initial centers.
+                  If argument 'return_index' is False then returns list of points.
+                  If argument 'return_index' is True then returns list of indexes.
+
+        """
+
+        return_index = kwargs.get('return_index', False)
+
+        norms = numpy.einsum('ij,ij->i', self.__data, self.__data)
+
+        # generator of oversampling is seeded by module 'random' that is used by K-Means++ as well.
+        generator = numpy.random.RandomState(random.getrandbits(32))
+
+        candidates = numpy.array([generator.randint(len(self.__data))])
+        distances, closest = self.__calculate_shortest_distances(candidates, norms)
+        distances[candidates] = 0.0
+
+        for _ in range(self.__rounds):
+            potential = numpy.sum(distances)
+            if potential == 0.0:
+                break
+
+            chosen = numpy.flatnonzero(generator.random_sample(len(self.__data)) < self.__oversampling * distances / potential)
+            if len(chosen) == 0:
+                continue
+
+            chosen_distances, chosen_closest = self.__calculate_shortest_distances(chosen, norms)
+            chosen_distances[chosen] = 0.0
+            chosen_closest[chosen] = numpy.arange(len(chosen))
+
+            update = chosen_distances < distances
+            distances[update] = chosen_distances[update]
+            closest[update] = chosen_closest[update] + len(candidates)
+
+            candidates = numpy.concatenate((candidates, chosen))
+
+        if len(candidates) < self.__amount:
+            # Oversampling has not provided enough candidates, therefore K-Means++ is used for the whole data.
+            centers = kmeans_plusplus_initializer(self.__data, self.__amount).initialize(return_index=True)
+
+        else:
+            # Candidates are reduced by greedy weighted K-Means++ that considers several candidates on each step.
+            weights = numpy.bincount(closest, minlength=len(candidates))
+            amount_candidates = min(len(candidates), 2 + int(numpy.log(self.__amount)))
+
+            initializer = kmeans_plusplus_initializer(self.__data[candidates], self.__amount, amount_candidates, weights=weights)
+            centers = [int(candidates[index]) for index in initializer.initialize(return_index=True)]
+
+        if return_index:
+            return centers
 
-        return centers
\ No newline at end of file
+        return [self.__data[index_center] for index_center in centers]
\ No newline at end of file
@@ -33,16 +33,13 @@ from pyclustering.core.wrapper import ccore_library
 import pyclustering.core.clique_wrapper as wrapper
 
 
-try:
-    import matplotlib
-    import matplotlib.gridspec as gridspec
-    import matplotlib.pyplot as plt
-    import matplotlib.patches as patches
-    import matplotlib.animation as animation
-except Exception as error_instance:
-    import warnings
-    warnings.warn("Impossible to import matplotlib (please, install 'matplotlib'), pyclustering's visualization "
-                  "functionality is not available (details: '%s')." % str(error_instance))
+from pyclustering.utils.lazy_import import lazy_module
+
+matplotlib = lazy_module('matplotlib')
+gridspec = lazy_module('matplotlib.gridspec')
+plt = lazy_module('matplotlib.pyplot')
+patches = lazy_module('matplotlib.patches')
+animation = lazy_module('matplotlib.animation')
 
 
 class clique_visualizer:
@@ -25,18 +25,21 @@
 """
 
 
+import heapq
+import math
 import numpy
+import random
 
 from pyclustering.cluster.encoder import type_encoding
 
-from pyclustering.utils import euclidean_distance_square
-
-from pyclustering.container.kdtree import kdtree
-
 from pyclustering.core.wrapper import ccore_library
 
 import pyclustering.core.cure_wrapper as wrapper
 
+from pyclustering.utils.lazy_import import lazy_module
+
+spatial = lazy_module('scipy.spatial')
+
 
 class cure_cluster:
     """!
@@ -86,52 +89,262 @@ class cure_cluster:
         return "%s, %s" % (self.distance, self.points)
         
 
+class cure_representor_index:
+    """!
+    @brief Dynamic spatial index of representative points of CURE clusters.
+    @details Points are stored in arrays where representative points of each cluster occupy contiguous block. The first
+              part of points is indexed by k-d tree (scipy.spatial.cKDTree), points that are inserted after building of
+              the tree are kept in a buffer that is scanned vectorially. Removed points are marked and skipped. The tree
+              is rebuilt when the buffer or amount of removed points becomes comparable with size of the tree, therefore
+              cost of rebuilding is amortized by insertions and removals.
+
+    """
+
+    __MINIMUM_BUFFER_SIZE = 256
+
+    def __init__(self, points, owners, amount_owners):
+        """!
+        @brief Creates index of representative points.
+
+        @param[in] points (numpy.ndarray): Representative points of all clusters.
+        @param[in] owners (numpy.ndarray): Index of cluster for each point, points of each cluster should be consecutive.
+        @param[in] amount_owners (uint): Amount of clusters, index of each cluster should be less than this value.
+
+        """
+
+        self.__points = numpy.array(points, dtype=float)
+        self.__owners = numpy.array(owners, dtype=int)
+        self.__alive = numpy.ones(len(self.__points), dtype=bool)
+        self.__size = len(self.__points)
+
+        self.__begins = numpy.zeros(amount_owners, dtype=int)
+        self.__ends = numpy.zeros(amount_owners, dtype=int)
+
+        self.__tree = None
+        self.__tree_size = 0
+        self.__removed = 0
+
+        self.__rebuild()
+
+
+    def insert(self, points, owner):
+        """!
+        @brief Inserts representative points of a cluster.
+
+        @param[in] points (numpy.ndarray): Representative points of the cluster.
+        @param[in] owner (uint): Index of the cluster, the cluster should not have points in the index.
+
+        """
+
+        if self.__size + len(points) > len(self.__points):
+            self.__rebuild(len(points))
+
+        begin, end = self.__size, self.__size + len(points)
+
+        self.__points[begin:end] = points
+        self.__owners[begin:end] = owner
+        self.__alive[begin:end] = True
+
+        self.__begins[owner], self.__ends[owner] = begin, end
+        self.__size = end
+
+        if end - self.__tree_size > max(self.__MINIMUM_BUFFER_SIZE, self.__tree_size // 8):
+            self.__rebuild()
+
+
+    def remove(self, owner):
+        """!
+        @brief Removes all representative points of a cluster.
+
+        @param[in] owner (uint): Index of the cluster whose points should be removed.
+
+        """
+
+        begin, end = self.__begins[owner], self.__ends[owner]
+        self.__alive[begin:end] = False
+
+        if begin < self.__tree_size:
+            self.__removed += end - begin
+            if self.__removed > self.__tree_size // 2:
+                self.__rebuild()
+
+
+    def nearest(self, points, owners):
+        """!
+        @brief Finds the nearest representative point of other clusters for each specified point.
+        @details If there are several nearest points then point of cluster with the smallest index is returned.
+
+        @param[in] points (numpy.ndarray): Points for which the nearest representative points should be found.
+        @param[in] owners (numpy.ndarray): Index of cluster for each point whose representative points are ignored.
+
+        @return (tuple) Indexes of clusters of the nearest representative points (-1 if there is no such point) and
+                 square euclidean distances to them.
+
+        """
+
+        amount = len(points)
+        best_owners = numpy.full(amount, -1, dtype=int)
+        best_distances = numpy.full(amount, float('inf'))
+
+        if self.__tree_size > 0:
+            rows = numpy.arange(amount)
+            neighbors = min(self.__tree_size, 4)
+
+            # neighbors may belong to the same cluster or may be removed, therefore search area is extended for such points
+            while len(rows) > 0:
+                _, candidates = self.__tree.query(points[rows], k=neighbors)
+                self.__update_nearest(points, owners, rows, candidates.reshape(len(rows), neighbors), best_owners, best_distances)
+
+                if neighbors == self.__tree_size:
+                    break
+
+                rows = rows[best_owners[rows] < 0]
+                neighbors = min(self.__tree_size, 2 * neighbors)
+
+        if self.__size > self.__tree_size:
+            candidates = numpy.broadcast_to(numpy.arange(self.__tree_size, self.__size), (amount, self.__size - self.__tree_size))
+            self.__update_nearest(points, owners, numpy.arange(amount), candidates, best_owners, best_distances)
+
+        return best_owners, best_distances
+
+
+    def __update_nearest(self, points, owners, rows, candidates, best_owners, best_distances):
+        """!
+        @brief Updates the nearest representative points using candidates.
+
+        @param[in] points (numpy.ndarray): Points for which the nearest representative points are searched.
+        @param[in] owners (numpy.ndarray): Index of cluster for each point whose representative points are ignored.
+        @param[in] rows (numpy.ndarray): Indexes of points that are updated.
+        @param[in] candidates (numpy.ndarray): Indexes of stored points that are considered for each updated point.
+        @param[in|out] best_owners (numpy.ndarray): Indexes of clusters of the nearest representative points.
+        @param[in|out] best_distances (numpy.ndarray): Square euclidean distances to the nearest representative points.
+
+        """
+
+        distances = numpy.sum(numpy.square(self.__points[candidates] - points[rows, numpy.newaxis, :]), axis=2)
+        candidate_owners = self.__owners[candidates]
+        distances[~self.__alive[candidates] | (candidate_owners == owners[rows, numpy.newaxis])] = float('inf')
+
+        distances = numpy.column_stack((best_distances[rows], distances))
+        candidate_owners = numpy.column_stack((best_owners[rows], candidate_owners))
+
+        minimal_distances = numpy.min(distances, axis=1)
+        nearest_owners = numpy.where(distances == minimal_distances[:, numpy.newaxis], candidate_owners, numpy.iinfo(int).max)
+        nearest_owners = numpy.min(nearest_owners, axis=1)
+        nearest_owners[numpy.isinf(minimal_distances)] = -1
+
+        best_owners[rows] = nearest_owners
+        best_distances[rows] = minimal_distances
+
+
+    def __rebuild(self, reserve = 0):
+        """!
+        @brief Removes marked points and builds k-d tree over all stored points.
+
+        @param[in] reserve (uint): Amount of points that should fit into storage after rebuilding in addition to stored points.
+
+        """
+
+        alive = numpy.flatnonzero(self.__alive[:self.__size])
+        points, owners = self.__points[alive], self.__owners[alive]
+        amount = len(alive)
+
+        if amount + reserve > len(self.__points):
+            capacity = 2 * (amount + reserve)
+            self.__points = numpy.empty((capacity, self.__points.shape[1]))
+            self.__owners = numpy.empty(capacity, dtype=int)
+            self.__alive = numpy.empty(capacity, dtype=bool)
+
+        self.__points[:amount] = points
+        self.__owners[:amount] = owners
+        self.__alive[:amount] = True
+        self.__alive[amount:] = False
+        self.__size = amount
+
+        if amount > 0:
+            begins = numpy.flatnonzero(numpy.concatenate(([True], owners[1:] != owners[:-1])))
+            self.__begins[owners[begins]] = begins
+            self.__ends[owners[begins]] = numpy.append(begins[1:], amount)
+
+        self.__tree = spatial.cKDTree(self.__points[:amount]) if amount > 0 else None
+        self.__tree_size = amount
+        self.__removed = 0
+
+
 class cure:
     """!
     @brief Class represents clustering algorithm CURE with KD-tree optimization.
     @details CCORE option can be used to use the pyclustering core - C/C++ shared library for processing that significantly increases performance.
-    
+
+             Python implementation keeps clusters in a priority queue ordered by distance to the closest cluster and
+             representative points in a dynamic k-d tree, therefore each merge requires only searches of the nearest
+             representative points instead of comparison with each cluster.
+
+             Large data can be processed using random sample as it is proposed in the paper: only the sample is
+             clustered and other points are assigned to clusters with the nearest representative point. The sample can
+             be divided into partitions that are partially clustered separately before the final clustering.
+
     Example:
     @code
         # read data for clustering from some file
         sample = read_sample(path_to_data);
-        
+
         # create instance of cure algorithm for cluster analysis
         # request for allocation of two clusters.
         cure_instance = cure(sample, 2, 5, 0.5);
-        
+
         # run cluster analysis
         cure_instance.process();
-        
+
         # get results of clustering
         clusters = cure_instance.get_clusters();
     @endcode
-    
+
+    Example where only 2500 random points are clustered in five partitions and other points are assigned to clusters:
+    @code
+        cure_instance = cure(large_sample, 2, 5, 0.5, sample_size=2500, partitions=5);
+        cure_instance.process();
+
+        clusters = cure_instance.get_clusters();
+    @endcode
+
     """
-    
-    def __init__(self, data, number_cluster, number_represent_points = 5, compression = 0.5, ccore = True):
+
+    __ASSIGNMENT_CHUNK_SIZE = 65536
+
+    def __init__(self, data, number_cluster, number_represent_points = 5, compression = 0.5, ccore = True, **kwargs):
         """!
         @brief Constructor of clustering algorithm CURE.
-        
+
         @param[in] data (array_like): Input data that should be processed.
         @param[in] number_cluster (uint): Number of clusters that should be allocated.
         @param[in] number_represent_points (uint): Number of representative points for each cluster.
         @param[in] compression (double): Coefficient defines level of shrinking of representation points toward the mean of the new created cluster after merging on each step. Usually it destributed from 0 to 1.
         @param[in] ccore (bool): If True then CCORE (C++ solution) will be used for solving.
-        
+        @param[in] **kwargs: Arbitrary keyword arguments (available arguments: 'sample_size', 'partitions', 'reduction').
+
+        <b>Keyword Args:</b><br>
+            - sample_size (uint): Amount of random points that are clustered, other points are assigned to clusters with the nearest representative point (by default all points are clustered).
+            - partitions (uint): Amount of partitions of the sample that are partially clustered before the final clustering, partitions are supported only by Python implementation (by default 1).
+            - reduction (double): Each partition is partially clustered until amount of its clusters is reduced by this factor (by default 3).
+
         """
-        
+
         self.__pointer_data = self.__prepare_data_points(data)
-        
+
         self.__clusters = None
         self.__representors = None
         self.__means = None
-        
+
         self.__number_cluster = number_cluster
         self.__number_represent_points = number_represent_points
         self.__compression = compression
 
-        self.__ccore = ccore
+        self.__sample_size = kwargs.get('sample_size', None)
+        self.__partitions = kwargs.get('partitions', 1)
+        self.__reduction = kwargs.get('reduction', 3.0)
+
+        self.__ccore = ccore and self.__partitions == 1
         if self.__ccore:
             self.__ccore = ccore_library.workable()
 
@@ -141,26 +354,39 @@ class cure:
     def process(self):
         """!
         @brief Performs cluster analysis in line with rules of CURE algorithm.
-        
+
         @remark Results of clustering can be obtained using corresponding get methods.
-        
+
         @see get_clusters()
-        
+
         """
-        
+
+        sample_indexes = numpy.arange(len(self.__pointer_data))
+        if (self.__sample_size is not None) and (self.__sample_size < len(self.__pointer_data)):
+            sample_indexes = numpy.sort(random.sample(range(len(self.__pointer_data)), self.__sample_size))
+
         if self.__ccore is True:
-            self.__process_by_ccore()
-            
+            self.__process_by_ccore(sample_indexes)
+
         else:
-            self.__process_by_python()
+            self.__process_by_python(sample_indexes)
 
+        if len(sample_indexes) < len(self.__pointer_data):
+            self.__assign_points()
 
-    def __process_by_ccore(self):
+
+    def __process_by_ccore(self, sample_indexes):
         """!
         @brief Performs cluster analysis using CCORE (C/C++ part of pyclustering library).
 
+        @param[in] sample_indexes (numpy.ndarray): Indexes of points that should be clustered.
+
         """
-        cure_data_pointer = wrapper.cure_algorithm(self.__pointer_data, self.__number_cluster,
+        sample = self.__pointer_data
+        if len(sample_indexes) < len(self.__pointer_data):
+            sample = self.__pointer_data[sample_indexes]
+
+        cure_data_pointer = wrapper.cure_algorithm(sample, self.__number_cluster,
                                                    self.__number_represent_points, self.__compression)
 
         self.__clusters = wrapper.cure_get_clusters(cure_data_pointer)
@@ -169,73 +395,33 @@ class cure:
 
         wrapper.cure_data_destroy(cure_data_pointer)
 
+        self.__clusters = [ sample_indexes[cluster].tolist() for cluster in self.__clusters ]
+
 
-    def __process_by_python(self):
+    def __process_by_python(self, sample_indexes):
         """!
         @brief Performs cluster analysis using python code.
 
-        """
-        self.__create_queue()  # queue
-        self.__create_kdtree()  # create k-d tree
-
-        while len(self.__queue) > self.__number_cluster:
-            cluster1 = self.__queue[0]  # cluster that has nearest neighbor.
-            cluster2 = cluster1.closest  # closest cluster.
-
-            self.__queue.remove(cluster1)
-            self.__queue.remove(cluster2)
+        @param[in] sample_indexes (numpy.ndarray): Indexes of points that should be clustered.
 
-            self.__delete_represented_points(cluster1)
-            self.__delete_represented_points(cluster2)
-
-            merged_cluster = self.__merge_clusters(cluster1, cluster2)
-
-            self.__insert_represented_points(merged_cluster)
-
-            # Pointers to clusters that should be relocated is stored here.
-            cluster_relocation_requests = []
-
-            # Check for the last cluster
-            if len(self.__queue) > 0:
-                merged_cluster.closest = self.__queue[0]  # arbitrary cluster from queue
-                merged_cluster.distance = self.__cluster_distance(merged_cluster, merged_cluster.closest)
-
-                for item in self.__queue:
-                    distance = self.__cluster_distance(merged_cluster, item)
-                    # Check if distance between new cluster and current is the best than now.
-                    if distance < merged_cluster.distance:
-                        merged_cluster.closest = item
-                        merged_cluster.distance = distance
-
-                    # Check if current cluster has removed neighbor.
-                    if (item.closest is cluster1) or (item.closest is cluster2):
-                        # If previous distance was less then distance to new cluster then nearest cluster should
-                        # be found in the tree.
-                        if item.distance < distance:
-                            (item.closest, item.distance) = self.__closest_cluster(item, distance)
-
-                            # TODO: investigation is required. There is assumption that itself and merged cluster
-                            # should be always in list of neighbors in line with specified radius. But merged cluster
-                            # may not be in list due to error calculation, therefore it should be added manually.
-                            if item.closest is None:
-                                item.closest = merged_cluster
-                                item.distance = distance
-
-                        else:
-                            item.closest = merged_cluster
-                            item.distance = distance
+        """
+        if self.__partitions > 1:
+            clusters = []
+            # each partition should contain at least one point
+            amount_partitions = min(self.__partitions, len(sample_indexes))
+            for partition in numpy.array_split(sample_indexes, amount_partitions):
+                amount_clusters = max(self.__number_cluster, int(math.ceil(len(partition) / self.__reduction)))
+                clusters += self.__agglomerate(self.__create_clusters(partition), amount_clusters)
 
-                        cluster_relocation_requests.append(item)
+        else:
+            clusters = self.__create_clusters(sample_indexes)
 
-            # New cluster and updated clusters should relocated in queue
-            self.__insert_cluster(merged_cluster)
-            for item in cluster_relocation_requests:
-                self.__relocate_cluster(item)
+        clusters = self.__agglomerate(clusters, self.__number_cluster)
 
         # Change cluster representation
-        self.__clusters = [cure_cluster_unit.indexes for cure_cluster_unit in self.__queue]
-        self.__representors = [cure_cluster_unit.rep for cure_cluster_unit in self.__queue]
-        self.__means = [cure_cluster_unit.mean for cure_cluster_unit in self.__queue]
+        self.__clusters = [ indexes for (indexes, _, _) in clusters ]
+        self.__representors = [ representors.tolist() for (_, _, representors) in clusters ]
+        self.__means = [ mean.tolist() for (_, mean, _) in clusters ]
 
 
     def get_clusters(self):
@@ -299,20 +485,18 @@ class cure:
     def __prepare_data_points(self, sample):
         """!
         @brief Prepare data points for clustering.
-        @details In case of numpy.array there are a lot of overloaded basic operators, such as __contains__, __eq__.
+        @details Points are processed as rows of two-dimensional array, array is not copied if it is already array of
+                  floating-point numbers.
 
-        @return (list) Returns sample in list format.
+        @return (numpy.ndarray) Returns sample as two-dimensional array.
 
         """
-        if isinstance(sample, numpy.ndarray):
-            return sample.tolist()
-
-        return sample
+        return numpy.asarray(sample, dtype=float)
 
 
     def __validate_arguments(self):
         """!
-        @brief Check input arguments of BANG algorithm and if one of them is not correct then appropriate exception
+        @brief Check input arguments of CURE algorithm and if one of them is not correct then appropriate exception
                 is thrown.
 
         """
@@ -329,205 +513,255 @@ class cure:
         if self.__number_represent_points <= 0:
             raise ValueError("Incorrect amount of representatives '%d'. Amount of representatives should be greater than 0." % self.__number_cluster)
 
+        if (self.__sample_size is not None) and (self.__sample_size < self.__number_cluster):
+            raise ValueError("Incorrect sample size '%d'. Sample size should not be less than amount of clusters." % self.__sample_size)
 
-    def __insert_cluster(self, cluster):
+        if self.__partitions <= 0:
+            raise ValueError("Incorrect amount of partitions '%d'. Amount of partitions should be greater than 0." % self.__partitions)
+
+        if self.__reduction < 1:
+            raise ValueError("Incorrect reduction '%f'. Reduction should not be less than 1." % self.__reduction)
+
+
+    def __create_clusters(self, indexes):
         """!
-        @brief Insert cluster to the list (sorted queue) in line with sequence order (distance).
-        
-        @param[in] cluster (cure_cluster): Cluster that should be inserted.
-        
+        @brief Creates clusters where each cluster contains only one point.
+
+        @param[in] indexes (numpy.ndarray): Indexes of points for which clusters should be created.
+
+        @return (list) Clusters where each cluster is represented by tuple (indexes of points, mean, representative points).
+
         """
-        
-        for index in range(len(self.__queue)):
-            if cluster.distance < self.__queue[index].distance:
-                self.__queue.insert(index, cluster)
-                return
-    
-        self.__queue.append(cluster)
 
+        return [ ([ index_point ], self.__pointer_data[index_point], self.__pointer_data[index_point:index_point + 1])
+                 for index_point in indexes.tolist() ]
 
-    def __relocate_cluster(self, cluster):
+
+    def __agglomerate(self, clusters, amount_clusters):
         """!
-        @brief Relocate cluster in list in line with distance order.
-        
-        @param[in] cluster (cure_cluster): Cluster that should be relocated in line with order.
-        
+        @brief Merges the closest clusters until required amount of clusters is reached.
+        @details Each cluster keeps its closest cluster, clusters are ordered by distance to the closest cluster in a
+                  priority queue where outdated records are skipped. Clusters with the same distance are ordered by time
+                  of insertion to the queue. Representative points are stored in the spatial index, therefore the
+                  closest cluster is found without comparison with each cluster.
+
+        @param[in] clusters (list): Initial clusters where each cluster is represented by tuple (indexes of points, mean, representative points).
+        @param[in] amount_clusters (uint): Amount of clusters that should be allocated.
+
+        @return (list) Allocated clusters in order of the queue, each cluster is represented as initial clusters.
+
         """
-        
-        self.__queue.remove(cluster)
-        self.__insert_cluster(cluster)
 
+        amount = len(clusters)
+
+        self.__indexes = [ indexes for (indexes, _, _) in clusters ]
+        self.__centers = numpy.array([ mean for (_, mean, _) in clusters ], dtype=float)
+        self.__representatives = [ representors for (_, _, representors) in clusters ]
+
+        self.__active = numpy.ones(amount, dtype=bool)
+        self.__closest = numpy.full(amount, -1, dtype=int)
+        self.__distances = numpy.full(amount, float('inf'))
+        self.__versions = numpy.zeros(amount, dtype=int)
+        self.__orders = numpy.zeros(amount, dtype=int)
+        self.__counter = 0
 
-    def __closest_cluster(self, cluster, distance):
+        owners = numpy.repeat(numpy.arange(amount), [ len(representors) for representors in self.__representatives ])
+        points = numpy.concatenate(self.__representatives)
+
+        self.__tree = cure_representor_index(points, owners, amount)
+
+        # set closest clusters: the nearest representative point of other clusters for each representative point
+        nearest_owners, nearest_distances = self.__tree.nearest(points, owners)
+        order = numpy.lexsort((nearest_owners, nearest_distances, owners))
+        first = order[numpy.concatenate(([True], owners[order][1:] != owners[order][:-1]))]
+
+        self.__closest[owners[first]] = nearest_owners[first]
+        self.__distances[owners[first]] = nearest_distances[first]
+
+        self.__queue = []
+        for index_cluster in numpy.lexsort((numpy.arange(amount), self.__distances)).tolist():
+            self.__push_cluster(index_cluster)
+
+        while amount > amount_clusters:
+            index_cluster1 = self.__pop_cluster()           # cluster that has nearest neighbor.
+            index_cluster2 = self.__closest[index_cluster1] # closest cluster.
+
+            self.__tree.remove(index_cluster1)
+            self.__tree.remove(index_cluster2)
+
+            self.__merge_clusters(index_cluster1, index_cluster2)
+            self.__tree.insert(self.__representatives[index_cluster1], index_cluster1)
+            amount -= 1
+
+            # Clusters whose closest cluster has been merged.
+            affected = self.__active & ((self.__closest == index_cluster1) | (self.__closest == index_cluster2))
+            affected[index_cluster1] = False
+            affected = numpy.flatnonzero(affected)
+            affected = affected[numpy.lexsort((self.__orders[affected], self.__distances[affected]))]
+
+            self.__closest[index_cluster1], self.__distances[index_cluster1] = self.__closest_cluster(index_cluster1)
+
+            for index_cluster in affected.tolist():
+                distance = self.__cluster_distance(index_cluster1, index_cluster)
+
+                # If previous distance was less then distance to new cluster then nearest cluster should be found
+                # in the tree, otherwise the new cluster is the closest.
+                if self.__distances[index_cluster] < distance:
+                    (index_closest, closest_distance) = self.__closest_cluster(index_cluster)
+                    if index_closest < 0:
+                        (index_closest, closest_distance) = (index_cluster1, distance)
+
+                else:
+                    (index_closest, closest_distance) = (index_cluster1, distance)
+
+                self.__closest[index_cluster] = index_closest
+                self.__distances[index_cluster] = closest_distance
+
+            # New cluster and updated clusters should relocated in queue
+            self.__push_cluster(index_cluster1)
+            for index_cluster in affected.tolist():
+                self.__push_cluster(index_cluster)
+
+        active = numpy.flatnonzero(self.__active)
+        active = active[numpy.lexsort((self.__orders[active], self.__distances[active]))]
+
+        return [ (self.__indexes[index_cluster], self.__centers[index_cluster], self.__representatives[index_cluster])
+                 for index_cluster in active.tolist() ]
+
+
+    def __push_cluster(self, index_cluster):
         """!
-        @brief Find closest cluster to the specified cluster in line with distance.
-        
-        @param[in] cluster (cure_cluster): Cluster for which nearest cluster should be found.
-        @param[in] distance (double): Closest distance to the previous cluster.
-        
-        @return (tuple) Pair (nearest CURE cluster, nearest distance) if the nearest cluster has been found, otherwise None is returned.
-        
+        @brief Inserts cluster to the queue in line with distance to its closest cluster, previous record of the cluster
+                becomes outdated.
+
+        @param[in] index_cluster (uint): Index of cluster that should be inserted.
+
         """
-        
-        nearest_cluster = None
-        nearest_distance = float('inf')
 
-        real_euclidean_distance = distance ** 0.5
+        self.__versions[index_cluster] += 1
+        self.__orders[index_cluster] = self.__counter
+        self.__counter += 1
 
-        for point in cluster.rep:
-            # Nearest nodes should be returned (at least it will return itself).
-            nearest_nodes = self.__tree.find_nearest_dist_nodes(point, real_euclidean_distance)
-            for (candidate_distance, kdtree_node) in nearest_nodes:
-                if (candidate_distance < nearest_distance) and (kdtree_node is not None) and (kdtree_node.payload is not cluster):
-                    nearest_distance = candidate_distance
-                    nearest_cluster = kdtree_node.payload
-                    
-        return (nearest_cluster, nearest_distance)
+        heapq.heappush(self.__queue, (self.__distances[index_cluster], self.__counter, index_cluster, self.__versions[index_cluster]))
 
 
-    def __insert_represented_points(self, cluster):
+    def __pop_cluster(self):
         """!
-        @brief Insert representation points to the k-d tree.
-        
-        @param[in] cluster (cure_cluster): Cluster whose representation points should be inserted.
-        
+        @brief Removes cluster that has the nearest closest cluster from the queue.
+
+        @return (uint) Index of the removed cluster.
+
         """
-        
-        for point in cluster.rep:
-            self.__tree.insert(point, cluster)
 
+        while True:
+            (_, _, index_cluster, version) = heapq.heappop(self.__queue)
+            if self.__active[index_cluster] and (self.__versions[index_cluster] == version):
+                return index_cluster
 
-    def __delete_represented_points(self, cluster): 
+
+    def __closest_cluster(self, index_cluster):
         """!
-        @brief Remove representation points of clusters from the k-d tree
-        
-        @param[in] cluster (cure_cluster): Cluster whose representation points should be removed.
-        
+        @brief Find closest cluster to the specified cluster using representative points in the tree.
+
+        @param[in] index_cluster (uint): Index of cluster for which nearest cluster should be found.
+
+        @return (tuple) Pair (index of nearest cluster, nearest square distance), index is -1 if there is no other cluster.
+
         """
-        
-        for point in cluster.rep:
-            self.__tree.remove(point, payload=cluster)
 
+        representors = self.__representatives[index_cluster]
+        nearest_owners, nearest_distances = self.__tree.nearest(representors, numpy.full(len(representors), index_cluster))
+
+        index_nearest = numpy.lexsort((nearest_owners, nearest_distances))[0]
+        return nearest_owners[index_nearest], nearest_distances[index_nearest]
 
-    def __merge_clusters(self, cluster1, cluster2):
+
+    def __merge_clusters(self, index_cluster1, index_cluster2):
         """!
-        @brief Merges two clusters and returns new merged cluster. Representation points and mean points are calculated for the new cluster.
-        
-        @param[in] cluster1 (cure_cluster): Cluster that should be merged.
-        @param[in] cluster2 (cure_cluster): Cluster that should be merged.
-        
-        @return (cure_cluster) New merged CURE cluster.
-        
+        @brief Merges the second cluster to the first cluster. Representation points and mean points are calculated for the merged cluster.
+
+        @param[in] index_cluster1 (uint): Index of cluster that becomes the merged cluster.
+        @param[in] index_cluster2 (uint): Index of cluster that should be merged, it is removed after merging.
+
         """
-        
-        merged_cluster = cure_cluster(None, None)
-        
-        merged_cluster.points = cluster1.points + cluster2.points
-        merged_cluster.indexes = cluster1.indexes + cluster2.indexes
-        
-        # merged_cluster.mean = ( len(cluster1.points) * cluster1.mean + len(cluster2.points) * cluster2.mean ) / ( len(cluster1.points) + len(cluster2.points) );
-        dimension = len(cluster1.mean)
-        merged_cluster.mean = [0] * dimension
-        if merged_cluster.points[1:] == merged_cluster.points[:-1]:
-            merged_cluster.mean = merged_cluster.points[0]
+
+        size1, size2 = len(self.__indexes[index_cluster1]), len(self.__indexes[index_cluster2])
+
+        indexes = self.__indexes[index_cluster1] + self.__indexes[index_cluster2]
+        points = self.__pointer_data[indexes]
+
+        if numpy.all(points == points[0]):
+            mean = points[0]
         else:
-            for index in range(dimension):
-                merged_cluster.mean[index] = ( len(cluster1.points) * cluster1.mean[index] + len(cluster2.points) * cluster2.mean[index] ) / ( len(cluster1.points) + len(cluster2.points) );
-        
-        temporary = list()
-        
-        for index in range(self.__number_represent_points):
-            maximal_distance = 0
-            maximal_point = None
-            
-            for point in merged_cluster.points:
-                minimal_distance = 0
-                if index == 0:
-                    minimal_distance = euclidean_distance_square(point, merged_cluster.mean)
-                    #minimal_distance = euclidean_distance_sqrt(point, merged_cluster.mean);
-                else:
-                    minimal_distance = min([euclidean_distance_square(point, p) for p in temporary])
-                    #minimal_distance = cluster_distance(cure_cluster(point), cure_cluster(temporary[0]));
-                    
-                if minimal_distance >= maximal_distance:
-                    maximal_distance = minimal_distance
-                    maximal_point = point
-        
-            if maximal_point not in temporary:
-                temporary.append(maximal_point)
-                
-        for point in temporary:
-            representative_point = [0] * dimension
-            for index in range(dimension):
-                representative_point[index] = point[index] + self.__compression * (merged_cluster.mean[index] - point[index])
-                
-            merged_cluster.rep.append(representative_point)
-        
-        return merged_cluster
+            mean = (size1 * self.__centers[index_cluster1] + size2 * self.__centers[index_cluster2]) / (size1 + size2)
 
+        # well scattered points: the farthest from the mean and then the farthest from already chosen points
+        scattered = []
+        distances = numpy.sum(numpy.square(points - mean), axis=1)
 
-    def __create_queue(self):
-        """!
-        @brief Create queue of sorted clusters by distance between them, where first cluster has the nearest neighbor. At the first iteration each cluster contains only one point.
-        
-        @param[in] data (list): Input data that is presented as list of points (objects), each point should be represented by list or tuple.
-        
-        @return (list) Create queue of sorted clusters by distance between them.
-        
-        """
-        
-        self.__queue = [cure_cluster(self.__pointer_data[index_point], index_point) for index_point in range(len(self.__pointer_data))]
-        
-        # set closest clusters
-        for i in range(0, len(self.__queue)):
-            minimal_distance = float('inf')
-            closest_index_cluster = -1
-            
-            for k in range(0, len(self.__queue)):
-                if i != k:
-                    dist = self.__cluster_distance(self.__queue[i], self.__queue[k])
-                    if dist < minimal_distance:
-                        minimal_distance = dist
-                        closest_index_cluster = k
-            
-            self.__queue[i].closest = self.__queue[closest_index_cluster]
-            self.__queue[i].distance = minimal_distance
-        
-        # sort clusters
-        self.__queue.sort(key = lambda x: x.distance, reverse = False)
-    
+        for _ in range(self.__number_represent_points):
+            index_point = len(distances) - 1 - numpy.argmax(distances[::-1])
+            if any(numpy.array_equal(points[index_point], point) for point in scattered):
+                break
+
+            scattered.append(points[index_point])
+
+            candidate_distances = numpy.sum(numpy.square(points - points[index_point]), axis=1)
+            distances = candidate_distances if len(scattered) == 1 else numpy.minimum(distances, candidate_distances)
+
+        scattered = numpy.array(scattered)
+
+        self.__indexes[index_cluster1] = indexes
+        self.__centers[index_cluster1] = mean
+        self.__representatives[index_cluster1] = scattered + self.__compression * (mean - scattered)
+
+        self.__active[index_cluster2] = False
+        self.__indexes[index_cluster2] = None
+        self.__representatives[index_cluster2] = None
 
-    def __create_kdtree(self):
+
+    def __cluster_distance(self, index_cluster1, index_cluster2):
         """!
-        @brief Create k-d tree in line with created clusters. At the first iteration contains all points from the input data set.
-        
-        @return (kdtree) k-d tree that consist of representative points of CURE clusters.
-        
+        @brief Calculate minimal distance between clusters using representative points.
+
+        @param[in] index_cluster1 (uint): Index of the first cluster.
+        @param[in] index_cluster2 (uint): Index of the second cluster.
+
+        @return (double) Square euclidean distance between two clusters that is defined by minimum distance between representation points of two clusters.
+
         """
-        
-        self.__tree = kdtree()
-        for current_cluster in self.__queue:
-            for representative_point in current_cluster.rep:
-                self.__tree.insert(representative_point, current_cluster)
 
+        representors1 = self.__representatives[index_cluster1]
+        representors2 = self.__representatives[index_cluster2]
+
+        return numpy.min(numpy.sum(numpy.square(representors1[:, numpy.newaxis, :] - representors2[numpy.newaxis, :, :]), axis=2))
 
-    def __cluster_distance(self, cluster1, cluster2):
+
+    def __assign_points(self):
         """!
-        @brief Calculate minimal distance between clusters using representative points.
-        
-        @param[in] cluster1 (cure_cluster): The first cluster.
-        @param[in] cluster2 (cure_cluster): The second cluster.
-        
-        @return (double) Euclidean distance between two clusters that is defined by minimum distance between representation points of two clusters.
-        
+        @brief Assigns each point to cluster with the nearest representative point when only sample has been clustered.
+        @details Points are processed by chunks, therefore memory-mapped arrays can be used as an input data. Means of
+                  clusters are recalculated using all assigned points.
+
         """
-        
-        distance = float('inf')
-        for i in range(0, len(cluster1.rep)):
-            for k in range(0, len(cluster2.rep)):
-                dist = euclidean_distance_square(cluster1.rep[i], cluster2.rep[k]);   # Fast mode
-                #dist = euclidean_distance(cluster1.rep[i], cluster2.rep[k])        # Slow mode
-                if dist < distance:
-                    distance = dist
-                    
-        return distance
+
+        representors = [ numpy.array(points, dtype=float) for points in self.__representors ]
+        owners = numpy.repeat(numpy.arange(len(representors)), [ len(points) for points in representors ])
+        tree = spatial.cKDTree(numpy.concatenate(representors))
+
+        labels = numpy.empty(len(self.__pointer_data), dtype=int)
+        sums = numpy.zeros((len(representors), self.__pointer_data.shape[1]))
+
+        for begin in range(0, len(self.__pointer_data), self.__ASSIGNMENT_CHUNK_SIZE):
+            chunk = self.__pointer_data[begin:begin + self.__ASSIGNMENT_CHUNK_SIZE]
+            _, nearest = tree.query(chunk)
+
+            labels[begin:begin + len(chunk)] = owners[nearest]
+            numpy.add.at(sums, owners[nearest], chunk)
+
+        sizes = numpy.bincount(labels, minlength=len(representors))
+        borders = numpy.cumsum(sizes)[:-1]
+
+        self.__clusters = [ cluster.tolist() for cluster in numpy.split(numpy.argsort(labels, kind='stable'), borders) ]
+        self.__means = [ (sums[index] / sizes[index]).tolist() if sizes[index] > 0 else self.__means[index]
+                         for index in range(len(representors)) ]
\ No newline at end of file
@@ -26,14 +26,11 @@
 
 
 import numpy
-import warnings
 
-try:
-    import matplotlib.pyplot as plt
-    import matplotlib.animation as animation
-except Exception as error_instance:
-    warnings.warn("Impossible to import matplotlib (please, install 'matplotlib'), pyclustering's visualization "
-                  "functionality is not available (details: '%s')." % str(error_instance))
+from pyclustering.utils.lazy_import import lazy_module
+
+plt = lazy_module('matplotlib.pyplot')
+animation = lazy_module('matplotlib.animation')
 
 import pyclustering.core.kmeans_wrapper as wrapper
 
@@ -349,7 +346,7 @@ class kmeans:
         @see center_initializer
         
         """
-        self.__pointer_data = numpy.array(data)
+        self.__pointer_data = numpy.asarray(data)
         self.__clusters = []
         self.__centers = numpy.array(initial_centers)
         self.__tolerance = tolerance
@@ -553,15 +550,7 @@ class kmeans:
         @brief Calculate distance from each point to each cluster center.
 
         """
-        dataset_differences = numpy.zeros((amount_clusters, len(self.__pointer_data)))
-        for index_center in range(amount_clusters):
-            if self.__metric.get_type() != type_metric.USER_DEFINED:
-                dataset_differences[index_center] = self.__metric(self.__pointer_data, self.__centers[index_center])
-            else:
-                dataset_differences[index_center] = [ self.__metric(point, self.__centers[index_center])
-                                                      for point in self.__pointer_data ]
-
-        return dataset_differences
+        return self.__metric.pairwise(self.__pointer_data, self.__centers[:amount_clusters]).T
 
 
     def __calculate_changes(self, updated_centers):
@@ -25,7 +25,7 @@
 """
 
 
-import math
+import numpy
 
 from pyclustering.cluster.encoder import type_encoding
 
@@ -43,6 +43,14 @@ class kmedians:
     @details The algorithm is less sensitive to outliers than K-Means. Medians are calculated instead of centroids.
     
              CCORE option can be used to use the pyclustering core - C/C++ shared library for processing that significantly increases performance.
+             
+             Weighted medians are calculated if weights of points are specified, for example, when stream of data is
+             summarized by representatives where weight of each representative is amount of points that it replaces:
+    @code
+        # representatives of chunks of the stream and amount of points that are represented by each of them
+        kmedians_instance = kmedians(representatives, initial_medians, weights=amounts);
+        kmedians_instance.process();
+    @endcode
     
     Example:
     @code
@@ -67,22 +75,39 @@ class kmedians:
         @param[in] initial_centers (list): Initial coordinates of medians of clusters that are represented by list: [center1, center2, ...].
         @param[in] tolerance (double): Stop condition: if maximum value of change of centers of clusters is less than tolerance than algorithm will stop processing
         @param[in] ccore (bool): Defines should be CCORE library (C++ pyclustering library) used instead of Python code or not.
-        @param[in] **kwargs: Arbitrary keyword arguments (available arguments: 'metric').
+        @param[in] **kwargs: Arbitrary keyword arguments (available arguments: 'metric', 'weights').
 
         <b>Keyword Args:</b><br>
             - metric (distance_metric): Metric that is used for distance calculation between two points.
+            - weights (array_like): Weight of each point that is used for calculation of weighted medians, it is not
+               supported by CCORE.
         
         """
-        self.__pointer_data = data
+        self.__pointer_data = numpy.asarray(data)
         self.__clusters = []
-        self.__medians = initial_centers[:]
+        self.__medians = numpy.array(initial_centers)
         self.__tolerance = tolerance
 
+        self.__weights = kwargs.get('weights', None)
+        if self.__weights is not None:
+            self.__weights = numpy.array(self.__weights, dtype=float)
+            if len(self.__weights) != len(self.__pointer_data):
+                raise ValueError("Amount of weights '%d' should be equal to amount of points '%d'." %
+                                 (len(self.__weights), len(self.__pointer_data)))
+
+            if numpy.any(self.__weights < 0.0):
+                raise ValueError("Weights of points should be non-negative.")
+
         self.__metric = kwargs.get('metric', distance_metric(type_metric.EUCLIDEAN_SQUARE))
         if self.__metric is None:
             self.__metric = distance_metric(type_metric.EUCLIDEAN_SQUARE)
 
-        self.__ccore = ccore and self.__metric.get_type() != type_metric.USER_DEFINED
+        if self.__metric.get_type() != type_metric.USER_DEFINED:
+            self.__metric.enable_numpy_usage()
+        else:
+            self.__metric.disable_numpy_usage()
+
+        self.__ccore = ccore and self.__metric.get_type() != type_metric.USER_DEFINED and self.__weights is None
         if self.__ccore:
             self.__ccore = ccore_library.workable()
 
@@ -115,7 +140,7 @@ class kmedians:
                 self.__clusters = self.__update_clusters()
                 updated_centers = self.__update_medians()
              
-                changes = max([self.__metric(self.__medians[index], updated_centers[index]) for index in range(len(updated_centers))])
+                changes = self.__calculate_changes(updated_centers)
                  
                 self.__medians = updated_centers
 
@@ -143,6 +168,9 @@ class kmedians:
         
         """
 
+        if isinstance(self.__medians, numpy.ndarray):
+            return self.__medians.tolist()
+
         return self.__medians
 
 
@@ -161,58 +189,83 @@ class kmedians:
 
     def __update_clusters(self):
         """!
-        @brief Calculate Manhattan distance to each point from the each cluster. 
+        @brief Calculate distance to each point from the each cluster. 
         @details Nearest points are captured by according clusters and as a result clusters are updated.
         
         @return (list) updated clusters as list of clusters where each cluster contains indexes of objects from data.
         
         """
         
-        clusters = [[] for i in range(len(self.__medians))]
-        for index_point in range(len(self.__pointer_data)):
-            index_optim = -1
-            dist_optim = 0.0
-             
-            for index in range(len(self.__medians)):
-                dist = self.__metric(self.__pointer_data[index_point], self.__medians[index])
-                 
-                if (dist < dist_optim) or (index is 0):
-                    index_optim = index
-                    dist_optim = dist
-             
-            clusters[index_optim].append(index_point)
-            
-        # If cluster is not able to capture object it should be removed
-        clusters = [cluster for cluster in clusters if len(cluster) > 0]
+        dataset_differences = self.__metric.pairwise(self.__pointer_data, self.__medians)
+        optimum_indexes = numpy.argmin(dataset_differences, axis=1)
         
-        return clusters
+        # Points are sorted by clusters to split them at once, clusters that have not captured objects are removed.
+        order = numpy.argsort(optimum_indexes, kind='stable')
+        borders = numpy.flatnonzero(numpy.diff(optimum_indexes[order])) + 1
+        
+        return [ cluster.tolist() for cluster in numpy.split(order, borders) if len(cluster) > 0 ]
     
     
     def __update_medians(self):
         """!
         @brief Calculate medians of clusters in line with contained objects.
         
-        @return (list) list of medians for current number of clusters.
+        @return (numpy.array) Medians for current number of clusters.
         
         """
-         
-        medians = [[] for i in range(len(self.__clusters))]
-         
+        
+        medians = numpy.zeros((len(self.__clusters), self.__pointer_data.shape[1]))
+        
         for index in range(len(self.__clusters)):
-            medians[index] = [ 0.0 for i in range(len(self.__pointer_data[0]))]
-            length_cluster = len(self.__clusters[index])
+            cluster_points = self.__pointer_data[self.__clusters[index]]
             
-            for index_dimension in range(len(self.__pointer_data[0])):
-                sorted_cluster = sorted(self.__clusters[index], key=lambda x: self.__pointer_data[x][index_dimension])
-                
-                relative_index_median = int(math.floor((length_cluster - 1) / 2))
-                index_median = sorted_cluster[relative_index_median]
-                
-                if (length_cluster % 2) == 0:
-                    index_median_second = sorted_cluster[relative_index_median + 1]
-                    medians[index][index_dimension] = (self.__pointer_data[index_median][index_dimension] + self.__pointer_data[index_median_second][index_dimension]) / 2.0
-                    
-                else:
-                    medians[index][index_dimension] = self.__pointer_data[index_median][index_dimension]
-             
+            if self.__weights is None:
+                medians[index] = numpy.median(cluster_points, axis=0)
+            else:
+                medians[index] = self.__calculate_weighted_median(cluster_points, self.__weights[self.__clusters[index]])
+        
         return medians
+    
+    
+    def __calculate_weighted_median(self, points, weights):
+        """!
+        @brief Calculates weighted median of points for each dimension.
+        @details If cumulative weight reaches exactly a half of total weight then average of two middle values is
+                  used, therefore in case of equal weights the result is equal to ordinary median.
+        
+        @param[in] points (numpy.array): Points of a cluster.
+        @param[in] weights (numpy.array): Weight of each point of a cluster.
+        
+        @return (numpy.array) Weighted median.
+        
+        """
+        
+        order = numpy.argsort(points, axis=0, kind='stable')
+        sorted_points = numpy.take_along_axis(points, order, axis=0)
+        cumulative_weights = numpy.cumsum(weights[order], axis=0)
+        
+        half_weight = cumulative_weights[-1] / 2.0
+        lower = numpy.argmax(cumulative_weights >= half_weight, axis=0)
+        upper = numpy.argmax(cumulative_weights > half_weight, axis=0)
+        
+        dimensions = numpy.arange(points.shape[1])
+        return (sorted_points[lower, dimensions] + sorted_points[upper, dimensions]) / 2.0
+    
+    
+    def __calculate_changes(self, updated_medians):
+        """!
+        @brief Calculates changes estimation between previous and current iteration using medians for that purpose.
+        
+        @param[in] updated_medians (numpy.array): New medians of clusters.
+        
+        @return (float) Maximum changes between medians.
+        
+        """
+        
+        if len(self.__medians) != len(updated_medians):
+            return float('inf')
+        
+        if self.__metric.get_type() != type_metric.USER_DEFINED:
+            return numpy.max(self.__metric(self.__medians, updated_medians))
+        
+        return max([ self.__metric(self.__medians[index], updated_medians[index]) for index in range(len(updated_medians)) ])
@@ -226,24 +226,18 @@ class kmedoids:
         
         """
         
-        clusters = [[self.__medoid_indexes[i]] for i in range(len(self.__medoid_indexes))]
-        for index_point in range(len(self.__pointer_data)):
-            if index_point in self.__medoid_indexes:
-                continue
-
-            index_optim = -1
-            dist_optim = float('Inf')
-            
-            for index in range(len(self.__medoid_indexes)):
-                dist = self.__distance_calculator(index_point, self.__medoid_indexes[index])
-                
-                if dist < dist_optim:
-                    index_optim = index
-                    dist_optim = dist
-            
-            clusters[index_optim].append(index_point)
-        
-        return clusters
+        if self.__data_type == 'points':
+            medoids = [self.__pointer_data[index] for index in self.__medoid_indexes]
+            dataset_differences = self.__metric.pairwise(self.__pointer_data, medoids)
+        else:
+            dataset_differences = numpy.asarray(self.__pointer_data)[:, self.__medoid_indexes]
+
+        # Medoids always belong to their own clusters, therefore they are excluded from assignment.
+        optimum_indexes = numpy.argmin(dataset_differences, axis=1)
+        optimum_indexes[self.__medoid_indexes] = -1
+
+        return [ [self.__medoid_indexes[index]] + numpy.flatnonzero(optimum_indexes == index).tolist()
+                 for index in range(len(self.__medoid_indexes)) ]
     
     
     def __update_medoids(self):
@@ -89,15 +89,9 @@ class silhouette:
                score calculation (by default Square Euclidean distance).
 
         """
-        self.__data = numpy.array(data)
+        self.__data = numpy.asarray(data)
         self.__clusters = clusters
         self.__metric = kwargs.get('metric', distance_metric(type_metric.EUCLIDEAN_SQUARE))
-
-        if self.__metric.get_type() != type_metric.USER_DEFINED:
-            self.__metric.enable_numpy_usage()
-        else:
-            self.__metric.disable_numpy_usage()
-
         self.__score = [0.0] * len(data)
 
 
@@ -108,9 +102,25 @@ class silhouette:
         @return (silhouette) Instance of the method (self).
 
         """
+        # Distances from each point to points of each cluster are summed up using membership matrix, points are
+        # processed by blocks to bound amount of memory for distance matrix.
+        membership = numpy.zeros((len(self.__data), len(self.__clusters)))
         for index_cluster in range(len(self.__clusters)):
-            for index_point in self.__clusters[index_cluster]:
-                self.__score[index_point] = self.__calculate_score(index_point, index_cluster)
+            membership[self.__clusters[index_cluster], index_cluster] = 1.0
+
+        point_clusters = [(index_point, index_cluster) for index_cluster in range(len(self.__clusters))
+                          for index_point in self.__clusters[index_cluster]]
+
+        block_size = max(1, 2 ** 20 // max(1, len(self.__data)))
+        for index_begin in range(0, len(point_clusters), block_size):
+            block = point_clusters[index_begin:index_begin + block_size]
+            block_points = [index_point for index_point, _ in block]
+
+            differences = self.__metric.pairwise(self.__data, self.__data[block_points]).T
+            cluster_differences = numpy.dot(differences, membership).tolist()
+
+            for (index_point, index_cluster), difference in zip(block, cluster_differences):
+                self.__score[index_point] = self.__calculate_score(index_cluster, difference)
 
         return self
 
@@ -125,18 +135,16 @@ class silhouette:
         return self.__score
 
 
-    def __calculate_score(self, index_point, index_cluster):
+    def __calculate_score(self, index_cluster, difference):
         """!
-        @brief Calculates Silhouette score for the specific object defined by index_point.
+        @brief Calculates Silhouette score for the specific object.
 
-        @param[in] index_point (uint): Index point from input data for which Silhouette score should be calculated.
         @param[in] index_cluster (uint): Index cluster to which the point belongs to.
+        @param[in] difference (list): Sum of distances from the object to objects of each cluster.
 
         @return (float) Silhouette score for the object.
 
         """
-        difference = self.__calculate_dataset_difference(index_point)
-
         a_score = self.__calculate_within_cluster_score(index_cluster, difference)
         b_score = self.__caclulate_optimal_neighbor_cluster_score(index_cluster, difference)
 
@@ -198,36 +206,15 @@ class silhouette:
 
     def __calculate_cluster_difference(self, index_cluster, difference):
         """!
-        @brief Calculates distance from each object in specified cluster to specified object.
+        @brief Returns sum of distances from specified object to objects of specified cluster.
 
-        @param[in] index_point (uint): Index point for which difference is calculated.
+        @param[in] index_cluster (uint): Index cluster for which sum of distances is required.
+        @param[in] difference (list): Sum of distances from the object to objects of each cluster.
 
-        @return (list) Distance from specified object to each object from input data in specified cluster.
+        @return (float) Sum of distances from specified object to objects of specified cluster.
 
         """
-        cluster_difference = 0.0
-        for index_point in self.__clusters[index_cluster]:
-            cluster_difference += difference[index_point]
-
-        return cluster_difference
-
-
-    def __calculate_dataset_difference(self, index_point):
-        """!
-        @brief Calculate distance from each object to specified object.
-
-        @param[in] index_point (uint): Index point for which difference with other points is calculated.
-
-        @return (list) Distance to each object from input data from the specified.
-
-        """
-
-        if self.__metric.get_type() != type_metric.USER_DEFINED:
-            dataset_differences = self.__metric(self.__data, self.__data[index_point])
-        else:
-            dataset_differences = [self.__metric(point, self.__data[index_point]) for point in self.__data]
-
-        return dataset_differences
+        return difference[index_cluster]
 
 
 
@@ -25,14 +25,11 @@
 """
 
 import math
-import warnings
 
-try:
-    import matplotlib.pyplot as plt
-    import matplotlib.animation as animation
-except Exception as error_instance:
-    warnings.warn("Impossible to import matplotlib (please, install 'matplotlib'), pyclustering's visualization "
-                  "functionality is not available (details: '%s')." % str(error_instance))
+from pyclustering.utils.lazy_import import lazy_module
+
+plt = lazy_module('matplotlib.pyplot', 'mpl_toolkits.mplot3d')
+animation = lazy_module('matplotlib.animation')
 
 from pyclustering.cluster.encoder import type_encoding
 from pyclustering.cluster import cluster_visualizer
@@ -199,7 +196,7 @@ class syncnet(sync_network):
         
         @param[in] sample (list): Input data that is presented as list of points (objects), each point should be represented by list or tuple.
         @param[in] radius (double): Connectivity radius between points, points should be connected if distance between them less then the radius.
-        @param[in] conn_repr (conn_represent): Internal representation of connection in the network: matrix or list. Ignored in case of usage of CCORE library.
+        @param[in] conn_repr (conn_represent): Internal representation of connection in the network: matrix, list or CSR. Ignored in case of usage of CCORE library.
         @param[in] initial_phases (initial_type): Type of initialization of initial phases of oscillators (random, uniformly distributed, etc.).
         @param[in] enable_conn_weight (bool): If True - enable mode when strength between oscillators depends on distance between two oscillators.
               If False - all connection between oscillators have the same strength that equals to 1 (True).
@@ -81,6 +81,56 @@ class bang_test_template:
         return bang_instance
 
 
+    @staticmethod
+    def clustering_linear_neighbor_search(sample, levels, density_threshold, ccore, **kwargs):
+        """
+        Compare clustering results with cluster allocation where neighbors are searched by direct check of each leaf.
+        """
+        amount_threshold = kwargs.get('amount_threshold', 0)
+
+        bang_instance = bang(sample, levels, ccore,
+                             density_threshold=density_threshold,
+                             amount_threshold=amount_threshold)
+
+        bang_instance.process()
+
+        leafs = bang_instance.get_directory().get_leafs()
+        unhandled_indexes = set([i for i in range(len(leafs)) if leafs[i].get_density() > density_threshold])
+        handled_indexes = set()
+
+        expected_clusters = []
+        for index_center in reversed(range(len(leafs))):
+            center = leafs[index_center]
+            if center.get_density() <= density_threshold:
+                break
+
+            if index_center in handled_indexes:
+                continue
+
+            if len(center) <= amount_threshold:
+                break
+
+            unhandled_indexes.remove(index_center)
+            handled_indexes.add(index_center)
+
+            cluster_blocks = [center]
+            for block in cluster_blocks:
+                neighbors = [i for i in sorted(unhandled_indexes) if block.is_neighbor(leafs[i])][:8]
+                for index_neighbor in neighbors:
+                    unhandled_indexes.remove(index_neighbor)
+                    handled_indexes.add(index_neighbor)
+                    cluster_blocks.append(leafs[index_neighbor])
+
+            cluster = set()
+            for block in cluster_blocks:
+                cluster.update(block.get_points())
+
+            expected_clusters.append(sorted(cluster))
+
+        obtained_clusters = [sorted(cluster) for cluster in bang_instance.get_clusters()]
+        assertion.eq(sorted(expected_clusters), sorted(obtained_clusters))
+
+
     @staticmethod
     def visualize(path, levels, threshold, ccore, **kwargs):
         sample = read_sample(path)
@@ -0,0 +1,127 @@
+"""!
+
+@brief Test templates for batch cluster analysis module.
+
+@authors Andrei Novikov (pyclustering@yandex.ru)
+@date 2014-2019
+@copyright GNU Public License
+
+@cond GNU_PUBLIC_LICENSE
+    PyClustering is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    
+    PyClustering is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+    
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+@endcond
+
+"""
+
+
+import numpy
+
+from pyclustering.cluster.batch import kmeans_batch, kmedoids_batch, dbscan_batch, xmeans_batch, batch_pack
+
+from pyclustering.cluster.dbscan import dbscan
+from pyclustering.cluster.kmeans import kmeans
+from pyclustering.cluster.kmedoids import kmedoids
+
+from pyclustering.tests.assertion import assertion
+
+from pyclustering.utils import read_sample
+
+
+class BatchTestTemplates:
+    @staticmethod
+    def get_datasets(sample_paths):
+        return [ read_sample(path) for path in sample_paths ]
+
+
+    @staticmethod
+    def get_partition(clusters):
+        return sorted(sorted(cluster) for cluster in clusters)
+
+
+    @staticmethod
+    def assertPartitions(instance, expected_clusters):
+        assertion.eq(len(expected_clusters), len(instance))
+        assertion.eq(instance.get_offsets()[-1], len(instance.get_labels()))
+
+        for index, clusters in enumerate(expected_clusters):
+            assertion.eq(BatchTestTemplates.get_partition(clusters),
+                             BatchTestTemplates.get_partition(instance.get_clusters(index)))
+
+
+    @staticmethod
+    def templateKMeans(sample_paths, amount_clusters, ccore):
+        datasets = BatchTestTemplates.get_datasets(sample_paths)
+        data, offsets = batch_pack(datasets)
+
+        initial_centers = [ numpy.asarray(dataset)[numpy.linspace(0, len(dataset) - 1, amount_clusters).astype(int)]
+                            for dataset in datasets ]
+        centers, center_offsets = batch_pack(initial_centers)
+
+        instance = kmeans_batch(data, offsets, centers, center_offsets, ccore=ccore).process()
+
+        expected = [ kmeans(dataset, centers.tolist(), ccore=False).process().get_clusters()
+                     for dataset, centers in zip(datasets, initial_centers) ]
+
+        BatchTestTemplates.assertPartitions(instance, expected)
+
+
+    @staticmethod
+    def templateKMedoids(sample_paths, amount_clusters, ccore):
+        datasets = BatchTestTemplates.get_datasets(sample_paths)
+        data, offsets = batch_pack(datasets)
+
+        initial_medoids = [ numpy.linspace(0, len(dataset) - 1, amount_clusters).astype(int).tolist() for dataset in datasets ]
+        medoid_offsets = numpy.arange(len(datasets) + 1) * amount_clusters
+
+        instance = kmedoids_batch(data, offsets, numpy.concatenate(initial_medoids), medoid_offsets, ccore=ccore).process()
+
+        expected = []
+        for dataset, medoids in zip(datasets, initial_medoids):
+            reference = kmedoids(dataset, medoids, ccore=False)
+            reference.process()
+            expected.append(reference.get_clusters())
+
+        BatchTestTemplates.assertPartitions(instance, expected)
+
+
+    @staticmethod
+    def templateDBSCAN(sample_paths, eps, neighbors, ccore):
+        datasets = BatchTestTemplates.get_datasets(sample_paths)
+        data, offsets = batch_pack(datasets)
+
+        instance = dbscan_batch(data, offsets, eps, neighbors, ccore=ccore).process()
+
+        expected = []
+        for index, dataset in enumerate(datasets):
+            reference = dbscan(dataset, eps, neighbors, ccore=False)
+            reference.process()
+            expected.append(reference.get_clusters())
+
+            labels = instance.get_labels()[offsets[index]:offsets[index + 1]]
+            assertion.eq(sorted(reference.get_noise()), numpy.flatnonzero(labels == -1).tolist())
+
+        BatchTestTemplates.assertPartitions(instance, expected)
+
+
+    @staticmethod
+    def templateXMeans(sample_paths, initial_centers, expected_amounts, kmax, ccore):
+        datasets = BatchTestTemplates.get_datasets(sample_paths)
+        data, offsets = batch_pack(datasets)
+        centers, center_offsets = batch_pack(initial_centers)
+
+        instance = xmeans_batch(data, offsets, centers, center_offsets, kmax, ccore=ccore).process()
+
+        for index, (dataset, expected_amount) in enumerate(zip(datasets, expected_amounts)):
+            clusters = instance.get_clusters(index)
+            assertion.eq(expected_amount, len(clusters))
+            assertion.eq(len(dataset), sum(len(cluster) for cluster in clusters))
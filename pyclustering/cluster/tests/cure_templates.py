@@ -49,8 +49,10 @@ class CureTestTemplates:
         numpy_usage = kwargs.get('numpy_usage', False)
         if numpy_usage is True:
             sample = numpy.array(sample)
+
+        parameters = { key: value for key, value in kwargs.items() if key != 'numpy_usage' }
          
-        cure_instance = cure(sample, number_cluster, number_represent_points, compression, ccore = ccore_flag)
+        cure_instance = cure(sample, number_cluster, number_represent_points, compression, ccore = ccore_flag, **parameters)
         cure_instance.process()
          
         clusters = cure_instance.get_clusters()
@@ -70,6 +72,9 @@ class CureTestTemplates:
         obtained_cluster_sizes.sort()
         assertion.eq(cluster_sizes, obtained_cluster_sizes)
 
+        for cluster, mean in zip(clusters, means):
+            assertion.eq(True, numpy.allclose(numpy.mean(numpy.array(sample)[cluster], axis=0), mean))
+
 
     @staticmethod
     def templateClusterAllocationOneDimensionData(ccore_flag):
@@ -103,14 +108,14 @@ class CureTestTemplates:
 
 
     @staticmethod
-    def exception(type, input_data, number_cluster, number_represent_points, compression, ccore_flag):
+    def exception(type, input_data, number_cluster, number_represent_points, compression, ccore_flag, **kwargs):
         try:
             if isinstance(input_data, str):
                 sample = read_sample(input_data)
             else:
                 sample = input_data
 
-            cure_instance = cure(sample, number_cluster, number_represent_points, compression, ccore=ccore_flag)
+            cure_instance = cure(sample, number_cluster, number_represent_points, compression, ccore=ccore_flag, **kwargs)
             cure_instance.process()
 
         except type:
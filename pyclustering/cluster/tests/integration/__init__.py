@@ -32,6 +32,7 @@ matplotlib.use('Agg')
 
 
 from pyclustering.cluster.tests.integration               import it_agglomerative as cluster_agglomerative_integration_tests
+from pyclustering.cluster.tests.integration               import it_batch         as cluster_batch_integration_tests
 from pyclustering.cluster.tests.integration               import it_bsas          as cluster_bsas_integration_tests
 from pyclustering.cluster.tests.integration               import it_clique        as cluster_clique_integration_tests
 from pyclustering.cluster.tests.integration               import it_cure          as cluster_cure_integration_tests
@@ -58,6 +59,7 @@ class clustering_integration_tests(suite_holder):
     @staticmethod
     def fill_suite(integration_cluster_suite):
         integration_cluster_suite.addTests(unittest.TestLoader().loadTestsFromModule(cluster_agglomerative_integration_tests))
+        integration_cluster_suite.addTests(unittest.TestLoader().loadTestsFromModule(cluster_batch_integration_tests))
         integration_cluster_suite.addTests(unittest.TestLoader().loadTestsFromModule(cluster_bsas_integration_tests))
         integration_cluster_suite.addTests(unittest.TestLoader().loadTestsFromModule(cluster_clique_integration_tests))
         integration_cluster_suite.addTests(unittest.TestLoader().loadTestsFromModule(cluster_cure_integration_tests))
@@ -0,0 +1,86 @@
+"""!
+
+@brief Integration-tests for batch cluster analysis module.
+
+@authors Andrei Novikov (pyclustering@yandex.ru)
+@date 2014-2019
+@copyright GNU Public License
+
+@cond GNU_PUBLIC_LICENSE
+    PyClustering is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    
+    PyClustering is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+    
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+@endcond
+
+"""
+
+
+import unittest
+import numpy
+
+# Generate images without having a window appear.
+import matplotlib
+matplotlib.use('Agg')
+
+from pyclustering.cluster.tests.batch_templates import BatchTestTemplates
+
+from pyclustering.cluster.batch import kmeans_batch, kmedoids_batch, batch_pack
+
+from pyclustering.samples.definitions import SIMPLE_SAMPLES
+
+from pyclustering.core.tests import remove_library
+
+
+class BatchIntegrationTest(unittest.TestCase):
+    def testKMeansBatchByCore(self):
+        BatchTestTemplates.templateKMeans([ SIMPLE_SAMPLES.SAMPLE_SIMPLE1, SIMPLE_SAMPLES.SAMPLE_SIMPLE2,
+                                            SIMPLE_SAMPLES.SAMPLE_SIMPLE3 ], 2, True)
+
+    def testKMeansBatchAmountClustersByCore(self):
+        data, offsets = batch_pack([ [[0.0], [0.1], [5.0], [5.1]], [[1.0]], [] ])
+        instance = kmeans_batch(data, offsets, 2, ccore=True).process()
+
+        self.assertEqual([[0, 1], [2, 3]], sorted(instance.get_clusters(0)))
+        self.assertEqual([[0]], instance.get_clusters(1))
+        self.assertEqual([], instance.get_clusters(2))
+
+    def testKMedoidsBatchByCore(self):
+        BatchTestTemplates.templateKMedoids([ SIMPLE_SAMPLES.SAMPLE_SIMPLE1, SIMPLE_SAMPLES.SAMPLE_SIMPLE2,
+                                              SIMPLE_SAMPLES.SAMPLE_SIMPLE3 ], 3, True)
+
+    def testKMedoidsBatchAmountClustersByCore(self):
+        data, offsets = batch_pack([ [[0.0], [0.1], [5.0], [5.1]], [[1.0], [1.1]] ])
+        instance = kmedoids_batch(data, offsets, 2, ccore=True).process()
+
+        self.assertEqual([[0, 1], [2, 3]], sorted(instance.get_clusters(0)))
+        self.assertEqual([[0], [1]], sorted(instance.get_clusters(1)))
+
+    def testDBSCANBatchByCore(self):
+        BatchTestTemplates.templateDBSCAN([ SIMPLE_SAMPLES.SAMPLE_SIMPLE1, SIMPLE_SAMPLES.SAMPLE_SIMPLE2,
+                                            SIMPLE_SAMPLES.SAMPLE_SIMPLE3 ], 0.7, 3, True)
+
+    def testXMeansBatchByCore(self):
+        BatchTestTemplates.templateXMeans([ SIMPLE_SAMPLES.SAMPLE_SIMPLE1, SIMPLE_SAMPLES.SAMPLE_SIMPLE3 ],
+                                          [ [[3.7, 5.5]], [[0.2, 0.1], [4.0, 1.0], [5.9, 5.9]] ], [2, 4], 20, True)
+
+    def testLargeBatchByCore(self):
+        datasets = [ numpy.concatenate([ numpy.random.normal(0.0, 0.1, (10, 2)), numpy.random.normal(5.0, 0.1, (10, 2)) ])
+                     for _ in range(200) ]
+        data, offsets = batch_pack(datasets)
+
+        instance = kmeans_batch(data, offsets, 2, ccore=True).process()
+        for index in range(len(instance)):
+            self.assertEqual([list(range(10)), list(range(10, 20))], sorted(instance.get_clusters(index)))
+
+    @remove_library
+    def testProcessingWhenLibraryCoreRemoved(self):
+        BatchTestTemplates.templateKMeans([ SIMPLE_SAMPLES.SAMPLE_SIMPLE1 ], 2, True)
@@ -92,6 +92,16 @@ class CureIntegrationTest(unittest.TestCase):
         CureTestTemplates.templateEncoderProcedures(True)
 
 
+    def testClusterAllocationSampleSimple3RandomSampleByCore(self):
+        CureTestTemplates.template_cluster_allocation(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, [10, 10, 10, 30], 4, 5, 0.5, True, sample_size=40)
+
+    def testClusterAllocationSampleSimple4RandomSampleByCore(self):
+        CureTestTemplates.template_cluster_allocation(SIMPLE_SAMPLES.SAMPLE_SIMPLE4, [15, 15, 15, 15, 15], 5, 5, 0.5, True, sample_size=40, numpy_usage=True)
+
+    def testClusterAllocationPartitionsWithCoreFlag(self):
+        CureTestTemplates.template_cluster_allocation(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, [10, 10, 10, 30], 4, 5, 0.5, True, partitions=2)
+
+
     def testCoreInterfaceIntInputData(self):
         cure_instance = cure([ [1], [2], [3], [20], [21], [22] ], 2, ccore = True)
         cure_instance.process()
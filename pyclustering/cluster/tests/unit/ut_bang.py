@@ -33,6 +33,8 @@ from pyclustering.cluster.tests.bang_templates import bang_test_template
 
 from pyclustering.samples.definitions import SIMPLE_SAMPLES
 
+from pyclustering.utils import read_sample
+
 
 class bang_unit_test(unittest.TestCase):
     def test_clustering_sample_simple_1(self):
@@ -112,6 +114,20 @@ class bang_unit_test(unittest.TestCase):
         bang_test_template.clustering(SIMPLE_SAMPLES.SAMPLE_SIMPLE13, 6, 0.0, [5, 5], 0, False)
         bang_test_template.clustering(SIMPLE_SAMPLES.SAMPLE_SIMPLE13, 1, 0.0, [10], 0, False)
 
+    def test_clustering_deep_directory(self):
+        bang_test_template.clustering(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, 25, 0.0, None, 0, False)
+        bang_test_template.clustering(SIMPLE_SAMPLES.SAMPLE_SIMPLE11, 25, 0.0, None, 0, False)
+        bang_test_template.clustering(SIMPLE_SAMPLES.SAMPLE_SIMPLE13, 25, 0.0, None, 0, False)
+
+        bang_test_template.clustering_linear_neighbor_search(read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE1), 25, 0.0, False)
+        bang_test_template.clustering_linear_neighbor_search(read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE11), 25, 0.0, False)
+        bang_test_template.clustering_linear_neighbor_search(read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE13), 25, 0.0, False)
+
+    def test_clustering_deep_directory_one_dimensional(self):
+        bang_test_template.clustering_linear_neighbor_search(read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE7), 60, 0.0, False)
+        bang_test_template.clustering_linear_neighbor_search(read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE9), 60, 0.0, False)
+        bang_test_template.clustering_linear_neighbor_search([[0.1 * i] for i in range(50)], 60, 0.0, False)
+
 
     def test_visualize_no_failure_one_dimensional(self):
         bang_test_template.visualize(SIMPLE_SAMPLES.SAMPLE_SIMPLE7, 4, 0.0, False)
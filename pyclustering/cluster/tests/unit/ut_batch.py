@@ -0,0 +1,118 @@
+"""!
+
+@brief Unit-tests for batch cluster analysis module.
+
+@authors Andrei Novikov (pyclustering@yandex.ru)
+@date 2014-2019
+@copyright GNU Public License
+
+@cond GNU_PUBLIC_LICENSE
+    PyClustering is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    
+    PyClustering is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+    
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+@endcond
+
+"""
+
+
+import unittest
+import numpy
+
+# Generate images without having a window appear.
+import matplotlib
+matplotlib.use('Agg')
+
+from pyclustering.cluster.tests.batch_templates import BatchTestTemplates
+
+from pyclustering.cluster.batch import batch_clustering, kmeans_batch, kmedoids_batch, dbscan_batch, xmeans_batch, batch_pack, batch_split
+
+from pyclustering.samples.definitions import SIMPLE_SAMPLES
+
+
+class BatchUnitTest(unittest.TestCase):
+    def testPackAndSplit(self):
+        data, offsets = batch_pack([ [[1.0, 2.0], [3.0, 4.0]], [], [[5.0, 6.0]] ])
+
+        self.assertEqual((3, 2), data.shape)
+        self.assertEqual([0, 2, 2, 3], offsets.tolist())
+
+        parts = batch_split(numpy.arange(3), offsets)
+        self.assertEqual([[0, 1], [], [2]], [ part.tolist() for part in parts ])
+
+
+    def testKMeansBatch(self):
+        BatchTestTemplates.templateKMeans([ SIMPLE_SAMPLES.SAMPLE_SIMPLE1, SIMPLE_SAMPLES.SAMPLE_SIMPLE2,
+                                            SIMPLE_SAMPLES.SAMPLE_SIMPLE3 ], 2, False)
+
+    def testKMeansBatchAmountClusters(self):
+        data, offsets = batch_pack([ [[0.0], [0.1], [5.0], [5.1]], [[1.0]], [] ])
+        instance = kmeans_batch(data, offsets, 2, ccore=False).process()
+
+        self.assertEqual([[0, 1], [2, 3]], sorted(instance.get_clusters(0)))
+        self.assertEqual([[0]], instance.get_clusters(1))
+        self.assertEqual([], instance.get_clusters(2))
+
+    def testKMedoidsBatch(self):
+        BatchTestTemplates.templateKMedoids([ SIMPLE_SAMPLES.SAMPLE_SIMPLE1, SIMPLE_SAMPLES.SAMPLE_SIMPLE2,
+                                              SIMPLE_SAMPLES.SAMPLE_SIMPLE3 ], 3, False)
+
+    def testKMedoidsBatchAmountClusters(self):
+        data, offsets = batch_pack([ [[0.0], [0.1], [5.0], [5.1]], [[1.0], [1.1]] ])
+        instance = kmedoids_batch(data, offsets, 2, ccore=False).process()
+
+        self.assertEqual([[0, 1], [2, 3]], sorted(instance.get_clusters(0)))
+        self.assertEqual([[0], [1]], sorted(instance.get_clusters(1)))
+
+    def testDBSCANBatch(self):
+        BatchTestTemplates.templateDBSCAN([ SIMPLE_SAMPLES.SAMPLE_SIMPLE1, SIMPLE_SAMPLES.SAMPLE_SIMPLE2,
+                                            SIMPLE_SAMPLES.SAMPLE_SIMPLE3 ], 0.7, 3, False)
+
+    def testXMeansBatch(self):
+        BatchTestTemplates.templateXMeans([ SIMPLE_SAMPLES.SAMPLE_SIMPLE1, SIMPLE_SAMPLES.SAMPLE_SIMPLE3 ],
+                                          [ [[3.7, 5.5]], [[0.2, 0.1], [4.0, 1.0], [5.9, 5.9]] ], [2, 4], 20, False)
+
+    def testEmptyBatch(self):
+        instance = dbscan_batch(numpy.empty((0, 2)), [0], 0.5, 2, ccore=False).process()
+
+        self.assertEqual(0, len(instance))
+        self.assertEqual(0, len(instance.get_labels()))
+
+    def testIncorrectOffsets(self):
+        data = [[0.0], [1.0], [2.0]]
+
+        self.assertRaises(ValueError, dbscan_batch, data, [], 0.5, 2)
+        self.assertRaises(ValueError, dbscan_batch, data, [1, 3], 0.5, 2)
+        self.assertRaises(ValueError, dbscan_batch, data, [0, 2], 0.5, 2)
+        self.assertRaises(ValueError, dbscan_batch, data, [0, 2, 1, 3], 0.5, 2)
+
+    def testIncorrectInitialCenters(self):
+        data, offsets = [[0.0], [1.0], [2.0]], [0, 1, 3]
+
+        self.assertRaises(ValueError, kmeans_batch, data, offsets, 0)
+        self.assertRaises(ValueError, kmeans_batch, data, offsets, [[0.0], [1.0]])
+        self.assertRaises(ValueError, kmeans_batch, data, offsets, [[0.0], [1.0]], [0, 1])
+        self.assertRaises(ValueError, xmeans_batch, data, offsets, [[0.0], [1.0]], [0, 2, 1])
+
+    def testIncompleteBatchClustering(self):
+        class incomplete_batch(batch_clustering):
+            def _process_dataset(self, index, data):
+                return [ list(range(len(data))) ]
+
+        self.assertRaises(TypeError, batch_clustering, [[0.0]], [0, 1], False)
+        self.assertRaises(TypeError, incomplete_batch, [[0.0]], [0, 1], False)
+
+    def testIncorrectInitialMedoids(self):
+        data, offsets = [[0.0], [1.0], [2.0]], [0, 1, 3]
+
+        self.assertRaises(ValueError, kmedoids_batch, data, offsets, [0, 1])
+        self.assertRaises(ValueError, kmedoids_batch, data, offsets, [1, 0], [0, 1, 2])
+        self.assertRaises(ValueError, kmedoids_batch, data, offsets, [0, 2], [0, 1, 2])
@@ -104,6 +104,12 @@ class BirchUnitTest(unittest.TestCase):
     def testClusterAllocationSampleSimple3VarianceIncreaseDistance(self):
         self.templateClusterAllocation(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, [10, 10, 10, 30], 4, type_measurement = measurement_type.VARIANCE_INCREASE_DISTANCE);
 
+    def testClusterAllocationSampleSimple3ManyFeatures(self):
+        self.templateClusterAllocation(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, [10, 10, 10, 30], 4, initial_diameter = 0.001, max_node_entries = 1, type_measurement = measurement_type.CENTROID_EUCLIDEAN_DISTANCE);
+
+    def testClusterAllocationSampleSimple3ManyFeaturesVarianceIncreaseDistance(self):
+        self.templateClusterAllocation(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, [10, 10, 10, 30], 4, initial_diameter = 0.001, max_node_entries = 1, type_measurement = measurement_type.VARIANCE_INCREASE_DISTANCE);
+
     def testClusterAllocationSampleSimple4(self):
         self.templateClusterAllocation(SIMPLE_SAMPLES.SAMPLE_SIMPLE4, [15, 15, 15, 15, 15], 5, max_node_entries = 2);
  
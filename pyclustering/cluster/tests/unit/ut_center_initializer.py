@@ -24,6 +24,8 @@
 """
 
 
+import numpy
+import random
 import unittest
 
 # Generate images without having a window appear.
@@ -35,6 +37,7 @@ from pyclustering.cluster.tests.kmedoids_templates import KmedoidsTestTemplates
 
 from pyclustering.cluster.center_initializer import random_center_initializer
 from pyclustering.cluster.center_initializer import kmeans_plusplus_initializer
+from pyclustering.cluster.center_initializer import kmeans_parallel_initializer
 
 from pyclustering.samples.definitions import SIMPLE_SAMPLES
 
@@ -225,6 +228,94 @@ class KmeansPlusPlusInitializerUnitTest(unittest.TestCase):
     def testInitializerForKmedoidsSampleSimple04(self):
         self.templateKmeansPlusPlusForKmedoidsClustering(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 5, [15, 15, 15, 15, 15])
 
+    def testWeightedInitializerIgnoresZeroWeights(self):
+        data = [[0.0], [1.0], [10.0], [11.0], [20.0]]
+        weights = [1.0, 0.0, 1.0, 0.0, 1.0]
+
+        for _ in range(10):
+            centers = kmeans_plusplus_initializer(data, 3, weights=weights).initialize(return_index=True)
+            self.assertEqual([0, 2, 4], sorted(centers))
+
+    def testWeightedInitializerIncorrectWeights(self):
+        self.assertRaises(AttributeError, kmeans_plusplus_initializer, [[0.0], [1.0]], 1, weights=[1.0])
+
+    def testInitializerDistinctCenters(self):
+        data = numpy.random.uniform(0.0, 1.0, (2000, 3))
+
+        for amount_candidates in [1, 3, kmeans_plusplus_initializer.FARTHEST_CENTER_CANDIDATE]:
+            centers = kmeans_plusplus_initializer(data, 100, amount_candidates).initialize(return_index=True)
+            self.assertEqual(100, len(set(centers)))
+
+
+class KmeansParallelInitializerUnitTest(unittest.TestCase):
+    def templateKmeansParallelInitializer(self, data, amount, **kwargs):
+        centers = kmeans_parallel_initializer(data, amount, **kwargs).initialize()
+        indexes = kmeans_parallel_initializer(data, amount, **kwargs).initialize(return_index=True)
+
+        self.assertEqual(amount, len(centers))
+        self.assertEqual(amount, len(indexes))
+
+        for center in centers:
+            self.assertEqual(len(data[0]), len(center))
+
+        for index in indexes:
+            self.assertTrue(0 <= index < len(data))
+
+    def test1DimensionDataOneCenter(self):
+        self.templateKmeansParallelInitializer([[0.0], [1.0], [2.0], [3.0]], 1)
+
+    def testGenerateFourCenters(self):
+        self.templateKmeansParallelInitializer(read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE3), 4)
+
+    def testGenerateAllPoints(self):
+        self.templateKmeansParallelInitializer([[0.0, 0.5], [1.0, 1.5], [2.0, 2.5], [3.0, 3.5]], 4)
+
+    def testGenerateCentersIdenticalData(self):
+        self.templateKmeansParallelInitializer([[1.2, 1.3]] * 10, 3)
+
+    def testGenerateCentersWithoutRounds(self):
+        self.templateKmeansParallelInitializer(read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE3), 4, rounds=0)
+
+    def testGenerateCentersSmallOversampling(self):
+        self.templateKmeansParallelInitializer(read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE3), 4, oversampling=0.1, rounds=1)
+
+    def testSeparatedClusters(self):
+        random.seed(1000)
+
+        data = [[float(100 * index + offset)] for index in range(5) for offset in range(10)]
+        for _ in range(10):
+            centers = kmeans_parallel_initializer(data, 5).initialize()
+            self.assertEqual(list(range(5)), sorted([int(center[0]) // 100 for center in centers]))
+
+    def testReproducibleWithSeed(self):
+        sample = read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE3)
+
+        random.seed(1000)
+        expected = kmeans_parallel_initializer(sample, 4, oversampling=2.0).initialize(return_index=True)
+
+        for _ in range(5):
+            numpy.random.random_sample(10)
+            random.seed(1000)
+            self.assertEqual(expected, kmeans_parallel_initializer(sample, 4, oversampling=2.0).initialize(return_index=True))
+
+    def testIncorrectArguments(self):
+        self.assertRaises(AttributeError, kmeans_parallel_initializer, [[0.0], [1.0]], 3)
+        self.assertRaises(AttributeError, kmeans_parallel_initializer, [[0.0], [1.0]], 1, oversampling=0.0)
+        self.assertRaises(AttributeError, kmeans_parallel_initializer, [[0.0], [1.0]], 1, rounds=-1)
+
+    def testInitializerForKmeansSampleSimple03(self):
+        sample = read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE3)
+        for _ in range(3):
+            try:
+                start_centers = kmeans_parallel_initializer(sample, 4).initialize()
+                KmeansTestTemplates.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, start_centers, [10, 10, 10, 30], False)
+            except AssertionError:
+                continue
+
+            return
+
+        self.fail("K-Means|| has not provided initial centers for correct clustering.")
+
 
 if __name__ == "__main__":
     unittest.main()
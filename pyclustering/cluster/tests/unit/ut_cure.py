@@ -109,6 +109,38 @@ class CureUnitTest(unittest.TestCase):
         CureTestTemplates.template_cluster_allocation(SIMPLE_SAMPLES.SAMPLE_SIMPLE12, [5, 10], 2, 5, 0.3)
 
 
+    def testClusterAllocationSampleSimple3Partitions(self):
+        CureTestTemplates.template_cluster_allocation(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, [10, 10, 10, 30], 4, partitions=3)
+
+    def testClusterAllocationSampleSimple4PartitionsReduction(self):
+        CureTestTemplates.template_cluster_allocation(SIMPLE_SAMPLES.SAMPLE_SIMPLE4, [15, 15, 15, 15, 15], 5, partitions=2, reduction=2)
+
+    def testClusterAllocationSampleTwoDiamondsPartitions(self):
+        CureTestTemplates.template_cluster_allocation(FCPS_SAMPLES.SAMPLE_TWO_DIAMONDS, [399, 401], 2, 5, 0.3, partitions=2)
+
+    def testClusterAllocationSampleLsunPartitions(self):
+        CureTestTemplates.template_cluster_allocation(FCPS_SAMPLES.SAMPLE_LSUN, [100, 101, 202], 3, 5, 0.3, partitions=2)
+
+    def testClusterAllocationSampleSimple3RandomSample(self):
+        CureTestTemplates.template_cluster_allocation(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, [10, 10, 10, 30], 4, sample_size=40)
+
+    def testClusterAllocationSampleSimple3RandomSampleNumPy(self):
+        CureTestTemplates.template_cluster_allocation(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, [10, 10, 10, 30], 4, sample_size=40, numpy_usage=True)
+
+    def testClusterAllocationSampleSimple4RandomSample(self):
+        CureTestTemplates.template_cluster_allocation(SIMPLE_SAMPLES.SAMPLE_SIMPLE4, [15, 15, 15, 15, 15], 5, sample_size=40)
+
+    def testClusterAllocationSampleSimple5RandomSamplePartitions(self):
+        CureTestTemplates.template_cluster_allocation(SIMPLE_SAMPLES.SAMPLE_SIMPLE5, [15, 15, 15, 15], 4, sample_size=40, partitions=2)
+
+    def testClusterAllocationPartitionsGreaterThanData(self):
+        CureTestTemplates.template_cluster_allocation([[1.0], [2.0], [10.0]], [1, 2], 2, partitions=5)
+        CureTestTemplates.template_cluster_allocation(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, [10, 10, 10, 30], 4, sample_size=40, partitions=50)
+
+    def testClusterAllocationSampleSizeGreaterThanData(self):
+        CureTestTemplates.template_cluster_allocation(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, [10, 10, 10, 30], 4, sample_size=100)
+
+
     def testEncoderProcedure(self):
         CureTestTemplates.templateEncoderProcedures(False)
 
@@ -129,6 +161,17 @@ class CureUnitTest(unittest.TestCase):
     def test_argument_empty_data(self):
         CureTestTemplates.exception(ValueError, [], 3, 5, 0.3, False)
 
+    def test_argument_invalid_sample_size(self):
+        CureTestTemplates.exception(ValueError, SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 4, 5, 0.3, False, sample_size=3)
+        CureTestTemplates.exception(ValueError, SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 4, 5, 0.3, False, sample_size=0)
+
+    def test_argument_invalid_partitions(self):
+        CureTestTemplates.exception(ValueError, SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 4, 5, 0.3, False, partitions=0)
+        CureTestTemplates.exception(ValueError, SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 4, 5, 0.3, False, partitions=-2)
+
+    def test_argument_invalid_reduction(self):
+        CureTestTemplates.exception(ValueError, SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 4, 5, 0.3, False, partitions=2, reduction=0.5)
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
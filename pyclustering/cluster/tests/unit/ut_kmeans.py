@@ -25,6 +25,7 @@
 
 
 import unittest
+import numpy
 
 # Generate images without having a window appear.
 import matplotlib
@@ -82,6 +83,19 @@ class KmeansUnitTest(unittest.TestCase):
         metric = distance_metric(type_metric.USER_DEFINED, func=lambda p1, p2: abs(p1[0] - p2[0]) + abs(p1[1] - p2[1]))
         KmeansTestTemplates.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, [[3.7, 5.5], [6.7, 7.5]], [5, 5], False, metric=metric)
 
+    def testClusterAllocationSampleSimple1WeightedMinkowski(self):
+        metric = distance_metric(type_metric.WEIGHTED_MINKOWSKI, degree=2, weights=[1.0, 2.0])
+        KmeansTestTemplates.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, [[3.7, 5.5], [6.7, 7.5]], [5, 5], False, metric=metric)
+
+    def testClusterAllocationSampleSimple1Mahalanobis(self):
+        metric = distance_metric(type_metric.MAHALANOBIS, matrix=[[1.0, 0.2], [0.2, 1.0]])
+        KmeansTestTemplates.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, [[3.7, 5.5], [6.7, 7.5]], [5, 5], False, metric=metric)
+
+    def testClusterAllocationSampleSimple1UserDefinedVectorized(self):
+        metric = distance_metric(type_metric.USER_DEFINED, func=lambda p1, p2: abs(p1[0] - p2[0]) + abs(p1[1] - p2[1]),
+                                 func_numpy=lambda points, point: numpy.sum(numpy.abs(points - point), axis=1))
+        KmeansTestTemplates.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, [[3.7, 5.5], [6.7, 7.5]], [5, 5], False, metric=metric)
+
     def testClusterAllocationSampleSimple1UserDefinedInfitityProcessing(self):
         metric = distance_metric(type_metric.USER_DEFINED, func=lambda p1, p2: p1[0] + p2[0] + 2)
         KmeansTestTemplates.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, [[3.7, 5.5], [6.7, 7.5]], [10], False, metric=metric)
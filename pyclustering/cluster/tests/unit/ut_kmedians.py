@@ -26,6 +26,7 @@
 
 import unittest
 import random
+import numpy
 
 # Generate images without having a window appear.
 import matplotlib
@@ -133,5 +134,49 @@ class KmediansUnitTest(unittest.TestCase):
         KmediansTestTemplates.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE10, initial_medians, None, False)
 
 
+    def testUnitWeightsEqualToUnweighted(self):
+        data = [[random.random(), random.random()] for _ in range(200)]
+        initial_medians = [[0.2, 0.2], [0.8, 0.8]]
+
+        expected = kmedians(data, initial_medians, ccore=False).process()
+        actual = kmedians(data, initial_medians, ccore=False, weights=[1.0] * len(data)).process()
+
+        self.assertEqual(expected.get_clusters(), actual.get_clusters())
+        numpy.testing.assert_array_almost_equal(expected.get_medians(), actual.get_medians())
+
+
+    def testWeightedMedians(self):
+        data = [[0.0], [1.0], [2.0], [10.0], [11.0], [12.0]]
+        weights = [1.0, 1.0, 5.0, 5.0, 1.0, 1.0]
+
+        medians = kmedians(data, [[0.0], [12.0]], ccore=False, weights=weights).process().get_medians()
+        self.assertEqual([[2.0], [10.0]], medians)
+
+
+    def testWeightedMediansDuplicatesAsWeights(self):
+        data = [[1.0, 1.0], [2.0, 2.0], [3.0, 5.0], [8.0, 8.0], [9.0, 7.0]]
+        weights = [3, 1, 2, 4, 1]
+        expanded = [point for point, weight in zip(data, weights) for _ in range(weight)]
+
+        expected = kmedians(expanded, [[1.0, 1.0], [9.0, 9.0]], ccore=False).process().get_medians()
+        actual = kmedians(data, [[1.0, 1.0], [9.0, 9.0]], ccore=False, weights=weights).process().get_medians()
+
+        numpy.testing.assert_array_almost_equal(expected, actual)
+
+
+    def testIncorrectWeights(self):
+        self.assertRaises(ValueError, kmedians, [[0.0], [1.0]], [[0.0]], weights=[1.0])
+        self.assertRaises(ValueError, kmedians, [[0.0], [1.0]], [[0.0]], weights=[1.0, -1.0])
+
+
+    def testUserDefinedMetricLargeData(self):
+        random.seed(1000)
+        data = [[random.gauss(center, 0.5), random.gauss(center, 0.5)] for center in [0, 5, 10] for _ in range(1000)]
+        metric = distance_metric(type_metric.USER_DEFINED, func=lambda p1, p2: abs(p1[0] - p2[0]) + abs(p1[1] - p2[1]))
+
+        instance = kmedians(data, [[1.0, 1.0], [4.0, 4.0], [9.0, 9.0]], ccore=False, metric=metric).process()
+        self.assertEqual([1000, 1000, 1000], sorted(len(cluster) for cluster in instance.get_clusters()))
+
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -24,6 +24,7 @@
 """
 
 import unittest
+import numpy
 
 from pyclustering.cluster.silhouette import silhouette, silhouette_ksearch, silhouette_ksearch_type
 
@@ -33,6 +34,7 @@ from pyclustering.samples.definitions import SIMPLE_SAMPLES, SIMPLE_ANSWERS
 from pyclustering.tests.assertion import assertion
 
 from pyclustering.utils import read_sample
+from pyclustering.utils.metric import distance_metric, type_metric
 
 
 class silhouette_unit_tests(unittest.TestCase):
@@ -71,6 +73,18 @@ class silhouette_unit_tests(unittest.TestCase):
     def test_correct_score_simple08(self):
         self.template_correct_scores(SIMPLE_SAMPLES.SAMPLE_SIMPLE8, SIMPLE_ANSWERS.ANSWER_SIMPLE8)
 
+    def test_correct_score_user_defined_vectorized(self):
+        sample = read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE3)
+        clusters = answer_reader(SIMPLE_ANSWERS.ANSWER_SIMPLE3).get_clusters()
+
+        metric = distance_metric(type_metric.USER_DEFINED, func=lambda p1, p2: abs(p1[0] - p2[0]) + abs(p1[1] - p2[1]),
+                                 func_numpy=lambda points, point: numpy.sum(numpy.abs(points - point), axis=1))
+
+        expected = silhouette(sample, clusters, metric=distance_metric(type_metric.MANHATTAN)).process().get_score()
+        actual = silhouette(sample, clusters, metric=metric).process().get_score()
+
+        numpy.testing.assert_array_almost_equal(expected, actual)
+
 
     def template_correct_ksearch(self, sample_path, answer_path, kmin, kmax, algorithm):
         attempts = 5
@@ -184,6 +184,18 @@ class XmeansUnitTest(unittest.TestCase):
     def testKmax05Amount01Offset01Initial04(self):
         XmeansTestTemplates.templateMaxAllocatedClusters(False, 1, 1000, 1, 4, 5)
 
+    def testBicClusterAllocationSampleSimple3OneWorker(self):
+        XmeansTestTemplates.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, [[0.2, 0.1], [4.0, 1.0], [5.9, 5.9]], [10, 10, 10, 30], splitting_type.BAYESIAN_INFORMATION_CRITERION, 20, False, workers=1)
+
+    def testMndlClusterAllocationSampleSimple3SeveralWorkers(self):
+        XmeansTestTemplates.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, [[0.2, 0.1], [4.0, 1.0], [2.0, 2.0], [2.3, 3.9]], [10, 10, 10, 30], splitting_type.MINIMUM_NOISELESS_DESCRIPTION_LENGTH, 20, False, workers=4)
+
+    def testBicWorkersConsistencyTwoDiamonds(self):
+        XmeansTestTemplates.templateWorkersConsistency(FCPS_SAMPLES.SAMPLE_TWO_DIAMONDS, splitting_type.BAYESIAN_INFORMATION_CRITERION, 20)
+
+    def testMndlWorkersConsistencyLsun(self):
+        XmeansTestTemplates.templateWorkersConsistency(FCPS_SAMPLES.SAMPLE_LSUN, splitting_type.MINIMUM_NOISELESS_DESCRIPTION_LENGTH, 20)
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -35,14 +35,14 @@ from pyclustering.tests.assertion import assertion
 
 class XmeansTestTemplates:
     @staticmethod
-    def templateLengthProcessData(input_sample, start_centers, expected_cluster_length, type_splitting, kmax, ccore):
+    def templateLengthProcessData(input_sample, start_centers, expected_cluster_length, type_splitting, kmax, ccore, **kwargs):
         if isinstance(input_sample, str):
             sample = read_sample(input_sample)
         else:
             sample = input_sample
         
         #clusters = xmeans(sample, start_centers, 20, ccore);
-        xmeans_instance = xmeans(sample, start_centers, kmax, 0.025, type_splitting, ccore)
+        xmeans_instance = xmeans(sample, start_centers, kmax, 0.025, type_splitting, ccore, **kwargs)
         xmeans_instance.process()
          
         clusters = xmeans_instance.get_clusters()
@@ -101,4 +101,20 @@ class XmeansTestTemplates:
 
         assertion.ge(kmax, len(clusters))
         assertion.ge(kmax, len(centers))
-        assertion.eq(len(clusters), len(centers))
\ No newline at end of file
+        assertion.eq(len(clusters), len(centers))
+
+
+    @staticmethod
+    def templateWorkersConsistency(input_sample, type_splitting, kmax):
+        sample = read_sample(input_sample)
+
+        results = []
+        for workers in [1, 4]:
+            random.seed(1000)
+
+            xmeans_instance = xmeans(sample, None, kmax, 0.025, type_splitting, False, workers=workers)
+            xmeans_instance.process()
+
+            results.append(sorted(sorted(cluster) for cluster in xmeans_instance.get_clusters()))
+
+        assertion.eq(results[0], results[1])
\ No newline at end of file
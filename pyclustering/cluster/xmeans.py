@@ -28,6 +28,7 @@
 import numpy
 import random
 
+from concurrent.futures import ThreadPoolExecutor
 from enum import IntEnum
 
 from math import log
@@ -40,8 +41,6 @@ from pyclustering.core.wrapper import ccore_library
 
 import pyclustering.core.xmeans_wrapper as wrapper
 
-from pyclustering.utils import euclidean_distance_square, euclidean_distance
-
 
 class splitting_type(IntEnum):
     """!
@@ -84,7 +83,9 @@ class xmeans:
              
              CCORE option can be used to use the pyclustering core - C/C++ shared library for processing that significantly increases performance.
              
-             CCORE implementation of the algorithm uses thread pool to parallelize the clustering process.
+             CCORE implementation of the algorithm uses thread pool to parallelize the clustering process. Python
+             implementation divides clusters concurrently using pool of threads, amount of threads can be specified
+             by keyword argument 'workers'.
     
     Here example how to perform cluster analysis using X-Means algorithm:
     @code
@@ -125,7 +126,7 @@ class xmeans:
     
     """
     
-    def __init__(self, data, initial_centers = None, kmax = 20, tolerance = 0.025, criterion = splitting_type.BAYESIAN_INFORMATION_CRITERION, ccore = True):
+    def __init__(self, data, initial_centers = None, kmax = 20, tolerance = 0.025, criterion = splitting_type.BAYESIAN_INFORMATION_CRITERION, ccore = True, **kwargs):
         """!
         @brief Constructor of clustering algorithm X-Means.
         
@@ -136,10 +137,15 @@ class xmeans:
         @param[in] tolerance (double): Stop condition for each iteration: if maximum value of change of centers of clusters is less than tolerance than algorithm will stop processing.
         @param[in] criterion (splitting_type): Type of splitting creation.
         @param[in] ccore (bool): Defines should be CCORE (C++ pyclustering library) used instead of Python code or not.
+        @param[in] **kwargs: Arbitrary keyword arguments (available arguments: 'workers').
+        
+        <b>Keyword Args:</b><br>
+            - workers (uint): Amount of threads that divide clusters in Python implementation, if it is not specified then it is defined by 'ThreadPoolExecutor'.
         
         """
         
         self.__pointer_data = data
+        self.__data = None
         self.__clusters = []
         
         if initial_centers is not None:
@@ -150,6 +156,7 @@ class xmeans:
         self.__kmax = kmax
         self.__tolerance = tolerance
         self.__criterion = criterion
+        self.__workers = kwargs.get('workers', None)
          
         self.__ccore = ccore
         if self.__ccore:
@@ -171,18 +178,21 @@ class xmeans:
             self.__clusters, self.__centers = wrapper.xmeans(self.__pointer_data, self.__centers, self.__kmax, self.__tolerance, self.__criterion)
 
         else:
+            self.__data = numpy.asarray(self.__pointer_data, dtype=float)
             self.__clusters = []
-            while len(self.__centers) <= self.__kmax:
-                current_cluster_number = len(self.__centers)
-                
-                self.__clusters, self.__centers = self.__improve_parameters(self.__centers)
-                allocated_centers = self.__improve_structure(self.__clusters, self.__centers)
-                
-                if current_cluster_number == len(allocated_centers):
-                #if ( (current_cluster_number == len(allocated_centers)) or (len(allocated_centers) > self.__kmax) ):
-                    break
-                else:
-                    self.__centers = allocated_centers
+
+            with ThreadPoolExecutor(max_workers=self.__workers) as executor:
+                while len(self.__centers) <= self.__kmax:
+                    current_cluster_number = len(self.__centers)
+                    
+                    self.__clusters, self.__centers = self.__improve_parameters(self.__centers)
+                    allocated_centers = self.__improve_structure(self.__clusters, self.__centers, executor)
+                    
+                    if current_cluster_number == len(allocated_centers):
+                    #if ( (current_cluster_number == len(allocated_centers)) or (len(allocated_centers) > self.__kmax) ):
+                        break
+                    else:
+                        self.__centers = allocated_centers
             
             self.__clusters, self.__centers = self.__improve_parameters(self.__centers)
 
@@ -228,69 +238,80 @@ class xmeans:
         return type_encoding.CLUSTER_INDEX_LIST_SEPARATION
 
 
-    def __improve_parameters(self, centers, available_indexes = None):
+    def __improve_parameters(self, centers):
         """!
-        @brief Performs k-means clustering in the specified region.
+        @brief Performs k-means clustering of the whole input data.
         
         @param[in] centers (list): Centers of clusters.
-        @param[in] available_indexes (list): Indexes that defines which points can be used for k-means clustering, if None - then all points are used.
         
-        @return (list) List of allocated clusters, each cluster contains indexes of objects in list of data.
+        @return (tuple) List of allocated clusters, each cluster contains indexes of objects in list of data, and centers of the clusters.
         
         """
 
-        if available_indexes and len(available_indexes) == 1:
-            index_center = available_indexes[0]
-            return [ available_indexes ], self.__pointer_data[index_center]
-
-        local_data = self.__pointer_data
-        if available_indexes:
-            local_data = [ self.__pointer_data[i] for i in available_indexes ]
+        kmeans_instance = kmeans(self.__data, centers, tolerance=self.__tolerance, ccore=False)
+        kmeans_instance.process()
 
-        local_centers = centers
-        if centers is None:
-            local_centers = kmeans_plusplus_initializer(local_data, 2, kmeans_plusplus_initializer.FARTHEST_CENTER_CANDIDATE).initialize()
+        return kmeans_instance.get_clusters(), kmeans_instance.get_centers()
 
-        kmeans_instance = kmeans(local_data, local_centers, tolerance=self.__tolerance, ccore=False)
-        kmeans_instance.process()
 
-        local_centers = kmeans_instance.get_centers()
+    def __split_cluster(self, data, initial_centers):
+        """!
+        @brief Divides cluster into two children using k-means clustering and calculates statistics of the children.
         
-        clusters = kmeans_instance.get_clusters()
-        if available_indexes:
-            clusters = self.__local_to_global_clusters(clusters, available_indexes)
+        @param[in] data (numpy.ndarray): Points of the cluster.
+        @param[in] initial_centers (list): Initial centers of the children, if None - then cluster cannot be divided.
+        
+        @return (tuple) Centers, sizes and errors (see '__calculate_errors()') of the children, or None if cluster cannot be divided.
         
-        return clusters, local_centers
+        """
 
+        if initial_centers is None:
+            return None
 
-    def __local_to_global_clusters(self, local_clusters, available_indexes):
-        """!
-        @brief Converts clusters in local region define by 'available_indexes' to global clusters.
+        kmeans_instance = kmeans(data, initial_centers, tolerance=self.__tolerance, ccore=False)
+        kmeans_instance.process()
 
-        @param[in] local_clusters (list): Local clusters in specific region.
-        @param[in] available_indexes (list): Map between local and global point's indexes.
+        clusters = kmeans_instance.get_clusters()
+        if len(clusters) < 2:
+            return None
 
-        @return Global clusters.
+        centers = kmeans_instance.get_centers()
+        sizes = numpy.array([ len(cluster) for cluster in clusters ])
+        errors = numpy.array([ numpy.sum(self.__calculate_errors(data[cluster], center)) for cluster, center in zip(clusters, centers) ])
 
-        """
+        return centers, sizes, errors
 
-        clusters = []
-        for local_cluster in local_clusters:
-            current_cluster = []
-            for index_point in local_cluster:
-                current_cluster.append(available_indexes[index_point])
 
-            clusters.append(current_cluster)
+    def __calculate_errors(self, points, centers):
+        """!
+        @brief Calculates errors between points and their centers that are used by splitting criterion: square euclidean
+                distance for bayesian information criterion and euclidean distance for minimum noiseless description length.
+        
+        @param[in] points (numpy.ndarray): Points for which errors should be calculated.
+        @param[in] centers (numpy.ndarray): Centers of the points (one center for all points or center for each point).
+        
+        @return (numpy.ndarray) Error of each point.
+        
+        """
+
+        errors = numpy.sum(numpy.square(points - centers), axis=1)
+        if self.__criterion == splitting_type.MINIMUM_NOISELESS_DESCRIPTION_LENGTH:
+            # euclidean_distance_square should be used in line with paper, but in this case results are
+            # very poor, therefore square root is used to improved.
+            errors = numpy.sqrt(errors)
 
-        return clusters
+        return errors
 
     
-    def __improve_structure(self, clusters, centers):
+    def __improve_structure(self, clusters, centers, executor):
         """!
         @brief Check for best structure: divides each cluster into two and checks for best results using splitting criterion.
+        @details Points of each cluster form contiguous block of reordered data, therefore each cluster is divided using
+                  view of its block, clusters are divided concurrently using executor.
         
         @param[in] clusters (list): Clusters that have been allocated (each cluster contains indexes of points from data).
         @param[in] centers (list): Centers of clusters.
+        @param[in] executor (ThreadPoolExecutor): Executor that is used to divide clusters.
         
         @return (list) Allocated centers for clustering.
         
@@ -299,15 +320,27 @@ class xmeans:
         allocated_centers = []
         amount_free_centers = self.__kmax - len(centers)
 
-        for index_cluster in range(len(clusters)):
-            # solve k-means problem for children where data of parent are used.
-            (parent_child_clusters, parent_child_centers) = self.__improve_parameters(None, clusters[index_cluster])
-              
+        sizes = numpy.array([ len(cluster) for cluster in clusters ])
+        borders = numpy.concatenate(([0], numpy.cumsum(sizes)))
+        labels = numpy.repeat(numpy.arange(len(clusters)), sizes)
+
+        data = self.__data[numpy.concatenate(clusters).astype(int)]
+        errors = numpy.bincount(labels, weights=self.__calculate_errors(data, numpy.asarray(centers)[labels]), minlength=len(clusters))
+
+        views = [ data[borders[index]:borders[index + 1]] for index in range(len(clusters)) ]
+
+        # initial centers are chosen sequentially to keep the same sequence of random numbers.
+        initial_centers = [ kmeans_plusplus_initializer(view, 2, kmeans_plusplus_initializer.FARTHEST_CENTER_CANDIDATE).initialize()
+                            if len(view) > 1 else None for view in views ]
+
+        for index_cluster, children in enumerate(executor.map(self.__split_cluster, views, initial_centers)):
             # If it's possible to split current data
-            if len(parent_child_clusters) > 1:
+            if children is not None:
+                (child_centers, child_sizes, child_errors) = children
+
                 # Calculate splitting criterion
-                parent_scores = self.__splitting_criterion([ clusters[index_cluster] ], [ centers[index_cluster] ])
-                child_scores = self.__splitting_criterion([ parent_child_clusters[0], parent_child_clusters[1] ], parent_child_centers)
+                parent_scores = self.__splitting_criterion(sizes[index_cluster:index_cluster + 1], errors[index_cluster:index_cluster + 1])
+                child_scores = self.__splitting_criterion(child_sizes, child_errors)
               
                 split_require = False
                 
@@ -321,8 +354,8 @@ class xmeans:
                     if parent_scores > child_scores: split_require = True;
                 
                 if (split_require is True) and (amount_free_centers > 0):
-                    allocated_centers.append(parent_child_centers[0])
-                    allocated_centers.append(parent_child_centers[1])
+                    allocated_centers.append(child_centers[0])
+                    allocated_centers.append(child_centers[1])
                     
                     amount_free_centers -= 1
                 else:
@@ -335,69 +368,57 @@ class xmeans:
         return allocated_centers
      
      
-    def __splitting_criterion(self, clusters, centers):
+    def __splitting_criterion(self, sizes, errors):
         """!
-        @brief Calculates splitting criterion for input clusters.
+        @brief Calculates splitting criterion for clusters that are described by their sizes and errors.
         
-        @param[in] clusters (list): Clusters for which splitting criterion should be calculated.
-        @param[in] centers (list): Centers of the clusters.
+        @param[in] sizes (numpy.ndarray): Amount of points in each cluster.
+        @param[in] errors (numpy.ndarray): Sum of errors of points of each cluster (see '__calculate_errors()').
         
         @return (double) Returns splitting criterion. High value of splitting cretion means that current structure is much better.
         
-        @see __bayesian_information_criterion(clusters, centers)
-        @see __minimum_noiseless_description_length(clusters, centers)
+        @see __bayesian_information_criterion(sizes, errors)
+        @see __minimum_noiseless_description_length(sizes, errors)
         
         """
         
         if self.__criterion == splitting_type.BAYESIAN_INFORMATION_CRITERION:
-            return self.__bayesian_information_criterion(clusters, centers)
+            return self.__bayesian_information_criterion(sizes, errors)
         
         elif self.__criterion == splitting_type.MINIMUM_NOISELESS_DESCRIPTION_LENGTH:
-            return self.__minimum_noiseless_description_length(clusters, centers)
+            return self.__minimum_noiseless_description_length(sizes, errors)
         
         else:
             assert 0;
 
 
-    def __minimum_noiseless_description_length(self, clusters, centers):
+    def __minimum_noiseless_description_length(self, sizes, errors):
         """!
         @brief Calculates splitting criterion for input clusters using minimum noiseless description length criterion.
         
-        @param[in] clusters (list): Clusters for which splitting criterion should be calculated.
-        @param[in] centers (list): Centers of the clusters.
+        @param[in] sizes (numpy.ndarray): Amount of points in each cluster.
+        @param[in] errors (numpy.ndarray): Sum of euclidean distances between points of each cluster and its center.
         
         @return (double) Returns splitting criterion in line with bayesian information criterion. 
                 Low value of splitting cretion means that current structure is much better.
         
-        @see __bayesian_information_criterion(clusters, centers)
+        @see __bayesian_information_criterion(sizes, errors)
         
         """
         
         scores = float('inf')
         
-        W = 0.0
-        K = len(clusters)
-        N = 0.0
+        K = len(sizes)
+        N = float(numpy.sum(sizes))
 
-        sigma_sqrt = 0.0
-        
         alpha = 0.9
         betta = 0.9
         
-        for index_cluster in range(0, len(clusters), 1):
-            Ni = len(clusters[index_cluster])
-            if Ni == 0:
-                return float('inf')
-            
-            Wi = 0.0
-            for index_object in clusters[index_cluster]:
-                # euclidean_distance_square should be used in line with paper, but in this case results are
-                # very poor, therefore square root is used to improved.
-                Wi += euclidean_distance(self.__pointer_data[index_object], centers[index_cluster])
-            
-            sigma_sqrt += Wi
-            W += Wi / Ni
-            N += Ni
+        if numpy.any(sizes == 0):
+            return float('inf')
+
+        W = float(numpy.sum(errors / sizes))
+        sigma_sqrt = float(numpy.sum(errors))
         
         if N - K > 0:
             sigma_sqrt /= (N - K)
@@ -411,36 +432,29 @@ class xmeans:
         return scores
 
 
-    def __bayesian_information_criterion(self, clusters, centers):
+    def __bayesian_information_criterion(self, sizes, errors):
         """!
         @brief Calculates splitting criterion for input clusters using bayesian information criterion.
         
-        @param[in] clusters (list): Clusters for which splitting criterion should be calculated.
-        @param[in] centers (list): Centers of the clusters.
+        @param[in] sizes (numpy.ndarray): Amount of points in each cluster.
+        @param[in] errors (numpy.ndarray): Sum of square euclidean distances between points of each cluster and its center.
         
         @return (double) Splitting criterion in line with bayesian information criterion.
                 High value of splitting criterion means that current structure is much better.
                 
-        @see __minimum_noiseless_description_length(clusters, centers)
+        @see __minimum_noiseless_description_length(sizes, errors)
         
         """
 
-        scores = [float('inf')] * len(clusters)     # splitting criterion
-        dimension = len(self.__pointer_data[0])
+        scores = float('inf')     # splitting criterion
+        dimension = self.__data.shape[1]
           
         # estimation of the noise variance in the data set
-        sigma_sqrt = 0.0
-        K = len(clusters)
-        N = 0.0
-          
-        for index_cluster in range(0, len(clusters), 1):
-            for index_object in clusters[index_cluster]:
-                sigma_sqrt += euclidean_distance_square(self.__pointer_data[index_object], centers[index_cluster]);
-
-            N += len(clusters[index_cluster])
+        K = len(sizes)
+        N = float(numpy.sum(sizes))
       
         if N - K > 0:
-            sigma_sqrt /= (N - K)
+            sigma_sqrt = float(numpy.sum(errors)) / (N - K)
             p = (K - 1) + dimension * K + 1
 
             # in case of the same points, sigma_sqrt can be zero (issue: #407)
@@ -450,13 +464,11 @@ class xmeans:
             else:
                 sigma_multiplier = dimension * 0.5 * log(sigma_sqrt)
             
-            # splitting criterion    
-            for index_cluster in range(0, len(clusters), 1):
-                n = len(clusters[index_cluster])
-
-                L = n * log(n) - n * log(N) - n * 0.5 * log(2.0 * numpy.pi) - n * sigma_multiplier - (n - K) * 0.5
-                
-                # BIC calculation
-                scores[index_cluster] = L - p * 0.5 * log(N)
+            # splitting criterion
+            n = sizes
+            L = n * numpy.log(n) - n * log(N) - n * 0.5 * log(2.0 * numpy.pi) - n * sigma_multiplier - (n - K) * 0.5
+            
+            # BIC calculation
+            scores = float(numpy.sum(L - p * 0.5 * log(N)))
                 
-        return sum(scores)
+        return scores
@@ -0,0 +1,87 @@
+"""!
+
+@brief CCORE Wrapper for batch processing of many datasets by K-Means, K-Medoids, DBSCAN and X-Means algorithms.
+
+@authors Andrei Novikov (pyclustering@yandex.ru)
+@date 2014-2019
+@copyright GNU Public License
+
+@cond GNU_PUBLIC_LICENSE
+    PyClustering is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    
+    PyClustering is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+    
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+@endcond
+
+"""
+
+import numpy
+
+from ctypes import c_double, c_size_t
+
+from pyclustering.core.wrapper import ccore_library
+from pyclustering.core.pyclustering_package import package_extractor, package_builder
+
+
+def __extract_labels(ccore, package):
+    labels = numpy.array(package_extractor(package).extract(), dtype=numpy.int64)
+    ccore.free_pyclustering_package(package)
+
+    return labels
+
+
+def kmeans_batch(data, offsets, centers, center_offsets, tolerance, metric_pointer):
+    pointer_data = package_builder(data.ravel(), c_double).create()
+    pointer_offsets = package_builder(offsets, c_size_t).create()
+    pointer_centers = package_builder(centers.ravel(), c_double).create()
+    pointer_center_offsets = package_builder(center_offsets, c_size_t).create()
+
+    ccore = ccore_library.get()
+    package = ccore.kmeans_batch_algorithm(pointer_data, data.shape[1], pointer_offsets, pointer_centers,
+                                           pointer_center_offsets, tolerance, metric_pointer)
+
+    return __extract_labels(ccore, package)
+
+
+def kmedoids_batch(data, offsets, medoids, medoid_offsets, tolerance, metric_pointer):
+    pointer_data = package_builder(data.ravel(), c_double).create()
+    pointer_offsets = package_builder(offsets, c_size_t).create()
+    pointer_medoids = package_builder(medoids, c_size_t).create()
+    pointer_medoid_offsets = package_builder(medoid_offsets, c_size_t).create()
+
+    ccore = ccore_library.get()
+    package = ccore.kmedoids_batch_algorithm(pointer_data, data.shape[1], pointer_offsets, pointer_medoids,
+                                             pointer_medoid_offsets, tolerance, metric_pointer)
+
+    return __extract_labels(ccore, package)
+
+
+def dbscan_batch(data, offsets, eps, neighbors):
+    pointer_data = package_builder(data.ravel(), c_double).create()
+    pointer_offsets = package_builder(offsets, c_size_t).create()
+
+    ccore = ccore_library.get()
+    package = ccore.dbscan_batch_algorithm(pointer_data, data.shape[1], pointer_offsets, eps, neighbors)
+
+    return __extract_labels(ccore, package)
+
+
+def xmeans_batch(data, offsets, centers, center_offsets, kmax, tolerance, criterion):
+    pointer_data = package_builder(data.ravel(), c_double).create()
+    pointer_offsets = package_builder(offsets, c_size_t).create()
+    pointer_centers = package_builder(centers.ravel(), c_double).create()
+    pointer_center_offsets = package_builder(center_offsets, c_size_t).create()
+
+    ccore = ccore_library.get()
+    package = ccore.xmeans_batch_algorithm(pointer_data, data.shape[1], pointer_offsets, pointer_centers,
+                                           pointer_center_offsets, kmax, tolerance, criterion)
+
+    return __extract_labels(ccore, package)
@@ -23,10 +23,10 @@
 
 """
 
-from ctypes import c_double, c_size_t, POINTER
+from ctypes import c_double
 
 from pyclustering.core.wrapper import ccore_library
-from pyclustering.core.pyclustering_package import pyclustering_package, package_builder, package_extractor
+from pyclustering.core.pyclustering_package import package_builder, package_extractor
 
 
 class clique_package_indexer:
@@ -43,8 +43,7 @@ def clique(sample, intervals, threshold):
 
     ccore = ccore_library.get()
 
-    ccore.clique_algorithm.restype = POINTER(pyclustering_package)
-    package = ccore.clique_algorithm(pointer_data, c_size_t(intervals), c_size_t(threshold))
+    package = ccore.clique_algorithm(pointer_data, intervals, threshold)
 
     results = package_extractor(package).extract()
     ccore.free_pyclustering_package(package)
@@ -23,11 +23,11 @@
 
 """
 
-from ctypes import c_double, c_size_t, POINTER
+from ctypes import c_double
 
 from pyclustering.core.converter import convert_data_type
 from pyclustering.core.wrapper import ccore_library
-from pyclustering.core.pyclustering_package import pyclustering_package, package_extractor, package_builder
+from pyclustering.core.pyclustering_package import package_extractor, package_builder
 
 
 def dbscan(sample, eps, min_neighbors, data_type):
@@ -36,8 +36,7 @@ def dbscan(sample, eps, min_neighbors, data_type):
     
     ccore = ccore_library.get()
     
-    ccore.dbscan_algorithm.restype = POINTER(pyclustering_package)
-    package = ccore.dbscan_algorithm(pointer_data, c_double(eps), c_size_t(min_neighbors), c_data_type)
+    package = ccore.dbscan_algorithm(pointer_data, eps, min_neighbors, c_data_type)
 
     list_of_clusters = package_extractor(package).extract()
     ccore.free_pyclustering_package(package)
@@ -24,7 +24,7 @@
 """
 
 from pyclustering.core.wrapper import *;
-from pyclustering.core.pyclustering_package import pyclustering_package, package_extractor, package_builder;
+from pyclustering.core.pyclustering_package import package_extractor, package_builder;
 
 
 class c_hhn_params(Structure):
@@ -82,8 +82,7 @@ def hhn_create(size, params):
 
     ccore = ccore_library.get();
 
-    ccore.hhn_create.restype = POINTER(c_void_p);
-    hhn_network_pointer = ccore.hhn_create(c_size_t(size), pointer(c_params));
+    hhn_network_pointer = ccore.hhn_create(size, pointer(c_params));
     return hhn_network_pointer;
 
 
@@ -95,11 +94,10 @@ def hhn_destroy(hhn_network_pointer):
 def hhn_dynamic_create(collect_membrane, collect_active_cond_sodium, collect_inactive_cond_sodium, collect_active_cond_potassium):
     ccore = ccore_library.get();
 
-    ccore.hhn_dynamic_create.restype = POINTER(c_void_p);
-    hhn_dynamic_pointer = ccore.hhn_dynamic_create(c_bool(collect_membrane),
-                                                   c_bool(collect_active_cond_sodium),
-                                                   c_bool(collect_inactive_cond_sodium),
-                                                   c_bool(collect_active_cond_potassium));
+    hhn_dynamic_pointer = ccore.hhn_dynamic_create(collect_membrane,
+                                                   collect_active_cond_sodium,
+                                                   collect_inactive_cond_sodium,
+                                                   collect_active_cond_potassium);
     return hhn_dynamic_pointer;
 
 
@@ -113,9 +111,9 @@ def hhn_simulate(hhn_network_pointer, steps, time, solution, stimulus, ccore_hhn
 
     c_stimulus = package_builder(stimulus, c_double).create();
     ccore.hhn_simulate(hhn_network_pointer,
-                       c_size_t(steps),
-                       c_double(time),
-                       c_size_t(solution),
+                       steps,
+                       time,
+                       solution,
                        c_stimulus,
                        ccore_hhn_dynamic_pointer);
 
@@ -123,8 +121,7 @@ def hhn_simulate(hhn_network_pointer, steps, time, solution, stimulus, ccore_hhn
 def hhn_dynamic_get_peripheral_evolution(ccore_hhn_dynamic_pointer, index_collection):
     ccore = ccore_library.get();
 
-    ccore.hhn_dynamic_get_peripheral_evolution.restype = POINTER(pyclustering_package);
-    dynamic_package = ccore.hhn_dynamic_get_peripheral_evolution(ccore_hhn_dynamic_pointer, c_size_t(index_collection));
+    dynamic_package = ccore.hhn_dynamic_get_peripheral_evolution(ccore_hhn_dynamic_pointer, index_collection);
 
     result = package_extractor(dynamic_package).extract();
     ccore.free_pyclustering_package(dynamic_package);
@@ -135,8 +132,7 @@ def hhn_dynamic_get_peripheral_evolution(ccore_hhn_dynamic_pointer, index_collec
 def hhn_dynamic_get_central_evolution(ccore_hhn_dynamic_pointer, index_collection):
     ccore = ccore_library.get();
 
-    ccore.hhn_dynamic_get_central_evolution.restype = POINTER(pyclustering_package);
-    dynamic_package = ccore.hhn_dynamic_get_central_evolution(ccore_hhn_dynamic_pointer, c_size_t(index_collection));
+    dynamic_package = ccore.hhn_dynamic_get_central_evolution(ccore_hhn_dynamic_pointer, index_collection);
 
     result = package_extractor(dynamic_package).extract();
     ccore.free_pyclustering_package(dynamic_package);
@@ -147,7 +143,6 @@ def hhn_dynamic_get_central_evolution(ccore_hhn_dynamic_pointer, index_collectio
 def hhn_dynamic_get_time(ccore_hhn_dynamic_pointer):
     ccore = ccore_library.get();
 
-    ccore.hhn_dynamic_get_time.restype = POINTER(pyclustering_package);
     dynamic_package = ccore.hhn_dynamic_get_time(ccore_hhn_dynamic_pointer);
 
     result = package_extractor(dynamic_package).extract();
@@ -160,7 +155,7 @@ def hhn_dynamic_write(ccore_hhn_dynamic_pointer, filename):
     ccore = ccore_library.get();
 
     byte_filename = filename.encode('utf-8');
-    ccore.hhn_dynamic_write(ccore_hhn_dynamic_pointer, c_char_p(byte_filename));
+    ccore.hhn_dynamic_write(ccore_hhn_dynamic_pointer, byte_filename);
 
 
 def hhn_dynamic_read(filename):
@@ -168,7 +163,6 @@ def hhn_dynamic_read(filename):
 
     byte_filename = filename.encode('utf-8');
 
-    ccore.hhn_dynamic_read.restype = POINTER(c_void_p);
     hhn_dynamic_pointer = ccore.hhn_dynamic_read(byte_filename);
 
     return hhn_dynamic_pointer;
\ No newline at end of file
@@ -24,10 +24,10 @@
 """
 
 
-from ctypes import c_double, c_bool, POINTER
+from ctypes import c_double
 
 from pyclustering.core.wrapper import ccore_library
-from pyclustering.core.pyclustering_package import pyclustering_package, package_extractor, package_builder
+from pyclustering.core.pyclustering_package import package_extractor, package_builder
 
 
 def kmeans(sample, centers, tolerance, observe, metric_pointer):
@@ -36,8 +36,7 @@ def kmeans(sample, centers, tolerance, observe, metric_pointer):
     
     ccore = ccore_library.get()
     
-    ccore.kmeans_algorithm.restype = POINTER(pyclustering_package)
-    package = ccore.kmeans_algorithm(pointer_data, pointer_centers, c_double(tolerance), c_bool(observe), metric_pointer)
+    package = ccore.kmeans_algorithm(pointer_data, pointer_centers, tolerance, observe, metric_pointer)
     
     result = package_extractor(package).extract()
     ccore.free_pyclustering_package(package)
@@ -24,10 +24,10 @@
 """
 
 
-from ctypes import c_double, POINTER
+from ctypes import c_double
 
 from pyclustering.core.wrapper import ccore_library
-from pyclustering.core.pyclustering_package import pyclustering_package, package_extractor, package_builder
+from pyclustering.core.pyclustering_package import package_extractor, package_builder
 
 
 def kmedians(sample, centers, tolerance, metric_pointer):
@@ -36,8 +36,7 @@ def kmedians(sample, centers, tolerance, metric_pointer):
     
     ccore = ccore_library.get()
     
-    ccore.kmedians_algorithm.restype = POINTER(pyclustering_package)
-    package = ccore.kmedians_algorithm(pointer_data, pointer_centers, c_double(tolerance), metric_pointer)
+    package = ccore.kmedians_algorithm(pointer_data, pointer_centers, tolerance, metric_pointer)
     
     result = package_extractor(package).extract()
     ccore.free_pyclustering_package(package)
@@ -24,11 +24,11 @@
 """
 
 
-from ctypes import c_double, c_size_t, POINTER
+from ctypes import c_double, c_size_t
 
 from pyclustering.core.wrapper import ccore_library
 from pyclustering.core.converter import convert_data_type
-from pyclustering.core.pyclustering_package import pyclustering_package, package_extractor, package_builder
+from pyclustering.core.pyclustering_package import package_extractor, package_builder
 
 
 def kmedoids(sample, medoids, tolerance, metric_pointer, data_type):
@@ -38,8 +38,7 @@ def kmedoids(sample, medoids, tolerance, metric_pointer, data_type):
     
     ccore = ccore_library.get()
     
-    ccore.kmedoids_algorithm.restype = POINTER(pyclustering_package)
-    package = ccore.kmedoids_algorithm(pointer_data, medoids_package, c_double(tolerance), metric_pointer, c_data_type)
+    package = ccore.kmedoids_algorithm(pointer_data, medoids_package, tolerance, metric_pointer, c_data_type)
     
     result = package_extractor(package).extract()
     ccore.free_pyclustering_package(package)
@@ -24,7 +24,7 @@
 """
 
 from pyclustering.core.wrapper import *;
-from pyclustering.core.pyclustering_package import pyclustering_package, package_extractor, package_builder;
+from pyclustering.core.pyclustering_package import package_extractor, package_builder;
 
 
 class c_legion_parameters(Structure):
@@ -72,8 +72,7 @@ def legion_create(size, conn_type, params):
     c_params.I = params.I;
     c_params.ENABLE_POTENTIONAL = params.ENABLE_POTENTIONAL;
     
-    ccore.legion_create.restype = POINTER(c_void_p);
-    legion_network_pointer = ccore.legion_create(c_uint(size), c_uint(conn_type), pointer(c_params));
+    legion_network_pointer = ccore.legion_create(size, conn_type, pointer(c_params));
     
     return legion_network_pointer;
 
@@ -88,13 +87,11 @@ def legion_simulate(legion_network_pointer, steps, time, solver, collect_dynamic
     
     c_stimulus = package_builder(stimulus, c_double).create();
     
-    ccore.legion_simulate.restype = POINTER(c_void_p);
-    return ccore.legion_simulate(legion_network_pointer, c_uint(steps), c_double(time), c_uint(solver), c_uint(collect_dynamic), c_stimulus);
+    return ccore.legion_simulate(legion_network_pointer, steps, time, solver, collect_dynamic, c_stimulus);
 
 
 def legion_get_size(legion_network_pointer):
     ccore = ccore_library.get();
-    ccore.legion_get_size.restype = c_size_t;
     return ccore.legion_get_size(legion_network_pointer);
 
 
@@ -106,7 +103,6 @@ def legion_dynamic_destroy(legion_dynamic_pointer):
 def legion_dynamic_get_output(legion_dynamic_pointer):
     ccore = ccore_library.get();
     
-    ccore.legion_dynamic_get_output.restype = POINTER(pyclustering_package);
     package = ccore.legion_dynamic_get_output(legion_dynamic_pointer);
     
     result = package_extractor(package).extract();
@@ -118,7 +114,6 @@ def legion_dynamic_get_output(legion_dynamic_pointer):
 def legion_dynamic_get_inhibitory_output(legion_dynamic_pointer):
     ccore = ccore_library.get();
     
-    ccore.legion_dynamic_get_inhibitory_output.restype = POINTER(pyclustering_package);
     package = ccore.legion_dynamic_get_inhibitory_output(legion_dynamic_pointer);
     
     result = package_extractor(package).extract();
@@ -130,7 +125,6 @@ def legion_dynamic_get_inhibitory_output(legion_dynamic_pointer):
 def legion_dynamic_get_time(legion_dynamic_pointer):
     ccore = ccore_library.get();
     
-    ccore.legion_dynamic_get_time.restype = POINTER(pyclustering_package);
     package = ccore.legion_dynamic_get_time(legion_dynamic_pointer);
     
     result = package_extractor(package).extract();
@@ -141,6 +135,5 @@ def legion_dynamic_get_time(legion_dynamic_pointer):
 
 def legion_dynamic_get_size(legion_dynamic_pointer):
     ccore = ccore_library.get();
-    ccore.legion_dynamic_get_size.restype = c_size_t;
     return ccore.legion_dynamic_get_size(legion_dynamic_pointer);
     
\ No newline at end of file
@@ -24,10 +24,10 @@
 """
 
 
-from ctypes import c_double, c_size_t, POINTER;
+from ctypes import c_double;
 
 from pyclustering.core.wrapper import ccore_library;
-from pyclustering.core.pyclustering_package import pyclustering_package, package_extractor, package_builder;
+from pyclustering.core.pyclustering_package import package_extractor, package_builder;
 
 
 def mbsas(sample, amount, threshold, metric_pointer):
@@ -35,8 +35,7 @@ def mbsas(sample, amount, threshold, metric_pointer):
 
     ccore = ccore_library.get();
 
-    ccore.mbsas_algorithm.restype = POINTER(pyclustering_package);
-    package = ccore.mbsas_algorithm(pointer_data, c_size_t(amount), c_double(threshold), metric_pointer);
+    package = ccore.mbsas_algorithm(pointer_data, amount, threshold, metric_pointer);
 
     result = package_extractor(package).extract();
     ccore.free_pyclustering_package(package);
@@ -24,11 +24,13 @@
 """
 
 
+import numpy
+
 from pyclustering.core.wrapper import ccore_library
 
 from pyclustering.core.pyclustering_package import package_builder, package_extractor, pyclustering_package
 
-from ctypes import c_double, c_size_t, POINTER, c_void_p, CFUNCTYPE
+from ctypes import c_double, POINTER, CFUNCTYPE
 
 from pyclustering.utils.metric import type_metric
 
@@ -40,29 +42,27 @@ class metric_wrapper:
     def __init__(self, type_metric_code, arguments, func):
         self.__func = lambda p1, p2: func(package_extractor(p1).extract(), package_extractor(p2).extract())
 
+        # Reference to the callback is kept while metric exists because ccore uses it for user-defined metric.
+        self.__callback = metric_callback(self.__func)
+
         package_arguments = package_builder(arguments, c_double).create()
 
-        ccore = ccore_library.get()
+        self.__ccore = ccore_library.get()
 
-        ccore.metric_create.restype = POINTER(c_void_p)
 
-        self.__pointer = ccore.metric_create(c_size_t(type_metric_code), package_arguments, metric_callback(self.__func))
+        self.__pointer = self.__ccore.metric_create(type_metric_code, package_arguments, self.__callback)
 
 
     def __del__(self):
         if self.__pointer:
-            ccore = ccore_library.get()
-            ccore.metric_destroy(self.__pointer)
+            self.__ccore.metric_destroy(self.__pointer)
 
 
     def __call__(self, point1, point2):
         point_package1 = package_builder(point1, c_double).create()
         point_package2 = package_builder(point2, c_double).create()
 
-        ccore = ccore_library.get()
-
-        ccore.metric_calculate.restype = c_double
-        return ccore.metric_calculate(self.__pointer, point_package1, point_package2)
+        return self.__ccore.metric_calculate(self.__pointer, point_package1, point_package2)
 
 
     def get_pointer(self):
@@ -75,6 +75,12 @@ class metric_wrapper:
         arguments = []
 
         if mtype == type_metric.MINKOWSKI:
-            arguments = [ metric.get_arguments().get('degree') ]
+            arguments = [ metric.get_arguments().get('degree', 2) ]
+
+        elif mtype == type_metric.WEIGHTED_MINKOWSKI:
+            arguments = [ metric.get_arguments().get('degree', 2) ] + list(metric.get_arguments().get('weights'))
+
+        elif mtype == type_metric.MAHALANOBIS:
+            arguments = numpy.array(metric.get_arguments().get('matrix'), dtype=float).flatten().tolist()
 
         return metric_wrapper(mtype, arguments, metric.get_function())
\ No newline at end of file
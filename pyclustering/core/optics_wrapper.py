@@ -23,11 +23,11 @@
 
 """
 
-from ctypes import c_double, c_size_t, POINTER
+from ctypes import c_double
 
 from pyclustering.core.converter import convert_data_type
 from pyclustering.core.wrapper import ccore_library
-from pyclustering.core.pyclustering_package import pyclustering_package, package_builder, package_extractor
+from pyclustering.core.pyclustering_package import package_builder, package_extractor
 
 
 class optics_package_indexer:
@@ -50,8 +50,7 @@ def optics(sample, radius, minimum_neighbors, amount_clusters, data_type):
     
     ccore = ccore_library.get()
     
-    ccore.optics_algorithm.restype = POINTER(pyclustering_package)
-    package = ccore.optics_algorithm(pointer_data, c_double(radius), c_size_t(minimum_neighbors), c_size_t(amount), c_data_type)
+    package = ccore.optics_algorithm(pointer_data, radius, minimum_neighbors, amount, c_data_type)
 
     results = package_extractor(package).extract()
     ccore.free_pyclustering_package(package)
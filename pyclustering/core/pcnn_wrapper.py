@@ -24,7 +24,7 @@
 """
 
 from pyclustering.core.wrapper import *;
-from pyclustering.core.pyclustering_package import package_builder, package_extractor, pyclustering_package;
+from pyclustering.core.pyclustering_package import package_builder, package_extractor;
 
 
 class c_pcnn_parameters(Structure):   
@@ -56,8 +56,7 @@ def pcnn_create(size, conn_type, height, width, params):
     c_parameters.M = params.M;
     c_parameters.FAST_LINKING = params.FAST_LINKING;
 
-    ccore.pcnn_create.restype = POINTER(c_void_p);
-    pcnn_pointer = ccore.pcnn_create(c_uint(size), c_uint(conn_type), c_uint(height), c_uint(width), pointer(c_parameters));
+    pcnn_pointer = ccore.pcnn_create(size, conn_type, height, width, pointer(c_parameters));
     return pcnn_pointer;
     
 
@@ -70,13 +69,11 @@ def pcnn_simulate(network_pointer, steps, stimulus):
     ccore = ccore_library.get();
     
     c_stimulus = package_builder(stimulus, c_double).create();
-    ccore.pcnn_simulate.restype = POINTER(c_void_p);
-    return ccore.pcnn_simulate(network_pointer, c_uint(steps), c_stimulus);
+    return ccore.pcnn_simulate(network_pointer, steps, c_stimulus);
 
 
 def pcnn_get_size(network_pointer):
     ccore = ccore_library.get();
-    ccore.pcnn_get_size.restype = c_size_t;
     return ccore.pcnn_get_size(network_pointer);
 
 
@@ -88,7 +85,6 @@ def pcnn_dynamic_destroy(dynamic_pointer):
 def pcnn_dynamic_allocate_sync_ensembles(dynamic_pointer):
     ccore = ccore_library.get();
     
-    ccore.pcnn_dynamic_allocate_sync_ensembles.restype = POINTER(pyclustering_package);
     package = ccore.pcnn_dynamic_allocate_sync_ensembles(dynamic_pointer);
     
     result = package_extractor(package).extract();
@@ -100,7 +96,6 @@ def pcnn_dynamic_allocate_sync_ensembles(dynamic_pointer):
 def pcnn_dynamic_allocate_spike_ensembles(dynamic_pointer):
     ccore = ccore_library.get();
     
-    ccore.pcnn_dynamic_allocate_spike_ensembles.restype = POINTER(pyclustering_package);
     package = ccore.pcnn_dynamic_allocate_spike_ensembles(dynamic_pointer);
     
     result = package_extractor(package).extract();
@@ -112,7 +107,6 @@ def pcnn_dynamic_allocate_spike_ensembles(dynamic_pointer):
 def pcnn_dynamic_allocate_time_signal(dynamic_pointer):
     ccore = ccore_library.get();
     
-    ccore.pcnn_dynamic_allocate_time_signal.restype = POINTER(pyclustering_package);
     package = ccore.pcnn_dynamic_allocate_time_signal(dynamic_pointer);
     
     result = package_extractor(package).extract();
@@ -124,7 +118,6 @@ def pcnn_dynamic_allocate_time_signal(dynamic_pointer):
 def pcnn_dynamic_get_output(dynamic_pointer):
     ccore = ccore_library.get();
     
-    ccore.pcnn_dynamic_get_output.restype = POINTER(pyclustering_package);
     package = ccore.pcnn_dynamic_get_output(dynamic_pointer);
     
     result = package_extractor(package).extract();
@@ -136,7 +129,6 @@ def pcnn_dynamic_get_output(dynamic_pointer):
 def pcnn_dynamic_get_time(dynamic_pointer):
     ccore = ccore_library.get();
     
-    ccore.pcnn_dynamic_get_time.restype = POINTER(pyclustering_package);
     package = ccore.pcnn_dynamic_get_time(dynamic_pointer);
     
     result = package_extractor(package).extract();
@@ -147,5 +139,4 @@ def pcnn_dynamic_get_time(dynamic_pointer):
 
 def pcnn_dynamic_get_size(dynamic_pointer):
     ccore = ccore_library.get();
-    ccore.pcnn_dynamic_get_time.restype = c_size_t;
     return ccore.pcnn_dynamic_get_size(dynamic_pointer);
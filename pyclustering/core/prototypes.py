@@ -0,0 +1,159 @@
+"""!
+
+@brief Prototypes of functions that are exported by CCORE library (part of this project).
+
+@authors Andrei Novikov (pyclustering@yandex.ru)
+@date 2014-2019
+@copyright GNU Public License
+
+@cond GNU_PUBLIC_LICENSE
+    PyClustering is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    
+    PyClustering is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+    
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+@endcond
+
+"""
+
+
+from ctypes import c_bool, c_char_p, c_double, c_size_t, c_uint, c_void_p, POINTER
+
+from pyclustering.core.pyclustering_package import pyclustering_package
+
+
+## Pointer to pyclustering package that is used to exchange data with CCORE.
+package_pointer = POINTER(pyclustering_package)
+
+## Pointer to an object (network, dynamic, metric, etc.) that is allocated and owned by CCORE.
+object_pointer = POINTER(c_void_p)
+
+
+## Prototypes of CCORE functions in format 'name: (restype, argtypes)', they are declared once when library is loaded.
+ccore_prototypes = {
+    'get_interface_description'                 : (c_char_p, []),
+    'get_interface_version'                     : (c_char_p, []),
+    'free_pyclustering_package'                 : (None, [package_pointer]),
+
+    'metric_create'                             : (object_pointer, [c_size_t, package_pointer, c_void_p]),
+    'metric_destroy'                            : (None, [c_void_p]),
+    'metric_calculate'                          : (c_double, [c_void_p, package_pointer, package_pointer]),
+
+    'agglomerative_algorithm'                   : (package_pointer, [package_pointer, c_size_t, c_size_t]),
+    'bsas_algorithm'                            : (package_pointer, [package_pointer, c_size_t, c_double, c_void_p]),
+    'clique_algorithm'                          : (package_pointer, [package_pointer, c_size_t, c_size_t]),
+    'dbscan_algorithm'                          : (package_pointer, [package_pointer, c_double, c_size_t, c_size_t]),
+    'elbow_method_ikpp'                         : (package_pointer, [package_pointer, c_size_t, c_size_t]),
+    'elbow_method_irnd'                         : (package_pointer, [package_pointer, c_size_t, c_size_t]),
+    'kmeans_algorithm'                          : (package_pointer, [package_pointer, package_pointer, c_double, c_bool, c_void_p]),
+    'kmedians_algorithm'                        : (package_pointer, [package_pointer, package_pointer, c_double, c_void_p]),
+    'kmedoids_algorithm'                        : (package_pointer, [package_pointer, package_pointer, c_double, c_void_p, c_size_t]),
+    'mbsas_algorithm'                           : (package_pointer, [package_pointer, c_size_t, c_double, c_void_p]),
+    'optics_algorithm'                          : (package_pointer, [package_pointer, c_double, c_size_t, c_size_t, c_size_t]),
+    'rock_algorithm'                            : (package_pointer, [package_pointer, c_double, c_size_t, c_double]),
+    'ttsas_algorithm'                           : (package_pointer, [package_pointer, c_double, c_double, c_void_p]),
+    'xmeans_algorithm'                          : (package_pointer, [package_pointer, package_pointer, c_size_t, c_double, c_uint]),
+
+    'kmeans_batch_algorithm'                    : (package_pointer, [package_pointer, c_size_t, package_pointer, package_pointer, package_pointer, c_double, c_void_p]),
+    'kmedoids_batch_algorithm'                  : (package_pointer, [package_pointer, c_size_t, package_pointer, package_pointer, package_pointer, c_double, c_void_p]),
+    'dbscan_batch_algorithm'                    : (package_pointer, [package_pointer, c_size_t, package_pointer, c_double, c_size_t]),
+    'xmeans_batch_algorithm'                    : (package_pointer, [package_pointer, c_size_t, package_pointer, package_pointer, package_pointer, c_size_t, c_double, c_uint]),
+
+    'cure_algorithm'                            : (object_pointer, [package_pointer, c_size_t, c_size_t, c_double]),
+    'cure_data_destroy'                         : (None, [c_void_p]),
+    'cure_get_clusters'                         : (package_pointer, [c_void_p]),
+    'cure_get_representors'                     : (package_pointer, [c_void_p]),
+    'cure_get_means'                            : (package_pointer, [c_void_p]),
+
+    'hhn_create'                                : (object_pointer, [c_size_t, c_void_p]),
+    'hhn_destroy'                               : (None, [c_void_p]),
+    'hhn_simulate'                              : (None, [c_void_p, c_size_t, c_double, c_size_t, package_pointer, c_void_p]),
+    'hhn_dynamic_create'                        : (object_pointer, [c_bool, c_bool, c_bool, c_bool]),
+    'hhn_dynamic_destroy'                       : (None, [c_void_p]),
+    'hhn_dynamic_get_peripheral_evolution'      : (package_pointer, [c_void_p, c_size_t]),
+    'hhn_dynamic_get_central_evolution'         : (package_pointer, [c_void_p, c_size_t]),
+    'hhn_dynamic_get_time'                      : (package_pointer, [c_void_p]),
+    'hhn_dynamic_write'                         : (None, [c_void_p, c_char_p]),
+    'hhn_dynamic_read'                          : (object_pointer, [c_char_p]),
+
+    'hsyncnet_create_network'                   : (object_pointer, [package_pointer, c_uint, c_uint, c_uint, c_double]),
+    'hsyncnet_destroy_network'                  : (None, [c_void_p]),
+    'hsyncnet_process'                          : (object_pointer, [c_void_p, c_double, c_uint, c_bool]),
+    'hsyncnet_analyser_destroy'                 : (None, [c_void_p]),
+
+    'legion_create'                             : (object_pointer, [c_uint, c_uint, c_void_p]),
+    'legion_destroy'                            : (None, [c_void_p]),
+    'legion_simulate'                           : (object_pointer, [c_void_p, c_uint, c_double, c_uint, c_bool, c_void_p]),
+    'legion_get_size'                           : (c_size_t, [c_void_p]),
+    'legion_dynamic_destroy'                    : (None, [c_void_p]),
+    'legion_dynamic_get_output'                 : (package_pointer, [c_void_p]),
+    'legion_dynamic_get_inhibitory_output'      : (package_pointer, [c_void_p]),
+    'legion_dynamic_get_time'                   : (package_pointer, [c_void_p]),
+    'legion_dynamic_get_size'                   : (c_size_t, [c_void_p]),
+
+    'pcnn_create'                               : (object_pointer, [c_uint, c_uint, c_uint, c_uint, c_void_p]),
+    'pcnn_destroy'                              : (None, [c_void_p]),
+    'pcnn_simulate'                             : (object_pointer, [c_void_p, c_uint, c_void_p]),
+    'pcnn_get_size'                             : (c_size_t, [c_void_p]),
+    'pcnn_dynamic_destroy'                      : (None, [c_void_p]),
+    'pcnn_dynamic_allocate_sync_ensembles'      : (package_pointer, [c_void_p]),
+    'pcnn_dynamic_allocate_spike_ensembles'     : (package_pointer, [c_void_p]),
+    'pcnn_dynamic_allocate_time_signal'         : (package_pointer, [c_void_p]),
+    'pcnn_dynamic_get_output'                   : (package_pointer, [c_void_p]),
+    'pcnn_dynamic_get_time'                     : (package_pointer, [c_void_p]),
+    'pcnn_dynamic_get_size'                     : (c_size_t, [c_void_p]),
+
+    'som_create'                                : (object_pointer, [c_size_t, c_size_t, c_size_t, c_void_p]),
+    'som_destroy'                               : (None, [c_void_p]),
+    'som_load'                                  : (None, [c_void_p, package_pointer, package_pointer, package_pointer]),
+    'som_train'                                 : (c_size_t, [c_void_p, package_pointer, c_size_t, c_bool]),
+    'som_simulate'                              : (c_size_t, [c_void_p, package_pointer]),
+    'som_get_winner_number'                     : (c_size_t, [c_void_p]),
+    'som_get_size'                              : (c_size_t, [c_void_p]),
+    'som_get_weights'                           : (package_pointer, [c_void_p]),
+    'som_get_capture_objects'                   : (package_pointer, [c_void_p]),
+    'som_get_awards'                            : (package_pointer, [c_void_p]),
+    'som_get_neighbors'                         : (package_pointer, [c_void_p]),
+
+    'sync_create_network'                       : (object_pointer, [c_uint, c_double, c_double, c_uint, c_uint]),
+    'sync_get_size'                             : (c_size_t, [c_void_p]),
+    'sync_destroy_network'                      : (None, [c_void_p]),
+    'sync_simulate_static'                      : (object_pointer, [c_void_p, c_uint, c_double, c_uint, c_bool]),
+    'sync_simulate_dynamic'                     : (object_pointer, [c_void_p, c_double, c_uint, c_bool, c_double, c_double, c_double]),
+    'sync_order'                                : (c_double, [c_void_p]),
+    'sync_local_order'                          : (c_double, [c_void_p]),
+    'sync_connectivity_matrix'                  : (package_pointer, [c_void_p]),
+    'sync_dynamic_get_size'                     : (c_size_t, [c_void_p]),
+    'sync_dynamic_destroy'                      : (None, [c_void_p]),
+    'sync_dynamic_allocate_sync_ensembles'      : (package_pointer, [c_void_p, c_double, c_size_t]),
+    'sync_dynamic_allocate_correlation_matrix'  : (package_pointer, [c_void_p, c_size_t]),
+    'sync_dynamic_get_time'                     : (package_pointer, [c_void_p]),
+    'sync_dynamic_get_output'                   : (package_pointer, [c_void_p]),
+    'sync_dynamic_calculate_order'              : (package_pointer, [c_void_p, c_size_t, c_size_t]),
+    'sync_dynamic_calculate_local_order'        : (package_pointer, [c_void_p, c_void_p, c_size_t, c_size_t]),
+
+    'syncnet_create_network'                    : (object_pointer, [package_pointer, c_double, c_bool, c_uint]),
+    'syncnet_destroy_network'                   : (None, [c_void_p]),
+    'syncnet_process'                           : (object_pointer, [c_void_p, c_double, c_uint, c_bool]),
+    'syncnet_analyser_destroy'                  : (None, [c_void_p]),
+
+    'syncpr_create'                             : (object_pointer, [c_uint, c_double, c_double]),
+    'syncpr_destroy'                            : (None, [c_void_p]),
+    'syncpr_get_size'                           : (c_size_t, [c_void_p]),
+    'syncpr_train'                              : (None, [c_void_p, c_void_p]),
+    'syncpr_simulate_static'                    : (object_pointer, [c_void_p, c_uint, c_double, c_void_p, c_uint, c_bool]),
+    'syncpr_simulate_dynamic'                   : (object_pointer, [c_void_p, c_void_p, c_double, c_uint, c_bool, c_double]),
+    'syncpr_memory_order'                       : (c_double, [c_void_p, c_void_p]),
+    'syncpr_dynamic_get_size'                   : (c_size_t, [c_void_p]),
+    'syncpr_dynamic_destroy'                    : (None, [c_void_p]),
+    'syncpr_dynamic_allocate_sync_ensembles'    : (package_pointer, [c_void_p, c_double]),
+    'syncpr_dynamic_get_time'                   : (package_pointer, [c_void_p]),
+    'syncpr_dynamic_get_output'                 : (package_pointer, [c_void_p])
+}
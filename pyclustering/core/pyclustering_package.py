@@ -27,7 +27,7 @@
 
 from ctypes import *
 
-import collections
+import collections.abc
 import numpy
 
 
@@ -110,8 +110,14 @@ class pyclustering_type_data:
 class package_builder:
     """!
     @brief Package builder provides service to create 'pyclustering_package' from data that is stored in 'list' container.
+    @details One-dimensional numpy arrays are copied to the package by one memory copy operation instead of element by
+              element packing when they are large enough.
 
     """
+
+    ## Minimal size of one-dimensional numpy array that is copied to the package as a memory block.
+    __NUMPY_BLOCK_SIZE = 64
+
     def __init__(self, dataset, c_data_type):
         """!
         @brief Initialize package builder object by dataset.
@@ -135,7 +141,7 @@ class package_builder:
 
 
     def __is_container_type(self, value):
-        return isinstance(value, collections.Iterable)
+        return isinstance(value, collections.abc.Iterable)
 
 
     def __get_type(self, pyclustering_data_type):
@@ -205,7 +211,11 @@ class package_builder:
             
             dataset_package.data = cast(package_data, POINTER(c_void_p))
         else:
-            array_object = (c_data_type * len(dataset))(*dataset)
+            if isinstance(dataset, numpy.ndarray) and len(dataset) >= package_builder.__NUMPY_BLOCK_SIZE:
+                array_object = (c_data_type * len(dataset)).from_buffer(numpy.array(dataset, dtype=c_data_type))
+            else:
+                array_object = (c_data_type * len(dataset))(*dataset)
+
             dataset_package.data = cast(array_object, POINTER(c_void_p))
 
 
@@ -267,6 +277,9 @@ class package_extractor:
     
     
     def __unpack_data(self, pointer_package, pointer_data, type_package):
+        if type_package != pyclustering_type_data.PYCLUSTERING_TYPE_LIST:
+            return pointer_data[:pointer_package[0].size]
+
         result = []
         
         for index in range(0, pointer_package[0].size):
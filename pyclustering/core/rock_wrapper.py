@@ -23,10 +23,10 @@
 
 """
 
-from ctypes import c_double, c_size_t, POINTER;
+from ctypes import c_double;
 
 from pyclustering.core.wrapper import ccore_library;
-from pyclustering.core.pyclustering_package import pyclustering_package, package_builder, package_extractor;
+from pyclustering.core.pyclustering_package import package_builder, package_extractor;
 
 
 def rock(sample, eps, number_clusters, threshold):
@@ -47,8 +47,7 @@ def rock(sample, eps, number_clusters, threshold):
 
     ccore = ccore_library.get();
 
-    ccore.rock_algorithm.restype = POINTER(pyclustering_package);
-    package = ccore.rock_algorithm(pointer_data, c_double(eps), c_size_t(number_clusters), c_double(threshold));
+    package = ccore.rock_algorithm(pointer_data, eps, number_clusters, threshold);
 
     list_of_clusters = package_extractor(package).extract();
     ccore.free_pyclustering_package(package);
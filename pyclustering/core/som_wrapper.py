@@ -23,10 +23,10 @@
 
 """
 
-from ctypes import Structure, c_uint, c_size_t, c_double, c_void_p, pointer, POINTER
+from ctypes import Structure, c_uint, c_size_t, c_double, pointer, POINTER
 
 from pyclustering.core.wrapper import ccore_library
-from pyclustering.core.pyclustering_package import pyclustering_package, package_builder, package_extractor
+from pyclustering.core.pyclustering_package import package_builder, package_extractor
 
 
 class c_som_parameters(Structure):
@@ -64,8 +64,7 @@ def som_create(rows, cols, conn_type, parameters):
     c_params.init_learn_rate = parameters.init_learn_rate
     c_params.adaptation_threshold = parameters.adaptation_threshold
     
-    ccore.som_create.restype = POINTER(c_void_p)
-    som_pointer = ccore.som_create(c_uint(rows), c_uint(cols), c_uint(conn_type), pointer(c_params))
+    som_pointer = ccore.som_create(rows, cols, conn_type, pointer(c_params))
     
     return som_pointer
 
@@ -122,8 +121,7 @@ def som_train(som_pointer, data, epochs, autostop):
     pointer_data = package_builder(data, c_double).create()
     
     ccore = ccore_library.get()
-    ccore.som_train.restype = c_size_t
-    return ccore.som_train(som_pointer, pointer_data, c_uint(epochs), autostop)
+    return ccore.som_train(som_pointer, pointer_data, epochs, autostop)
 
 
 def som_simulate(som_pointer, pattern):
@@ -141,7 +139,6 @@ def som_simulate(som_pointer, pattern):
     pointer_data = package_builder(pattern, c_double).create()
     
     ccore = ccore_library.get()
-    ccore.som_simulate.restype = c_size_t
     return ccore.som_simulate(som_pointer, pointer_data)
 
 
@@ -154,7 +151,6 @@ def som_get_winner_number(som_pointer):
     """
     
     ccore = ccore_library.get()
-    ccore.som_get_winner_number.restype = c_size_t
     return ccore.som_get_winner_number(som_pointer)
 
 
@@ -167,7 +163,6 @@ def som_get_size(som_pointer):
     """
     
     ccore = ccore_library.get()
-    ccore.som_get_size.restype = c_size_t
     return ccore.som_get_size(som_pointer)
 
 
@@ -181,7 +176,6 @@ def som_get_capture_objects(som_pointer):
     
     ccore = ccore_library.get()
     
-    ccore.som_get_capture_objects.restype = POINTER(pyclustering_package)
     package = ccore.som_get_capture_objects(som_pointer)
     
     result = package_extractor(package).extract()
@@ -198,7 +192,6 @@ def som_get_weights(som_pointer):
     
     ccore = ccore_library.get()
     
-    ccore.som_get_weights.restype = POINTER(pyclustering_package)
     package = ccore.som_get_weights(som_pointer)
     
     result = package_extractor(package).extract()
@@ -215,7 +208,6 @@ def som_get_awards(som_pointer):
     
     ccore = ccore_library.get()
     
-    ccore.som_get_awards.restype = POINTER(pyclustering_package)
     package = ccore.som_get_awards(som_pointer)
     
     result = package_extractor(package).extract()
@@ -232,7 +224,6 @@ def som_get_neighbors(som_pointer):
     
     ccore = ccore_library.get()
     
-    ccore.som_get_neighbors.restype = POINTER(pyclustering_package)
     package = ccore.som_get_neighbors(som_pointer)
     
     result = package_extractor(package).extract()
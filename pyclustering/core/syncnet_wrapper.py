@@ -31,8 +31,7 @@ def syncnet_create_network(sample, radius, initial_phases, enable_conn_weight):
     package_data = package_builder(sample, c_double).create()
     
     ccore = ccore_library.get()
-    ccore.syncnet_create_network.restype = POINTER(c_void_p)
-    pointer_network = ccore.syncnet_create_network(package_data, c_double(radius), c_bool(enable_conn_weight), c_uint(initial_phases))
+    pointer_network = ccore.syncnet_create_network(package_data, radius, enable_conn_weight, initial_phases)
     
     return pointer_network
 
@@ -44,8 +43,7 @@ def syncnet_destroy_network(pointer_network):
 
 def syncnet_process(network_pointer, order, solution, collect_dynamic):
     ccore = ccore_library.get()
-    ccore.syncnet_process.restype = POINTER(c_void_p)
-    return ccore.syncnet_process(network_pointer, c_double(order), c_uint(solution), c_bool(collect_dynamic))
+    return ccore.syncnet_process(network_pointer, order, solution, collect_dynamic)
 
 
 def syncnet_analyser_destroy(pointer_analyser):
@@ -32,6 +32,7 @@ matplotlib.use('Agg')
 
 
 from pyclustering.core.tests            import package_tests as core_package_unit_tests
+from pyclustering.core.tests            import wrapper_tests as core_wrapper_unit_tests
 
 import os
 
@@ -103,6 +104,7 @@ class core_tests(suite_holder):
     @staticmethod
     def fill_suite(core_suite):
         core_suite.addTests(unittest.TestLoader().loadTestsFromModule(core_package_unit_tests))
+        core_suite.addTests(unittest.TestLoader().loadTestsFromModule(core_wrapper_unit_tests))
 
 
 if __name__ == "__main__":
@@ -141,6 +141,12 @@ class Test(unittest.TestCase):
     def testNumpyMatrixThreeColumns(self):
         self.templatePackUnpack(numpy.matrix([[1.1, 2.2, 3.3], [2.2, 3.3, 4.4], [3.3, 4.4, 5.5]]), c_double);
 
+    def testNumpyArrayLarge(self):
+        self.templatePackUnpack(numpy.linspace(-10.0, 10.0, 1000), c_double);
+
+    def testNumpyArrayLargeSizeT(self):
+        self.templatePackUnpack(numpy.arange(500), c_size_t);
+
 
 if __name__ == "__main__":
     unittest.main();
\ No newline at end of file
@@ -0,0 +1,107 @@
+"""!
+
+@brief Unit-tests for wrapper of ccore library: prototypes of functions and access from several threads.
+
+@authors Andrei Novikov (pyclustering@yandex.ru)
+@date 2014-2019
+@copyright GNU Public License
+
+@cond GNU_PUBLIC_LICENSE
+    PyClustering is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PyClustering is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+@endcond
+
+"""
+
+
+import unittest
+
+from concurrent.futures import ThreadPoolExecutor
+
+from pyclustering.core.wrapper import ccore_library
+from pyclustering.core.prototypes import ccore_prototypes
+from pyclustering.core.metric_wrapper import metric_wrapper
+
+from pyclustering.cluster.kmeans import kmeans
+
+from pyclustering.utils.metric import distance_metric, type_metric
+
+
+class Test(unittest.TestCase):
+    def testPrototypesFormat(self):
+        for name, (restype, argtypes) in ccore_prototypes.items():
+            self.assertIsInstance(argtypes, list, name)
+            for argtype in argtypes:
+                self.assertIsNotNone(argtype, name)
+
+
+    def testLibraryFromSeveralThreads(self):
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            libraries = list(executor.map(lambda _: ccore_library.get(), range(32)))
+
+        for library in libraries:
+            self.assertIs(libraries[0], library)
+
+
+    @unittest.skipUnless(ccore_library.workable(), "ccore library is not available")
+    def testPrototypesAreDeclared(self):
+        library = ccore_library.get()
+
+        for name, (restype, argtypes) in ccore_prototypes.items():
+            function = getattr(library, name)
+            self.assertEqual(restype, function.restype, name)
+            self.assertEqual(argtypes, function.argtypes, name)
+
+
+    @unittest.skipUnless(ccore_library.workable(), "ccore library is not available")
+    def testMetricFromSeveralThreads(self):
+        metrics = [ distance_metric(type_metric.EUCLIDEAN_SQUARE),
+                    distance_metric(type_metric.MANHATTAN),
+                    distance_metric(type_metric.USER_DEFINED, func=lambda p1, p2: abs(p1[0] - p2[0]) + abs(p1[1] - p2[1])) ]
+
+        points = [ ([index, 1.0], [2.0, -index]) for index in range(50) ]
+
+        def calculate(metric):
+            wrapper = metric_wrapper.create_instance(metric)
+            return [ wrapper(point1, point2) for point1, point2 in points ]
+
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            results = list(executor.map(calculate, metrics * 4))
+
+        for index, result in enumerate(results):
+            metric = metrics[index % len(metrics)]
+            expected = [ metric(point1, point2) for point1, point2 in points ]
+
+            for expected_distance, actual_distance in zip(expected, result):
+                self.assertAlmostEqual(expected_distance, actual_distance)
+
+
+    @unittest.skipUnless(ccore_library.workable(), "ccore library is not available")
+    def testKMeansFromSeveralThreads(self):
+        groups = [ [ [float(index + shift), float(index)] for index in range(10) ] +
+                   [ [float(index + shift + 100), float(index)] for index in range(10) ] for shift in range(16) ]
+
+        def cluster(group):
+            instance = kmeans(group, [ group[0], group[-1] ], ccore=True)
+            instance.process()
+            return sorted(instance.get_clusters())
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(cluster, groups))
+
+        for clusters in results:
+            self.assertEqual([ list(range(10)), list(range(10, 20)) ], clusters)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -24,10 +24,10 @@
 """
 
 
-from ctypes import c_double, POINTER;
+from ctypes import c_double;
 
 from pyclustering.core.wrapper import ccore_library;
-from pyclustering.core.pyclustering_package import pyclustering_package, package_extractor, package_builder;
+from pyclustering.core.pyclustering_package import package_extractor, package_builder;
 
 
 def ttsas(sample, threshold1, threshold2, metric_pointer):
@@ -35,8 +35,7 @@ def ttsas(sample, threshold1, threshold2, metric_pointer):
 
     ccore = ccore_library.get();
 
-    ccore.ttsas_algorithm.restype = POINTER(pyclustering_package);
-    package = ccore.ttsas_algorithm(pointer_data, c_double(threshold1), c_double(threshold2), metric_pointer);
+    package = ccore.ttsas_algorithm(pointer_data, threshold1, threshold2, metric_pointer);
 
     result = package_extractor(package).extract();
     ccore.free_pyclustering_package(package);
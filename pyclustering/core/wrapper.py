@@ -25,10 +25,12 @@
 
 
 import sys
+import threading
 
 from ctypes import *
 
 from pyclustering.core.definitions import *
+from pyclustering.core.prototypes import ccore_prototypes
 
 
 ccore_library_instance  = None
@@ -36,14 +38,33 @@ ccore_library_version   = "0.8.1"
 
 
 class ccore_library:
+    """!
+    @brief Provides access to CCORE library that is loaded once per process.
+    @details Prototypes (result and argument types) of all CCORE functions are declared once when the library is
+              loaded, therefore wrappers call CCORE functions directly and pass Python values as arguments without
+              wrapping them by ctypes objects. Library is loaded under lock, so it can be requested from several
+              threads at the same time. CCORE functions are called without Python GIL (only user-defined metrics
+              acquire it back during callback), therefore clustering jobs that are running in a thread pool are
+              executed by CCORE in parallel.
+
+    """
     __library           = None
     __workable          = False
     __initialized       = False
+    __lock              = threading.RLock()
 
     @staticmethod
     def get():
-        if not ccore_library.__library:
-            ccore_library.initialize()
+        """!
+        @brief Returns CCORE library with declared function prototypes, library is loaded on first call.
+
+        @return (CDLL) CCORE library or None if the library is not available.
+
+        """
+        if not ccore_library.__initialized:
+            with ccore_library.__lock:
+                if not ccore_library.__initialized:
+                    ccore_library.initialize()
 
         return ccore_library.__library
 
@@ -58,8 +79,17 @@ class ccore_library:
 
     @staticmethod
     def initialize():
-        ccore_library.__initialized = True
-        
+        with ccore_library.__lock:
+            ccore_library.__library = ccore_library.__load()
+            ccore_library.__initialized = True
+
+        return ccore_library.__library
+
+
+    @staticmethod
+    def __load():
+        ccore_library.__workable = False
+
         if PATH_PYCLUSTERING_CCORE_LIBRARY is None:
             print("The pyclustering core is not supported for platform '" + sys.platform + "' (" + platform.architecture()[0] + ").\n" + 
                   "Please, contact to 'pyclustering@yandex.ru'.")
@@ -73,28 +103,38 @@ class ccore_library:
             
             return None
 
-        ccore_library.__library = cdll.LoadLibrary(PATH_PYCLUSTERING_CCORE_LIBRARY)
-        if ccore_library.__check_library_integrity() is False:
+        library = cdll.LoadLibrary(PATH_PYCLUSTERING_CCORE_LIBRARY)
+        ccore_library.__declare_prototypes(library)
+
+        if ccore_library.__check_library_integrity(library) is False:
             print("Impossible to mark core as workable due to compitability troubles " +
                   "('" + sys.platform + "', '" + platform.architecture()[0] + "').\n" + 
                   "Please, contact to 'pyclustering@yandex.ru'")
             
-            return None
+            return library
 
-        result, version = ccore_library.__check_library_version()
+        result, version = ccore_library.__check_library_version(library)
         if result is False:
             print("Incompatible core version of pyclustering library is used ('" + version +"' instead '" + ccore_library_version + "').\n" +
                   "Probably library has not been successfully installed.\n" +
                   "Please, contact to 'pyclustering@yandex.ru'.")
 
-        return ccore_library.__library
+        return library
 
 
     @staticmethod
-    def __check_library_integrity():
+    def __declare_prototypes(library):
+        for name, (restype, argtypes) in ccore_prototypes.items():
+            function = getattr(library, name, None)
+            if function is not None:
+                function.restype = restype
+                function.argtypes = argtypes
+
+
+    @staticmethod
+    def __check_library_integrity(library):
         try:
-            ccore_library.__library.get_interface_description.restype = c_char_p
-            result = ccore_library.__library.get_interface_description()
+            result = library.get_interface_description()
             
             if len(result) > 0:
                 ccore_library.__workable = True
@@ -106,15 +146,12 @@ class ccore_library:
 
 
     @staticmethod
-    def __check_library_version():
+    def __check_library_version(library):
         version = "unknown"
 
         try:
-            ccore_library.__library.get_interface_version.restype = c_char_p
-            version_cptr = ccore_library.__library.get_interface_version()
-
-            ccore_version = version_cptr.decode("utf-8")
-            if ccore_version == ccore_library_version:
+            version = library.get_interface_version().decode("utf-8")
+            if version == ccore_library_version:
                 ccore_library.__workable = True
             else:
                 ccore_library.__workable = False
@@ -24,10 +24,10 @@
 """
 
 
-from ctypes import c_double, c_size_t, c_uint, POINTER;
+from ctypes import c_double;
 
 from pyclustering.core.wrapper import ccore_library;
-from pyclustering.core.pyclustering_package import pyclustering_package, package_extractor, package_builder;
+from pyclustering.core.pyclustering_package import package_extractor, package_builder;
 
 
 def xmeans(sample, centers, kmax, tolerance, criterion):
@@ -36,8 +36,7 @@ def xmeans(sample, centers, kmax, tolerance, criterion):
     
     ccore = ccore_library.get();
     
-    ccore.xmeans_algorithm.restype = POINTER(pyclustering_package);
-    package = ccore.xmeans_algorithm(pointer_data, pointer_centers, c_size_t(kmax), c_double(tolerance), c_uint(criterion));
+    package = ccore.xmeans_algorithm(pointer_data, pointer_centers, kmax, tolerance, criterion);
     
     result = package_extractor(package).extract();
     ccore.free_pyclustering_package(package);
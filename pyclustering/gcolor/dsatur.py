@@ -24,103 +24,117 @@
 
 """
 
+import heapq;
+import numpy;
+
+from scipy.sparse import csr_matrix, issparse;
+
+from pyclustering.utils.graph import type_graph_descr;
+
+
 class dsatur:
     """!
     @brief Represents DSATUR algorithm for graph coloring problem that uses greedy strategy.
     
     """
     
-    def __init__(self, data):
+    def __init__(self, data, type_graph = None):
         """!
         @brief Constructor of DSATUR algorithm.
         
-        @param[in] data (list): Matrix graph representation.
+        @param[in] data (list): Graph representation - matrix, vector (lists of neighbors of each vertex) or sparse matrix (scipy.sparse).
+        @param[in] type_graph (type_graph_descr): Type of graph representation in 'data', it is considered as matrix if it is not specified.
         
         """
-        if (len(data[0]) != len(data)):
-            raise NameError('Only matrix graph representation is available.');
-    
+        
+        if (issparse(data)):
+            adjacency = csr_matrix(data);
+            adjacency.eliminate_zeros();
+            
+            degrees = numpy.asarray(adjacency.sum(axis = 1)).ravel().tolist();
+        
+        elif (type_graph == type_graph_descr.GRAPH_VECTOR_DESCR):
+            neighbors = [ numpy.unique(numpy.asarray(row, dtype = numpy.int64)) for row in data ];
+            lengths = [ len(row) for row in neighbors ];
+            
+            indices = numpy.concatenate(neighbors) if len(neighbors) > 0 else numpy.empty(0, dtype = numpy.int64);
+            indptr = numpy.concatenate(([0], numpy.cumsum(lengths)));
+            adjacency = csr_matrix((numpy.ones(len(indices)), indices, indptr), shape = (len(data), len(data)));
+            
+            degrees = lengths;
+        
+        else:
+            if (len(data[0]) != len(data)):
+                raise NameError('Only matrix graph representation is available.');
+            
+            adjacency = csr_matrix(numpy.asarray(data));
+            adjacency.eliminate_zeros();
+            
+            degrees = [ sum(row) for row in data ];
+        
         self.__data_pointer = data;
+        self.__indptr = adjacency.indptr.tolist();
+        self.__indices = adjacency.indices.tolist();
+        self.__degrees = degrees;
+        
         self.__colors = [];
         self.__coloring = None;
         
     def process(self):
         """!
         @brief Perform graph coloring using DSATUR algorithm.
+        @details Uncolored vertices are kept in buckets by saturation degree where each bucket is a heap ordered by degree,
+                  so the next vertex (maximum saturation, then maximum degree, then minimum index) is extracted
+                  without scanning of uncolored vertices. Colors of neighbors of each vertex are stored as a bitset.
         
         @see get_colors()
         
-        """        
-        color_counter = 1;
+        """
         
-        degrees = list();
-        saturation_degrees = [0] * len(self.__data_pointer);
+        indptr, indices = self.__indptr, self.__indices;
+        amount_vertices = len(self.__degrees);
         
-        self.__coloring = [0] * len(self.__data_pointer);
-        uncolored_vertices = set(range(len(self.__data_pointer)));
+        self.__coloring = [0] * amount_vertices;
+        saturation_degrees = [0] * amount_vertices;
+        neighbor_colors = [0] * amount_vertices;
         
-        index_maximum_degree = 0;
-        maximum_degree = 0;
-        for index_node in range(len(self.__data_pointer)):
-            # Fill degree of nodes in the input graph
-            degrees.append( ( sum(self.__data_pointer[index_node]), index_node ) );
-            
-            # And find node with maximal degree at the same time.
-            if (degrees[index_node][0] > maximum_degree):
-                (maximum_degree, node_index) = degrees[index_node];
-                index_maximum_degree = index_node;
-            
-        # Update saturation
-        neighbors = self.__get_neighbors(index_maximum_degree);
-        for index_neighbor in neighbors:
-            saturation_degrees[index_neighbor] += 1;
-        
-        # Coloring the first node
-        self.__coloring[index_maximum_degree] = color_counter;
-        uncolored_vertices.remove(index_maximum_degree);
-        
-        while(len(uncolored_vertices) > 0):
-            # Get maximum saturation degree
-            maximum_satur_degree = -1;
-            for index in uncolored_vertices:
-                if (saturation_degrees[index] > maximum_satur_degree):
-                    maximum_satur_degree = saturation_degrees[index];
-            
-            # Get list of indexes with maximum saturation degree
-            indexes_maximum_satur_degree = [index for index in uncolored_vertices if saturation_degrees[index] == maximum_satur_degree];           
-    
-            coloring_index = indexes_maximum_satur_degree[0];
-            if (len(indexes_maximum_satur_degree) > 1): # There are more then one node with maximum saturation
-                # Find node with maximum degree
-                maximum_degree = -1;
-                for index in indexes_maximum_satur_degree:
-                    (degree, node_index) = degrees[index];
-                    if (degree > maximum_degree):
-                        coloring_index = node_index;
-                        maximum_degree = degree;
-            
-            # Coloring
-            node_index_neighbors = self.__get_neighbors(coloring_index);
-            for number_color in range(1, color_counter + 1, 1):
-                if (self.__get_amount_color(node_index_neighbors, number_color) == 0):
-                    self.__coloring[coloring_index] = number_color;
+        buckets = [ [ (-self.__degrees[index], index) for index in range(amount_vertices) ] ];
+        heapq.heapify(buckets[0]);
+        
+        maximum_satur_degree = 0;
+        for _ in range(amount_vertices):
+            # Get uncolored node with maximum saturation degree and maximum degree, outdated entries are skipped.
+            while (True):
+                bucket = buckets[maximum_satur_degree];
+                if (len(bucket) == 0):
+                    maximum_satur_degree -= 1;
+                    continue;
+                
+                (_, coloring_index) = heapq.heappop(bucket);
+                if ( (self.__coloring[coloring_index] == 0) and (saturation_degrees[coloring_index] == maximum_satur_degree) ):
                     break;
-                    
-            # If it has not been colored then
-            if (self.__coloring[coloring_index] == 0):
-                color_counter += 1;     # Add new color
-                self.__coloring[coloring_index] = color_counter;
-            
-            # Remove node from uncolored set
-            uncolored_vertices.remove(coloring_index);
             
+            # Coloring by the minimal color that is not used by neighbors
+            used_colors = neighbor_colors[coloring_index] | 1;
+            color = (~used_colors & (used_colors + 1)).bit_length() - 1;
+            self.__coloring[coloring_index] = color;
             
             # Update degree of saturation
-            for index_neighbor in node_index_neighbors:
-                subneighbors = self.__get_neighbors(index_neighbor);
+            color_mask = 1 << color;
+            for index_neighbor in indices[indptr[coloring_index]:indptr[coloring_index + 1]]:
+                if (neighbor_colors[index_neighbor] & color_mask):
+                    continue;
                 
-                if (self.__get_amount_color(subneighbors, self.__coloring[coloring_index]) == 1):
-                    saturation_degrees[index_neighbor] += 1;     
+                neighbor_colors[index_neighbor] |= color_mask;
+                saturation_degrees[index_neighbor] += 1;
+                
+                if (self.__coloring[index_neighbor] == 0):
+                    satur_degree = saturation_degrees[index_neighbor];
+                    if (satur_degree == len(buckets)):
+                        buckets.append([]);
+                    
+                    heapq.heappush(buckets[satur_degree], (-self.__degrees[index_neighbor], index_neighbor));
+                    maximum_satur_degree = max(maximum_satur_degree, satur_degree);
     
     def get_colors(self):
         """!
@@ -134,35 +148,3 @@ class dsatur:
         """
     
         return self.__coloring;
-    
-    def __get_amount_color(self, node_indexes, color_number):
-        """!
-        @brief Countes how many nodes has color 'color_number'.
-        
-        @param[in] node_indexes (list): Indexes of graph nodes for checking.
-        @param[in] color_number (uint): Number of color that is searched in nodes.
-        
-        @return (uint) Number found nodes with the specified color 'color_number'.
-        
-        """
-        
-        color_counter = 0;  
-        for index in node_indexes:
-            if (self.__coloring[index] == color_number):
-                color_counter += 1;
-        
-        return color_counter;
-    
-    
-    def __get_neighbors(self, node_index):
-        """!
-        @brief Returns indexes of neighbors of the specified node.
-        
-        @param[in] node_index (uint):
-        
-        @return (list) Neighbors of the specified node.
-        
-        """
-        
-        return [ index for index in range(len(self.__data_pointer[node_index])) if self.__data_pointer[node_index][index] != 0 ]; 
-    
\ No newline at end of file
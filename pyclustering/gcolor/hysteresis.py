@@ -25,6 +25,12 @@
 """
 
 
+import numpy
+
+from scipy.integrate import odeint
+from scipy.sparse import csr_matrix, issparse
+
+from pyclustering.nnet import conn_type, conn_represent, solve_type
 from pyclustering.nnet.hysteresis import hysteresis_network, hysteresis_dynamic
 
 
@@ -130,45 +136,154 @@ class hysteresisgcolor(hysteresis_network):
         """!
         @brief Constructor of hysteresis oscillatory network for graph coloring.
         
-        @param[in] graph_matrix (list): Matrix representation of a graph.
+        @param[in] graph_matrix (list): Matrix representation of a graph (list of lists, numpy array or scipy sparse matrix).
         @param[in] alpha (double): Positive constant (affect weight between two oscillators w[i][j]).
         @param[in] eps (double): Positive constant (affect feedback to itself (i = j) of each oscillator w[i][j] = -alpha - eps).
                 
         """
-        number_oscillators = len(graph_matrix)
+        number_oscillators = graph_matrix.shape[0] if issparse(graph_matrix) else len(graph_matrix)
         
-        super().__init__(number_oscillators)
+        # oscillators are coupled only by edges of the graph, therefore connections are defined by weights.
+        super().__init__(number_oscillators, type_conn=conn_type.NONE, type_conn_represent=conn_represent.LIST)
         
-        self._states = [0] * self._num_osc
-        for i in range(0, self._num_osc):
-            self._states[i] = 1 - (2 / self._num_osc) * i
+        self._states = 1 - (2 / self._num_osc) * numpy.arange(self._num_osc)
         
-        self._outputs = [-1] * self._num_osc
-        self._outputs_buffer = [-1] * self._num_osc
+        self._outputs = numpy.full(self._num_osc, -1.0)
+        self._outputs_buffer = numpy.full(self._num_osc, -1.0)
         self._time_contant = 1
         
-        # Create connections
-        self._weight = []
-        for row in range(0, self._num_osc):
-            self._weight.append([0] * self._num_osc)
-            for col in range(0, self._num_osc):
-                if (row != col):
-                    self._weight[row][col] = -alpha * (graph_matrix[row][col]) / sum(graph_matrix[row])
-                else:
-                    self._weight[row][col] = -alpha - eps
+        # Create connections: w[i][j] = -alpha * g[i][j] / sum(g[i]) and w[i][i] = -alpha - eps
+        adjacency = csr_matrix(graph_matrix, dtype=float) if issparse(graph_matrix) else csr_matrix(numpy.asarray(graph_matrix, dtype=float))
+        degrees = numpy.asarray(adjacency.sum(axis=1)).ravel()
+        
+        edges = adjacency.tocoo()
+        rows, columns, values = edges.row, edges.col, edges.data
+        mask = rows != columns
+        
+        weights = -alpha * values[mask] / degrees[rows[mask]]
+        self._weight = csr_matrix((weights, (rows[mask], columns[mask])), shape=(self._num_osc, self._num_osc))
+        self._own_weight = numpy.full(self._num_osc, -alpha - eps)
+    
+    
+    def _neuron_states(self, inputs, t, argv):
+        """!
+        @brief Returns new values of neurons (oscillators) of one or several networks (rows) with the same structure.
+        @details Outputs of neurons are considered as constants during integration.
+        
+        @param[in] inputs (array_like): Current states of neurons.
+        @param[in] t (double): Current time of simulation.
+        @param[in] argv (tuple): Extra arguments that are not used for integration - index of the neuron, if 'None' then
+                    all neurons are integrated.
+        
+        @return (double|numpy.array) New values of neurons.
+        
+        """
+        
+        if argv is not None:
+            xi = inputs[0]
+            impact = self._own_weight[argv] * self._outputs[argv] + self._weight[argv].dot(self._outputs).item()
+            
+            if xi > 1: self._outputs_buffer[argv] = 1
+            if xi < -1: self._outputs_buffer[argv] = -1
+            
+            return -xi + impact
+        
+        outputs = self.__integrated_outputs
+        xi = numpy.reshape(inputs, outputs.shape)
+        
+        impact = self._own_weight * outputs + self._weight.dot(outputs.T).T
+        
+        self.__integrated_buffer[xi > 1] = 1
+        self.__integrated_buffer[xi < -1] = -1
+        
+        return (-xi + impact).ravel()
+    
+    
+    def _calculate_states(self, solution, t, step, int_step):
+        """!
+        @brief Calculates new states for neurons using differential calculus. Returns new states for neurons.
+        
+        @param[in] solution (solve_type): Type solver of the differential equation.
+        @param[in] t (double): Current time of simulation.
+        @param[in] step (double): Step of solution at the end of which states of oscillators should be calculated.
+        @param[in] int_step (double): Step differentiation that is used for solving differential equation.
+        
+        @return (numpy.array) New states for neurons.
+        
+        """
+        
+        (next_states, self._outputs) = self.__calculate_states(numpy.asarray(self._states, dtype=float),
+                                                               numpy.asarray(self._outputs, dtype=float), t, step, int_step)
+        
+        self._outputs_buffer = self._outputs.copy()
+        return next_states
     
     
-    def process(self, steps, time, collect_dynamic=True):
+    def __calculate_states(self, states, outputs, t, step, int_step):
+        """!
+        @brief Integrates states of all neurons of one or several networks (rows) with the same structure at once.
+        
+        @return (tuple) New states of neurons and their new outputs.
+        
+        """
+        
+        self.__integrated_outputs = outputs
+        self.__integrated_buffer = outputs.copy()
+        
+        result = odeint(self._neuron_states, states.ravel(), numpy.arange(t - step, t, int_step), (None, ))
+        return numpy.reshape(result[len(result) - 1], states.shape), self.__integrated_buffer
+    
+    
+    def process(self, steps, time, collect_dynamic=True, restarts=1, tolerance=0.1, threshold_steps=10):
         """!
         @brief Peforms graph coloring analysis using simulation of the oscillatory network.
+        @details If several restarts are requested then the network is simulated from several initial states at once
+                  (the first one is the current state of the network and others are random) and result with the lowest
+                  amount of colors is returned.
         
         @param[in] steps (uint): Number steps of simulations during simulation.
         @param[in] time (double): Time of simulation.
         @param[in] collect_dynamic (bool): Specified requirement to collect whole dynamic of the network.
+        @param[in] restarts (uint): Amount of initial states that are simulated concurrently.
+        @param[in] tolerance (double): Tolerance level that is used to compare colorings of restarts.
+        @param[in] threshold_steps (uint): Number of steps from the end of simulation that are used to compare colorings of restarts.
         
         @return (hysteresis_analyser) Returns analyser of results of clustering.
         
         """
         
-        output_dynamic = super().simulate(steps, time, collect_dynamic=collect_dynamic)
-        return hysteresis_analyser(output_dynamic.output, output_dynamic.time)
+        if restarts <= 1:
+            output_dynamic = super().simulate(steps, time, collect_dynamic=collect_dynamic)
+            return hysteresis_analyser(output_dynamic.output, output_dynamic.time)
+        
+        states = numpy.random.uniform(-1.0, 1.0, (restarts, self._num_osc))
+        states[0] = self._states
+        
+        outputs = numpy.tile(numpy.asarray(self._outputs, dtype=float), (restarts, 1))
+        
+        # the last states are stored in any case, because they are required for coloring allocation.
+        dyn_state, dyn_time = [states], [0]
+        
+        step = time / steps
+        int_step = step / 10.0
+        
+        for t in numpy.arange(step, time + step, step):
+            states, outputs = self.__calculate_states(states, outputs, t, step, int_step)
+            
+            dyn_state.append(states)
+            dyn_time.append(t)
+            
+            if collect_dynamic is False:
+                dyn_state, dyn_time = dyn_state[-threshold_steps:], dyn_time[-threshold_steps:]
+        
+        analysers = [ hysteresis_analyser([ state[index] for state in dyn_state ], dyn_time) for index in range(restarts) ]
+        amount_colors = [ len(analyser.allocate_clusters(tolerance, threshold_steps)) for analyser in analysers ]
+        
+        best_index = int(numpy.argmin(amount_colors))
+        self._states, self._outputs = states[best_index].copy(), outputs[best_index].copy()
+        self._outputs_buffer = self._outputs.copy()
+        
+        if collect_dynamic is False:
+            return hysteresis_analyser([ dyn_state[-1][best_index] ], [ dyn_time[-1] ])
+        
+        return analysers[best_index]
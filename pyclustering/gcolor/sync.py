@@ -24,10 +24,17 @@
 
 """
 
+import numpy
+
+from scipy.integrate import odeint
+from scipy.sparse import csr_matrix, issparse
+
 from pyclustering.nnet import *
 from pyclustering.nnet.sync import sync_network
 from pyclustering.nnet.sync import sync_dynamic
 
+from pyclustering.utils import pi
+
 
 class syncgcolor_analyser(sync_dynamic):
     """!
@@ -86,6 +93,9 @@ class syncgcolor_analyser(sync_dynamic):
 class syncgcolor(sync_network):
     """!
     @brief Oscillatory network based on Kuramoto model with negative and positive connections for graph coloring problem.
+    @details Coupling of the network is represented by a sparse matrix of graph edges: each oscillator is coupled with all
+              others by positive weight and edges of the graph correct it to negative weight. Thus one step of the
+              simulation requires O(V + E) operations.
     
     """
     
@@ -93,14 +103,14 @@ class syncgcolor(sync_network):
         """!
         @brief Constructor of the oscillatory network syncgcolor for graph coloring problem.
         
-        @param[in] graph_matrix (list): Graph represented by matrix.
+        @param[in] graph_matrix (list): Graph represented by matrix (list of lists, numpy array or scipy sparse matrix).
         @param[in] positive_weight (double): Value of weight of positive connections.
         @param[in] negative_weight (double): Value of weight of negative connections.
         @param[in] reduction (bool): Inverse degree of the processed graph.
         
         """
-        number_oscillators = len(graph_matrix);
-        super().__init__(number_oscillators, type_conn = conn_type.DYNAMIC, ccore = False);
+        number_oscillators = graph_matrix.shape[0] if issparse(graph_matrix) else len(graph_matrix);
+        super().__init__(number_oscillators, type_conn = conn_type.DYNAMIC, representation = conn_represent.CSR, ccore = False);
         
         if (reduction == None):
             self._reduction = self._num_osc;
@@ -112,6 +122,8 @@ class syncgcolor(sync_network):
         
         self._create_connections(graph_matrix);
         
+        self._phases = numpy.array(self._phases, dtype = float);
+        
     
     def _create_connections(self, graph_matrix):
         """!
@@ -121,49 +133,184 @@ class syncgcolor(sync_network):
         
         """
         
-        for row in range(0, len(graph_matrix)):
-            for column in range (0, len(graph_matrix[row])):
-                if (graph_matrix[row][column] > 0):
-                    self.set_connection(row, column);
+        adjacency = csr_matrix(graph_matrix) if issparse(graph_matrix) else csr_matrix(numpy.asarray(graph_matrix));
+        adjacency = csr_matrix(adjacency > 0, dtype = float);
+        
+        # connections are bidirectional as in case of setting them one by one.
+        self._osc_conn = csr_matrix((adjacency + adjacency.T) > 0, dtype = float);
+        self._osc_conn.sort_indices();
+        
+        (self.__rows, self.__columns) = self._osc_conn.nonzero();
+        self.__coupling = (self._negative_weight - self._positive_weight) * self._osc_conn;
                 
     
     def _phase_kuramoto(self, teta, t, argv):
         """!
         @brief Returns result of phase calculation for oscillator in the network.
+        @details Phases of other oscillators are considered as constants during integration (the current phases of the network).
         
-        @param[in] teta (double): Value of phase of the oscillator with index argv in the network.
+        @param[in] teta (double|array_like): Value of phase of the oscillator with index argv in the network, or phases of all
+                    oscillators (of several networks) if 'argv' is None.
         @param[in] t (double): Unused, can be ignored.
-        @param[in] argv (uint): Index of the oscillator in the network.
+        @param[in] argv (uint): Index of the oscillator in the network, if 'None' then derivatives are calculated for all oscillators.
+        
+        @return (double|numpy.array) New value of phase for oscillator with index argv or derivatives of all phases.
+        
+        """
+        
+        if (argv is None):
+            phases = self.__integrated_phases;
+            teta = numpy.reshape(teta, phases.shape);
+        else:
+            phases = self._phases;
+        
+        sines, cosines = numpy.sin(phases), numpy.cos(phases);
+        
+        # sum(w[k] * sin(phase[k] - teta)) = cos(teta) * sum(w[k] * sin(phase[k])) - sin(teta) * sum(w[k] * cos(phase[k]))
+        weighted_sines = self._positive_weight * numpy.sum(sines, axis = -1, keepdims = True) + self.__coupling.dot(sines.T).T;
+        weighted_cosines = self._positive_weight * numpy.sum(cosines, axis = -1, keepdims = True) + self.__coupling.dot(cosines.T).T;
+        
+        if (argv is not None):
+            return float( (math.cos(teta) * weighted_sines[argv] - math.sin(teta) * weighted_cosines[argv]) / self._reduction );
+        
+        phase = numpy.cos(teta) * weighted_sines - numpy.sin(teta) * weighted_cosines;
+        return ( phase / self._reduction ).ravel();
+    
+    
+    def _calculate_phases(self, solution, t, step, int_step):
+        """!
+        @brief Calculates new phases for oscillators in the network in line with current step.
+        
+        @param[in] solution (solve_type): Type solver of the differential equation.
+        @param[in] t (double): Time of simulation.
+        @param[in] step (double): Step of solution at the end of which states of oscillators should be calculated.
+        @param[in] int_step (double): Step differentiation that is used for solving differential equation.
         
-        @return (double) New value of phase for oscillator with index argv.
+        @return (numpy.array) New states (phases) for oscillators.
         
         """
         
-        index = argv;
-        phase = 0;
+        return self.__calculate_phases(self._phases, solution, t, step, int_step);
+    
+    
+    def __calculate_phases(self, phases, solution, t, step, int_step):
+        """!
+        @brief Calculates new phases for all oscillators of one or several networks (rows) with the same structure.
+        
+        @return (numpy.array) New phases of oscillators.
         
-        for k in range(0, self._num_osc):
-            if (self.has_connection(index, k) == True):
-                phase += self._negative_weight * math.sin(self._phases[k] - teta);
-            else:
-                phase += self._positive_weight * math.sin(self._phases[k] - teta);
+        """
+        
+        self.__integrated_phases = phases;
+        
+        if (solution == solve_type.FAST):
+            next_phases = phases + numpy.reshape(self._phase_kuramoto(phases, 0, None), phases.shape);
             
-        return ( phase / self._reduction );
+        elif ( (solution == solve_type.RK4) or (solution == solve_type.RKF45) ):
+            result = odeint(self._phase_kuramoto, phases.ravel(), numpy.arange(t - step, t, int_step), (None, ));
+            next_phases = numpy.reshape(result[len(result) - 1], phases.shape);
+        
+        else:
+            raise NameError("Solver '" + str(solution) + "' is not supported");
+        
+        # phases that are out of [0; 2 * pi] are normalized.
+        outside = (next_phases > 2.0 * pi) | (next_phases < 0);
+        next_phases[outside] = numpy.mod(next_phases[outside], 2.0 * pi);
+        return next_phases;
+    
+    
+    def sync_local_order(self):
+        """!
+        @brief Calculates current level of local (partial) synchronization in the network.
+        
+        @return (double) Level of local (partial) synchronization.
+        
+        """
+        
+        return self.__calculate_local_orders(self._phases).item();
     
     
-    def process(self, order = 0.998, solution = solve_type.FAST, collect_dynamic = False):
+    def __calculate_local_orders(self, phases):
+        """!
+        @brief Calculates local order parameter for phases of one or several networks (rows) with the same structure.
+        
+        @return (numpy.array) Local order parameters.
+        
+        """
+        
+        differences = numpy.abs(phases[..., self.__columns] - phases[..., self.__rows]);
+        return numpy.sum(numpy.exp(-differences), axis = -1) / max(len(self.__rows), 1);
+    
+    
+    def process(self, order = 0.998, solution = solve_type.FAST, collect_dynamic = False, restarts = 1, tolerance = 0.1):
         """!
         @brief Performs simulation of the network (performs solving of graph coloring problem).
+        @details If several restarts are requested then the network is simulated from several random initial phase
+                  assignments at once (the first one is the current state of the network) and result with the lowest
+                  amount of colors is returned, the network keeps the final state of this result.
         
         @param[in] order (double): Defines when process of synchronization in the network is over, range from 0 to 1.
         @param[in] solution (solve_type): defines type (method) of solving diff. equation.
         @param[in] collect_dynamic (bool): If True - return full dynamic of the network, otherwise - last state of phases.
+        @param[in] restarts (uint): Amount of initial phase assignments that are simulated concurrently.
+        @param[in] tolerance (double): Defines maximum deviation between phases that is used to compare colorings of restarts.
         
         @return (syncnet_analyser) Returns analyser of results of coloring.
         
         """
         
-        analyser = self.simulate_dynamic(order, solution, collect_dynamic);
-        return syncgcolor_analyser(analyser.output, analyser.time, None);
+        if (restarts <= 1):
+            analyser = self.simulate_dynamic(order, solution, collect_dynamic);
+            return syncgcolor_analyser(analyser.output, analyser.time, None);
+        
+        return self.__simulate_restarts(order, solution, collect_dynamic, restarts, tolerance);
+    
     
-    
\ No newline at end of file
+    def __simulate_restarts(self, order, solution, collect_dynamic, restarts, tolerance, step = 0.1, int_step = 0.01, threshold_changes = 0.0000001):
+        """!
+        @brief Simulates network from several initial phase assignments at once until each of them reaches stop condition
+                of dynamic simulation.
+        
+        @return (syncgcolor_analyser) Analyser of the simulation whose coloring uses the lowest amount of colors.
+        
+        @see simulate_dynamic()
+        
+        """
+        
+        phases = numpy.random.random((restarts, self._num_osc)) * 2 * pi;
+        phases[0] = self._phases;
+        
+        dyn_phase = [ [ phases[index] ] for index in range(restarts) ];
+        dyn_time = [ [ 0 ] for _ in range(restarts) ];
+        
+        current_order = self.__calculate_local_orders(phases);
+        active = numpy.flatnonzero(current_order < order);
+        
+        time_counter = 0;
+        while (len(active) > 0):
+            phases = phases.copy();
+            phases[active] = self.__calculate_phases(phases[active], solution, time_counter, step, int_step);
+            time_counter += step;
+            
+            previous_order = current_order[active];
+            current_order[active] = self.__calculate_local_orders(phases[active]);
+            
+            for index in active:
+                if (collect_dynamic is True):
+                    dyn_phase[index].append(phases[index]);
+                    dyn_time[index].append(time_counter);
+                else:
+                    dyn_phase[index] = [ phases[index] ];
+                    dyn_time[index] = [ time_counter ];
+            
+            # simulation is over when sync state is reached or when convergence rate is too low.
+            converged = numpy.abs(current_order[active] - previous_order) < threshold_changes;
+            active = active[(current_order[active] < order) & ~converged];
+        
+        analysers = [ syncgcolor_analyser(dyn_phase[index], dyn_time[index], None) for index in range(restarts) ];
+        amount_colors = [ len(analyser.allocate_color_clusters(tolerance)) for analyser in analysers ];
+        
+        best_index = int(numpy.argmin(amount_colors));
+        self._phases = phases[best_index].copy();
+        
+        return analysers[best_index];
@@ -25,9 +25,14 @@
 
 import unittest;
 
+import os;
+import tempfile;
+
+from scipy.sparse import csr_matrix;
+
 from pyclustering.gcolor.dsatur import dsatur;
 
-from pyclustering.utils.graph import read_graph;
+from pyclustering.utils.graph import read_graph, type_graph_descr;
 
 from pyclustering.samples.definitions import GRAPH_SIMPLE_SAMPLES;
 
@@ -52,6 +57,22 @@ class Test(unittest.TestCase):
             #print(index_node, map_coloring[index_node], color_neighbors, assigned_colors, map_coloring, "\n\n");
             assert map_coloring[index_node] not in color_neighbors;
     
+    def templateTestColoringRepresentations(self, filename):
+        graph = read_graph(filename);
+        
+        dsatur_instance = dsatur(graph.data);
+        dsatur_instance.process();
+        expected_coloring = dsatur_instance.get_colors();
+        
+        vector_data = [ [ index for index in range(len(row)) if row[index] != 0 ] for row in graph.data ];
+        dsatur_instance = dsatur(vector_data, type_graph_descr.GRAPH_VECTOR_DESCR);
+        dsatur_instance.process();
+        assert expected_coloring == dsatur_instance.get_colors();
+        
+        dsatur_instance = dsatur(csr_matrix(graph.data));
+        dsatur_instance.process();
+        assert expected_coloring == dsatur_instance.get_colors();
+    
     def testColoringFull1(self):
         self.templateTestColoring(GRAPH_SIMPLE_SAMPLES.GRAPH_FULL1);
         
@@ -83,6 +104,41 @@ class Test(unittest.TestCase):
         self.templateTestColoring(GRAPH_SIMPLE_SAMPLES.GRAPH_SIMPLE1);
         self.templateTestColoring(GRAPH_SIMPLE_SAMPLES.GRAPH_TWO_CROSSROADS);
 
+    def testColoringRepresentations(self):
+        self.templateTestColoringRepresentations(GRAPH_SIMPLE_SAMPLES.GRAPH_BROKEN_CIRCLE1);
+        self.templateTestColoringRepresentations(GRAPH_SIMPLE_SAMPLES.GRAPH_FIVE_POINTED_FRAME_STAR);
+        self.templateTestColoringRepresentations(GRAPH_SIMPLE_SAMPLES.GRAPH_FULL2);
+        self.templateTestColoringRepresentations(GRAPH_SIMPLE_SAMPLES.GRAPH_ONE_CROSSROAD);
+        self.templateTestColoringRepresentations(GRAPH_SIMPLE_SAMPLES.GRAPH_SIMPLE1);
+        self.templateTestColoringRepresentations(GRAPH_SIMPLE_SAMPLES.GRAPH_TWO_CROSSROADS);
+
+    def testColoringLargeSparseGraph(self):
+        # circle of 200000 vertices where each vertex is connected with two following vertices
+        amount_vertices = 200000;
+        (file_descriptor, filename) = tempfile.mkstemp(suffix = '.grpr');
+        with os.fdopen(file_descriptor, 'w') as file:
+            for index in range(amount_vertices):
+                file.write("e %d %d\n" % (index + 1, (index + 1) % amount_vertices + 1));
+                file.write("e %d %d\n" % (index + 1, (index + 2) % amount_vertices + 1));
+        
+        try:
+            graph = read_graph(filename, True);
+        finally:
+            os.remove(filename);
+        
+        assert graph.type_graph_descr == type_graph_descr.GRAPH_VECTOR_DESCR;
+        assert graph.data[0] == [1, 2, amount_vertices - 2, amount_vertices - 1];
+        
+        dsatur_instance = dsatur(graph.data, graph.type_graph_descr);
+        dsatur_instance.process();
+        map_coloring = dsatur_instance.get_colors();
+        
+        # greedy coloring doesn't use more than (maximum degree + 1) colors
+        assert set(map_coloring) <= {1, 2, 3, 4, 5};
+        for index_node in range(amount_vertices):
+            for index_neighbor in graph.data[index_node]:
+                assert map_coloring[index_node] != map_coloring[index_neighbor];
+
 
 if __name__ == "__main__":
     unittest.main();
\ No newline at end of file
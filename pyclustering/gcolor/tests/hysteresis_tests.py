@@ -25,6 +25,8 @@
 
 import unittest;
 
+from scipy.sparse import csr_matrix;
+
 from pyclustering.gcolor.hysteresis import hysteresisgcolor;
 
 from pyclustering.utils.graph import read_graph;
@@ -32,11 +34,11 @@ from pyclustering.utils.graph import read_graph;
 from pyclustering.samples.definitions import GRAPH_SIMPLE_SAMPLES;
 
 class Test(unittest.TestCase):
-    def templateTestColoring(self, filename, alpha, eps, steps, time):
+    def templateTestColoring(self, filename, alpha, eps, steps, time, restarts = 1):
         graph = read_graph(filename);
         network = hysteresisgcolor(graph.data, alpha, eps);
         
-        output_analyser = network.process(steps, time);
+        output_analyser = network.process(steps, time, restarts = restarts);
         map_coloring = output_analyser.allocate_map_coloring(0.05, 20);
         
         # Check number of colors
@@ -71,6 +73,28 @@ class Test(unittest.TestCase):
     def testColoringTwoCrossroads(self):
         self.templateTestColoring(GRAPH_SIMPLE_SAMPLES.GRAPH_TWO_CROSSROADS, 1.2, 1.8, 1500, 15);
 
+    def testColoringRestarts(self):
+        self.templateTestColoring(GRAPH_SIMPLE_SAMPLES.GRAPH_SIMPLE1, 1.2, 1.8, 1500, 15, 4);
+        self.templateTestColoring(GRAPH_SIMPLE_SAMPLES.GRAPH_ONE_CROSSROAD, 1.2, 1.8, 1500, 15, 3);
+
+    def testRestartsWithoutDynamicCollection(self):
+        graph = read_graph(GRAPH_SIMPLE_SAMPLES.GRAPH_SIMPLE1);
+        network = hysteresisgcolor(graph.data, 1.2, 1.8);
+        
+        output_analyser = network.process(1500, 15, collect_dynamic = False, restarts = 3);
+        assert len(output_analyser) == 1;
+        assert list(output_analyser.output[0]) == list(network.states);
+
+    def testSparseGraphRepresentation(self):
+        graph = read_graph(GRAPH_SIMPLE_SAMPLES.GRAPH_TWO_CROSSROADS);
+        
+        dense_dynamic = hysteresisgcolor(graph.data, 1.2, 1.8).process(500, 5).output;
+        sparse_dynamic = hysteresisgcolor(csr_matrix(graph.data), 1.2, 1.8).process(500, 5).output;
+        
+        assert len(dense_dynamic) == len(sparse_dynamic);
+        for index in range(len(dense_dynamic)):
+            assert list(dense_dynamic[index]) == list(sparse_dynamic[index]);
+
 
 if __name__ == "__main__":
     unittest.main();
\ No newline at end of file
@@ -25,6 +25,10 @@
 
 import unittest;
 
+import numpy;
+
+from scipy.sparse import csr_matrix;
+
 from pyclustering.nnet import solve_type;
 
 from pyclustering.gcolor.sync import syncgcolor;
@@ -111,6 +115,52 @@ class Test(unittest.TestCase):
     def testOdeIntSolutionGraphFull2(self):
         self.templateTestColoringNegativeConnections(GRAPH_SIMPLE_SAMPLES.GRAPH_FULL2, solve_type.RK4);
 
+    def templateTestColoringRestarts(self, filename, restarts, solver_type):
+        graph = read_graph(filename);
+        syncgcolor_network = syncgcolor(graph.data, 0, -1);
+        
+        analyser = syncgcolor_network.process(solution = solver_type, restarts = restarts);
+        map_coloring = analyser.allocate_map_coloring(0.05);
+        
+        assert len(map_coloring) == len(graph.data);
+        assert numpy.array_equal(analyser.output[-1], syncgcolor_network._phases);
+
+    def testColoringRestarts(self):
+        self.templateTestColoringRestarts(GRAPH_SIMPLE_SAMPLES.GRAPH_SIMPLE1, 4, solve_type.FAST);
+        self.templateTestColoringRestarts(GRAPH_SIMPLE_SAMPLES.GRAPH_FULL1, 3, solve_type.FAST);
+
+    def testColoringRestartsOdeIntSolution(self):
+        self.templateTestColoringRestarts(GRAPH_SIMPLE_SAMPLES.GRAPH_BROKEN_CIRCLE1, 3, solve_type.RK4);
+
+    def testSparseGraphRepresentation(self):
+        graph = read_graph(GRAPH_SIMPLE_SAMPLES.GRAPH_TWO_CROSSROADS);
+        
+        dense_network = syncgcolor(graph.data, 0, -1);
+        sparse_network = syncgcolor(csr_matrix(graph.data), 0, -1);
+        sparse_network._phases = dense_network._phases.copy();
+        
+        dense_dynamic = dense_network.process(collect_dynamic = True).output;
+        sparse_dynamic = sparse_network.process(collect_dynamic = True).output;
+        
+        assert len(dense_dynamic) == len(sparse_dynamic);
+        assert numpy.array_equal(dense_dynamic[-1], sparse_dynamic[-1]);
+        
+        for index in range(len(graph.data)):
+            assert sorted(sparse_network.get_neighbors(index)) == [ neighbor for neighbor in range(len(graph.data)) if graph.data[index][neighbor] > 0 ];
+
+    def testPhaseKuramotoOfSingleOscillator(self):
+        graph = read_graph(GRAPH_SIMPLE_SAMPLES.GRAPH_SIMPLE1);
+        syncgcolor_network = syncgcolor(graph.data, 0.5, -1);
+        
+        phases = syncgcolor_network._phases;
+        for index in range(len(graph.data)):
+            expected = 0.0;
+            for neighbor in range(len(graph.data)):
+                weight = -1 if graph.data[index][neighbor] > 0 else 0.5;
+                expected += weight * numpy.sin(phases[neighbor] - phases[index]);
+            
+            assert abs(expected / len(graph.data) - syncgcolor_network._phase_kuramoto(phases[index], 0, index)) < 0.0000001;
+
 
 if __name__ == "__main__":
     unittest.main();
\ No newline at end of file
@@ -24,9 +24,14 @@
 """
 
 import math;
+import numpy;
 
 from enum import IntEnum;
 
+from pyclustering.utils.lazy_import import lazy_module;
+
+sparse = lazy_module('scipy.sparse');
+
 class initial_type(IntEnum):
     """!
     @brief Enumerator of types of oscillator output initialization.
@@ -91,7 +96,11 @@ class conn_represent(IntEnum):
     LIST = 0;
     
     ## Connections are represented my matrix connection NxN, where N is number of oscillators.
-    MATRIX = 1;    
+    MATRIX = 1;
+    
+    ## Connections are represented by compressed sparse row matrix (index pointers and column indexes), neighbors of
+    ## each oscillator are stored as a contiguous slice of column indexes.
+    CSR = 2;
 
 
 class network:
@@ -209,6 +218,19 @@ class network:
         elif (self._conn_represent == conn_represent.LIST):
             for index in range(0, self._num_osc, 1):
                 self._osc_conn.append([neigh for neigh in range(0, self._num_osc, 1) if index != neigh]); 
+        
+        elif (self._conn_represent == conn_represent.CSR):
+            amount_neighbors = max(self._num_osc - 1, 0);
+            
+            rows = numpy.repeat(numpy.arange(self._num_osc, dtype = numpy.int32), amount_neighbors);
+            columns = numpy.tile(numpy.arange(amount_neighbors, dtype = numpy.int32), self._num_osc);
+            columns += (columns >= rows);   # skip connection with itself
+            
+            pointers = numpy.arange(0, self._num_osc * amount_neighbors + 1, max(amount_neighbors, 1), dtype = numpy.int64);
+            if (amount_neighbors == 0):
+                pointers = numpy.zeros(self._num_osc + 1, dtype = numpy.int64);
+            
+            self._osc_conn = sparse.csr_matrix((numpy.ones(len(columns)), columns, pointers), shape = (self._num_osc, self._num_osc));
 
 
     def __create_grid_four_connections(self):
@@ -223,6 +245,9 @@ class network:
             self._osc_conn = [[0] * self._num_osc for index in range(0, self._num_osc, 1)];
         elif (self._conn_represent == conn_represent.LIST):
             self._osc_conn = [[] for index in range(0, self._num_osc, 1)];
+        elif (self._conn_represent == conn_represent.CSR):
+            self.__create_csr_connections(*self.__get_grid_connections(False));
+            return;
         else:
             raise NameError("Unknown type of representation of connections");
         
@@ -253,6 +278,10 @@ class network:
         
         """
         
+        if (self._conn_represent == conn_represent.CSR):
+            self.__create_csr_connections(*self.__get_grid_connections(True));
+            return;
+        
         self.__create_grid_four_connections();     # create connection with right, upper, left, lower.
         side_size = self.__width;
         
@@ -305,6 +334,87 @@ class network:
                 
                 if (index < (self._num_osc - 1)):
                     self._osc_conn[index].append(index + 1);
+        
+        elif (self._conn_represent == conn_represent.CSR):
+            indexes = numpy.arange(self._num_osc - 1);
+            rows = numpy.concatenate((indexes, indexes + 1));
+            columns = numpy.concatenate((indexes + 1, indexes));
+            self.__create_csr_connections(rows, columns);
+    
+    
+    def __get_grid_connections(self, diagonal):
+        """!
+        @brief Calculates connections of grid structure for all oscillators at once.
+        @details Connections are the same that are created for other representations by grid four and grid eight
+                  procedures.
+        
+        @param[in] diagonal (bool): If True then diagonal connections are also created (grid eight structure).
+        
+        @return (tuple) Pair of arrays (rows, columns) where each pair of elements defines connection.
+        
+        """
+        
+        side_size = self.__width;
+        indexes = numpy.arange(self._num_osc);
+        
+        node_row_index = -(-indexes // side_size);      # integer ceil(index / side_size) as for other representations.
+        
+        upper_index = indexes - side_size;
+        lower_index = indexes + side_size;
+        left_index = indexes - 1;
+        right_index = indexes + 1;
+        
+        masks = [ (upper_index, upper_index >= 0),
+                  (lower_index, lower_index < self._num_osc),
+                  (left_index, (left_index >= 0) & (-(-left_index // side_size) == node_row_index)),
+                  (right_index, (right_index < self._num_osc) & (-(-right_index // side_size) == node_row_index)) ];
+        
+        if (diagonal is True):
+            node_row_index = indexes // side_size;
+            for offset, row_offset in ((-side_size - 1, -1), (-side_size + 1, -1), (side_size - 1, 1), (side_size + 1, 1)):
+                neighbor_index = indexes + offset;
+                mask = (neighbor_index >= 0) & (neighbor_index < self._num_osc) & (neighbor_index // side_size == node_row_index + row_offset);
+                masks.append((neighbor_index, mask));
+        
+        rows = numpy.concatenate([ indexes[mask] for _, mask in masks ]);
+        columns = numpy.concatenate([ neighbor_index[mask] for neighbor_index, mask in masks ]);
+        
+        return rows, columns;
+    
+    
+    def __create_csr_connections(self, rows, columns):
+        """!
+        @brief Creates connections in CSR representation using pairs of connected oscillators.
+        
+        @param[in] rows (array_like): Indexes of oscillators that are connected with oscillators from 'columns'.
+        @param[in] columns (array_like): Indexes of neighbors of oscillators from 'rows'.
+        
+        """
+        
+        self._osc_conn = sparse.csr_matrix((numpy.ones(len(rows)), (rows, columns)), shape = (self._num_osc, self._num_osc));
+        self._osc_conn.sum_duplicates();
+        self._osc_conn.data[:] = 1.0;
+    
+    
+    def __update_csr_connections(self):
+        """!
+        @brief Merges connections that were set by user into CSR representation.
+        
+        """
+        
+        if (self.__amount_pending > 0):
+            rows, columns = [], [];
+            for index, neighbors in self.__pending_connections.items():
+                rows += [index] * len(neighbors);
+                columns += neighbors;
+            
+            self.__pending_connections = {};
+            self.__amount_pending = 0;
+            
+            pending = sparse.csr_matrix((numpy.ones(len(rows)), (rows, columns)), shape = (self._num_osc, self._num_osc));
+            self._osc_conn = self._osc_conn + pending;
+            self._osc_conn.sum_duplicates();
+            self._osc_conn.data[:] = 1.0;
     
     
     def __create_none_connections(self):
@@ -317,6 +427,8 @@ class network:
                 self._osc_conn.append([False] * self._num_osc);
         elif (self._conn_represent == conn_represent.LIST):
             self._osc_conn = [[] for _ in range(0, self._num_osc, 1)];
+        elif (self._conn_represent == conn_represent.CSR):
+            self.__create_csr_connections([], []);
 
     
     def __create_dynamic_connection(self):
@@ -329,6 +441,8 @@ class network:
                 self._osc_conn.append([False] * self._num_osc);   
         elif (self._conn_represent == conn_represent.LIST):
             self._osc_conn = [[] for _ in range(0, self._num_osc, 1)];
+        elif (self._conn_represent == conn_represent.CSR):
+            self.__create_csr_connections([], []);
         
     
     def _create_structure(self, type_conn = conn_type.ALL_TO_ALL):
@@ -340,6 +454,9 @@ class network:
         """
         
         self._osc_conn = list();
+        self.__pending_connections = {};
+        self.__amount_pending = 0;
+        self.__connectivity = None;
         
         if (type_conn == conn_type.NONE):
             self.__create_none_connections();
@@ -380,6 +497,14 @@ class network:
                     return True;
             return False;
         
+        elif (self._conn_represent == conn_represent.CSR):
+            if (j in self.__pending_connections.get(i, ())):
+                return True;
+            
+            neighbors = self._osc_conn.indices[self._osc_conn.indptr[i]:self._osc_conn.indptr[i + 1]];
+            position = numpy.searchsorted(neighbors, j);
+            return bool( (position < len(neighbors)) and (neighbors[position] == j) );
+        
         else:
             raise NameError("Unknown type of representation of coupling");
     
@@ -398,12 +523,23 @@ class network:
         if (self.structure != conn_type.DYNAMIC):
             raise NameError("Connection between oscillators can be changed only in case of dynamic type.");
         
+        self.__connectivity = None;
+        
         if (self._conn_represent == conn_represent.MATRIX):
             self._osc_conn[i][j] = True;
             self._osc_conn[j][i] = True;
+        elif (self._conn_represent == conn_represent.CSR):
+            if (self.has_connection(i, j) is False):
+                # connections are merged when amount of them is comparable with size of the matrix.
+                self.__pending_connections.setdefault(i, []).append(j);
+                self.__pending_connections.setdefault(j, []).append(i);
+                self.__amount_pending += 2;
+                
+                if (self.__amount_pending >= max(self._num_osc, self._osc_conn.nnz)):
+                    self.__update_csr_connections();
         else:
             self._osc_conn[i].append(j);
-            self._osc_conn[j].append(i); 
+            self._osc_conn[j].append(i);
     
     
     def get_neighbors(self, index):
@@ -412,7 +548,9 @@ class network:
         
         @param[in] index (uint): index of oscillator for which neighbors should be found in the network.
         
-        @return (list) Indexes of neighbors of the specified oscillator.
+        @return (list) Indexes of neighbors of the specified oscillator, in case of CSR representation it is a slice
+                 (array_like) of sorted column indexes that is not copied (if connections of the oscillator have not
+                 been changed since the last merge).
         
         """
         
@@ -420,5 +558,40 @@ class network:
             return self._osc_conn[index];      # connections are represented by list.
         elif (self._conn_represent == conn_represent.MATRIX):
             return [neigh_index for neigh_index in range(self._num_osc) if self._osc_conn[index][neigh_index] == True];
+        elif (self._conn_represent == conn_represent.CSR):
+            neighbors = self._osc_conn.indices[self._osc_conn.indptr[index]:self._osc_conn.indptr[index + 1]];
+            if (index in self.__pending_connections):
+                return numpy.union1d(neighbors, self.__pending_connections[index]);
+            
+            return neighbors;
         else:
             raise NameError("Unknown type of representation of connections");
+    
+    
+    def get_connectivity(self):
+        """!
+        @brief Returns connections between oscillators as a sparse matrix in CSR format.
+        @details In case of CSR representation the internal matrix is returned without copying, otherwise it is created
+                  from the internal representation once and cached until connections are changed. Values of the matrix
+                  are weights of connections (1.0 for each existing connection).
+        
+        @return (csr_matrix) Sparse matrix NxN of connections, where N is number of oscillators.
+        
+        """
+        
+        if (self._conn_represent == conn_represent.CSR):
+            self.__update_csr_connections();
+            return self._osc_conn;
+        
+        if (self.__connectivity is None):
+            rows, columns = [], [];
+            for index in range(self._num_osc):
+                neighbors = self.get_neighbors(index);
+                rows += [index] * len(neighbors);
+                columns += neighbors;
+            
+            self.__connectivity = sparse.csr_matrix((numpy.ones(len(rows)), (rows, columns)), shape = (self._num_osc, self._num_osc));
+            self.__connectivity.sum_duplicates();
+            self.__connectivity.data[:] = 1.0;
+        
+        return self.__connectivity;
@@ -24,25 +24,20 @@
 
 """
 
-import math
 import numpy
 import random
-import warnings
 
-try:
-    import matplotlib.pyplot as plt
+from pyclustering.utils.lazy_import import lazy_module
 
-    from matplotlib import rcParams
-    from matplotlib.font_manager import FontProperties
-except Exception as error_instance:
-    warnings.warn("Impossible to import matplotlib (please, install 'matplotlib'), pyclustering's visualization "
-                  "functionality is not available (details: '%s')." % str(error_instance))
+plt = lazy_module('matplotlib.pyplot', 'mpl_toolkits.mplot3d')
 
 from enum import IntEnum
 
+from scipy.sparse import csr_matrix, triu
 from scipy.spatial import Delaunay
+from scipy.spatial.distance import cdist
 
-from pyclustering.utils import euclidean_distance_square, average_neighbor_distance, heaviside, draw_dynamics
+from pyclustering.utils import average_neighbor_distance, draw_dynamics
 
 
 class type_conn(IntEnum):
@@ -72,16 +67,16 @@ class cnn_dynamic:
         """!
         @brief Costructor of the chaotic neural network output dynamic.
 
-        @param[in] output (list): Dynamic of oscillators on each step of simulation.
+        @param[in] output (array_like): Dynamic of oscillators on each step of simulation, where each row corresponds to step.
         @param[in] time (list): Simulation time.
         
         """
         
         ## Output value of each neuron on each iteration.
-        self.output = output or []
+        self.output = output if output is not None else []
         
         ## Sequence of simulation steps of the network.
-        self.time = time or []
+        self.time = time if time is not None else []
 
 
     def __len__(self):
@@ -100,17 +95,7 @@ class cnn_dynamic:
         @return (list) Observation matrix of the network dynamic.
         
         """
-        number_neurons = len(self.output[0])
-        observation_matrix = []
-        
-        for iteration in range(len(self.output)):
-            obervation_column = []
-            for index_neuron in range(number_neurons):
-                obervation_column.append(heaviside(self.output[iteration][index_neuron]))
-            
-            observation_matrix.append(obervation_column)
-        
-        return observation_matrix
+        return (numpy.asarray(self.output) > 0.0).astype(float).tolist()
     
     
     def __allocate_neuron_patterns(self, start_iteration, stop_iteration):
@@ -118,19 +103,11 @@ class cnn_dynamic:
         @brief Allocates observation transposed matrix of neurons that is limited by specified periods of simulation.
         @details Matrix where state of each neuron is denoted by zero/one in line with Heaviside function on each iteration.
         
-        @return (list) Transposed observation matrix that is limited by specified periods of simulation.
+        @return (numpy.ndarray) Transposed observation matrix that is limited by specified periods of simulation.
         
         """
         
-        pattern_matrix = []
-        for index_neuron in range(len(self.output[0])):
-            pattern_neuron = []
-            for iteration in range(start_iteration, stop_iteration):
-                pattern_neuron.append(heaviside(self.output[iteration][index_neuron]))
-            
-            pattern_matrix.append(pattern_neuron)
-        
-        return pattern_matrix
+        return (numpy.asarray(self.output)[start_iteration:stop_iteration] > 0.0).T
     
     
     def allocate_sync_ensembles(self, steps):
@@ -156,23 +133,15 @@ class cnn_dynamic:
         
         pattern_matrix = self.__allocate_neuron_patterns(start_iteration, end_iteration)
         
-        ensembles.append( [0] )
+        # neurons with the same pattern form ensemble, ensembles are ordered by their first neurons.
+        _, first_neurons, labels = numpy.unique(pattern_matrix, axis=0, return_index=True, return_inverse=True)
+        labels = labels.reshape(-1)
         
-        for index_neuron in range(1, len(self.output[0])):
-            neuron_pattern = pattern_matrix[index_neuron][:]
-            
-            neuron_assigned = False
-            
-            for ensemble in ensembles:
-                ensemble_pattern = pattern_matrix[ensemble[0]][:]
-
-                if neuron_pattern == ensemble_pattern:
-                    ensemble.append(index_neuron)
-                    neuron_assigned = True
-                    break
-            
-            if neuron_assigned is False:
-                ensembles.append( [index_neuron] )
+        neurons = numpy.argsort(labels, kind='stable')
+        groups = numpy.split(neurons, numpy.cumsum(numpy.bincount(labels))[:-1])
+        
+        for label in numpy.argsort(first_neurons):
+            ensembles.append(groups[label].tolist())
         
         return ensembles
 
@@ -276,13 +245,13 @@ class cnn_network:
         self.__amount_neighbors = amount_neighbors
         
         self.__average_distance = 0.0
-        self.__weights = None
+        self.__weights = None           # dense matrix for all-to-all structure, CSR matrix for triangulation
         self.__weights_summary = None
         
         self.__location = None     # just for network visualization
         
         random.seed()
-        self.__output = [ random.random() for _ in range(num_osc) ]
+        self.__output = numpy.array([ random.random() for _ in range(num_osc) ])
     
     
     def __len__(self):
@@ -302,24 +271,21 @@ class cnn_network:
         @param[in] steps (uint): Amount of steps for simulation.
         @param[in] stimulus (list): Stimulus that are used for simulation.
         
-        @return (cnn_dynamic) Output dynamic of the chaotic neural network.
+        @return (cnn_dynamic) Output dynamic of the chaotic neural network, output is stored as an array (steps x neurons) of float32.
         
         """
         
         self.__create_weights(stimulus)
         self.__location = stimulus
         
-        dynamic = cnn_dynamic([], [])
-        dynamic.output.append(self.__output)
-        dynamic.time.append(0)
+        output = numpy.empty((max(steps, 1), self.__num_osc), dtype=numpy.float32)
+        output[0] = self.__output
         
         for step in range(1, steps, 1):
             self.__output = self.__calculate_states()
-            
-            dynamic.output.append(self.__output)
-            dynamic.time.append(step)
-            
-        return dynamic
+            output[step] = self.__output
+        
+        return cnn_dynamic(output, list(range(len(output))))
     
     
     def __calculate_states(self):
@@ -327,33 +293,11 @@ class cnn_network:
         @brief Calculates new state of each neuron.
         @detail There is no any assignment.
         
-        @return (list) Returns new states (output).
+        @return (numpy.ndarray) Returns new states (output).
         
         """
         
-        output = [ 0.0 for _ in range(self.__num_osc) ]
-        
-        for i in range(self.__num_osc):
-            output[i] = self.__neuron_evolution(i)
-        
-        return output
-    
-    
-    def __neuron_evolution(self, index):
-        """!
-        @brief Calculates state of the neuron with specified index.
-        
-        @param[in] index (uint): Index of neuron in the network.
-        
-        @return (double) New output of the specified neuron.
-        
-        """
-        value = 0.0
-        
-        for index_neighbor in range(self.__num_osc):
-            value += self.__weights[index][index_neighbor] * (1.0 - 2.0 * (self.__output[index_neighbor] ** 2))
-        
-        return value / self.__weights_summary[index]
+        return self.__weights.dot(1.0 - 2.0 * (self.__output ** 2)) / self.__weights_summary
     
     
     def __create_weights(self, stimulus):
@@ -366,9 +310,6 @@ class cnn_network:
         
         self.__average_distance = average_neighbor_distance(stimulus, self.__amount_neighbors)
         
-        self.__weights = [ [ 0.0 for _ in range(len(stimulus)) ] for _ in range(len(stimulus)) ]
-        self.__weights_summary = [ 0.0 for _ in range(self.__num_osc) ]
-        
         if self.__conn_type == type_conn.ALL_TO_ALL:
             self.__create_weights_all_to_all(stimulus)
         
@@ -384,15 +325,12 @@ class cnn_network:
         
         """
         
-        for i in range(len(stimulus)):
-            for j in range(i + 1, len(stimulus)):
-                weight = self.__calculate_weight(stimulus[i], stimulus[j])
-                
-                self.__weights[i][j] = weight
-                self.__weights[j][i] = weight
-                
-                self.__weights_summary[i] += weight
-                self.__weights_summary[j] += weight
+        points = numpy.array(stimulus, dtype=float)
+        
+        self.__weights = self.__calculate_weight(cdist(points, points, 'sqeuclidean'))
+        numpy.fill_diagonal(self.__weights, 0.0)
+        
+        self.__weights_summary = numpy.sum(self.__weights, axis=1)
     
     
     def __create_weights_delaunay_triangulation(self, stimulus):
@@ -403,37 +341,37 @@ class cnn_network:
         
         """
         
-        points = numpy.array(stimulus)
+        points = numpy.array(stimulus, dtype=float)
         triangulation = Delaunay(points)
         
-        for triangle in triangulation.simplices:
-            for index_tri_point1 in range(len(triangle)):
-                for index_tri_point2 in range(index_tri_point1 + 1, len(triangle)):
-                    index_point1 = triangle[index_tri_point1]
-                    index_point2 = triangle[index_tri_point2]
-                    
-                    weight = self.__calculate_weight(stimulus[index_point1], stimulus[index_point2])
-                    
-                    self.__weights[index_point1][index_point2] = weight
-                    self.__weights[index_point2][index_point1] = weight
-                    
-                    self.__weights_summary[index_point1] += weight
-                    self.__weights_summary[index_point2] += weight
-    
-    
-    def __calculate_weight(self, stimulus1, stimulus2):
+        # edges of each triangle, an edge that belongs to several triangles contributes to summary several times.
+        pairs = numpy.array([ (i, j) for i in range(triangulation.simplices.shape[1]) for j in range(i + 1, triangulation.simplices.shape[1]) ])
+        edges = triangulation.simplices[:, pairs].reshape(-1, 2)
+        
+        weights = self.__calculate_weight(numpy.sum((points[edges[:, 0]] - points[edges[:, 1]]) ** 2, axis=1))
+        
+        self.__weights_summary = numpy.bincount(edges[:, 0], weights, self.__num_osc) + numpy.bincount(edges[:, 1], weights, self.__num_osc)
+        
+        edges, unique_indexes = numpy.unique(numpy.sort(edges, axis=1), axis=0, return_index=True)
+        weights = weights[unique_indexes]
+        
+        rows = numpy.concatenate((edges[:, 0], edges[:, 1]))
+        columns = numpy.concatenate((edges[:, 1], edges[:, 0]))
+        
+        self.__weights = csr_matrix((numpy.concatenate((weights, weights)), (rows, columns)), shape=(self.__num_osc, self.__num_osc))
+    
+    
+    def __calculate_weight(self, distances):
         """!
-        @brief Calculate weight between neurons that have external stimulus1 and stimulus2.
+        @brief Calculate weights between neurons using square euclidean distances between their external stimulus.
         
-        @param[in] stimulus1 (list): External stimulus of the first neuron.
-        @param[in] stimulus2 (list): External stimulus of the second neuron.
+        @param[in] distances (numpy.ndarray): Square euclidean distances between external stimulus of neurons.
         
-        @return (double) Weight between neurons that are under specified stimulus.
+        @return (numpy.ndarray) Weights between neurons that are under specified stimulus.
         
         """
         
-        distance = euclidean_distance_square(stimulus1, stimulus2)
-        return math.exp(-distance / (2.0 * self.__average_distance))
+        return numpy.exp(-distances / (2.0 * self.__average_distance))
 
     
     def show_network(self):
@@ -448,19 +386,22 @@ class cnn_network:
 
         (fig, axes) = self.__create_surface(dimension)
         
+        # draw connection between two points only one time
+        connections = triu(self.__weights, k=1).tocsr()
+        
         for i in range(0, self.__num_osc, 1):
+            neighbors = connections.indices[connections.indptr[i]:connections.indptr[i + 1]]
+            
             if dimension == 2:
                 axes.plot(self.__location[i][0], self.__location[i][1], 'bo')
-                for j in range(i, self.__num_osc, 1):    # draw connection between two points only one time
-                    if self.__weights[i][j] > 0.0:
-                        axes.plot([self.__location[i][0], self.__location[j][0]], [self.__location[i][1], self.__location[j][1]], 'b-', linewidth = 0.5)
+                for j in neighbors:
+                    axes.plot([self.__location[i][0], self.__location[j][0]], [self.__location[i][1], self.__location[j][1]], 'b-', linewidth = 0.5)
             
             elif dimension == 3:
                 axes.scatter(self.__location[i][0], self.__location[i][1], self.__location[i][2], c = 'b', marker = 'o')
                 
-                for j in range(i, self.__num_osc, 1):    # draw connection between two points only one time
-                    if self.__weights[i][j] > 0.0:
-                        axes.plot([self.__location[i][0], self.__location[j][0]], [self.__location[i][1], self.__location[j][1]], [self.__location[i][2], self.__location[j][2]], 'b-', linewidth = 0.5)
+                for j in neighbors:
+                    axes.plot([self.__location[i][0], self.__location[j][0]], [self.__location[i][1], self.__location[j][1]], [self.__location[i][2], self.__location[j][2]], 'b-', linewidth = 0.5)
                 
         plt.grid()
         plt.show()
@@ -476,6 +417,9 @@ class cnn_network:
         
         """
         
+        from matplotlib.font_manager import FontProperties
+        from matplotlib import rcParams
+
         rcParams['font.sans-serif'] = ['Arial']
         rcParams['font.size'] = 12
 
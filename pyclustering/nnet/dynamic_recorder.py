@@ -0,0 +1,301 @@
+"""!
+
+@brief Output dynamic recorder of oscillatory networks
+
+@authors Andrei Novikov (pyclustering@yandex.ru)
+@date 2014-2019
+@copyright GNU Public License
+
+@cond GNU_PUBLIC_LICENSE
+    PyClustering is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    
+    PyClustering is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+    
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+@endcond
+
+"""
+
+
+import numpy
+
+
+class dynamic_recorder:
+    """!
+    @brief Records output dynamic of an oscillatory network into preallocated numpy arrays.
+    @details States are stored in a buffer that grows twice when it is full, or in a ring buffer that keeps only the last
+              states if capacity is specified, or they are written to a file that is memory-mapped when the dynamic is
+              requested. Recorder can store only each k-th state (decimation) and only selected oscillators.
+    
+    Example:
+    @code
+        from pyclustering.nnet.sync import sync_network
+        from pyclustering.nnet.dynamic_recorder import dynamic_recorder
+        
+        network = sync_network(10000, ccore=False)
+        
+        # store each 10-th state of the first 100 oscillators in single precision
+        recorder = dynamic_recorder(len(network), numpy.float32, decimation=10, indexes=range(100))
+        output_dynamic = network.simulate_static(1000, 100, recorder=recorder)
+        
+        print(output_dynamic.output.shape)     # (102, 100) - initial, each 10-th and the last states
+    @endcode
+    
+    """
+    
+    def __init__(self, size, dtype=numpy.float64, decimation=1, indexes=None, capacity=None, filename=None, chunk_size=1024):
+        """!
+        @brief Constructor of the recorder.
+        
+        @param[in] size (uint): Amount of values in a state (amount of oscillators).
+        @param[in] dtype (numpy.dtype): Type of stored values, for example, numpy.float32 halves required memory.
+        @param[in] decimation (uint): Only each k-th state is stored, the last state is always stored.
+        @param[in] indexes (array_like): Indexes of oscillators whose values are stored, if 'None' then all values are stored.
+        @param[in] capacity (uint): If specified then only the last 'capacity' states are stored.
+        @param[in] filename (string): If specified then states are written to the file and dynamic is memory-mapped from it.
+        @param[in] chunk_size (uint): Initial amount of states in the buffer, in case of file it is amount of states that
+                    are written to the file at once.
+        
+        """
+        
+        self.__file = None
+        
+        if decimation < 1:
+            raise ValueError("Decimation should be positive integer (current value: '%s')." % decimation)
+        
+        if (capacity is not None) and (filename is not None):
+            raise ValueError("Ring buffer ('capacity') can't be used with memory-mapped file ('filename').")
+        
+        if (capacity is not None) and (capacity < 1):
+            raise ValueError("Capacity should be positive integer (current value: '%s')." % capacity)
+        
+        self.__indexes = None if indexes is None else numpy.asarray(indexes, dtype=numpy.int64)
+        self.__width = size if indexes is None else len(self.__indexes)
+        self.__dtype = numpy.dtype(dtype)
+        
+        self.__decimation = decimation
+        self.__capacity = capacity
+        self.__filename = filename
+        
+        length = capacity if capacity is not None else max(1, chunk_size)
+        self.__states = numpy.empty((length, self.__width), dtype=self.__dtype)
+        self.__times = numpy.empty(length)
+        
+        self.__amount = 0       # amount of states in the buffer
+        self.__start = 0        # position of the oldest state in case of ring buffer
+        self.__stored = 0       # amount of states that are written to the file
+        self.__calls = 0
+        
+        self.__pending = None   # the last state that has been skipped by decimation
+        self.__stored_times = []
+        self.__output = None
+        
+        if filename is not None:
+            self.__file = open(filename, 'wb')
+    
+    
+    def __del__(self):
+        """!
+        @brief Destructor of the recorder that closes the file of dynamic if it is used.
+        
+        """
+        
+        if self.__file is not None:
+            self.__file.close()
+    
+    
+    def __len__(self):
+        """!
+        @brief Returns amount of stored states.
+        
+        """
+        
+        return self.__stored + self.__amount + (1 if self.__pending is not None else 0)
+    
+    
+    @property
+    def decimation(self):
+        """!
+        @brief (uint) Returns decimation of the recorder - only each k-th state is stored.
+        
+        """
+        
+        return self.__decimation
+    
+    
+    @property
+    def capacity(self):
+        """!
+        @brief (uint) Returns maximum amount of stored states if ring buffer is used, otherwise 'None'.
+        
+        """
+        
+        return self.__capacity
+    
+    
+    def companion(self, size):
+        """!
+        @brief Creates in-memory recorder with the same decimation and capacity for auxiliary values of the network, for
+                example, for global inhibitor, that are recorded simultaneously with the main output.
+        
+        @param[in] size (uint): Amount of auxiliary values in a state.
+        
+        @return (dynamic_recorder) Recorder whose states correspond to states of this recorder.
+        
+        """
+        
+        return dynamic_recorder(size, decimation=self.__decimation, capacity=self.__capacity)
+    
+    
+    @property
+    def output(self):
+        """!
+        @brief (numpy.ndarray) Returns stored states (amount of states x amount of oscillators), it is a view of the buffer
+                or memory-mapped array in case of file.
+        
+        """
+        
+        self.__finish()
+        
+        if self.__filename is None:
+            return self.__states[:self.__amount]
+        
+        if self.__output is None:
+            self.__output = numpy.memmap(self.__filename, dtype=self.__dtype, mode='r', shape=(self.__stored, self.__width)) \
+                if self.__stored > 0 else numpy.empty((0, self.__width), dtype=self.__dtype)
+        
+        return self.__output
+    
+    
+    @property
+    def time(self):
+        """!
+        @brief (numpy.ndarray) Returns simulation time of each stored state.
+        
+        """
+        
+        self.__finish()
+        
+        if self.__filename is None:
+            return self.__times[:self.__amount]
+        
+        if len(self.__stored_times) > 1:
+            self.__stored_times = [ numpy.concatenate(self.__stored_times) ]
+        
+        return self.__stored_times[0] if len(self.__stored_times) > 0 else numpy.empty(0)
+    
+    
+    def record(self, t, state):
+        """!
+        @brief Records state of the network, it is stored only if it is each k-th state in line with decimation.
+        @details States can't be recorded to the file after time or output has been requested.
+        
+        @param[in] t (double): Simulation time of the state.
+        @param[in] state (array_like): State of each oscillator of the network.
+        
+        """
+        
+        if (self.__filename is not None) and (self.__file is None):
+            # the file is closed when time or output is requested, states that are recorded after that would be lost.
+            raise RuntimeError("Dynamic can't be recorded to the file after it has been read.")
+        
+        state = numpy.asarray(state)
+        if self.__indexes is not None:
+            state = state[self.__indexes]
+        
+        stored = (self.__calls % self.__decimation) == 0
+        self.__calls += 1
+        
+        if stored:
+            self.__pending = None
+            self.__append(t, state)
+        else:
+            self.__pending = (t, numpy.array(state, dtype=self.__dtype))
+    
+    
+    def __finish(self):
+        """!
+        @brief Stores the last state if it has been skipped by decimation and writes buffer to the file.
+        
+        """
+        
+        if self.__pending is not None:
+            (t, state), self.__pending = self.__pending, None
+            self.__append(t, state)
+        
+        if self.__capacity is not None and self.__start > 0:
+            # the oldest state is moved to the beginning of the buffer to return a view.
+            order = numpy.roll(numpy.arange(self.__capacity), -self.__start)
+            self.__states[:] = self.__states[order]
+            self.__times[:] = self.__times[order]
+            self.__start = 0
+        
+        if self.__file is not None:
+            self.__flush()
+            self.__file.close()
+            self.__file = None
+    
+    
+    def __append(self, t, state):
+        """!
+        @brief Appends state to the buffer.
+        
+        """
+        
+        if self.__capacity is not None:
+            position = (self.__start + self.__amount) % self.__capacity
+            if self.__amount == self.__capacity:
+                self.__start = (self.__start + 1) % self.__capacity
+            else:
+                self.__amount += 1
+        
+        else:
+            if self.__amount == len(self.__states):
+                if self.__file is not None:
+                    self.__flush()
+                else:
+                    self.__grow()
+            
+            position = self.__amount
+            self.__amount += 1
+        
+        self.__states[position] = state
+        self.__times[position] = t
+    
+    
+    def __grow(self):
+        """!
+        @brief Increases size of the buffer twice.
+        
+        """
+        
+        states = numpy.empty((2 * len(self.__states), self.__width), dtype=self.__dtype)
+        states[:self.__amount] = self.__states[:self.__amount]
+        
+        times = numpy.empty(2 * len(self.__times))
+        times[:self.__amount] = self.__times[:self.__amount]
+        
+        self.__states, self.__times = states, times
+    
+    
+    def __flush(self):
+        """!
+        @brief Writes states from the buffer to the file, times are kept in memory.
+        
+        """
+        
+        if self.__amount == 0:
+            return
+        
+        self.__file.write(self.__states[:self.__amount].tobytes())
+        self.__stored_times.append(self.__times[:self.__amount].copy())
+        
+        self.__stored += self.__amount
+        self.__amount = 0
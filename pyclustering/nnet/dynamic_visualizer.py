@@ -23,13 +23,11 @@
 
 """
 
-import warnings
+import numpy
 
-try:
-    import matplotlib.pyplot as plt
-except Exception as error_instance:
-    warnings.warn("Impossible to import matplotlib (please, install 'matplotlib'), pyclustering's visualization "
-                  "functionality is not available (details: '%s')." % str(error_instance))
+from pyclustering.utils.lazy_import import lazy_module
+
+plt = lazy_module('matplotlib.pyplot')
 
 from pyclustering.utils import set_ax_param
 
@@ -147,13 +145,13 @@ class dynamic_descr:
             return separate;
         
         elif (input_separate is False):
-            if (isinstance(self.dynamics[0], list) is True):
+            if (numpy.ndim(self.dynamics[0]) > 0):
                 return [ self.canvas ] * len(self.dynamics[0]);
             else:
                 return [ self.canvas ];
         
         elif (input_separate is True):
-            if (isinstance(self.dynamics[0], list) is True):
+            if (numpy.ndim(self.dynamics[0]) > 0):
                 return range(self.canvas, self.canvas + len(self.dynamics[0]));
             else:
                 return [ self.canvas ];
@@ -268,7 +266,7 @@ class dynamic_visualizer:
 
 
     def __display_dynamic(self, axis, dyn_descr):
-        if (isinstance(dyn_descr.dynamics[0], list) is True):
+        if (numpy.ndim(dyn_descr.dynamics[0]) > 0):
             self.__display_multiple_dynamic(axis, dyn_descr);
         
         else:
@@ -29,9 +29,12 @@ import numpy
 import random
 import pyclustering.utils
 
-from scipy.integrate import odeint
+from pyclustering.utils.lazy_import import lazy_module
 
 from pyclustering.nnet import network, conn_type, conn_represent
+from pyclustering.nnet.dynamic_recorder import dynamic_recorder
+
+integrate = lazy_module('scipy.integrate')
 
 
 class fsync_dynamic:
@@ -214,7 +217,7 @@ class fsync_network(network):
                     single double value and for each separately by list.
         @param[in] factor_coupling (double): Coupling strength between oscillators.
         @param[in] type_conn (conn_type): Type of connection between oscillators in the network (all-to-all, grid, bidirectional list, etc.).
-        @param[in] representation (conn_represent): Internal representation of connection in the network: matrix or list.
+        @param[in] representation (conn_represent): Internal representation of connection in the network: matrix, list or CSR.
         
         """
         
@@ -229,13 +232,15 @@ class fsync_network(network):
         self.__amplitude = [ random.random() for _ in range(num_osc) ];
 
 
-    def simulate(self, steps, time, collect_dynamic = False):
+    def simulate(self, steps, time, collect_dynamic = False, recorder = None):
         """!
         @brief Performs static simulation of oscillatory network.
         
         @param[in] steps (uint): Number simulation steps.
         @param[in] time (double): Time of simulation.
         @param[in] collect_dynamic (bool): If True - returns whole dynamic of oscillatory network, otherwise returns only last values of dynamics.
+        @param[in] recorder (dynamic_recorder): Recorder of real parts of amplitudes (decimation, subset of oscillators,
+                    single precision, memory-mapped file), if it is specified then 'collect_dynamic' is ignored.
         
         @return (list) Dynamic of oscillatory network. If argument 'collect_dynamic' is True, than return dynamic for the whole simulation time,
                  otherwise returns only last values (last step of simulation) of output dynamic.
@@ -245,7 +250,11 @@ class fsync_network(network):
         
         """
         
-        dynamic_amplitude, dynamic_time = ([], []) if collect_dynamic is False else ([self.__amplitude], [0]);
+        if recorder is None and collect_dynamic is True:
+            recorder = dynamic_recorder(self._num_osc);
+        
+        if recorder is not None:
+            recorder.record(0, self.__real_amplitudes());
         
         step = time / steps;
         int_step = step / 10.0;
@@ -253,18 +262,27 @@ class fsync_network(network):
         for t in numpy.arange(step, time + step, step):
             self.__amplitude = self.__calculate(t, step, int_step);
             
-            if collect_dynamic is True:
-                dynamic_amplitude.append([ numpy.real(amplitude)[0] for amplitude in self.__amplitude ]);
-                dynamic_time.append(t);
+            if recorder is not None:
+                recorder.record(t, self.__real_amplitudes());
         
-        if collect_dynamic is False:
-            dynamic_amplitude.append([ numpy.real(amplitude)[0] for amplitude in self.__amplitude ]);
-            dynamic_time.append(time);
+        if recorder is None:
+            return fsync_dynamic([ self.__real_amplitudes().tolist() ], [ time ]);
 
-        output_sync_dynamic = fsync_dynamic(dynamic_amplitude, dynamic_time);
+        output_sync_dynamic = fsync_dynamic(recorder.output, recorder.time);
         return output_sync_dynamic;
 
 
+    def __real_amplitudes(self):
+        """!
+        @brief Returns real parts of amplitudes of oscillators.
+        
+        @return (numpy.array) Real part of amplitude of each oscillator.
+        
+        """
+        
+        return numpy.real(numpy.asarray(self.__amplitude)).reshape(self._num_osc);
+
+
     def __calculate(self, t, step, int_step):
         """!
         @brief Calculates new amplitudes for oscillators in the network in line with current step.
@@ -281,7 +299,7 @@ class fsync_network(network):
         
         for index in range (0, self._num_osc, 1):
             z = numpy.array(self.__amplitude[index], dtype = numpy.complex128, ndmin = 1);
-            result = odeint(self.__calculate_amplitude, z.view(numpy.float64), numpy.arange(t - step, t, int_step), (index , ));
+            result = integrate.odeint(self.__calculate_amplitude, z.view(numpy.float64), numpy.arange(t - step, t, int_step), (index , ));
             next_amplitudes[index] = (result[len(result) - 1]).view(numpy.complex128);
         
         return next_amplitudes;
@@ -327,10 +345,9 @@ class fsync_network(network):
         
         sync_influence = 0.0;
         
-        for k in range(self._num_osc):
-            if self.has_connection(index, k) is True:
-                amplitude_neighbor = numpy.array(self.__amplitude[k], dtype = numpy.complex128, ndmin = 1);
-                sync_influence += amplitude_neighbor - amplitude;
+        for k in self.get_neighbors(index):
+            amplitude_neighbor = numpy.array(self.__amplitude[k], dtype = numpy.complex128, ndmin = 1);
+            sync_influence += amplitude_neighbor - amplitude;
         
         return sync_influence * self.__coupling_strength / self._num_osc;
 
@@ -24,15 +24,15 @@
 
 """
 
-from scipy.integrate import odeint
-
 from pyclustering.core.wrapper import ccore_library
 
 import pyclustering.core.hhn_wrapper as wrapper
 
 from pyclustering.nnet import *
+from pyclustering.nnet.dynamic_recorder import dynamic_recorder
 
 from pyclustering.utils import allocate_sync_ensembles
+from pyclustering.utils.integrate import rk4, rkf45
 
 import numpy
 import random
@@ -216,7 +216,7 @@ class hhn_network(network):
         @param[in] stimulus (list): List of stimulus for oscillators, number of stimulus should be equal to number of peripheral oscillators.
         @param[in] parameters (hhn_parameters): Parameters of the network.
         @param[in] type_conn (conn_type): Type of connections between oscillators in the network (ignored for this type of network).
-        @param[in] type_conn_represent (conn_represent): Internal representation of connection in the network: matrix or list.
+        @param[in] type_conn_represent (conn_represent): Internal representation of connection in the network: matrix, list or CSR.
         @param[in] ccore (bool): If 'True' then CCORE is used (C/C++ implementation of the model).
         
         """
@@ -241,18 +241,20 @@ class hhn_network(network):
         else:
             self._membrane_dynamic_pointer = None;        # final result is stored here.
             
-            self._membrane_potential        = [0.0] * self._num_osc;
-            self._active_cond_sodium        = [0.0] * self._num_osc;
-            self._inactive_cond_sodium      = [0.0] * self._num_osc;
-            self._active_cond_potassium     = [0.0] * self._num_osc;
-            self._link_activation_time      = [0.0] * self._num_osc;
-            self._link_pulse_counter        = [0.0] * self._num_osc;
-            self._link_deactivation_time    = [0.0] * self._num_osc;
-            self._link_weight3              = [0.0] * self._num_osc;
+            self._membrane_potential        = numpy.zeros(self._num_osc);
+            self._active_cond_sodium        = numpy.zeros(self._num_osc);
+            self._inactive_cond_sodium      = numpy.zeros(self._num_osc);
+            self._active_cond_potassium     = numpy.zeros(self._num_osc);
+            self._link_activation_time      = numpy.zeros(self._num_osc);
+            self._link_pulse_counter        = numpy.zeros(self._num_osc);
+            self._link_deactivation_time    = numpy.zeros(self._num_osc);
+            self._link_weight3              = numpy.zeros(self._num_osc);
             self._pulse_generation_time     = [ [] for i in range(self._num_osc) ];
-            self._pulse_generation          = [False] * self._num_osc;
+            self._pulse_generation          = numpy.zeros(self._num_osc, dtype = bool);
+            
+            self.__peripheral_pulse_history = [];   # pulse generation times of all peripheral neurons
             
-            self._noise = [random.random() * 2.0 - 1.0 for i in range(self._num_osc)];
+            self._noise = numpy.array([ random.random() * 2.0 - 1.0 for i in range(self._num_osc) ]);
             
             self._central_element = [central_element(), central_element()];
 
@@ -266,40 +268,43 @@ class hhn_network(network):
             wrapper.hhn_destroy(self.__ccore_hhn_pointer)
 
 
-    def simulate(self, steps, time, solution = solve_type.RK4):
+    def simulate(self, steps, time, solution = solve_type.RK4, recorder = None):
         """!
         @brief Performs static simulation of oscillatory network based on Hodgkin-Huxley neuron model.
         @details Output dynamic is sensible to amount of steps of simulation and solver of differential equation.
-                  Python implementation uses 'odeint' from 'scipy', CCORE uses classical RK4 and RFK45 methods,
-                  therefore in case of CCORE HHN (Hodgkin-Huxley network) amount of steps should be greater than in
-                  case of Python HHN.
+                  Python implementation integrates the whole network at once using RK4 or RKF45 methods from
+                  'pyclustering.utils.integrate', CCORE uses the same classical methods.
 
         @param[in] steps (uint): Number steps of simulations during simulation.
         @param[in] time (double): Time of simulation.
         @param[in] solution (solve_type): Type of solver for differential equations.
+        @param[in] recorder (dynamic_recorder): Recorder of peripheral neurons dynamic, see simulate_static().
         
         @return (tuple) Dynamic of oscillatory network represented by (time, peripheral neurons dynamic, central elements
-                dynamic), where types are (list, list, list).
+                dynamic), where types are (numpy.ndarray, numpy.ndarray, numpy.ndarray).
         
         """
         
-        return self.simulate_static(steps, time, solution);
+        return self.simulate_static(steps, time, solution, recorder);
     
     
-    def simulate_static(self, steps, time, solution = solve_type.RK4):
+    def simulate_static(self, steps, time, solution = solve_type.RK4, recorder = None):
         """!
         @brief Performs static simulation of oscillatory network based on Hodgkin-Huxley neuron model.
         @details Output dynamic is sensible to amount of steps of simulation and solver of differential equation.
-                  Python implementation uses 'odeint' from 'scipy', CCORE uses classical RK4 and RFK45 methods,
-                  therefore in case of CCORE HHN (Hodgkin-Huxley network) amount of steps should be greater than in
-                  case of Python HHN.
+                  Python implementation integrates the whole network at once using RK4 or RKF45 methods from
+                  'pyclustering.utils.integrate', CCORE uses the same classical methods. Python implementation stores
+                  dynamic into preallocated arrays using recorder, central elements are recorded with the same
+                  decimation and capacity as peripheral neurons.
 
         @param[in] steps (uint): Number steps of simulations during simulation.
         @param[in] time (double): Time of simulation.
         @param[in] solution (solve_type): Type of solver for differential equations.
+        @param[in] recorder (dynamic_recorder): Recorder of peripheral neurons dynamic, by default the whole dynamic is
+                    stored in double precision, it is not supported by CCORE.
         
         @return (tuple) Dynamic of oscillatory network represented by (time, peripheral neurons dynamic, central elements
-                dynamic), where types are (list, list, list).
+                dynamic), where types are (numpy.ndarray, numpy.ndarray, numpy.ndarray).
         
         """
         
@@ -313,9 +318,9 @@ class hhn_network(network):
             self.__ccore_hhn_dynamic_pointer = wrapper.hhn_dynamic_create(True, False, False, False);
             wrapper.hhn_simulate(self.__ccore_hhn_pointer, steps, time, solution, self._stimulus, self.__ccore_hhn_dynamic_pointer);
             
-            peripheral_membrane_potential = wrapper.hhn_dynamic_get_peripheral_evolution(self.__ccore_hhn_dynamic_pointer, 0);
-            central_membrane_potential = wrapper.hhn_dynamic_get_central_evolution(self.__ccore_hhn_dynamic_pointer, 0);
-            dynamic_time = wrapper.hhn_dynamic_get_time(self.__ccore_hhn_dynamic_pointer);
+            peripheral_membrane_potential = numpy.array(wrapper.hhn_dynamic_get_peripheral_evolution(self.__ccore_hhn_dynamic_pointer, 0));
+            central_membrane_potential = numpy.array(wrapper.hhn_dynamic_get_central_evolution(self.__ccore_hhn_dynamic_pointer, 0));
+            dynamic_time = numpy.array(wrapper.hhn_dynamic_get_time(self.__ccore_hhn_dynamic_pointer));
             
             self._membrane_dynamic_pointer = peripheral_membrane_potential;
 
@@ -323,12 +328,13 @@ class hhn_network(network):
             
             return (dynamic_time, peripheral_membrane_potential, central_membrane_potential);
         
-        if (solution == solve_type.RKF45):
-            raise NameError("Solver RKF45 is not support in python version.");
+        if (recorder is None):
+            recorder = dynamic_recorder(self._num_osc);
         
-        dyn_peripheral = [ self._membrane_potential[:] ];
-        dyn_central = [ [0.0, 0.0] ];
-        dyn_time = [ 0.0 ];
+        central_recorder = recorder.companion(2);
+        
+        recorder.record(0.0, self._membrane_potential);
+        central_recorder.record(0.0, [0.0, 0.0]);
         
         step = time / steps;
         int_step = step / 10.0;
@@ -338,17 +344,18 @@ class hhn_network(network):
             (memb_peripheral, memb_central) = self._calculate_states(solution, t, step, int_step);
             
             # update states of oscillators
-            dyn_peripheral.append(memb_peripheral);
-            dyn_central.append(memb_central);
-            dyn_time.append(t);
+            recorder.record(t, memb_peripheral);
+            central_recorder.record(t, memb_central);
         
-        self._membrane_dynamic_pointer = dyn_peripheral;
-        return (dyn_time, dyn_peripheral, dyn_central);
+        self._membrane_dynamic_pointer = recorder.output;
+        return (recorder.time, recorder.output, central_recorder.output);
     
     
     def _calculate_states(self, solution, t, step, int_step):
         """!
         @brief Caclculates new state of each oscillator in the network. Returns only excitatory state of oscillators.
+        @details States of peripheral neurons and central elements are integrated together as one system, pulse
+                  generation times that define synaptic currents are considered as constants during the step.
         
         @param[in] solution (solve_type): Type solver of the differential equations.
         @param[in] t (double): Current time of simulation.
@@ -360,36 +367,23 @@ class hhn_network(network):
                  
         """
         
-        next_membrane           = [0.0] * self._num_osc;
-        next_active_sodium      = [0.0] * self._num_osc;
-        next_inactive_sodium    = [0.0] * self._num_osc;
-        next_active_potassium   = [0.0] * self._num_osc;
-        
-        # Update states of oscillators
-        for index in range (0, self._num_osc, 1):
-            result = odeint(self.hnn_state, 
-                            [ self._membrane_potential[index], self._active_cond_sodium[index], self._inactive_cond_sodium[index], self._active_cond_potassium[index] ], 
-                            numpy.arange(t - step, t, int_step), 
-                            (index , ));
-                            
-            [ next_membrane[index], next_active_sodium[index], next_inactive_sodium[index], next_active_potassium[index] ] = result[len(result) - 1][0:4];        
-        
-        next_cn_membrane            = [0.0, 0.0];
-        next_cn_active_sodium       = [0.0, 0.0];
-        next_cn_inactive_sodium     = [0.0, 0.0];
-        next_cn_active_potassium    = [0.0, 0.0];
-        
-        # Update states of central elements
-        for index in range(0, len(self._central_element)):
-            result = odeint(self.hnn_state, 
-                            [ self._central_element[index].membrane_potential, self._central_element[index].active_cond_sodium, self._central_element[index].inactive_cond_sodium, self._central_element[index].active_cond_potassium ], 
-                            numpy.arange(t - step, t, int_step), 
-                            (self._num_osc + index , ));
-                            
-            [ next_cn_membrane[index], next_cn_active_sodium[index], next_cn_inactive_sodium[index], next_cn_active_potassium[index] ] = result[len(result) - 1][0:4];
+        self.__prepare_synaptic_influence();
+        
+        states = numpy.array([ numpy.concatenate((self._membrane_potential, [ element.membrane_potential for element in self._central_element ])),
+                               numpy.concatenate((self._active_cond_sodium, [ element.active_cond_sodium for element in self._central_element ])),
+                               numpy.concatenate((self._inactive_cond_sodium, [ element.inactive_cond_sodium for element in self._central_element ])),
+                               numpy.concatenate((self._active_cond_potassium, [ element.active_cond_potassium for element in self._central_element ])) ]);
+        
+        if (solution == solve_type.RKF45):
+            next_states = rkf45(lambda states, time: self.hnn_state(states, time, None), states, t - step, t, step = int_step);
+        else:
+            next_states = rk4(lambda states, time: self.hnn_state(states, time, None), states, t - step, t, max(1, int(round(step / int_step))));
+        
+        [ next_membrane, next_active_sodium, next_inactive_sodium, next_active_potassium ] = next_states[:, :self._num_osc];
+        [ next_cn_membrane, next_cn_active_sodium, next_cn_inactive_sodium, next_cn_active_potassium ] = next_states[:, self._num_osc:].tolist();
         
         # Noise generation
-        self._noise = [ 1.0 + 0.01 * (random.random() * 2.0 - 1.0) for i in range(self._num_osc)];
+        self._noise = 1.0 + 0.01 * (numpy.array([ random.random() for _ in range(self._num_osc) ]) * 2.0 - 1.0);
         
         # Updating states of PNs
         self.__update_peripheral_neurons(t, step, next_membrane, next_active_sodium, next_inactive_sodium, next_active_potassium);
@@ -397,7 +391,22 @@ class hhn_network(network):
         # Updation states of CN
         self.__update_central_neurons(t, next_cn_membrane, next_cn_active_sodium, next_cn_inactive_sodium, next_cn_active_potassium);
         
-        return (next_membrane, next_cn_membrane);
+        return (next_membrane.tolist(), next_cn_membrane);
+    
+    
+    def __prepare_synaptic_influence(self):
+        """!
+        @brief Prepares external currents, synaptic potentials and pulse generation times of the whole network
+                (peripheral neurons followed by central elements) that are used for integration during the step.
+        
+        """
+        
+        self.__external_current = numpy.concatenate((numpy.array(self._stimulus, dtype = float) * self._noise, [ self._params.Icn1, self._params.Icn2 ]));
+        self.__synaptic_potential = numpy.concatenate((numpy.full(self._num_osc, self._params.Vsyninh), [ self._params.Vsynexc, self._params.Vsyninh ]));
+        
+        self.__cn1_pulse_times = numpy.array(self._central_element[0].pulse_generation_time);
+        self.__cn2_pulse_times = numpy.array(self._central_element[1].pulse_generation_time);
+        self.__peripheral_pulse_times = numpy.array(self.__peripheral_pulse_history);
     
     
     def __update_peripheral_neurons(self, t, step, next_membrane, next_active_sodium, next_inactive_sodium, next_active_potassium):
@@ -406,37 +415,38 @@ class hhn_network(network):
         
         @param[in] t (doubles): Current time of simulation.
         @param[in] step (uint): Step (time duration) during simulation when states of oscillators should be calculated.
-        @param[in] next_membrane (list): New values of membrane potentials for peripheral neurons.
-        @Param[in] next_active_sodium (list): New values of activation conductances of the sodium channels for peripheral neurons.
-        @param[in] next_inactive_sodium (list): New values of inactivaton conductances of the sodium channels for peripheral neurons.
-        @param[in] next_active_potassium (list): New values of activation conductances of the potassium channel for peripheral neurons.
+        @param[in] next_membrane (numpy.array): New values of membrane potentials for peripheral neurons.
+        @Param[in] next_active_sodium (numpy.array): New values of activation conductances of the sodium channels for peripheral neurons.
+        @param[in] next_inactive_sodium (numpy.array): New values of inactivaton conductances of the sodium channels for peripheral neurons.
+        @param[in] next_active_potassium (numpy.array): New values of activation conductances of the potassium channel for peripheral neurons.
         
         """
         
-        self._membrane_potential = next_membrane[:];
-        self._active_cond_sodium = next_active_sodium[:];
-        self._inactive_cond_sodium = next_inactive_sodium[:];
-        self._active_cond_potassium = next_active_potassium[:];
-        
-        for index in range(0, self._num_osc):
-            if (self._pulse_generation[index] is False):
-                if (self._membrane_potential[index] >= 0.0):
-                    self._pulse_generation[index] = True;
-                    self._pulse_generation_time[index].append(t);
-            elif (self._membrane_potential[index] < 0.0):
-                self._pulse_generation[index] = False;
-            
-            # Update connection from CN2 to PN
-            if (self._link_weight3[index] == 0.0):
-                if (self._membrane_potential[index] > self._params.threshold):
-                    self._link_pulse_counter[index] += step;
-                
-                    if (self._link_pulse_counter[index] >= 1 / self._params.eps):
-                        self._link_weight3[index] = self._params.w3;
-                        self._link_activation_time[index] = t;
-            elif ( not ((self._link_activation_time[index] < t) and (t < self._link_activation_time[index] + self._params.deltah)) ):
-                self._link_weight3[index] = 0.0;
-                self._link_pulse_counter[index] = 0.0;
+        self._membrane_potential = next_membrane;
+        self._active_cond_sodium = next_active_sodium;
+        self._inactive_cond_sodium = next_inactive_sodium;
+        self._active_cond_potassium = next_active_potassium;
+        
+        generation = self._membrane_potential >= 0.0;
+        for index in numpy.flatnonzero(generation & ~self._pulse_generation):
+            self._pulse_generation_time[index].append(t);
+            self.__peripheral_pulse_history.append(t);
+        
+        self._pulse_generation = generation;
+        
+        # Update connection from CN2 to PN
+        disabled = (self._link_weight3 == 0.0);
+        
+        accumulating = disabled & (self._membrane_potential > self._params.threshold);
+        self._link_pulse_counter[accumulating] += step;
+        
+        activated = accumulating & (self._link_pulse_counter >= 1 / self._params.eps);
+        self._link_weight3[activated] = self._params.w3;
+        self._link_activation_time[activated] = t;
+        
+        expired = ~disabled & ~( (self._link_activation_time < t) & (t < self._link_activation_time + self._params.deltah) );
+        self._link_weight3[expired] = 0.0;
+        self._link_pulse_counter[expired] = 0.0;
     
     
     def __update_central_neurons(self, t, next_cn_membrane, next_cn_active_sodium, next_cn_inactive_sodium, next_cn_active_potassium):
@@ -467,13 +477,16 @@ class hhn_network(network):
     
     def hnn_state(self, inputs, t, argv):
         """!
-        @brief Returns new values of excitatory and inhibitory parts of oscillator and potential of oscillator.
+        @brief Returns new values of excitatory and inhibitory parts of oscillators and potential of oscillators.
         
-        @param[in] inputs (list): States of oscillator for integration [v, m, h, n] (see description below).
+        @param[in] inputs (array_like): States of oscillators for integration [v, m, h, n] (see description below), where
+                    each row contains values of oscillators.
         @param[in] t (double): Current time of simulation.
-        @param[in] argv (tuple): Extra arguments that are not used for integration - index of oscillator.
+        @param[in] argv (array_like): Extra arguments that are not used for integration - indexes of oscillators whose
+                    states are in 'inputs', if 'None' then inputs contain states of the whole network (peripheral
+                    neurons followed by central element 1 and 2).
         
-        @return (list) new values of oscillator [v, m, h, n], where:
+        @return (numpy.array) new values of oscillators [v, m, h, n], where:
                 v - membrane potantial of oscillator,
                 m - activation conductance of the sodium channel,
                 h - inactication conductance of the sodium channel,
@@ -481,8 +494,6 @@ class hhn_network(network):
         
         """
         
-        index = argv;
-        
         v = inputs[0]; # membrane potential (v).
         m = inputs[1]; # activation conductance of the sodium channel (m).
         h = inputs[2]; # inactivaton conductance of the sodium channel (h).
@@ -496,60 +507,41 @@ class hhn_network(network):
         
         Iion = active_sodium_part + inactive_sodium_part + active_potassium_part;
         
-        Iext = 0.0;
-        Isyn = 0.0;
-        if (index < self._num_osc): 
-            # PN - peripheral neuron - calculation of external current and synaptic current.
-            Iext = self._stimulus[index] * self._noise[index];    # probably noise can be pre-defined for reducting compexity
-            
-            memory_impact1 = 0.0;
-            for i in range(0, len(self._central_element[0].pulse_generation_time)):
-                memory_impact1 += self.__alfa_function(t - self._central_element[0].pulse_generation_time[i], self._params.alfa_inhibitory, self._params.betta_inhibitory);
-            
-            memory_impact2 = 0.0;
-            for i in range(0, len(self._central_element[1].pulse_generation_time)):
-                memory_impact2 += self.__alfa_function(t - self._central_element[1].pulse_generation_time[i], self._params.alfa_inhibitory, self._params.betta_inhibitory);
-    
-            Isyn = self._params.w2 * (v - self._params.Vsyninh) * memory_impact1 + self._link_weight3[index] * (v - self._params.Vsyninh) * memory_impact2;
-        else:
-            # CN - central element.
-            central_index = index - self._num_osc;
-            if (central_index == 0):
-                Iext = self._params.Icn1;   # CN1
-                
-                memory_impact = 0.0;
-                for index_oscillator in range(0, self._num_osc):
-                    for index_generation in range(0, len(self._pulse_generation_time[index_oscillator])):
-                        memory_impact += self.__alfa_function(t - self._pulse_generation_time[index_oscillator][index_generation], self._params.alfa_excitatory, self._params.betta_excitatory);
-                 
-                Isyn = self._params.w1 * (v - self._params.Vsynexc) * memory_impact;
-                
-            elif (central_index == 1):
-                Iext = self._params.Icn2;   # CN2
-                Isyn = 0.0;
-                
-            else:
-                assert 0;
+        # PN - peripheral neuron - synaptic current from CN1 and CN2, CN1 - synaptic current from PNs, CN2 - no synaptic current.
+        memory_impact1 = numpy.sum(self.__alfa_function(t - self.__cn1_pulse_times, self._params.alfa_inhibitory, self._params.betta_inhibitory));
+        memory_impact2 = numpy.sum(self.__alfa_function(t - self.__cn2_pulse_times, self._params.alfa_inhibitory, self._params.betta_inhibitory));
+        memory_impact = numpy.sum(self.__alfa_function(t - self.__peripheral_pulse_times, self._params.alfa_excitatory, self._params.betta_excitatory));
+        
+        synaptic_weight = numpy.concatenate((self._params.w2 * memory_impact1 + self._link_weight3 * memory_impact2, [ self._params.w1 * memory_impact, 0.0 ]));
+        
+        Iext = self.__external_current;
+        Vsyn = self.__synaptic_potential;
+        
+        if (argv is not None):
+            Iext = Iext[argv];
+            Vsyn = Vsyn[argv];
+            synaptic_weight = synaptic_weight[argv];
         
+        Isyn = synaptic_weight * (v - Vsyn);
         
         # Membrane potential
         dv = -Iion + Iext - Isyn;
         
         # Calculate variables
         potential = v - self._params.vRest;
-        am = (2.5 - 0.1 * potential) / (math.exp(2.5 - 0.1 * potential) - 1.0);
-        ah = 0.07 * math.exp(-potential / 20.0);
-        an = (0.1 - 0.01 * potential) / (math.exp(1.0 - 0.1 * potential) - 1.0);
+        am = (2.5 - 0.1 * potential) / (numpy.exp(2.5 - 0.1 * potential) - 1.0);
+        ah = 0.07 * numpy.exp(-potential / 20.0);
+        an = (0.1 - 0.01 * potential) / (numpy.exp(1.0 - 0.1 * potential) - 1.0);
         
-        bm = 4.0 * math.exp(-potential / 18.0);
-        bh = 1.0 / (math.exp(3.0 - 0.1 * potential) + 1.0);
-        bn = 0.125 * math.exp(-potential / 80.0);
+        bm = 4.0 * numpy.exp(-potential / 18.0);
+        bh = 1.0 / (numpy.exp(3.0 - 0.1 * potential) + 1.0);
+        bn = 0.125 * numpy.exp(-potential / 80.0);
         
         dm = am * (1.0 - m) - bm * m;
         dh = ah * (1.0 - h) - bh * h;
         dn = an * (1.0 - n) - bn * n;
         
-        return [dv, dm, dh, dn];
+        return numpy.array([dv, dm, dh, dn]);
         
         
     def allocate_sync_ensembles(self, tolerance = 0.1):
@@ -569,13 +561,13 @@ class hhn_network(network):
         """!
         @brief Calculates value of alfa-function for difference between spike generation time and current simulation time.
         
-        @param[in] time (double): Difference between last spike generation time and current time.
+        @param[in] time (array_like): Differences between spike generation times and current time.
         @param[in] alfa (double): Alfa parameter for alfa-function.
         @param[in] betta (double): Betta parameter for alfa-function.
         
-        @return (double) Value of alfa-function.
+        @return (numpy.array) Values of alfa-function.
         
         """
         
-        return alfa * time * math.exp(-betta * time);
+        return alfa * time * numpy.exp(-betta * time);
     
@@ -26,12 +26,15 @@
 
 import numpy
 
-from scipy.integrate import odeint
+from pyclustering.utils.lazy_import import lazy_module
 
 from pyclustering.nnet import *
+from pyclustering.nnet.dynamic_recorder import dynamic_recorder
 
 from pyclustering.utils import draw_dynamics
 
+integrate = lazy_module('scipy.integrate')
+
 
 class hysteresis_dynamic:
     """!
@@ -98,35 +101,25 @@ class hysteresis_dynamic:
         
         """
         
-        clusters = [ [0] ];
-        
         number_oscillators = len(self._dynamic[0]);
         
-        for i in range(1, number_oscillators, 1):
-            captured_neuron = True;
-            for cluster in clusters:
-                neuron_index = cluster[0];
-                
-                analysis_steps = threshold_steps;
-                if (len(self._dynamic) < analysis_steps):
-                    analysis_steps = len(self._dynamic);
-                
-                analysis_start_step_index = len(self._dynamic) - 1;
-                
-                for step in range(analysis_start_step_index, analysis_start_step_index - analysis_steps, -1):
-                    neuron_amplitude = self._dynamic[step][neuron_index];
-                    candidate_amplitude = self._dynamic[step][i];
-                    
-                    if ( not (candidate_amplitude < (neuron_amplitude + tolerance)) or not (candidate_amplitude > (neuron_amplitude - tolerance)) ):
-                        captured_neuron = False;
-                        break;
-                    
-                if ( captured_neuron is True ):
-                    cluster.append(i);
-                    break;
+        analysis_steps = max(0, min(threshold_steps, len(self._dynamic)));
+        
+        # oscillator belongs to the first ensemble whose first oscillator has close amplitudes during analysed steps.
+        dynamic = numpy.array(self._dynamic[len(self._dynamic) - analysis_steps:], dtype = float).reshape(analysis_steps, number_oscillators);
+        
+        clusters = [];
+        remaining = numpy.arange(number_oscillators);
+        
+        while (len(remaining) > 0):
+            neuron_amplitudes = dynamic[:, remaining[0]][:, numpy.newaxis];
+            candidate_amplitudes = dynamic[:, remaining];
             
-            if (captured_neuron is False):
-                clusters.append([i]);
+            captured = numpy.all((candidate_amplitudes < neuron_amplitudes + tolerance) & (candidate_amplitudes > neuron_amplitudes - tolerance), axis = 0);
+            captured[0] = True;
+            
+            clusters.append(remaining[captured].tolist());
+            remaining = remaining[~captured];
         
         return clusters;
 
@@ -227,7 +220,7 @@ class hysteresis_network(network):
         @param[in] own_weight (double): Weight of connection from oscillator to itself - own weight.
         @param[in] neigh_weight (double): Weight of connection between oscillators.
         @param[in] type_conn (conn_type): Type of connection between oscillators in the network.
-        @param[in] type_conn_represent (conn_represent): Internal representation of connection in the network: matrix or list.
+        @param[in] type_conn_represent (conn_represent): Internal representation of connection in the network: matrix, list or CSR.
         
         """
         
@@ -267,9 +260,8 @@ class hysteresis_network(network):
         # own impact
         impact = self._weight[index][index] * self._outputs[index];
         
-        for i in range(0, self._num_osc, 1):
-            if (self.has_connection(i, index)):
-                impact += self._weight[index][i] * self._outputs[i];
+        for i in self.get_neighbors(index):
+            impact += self._weight[index][i] * self._outputs[i];
 
         x = -xi + impact;
                 
@@ -279,7 +271,7 @@ class hysteresis_network(network):
         return x;
         
     
-    def simulate(self, steps, time, solution = solve_type.RK4, collect_dynamic = True):
+    def simulate(self, steps, time, solution = solve_type.RK4, collect_dynamic = True, recorder = None):
         """!
         @brief Performs static simulation of hysteresis oscillatory network.
         
@@ -287,15 +279,16 @@ class hysteresis_network(network):
         @param[in] time (double): Time of simulation.
         @param[in] solution (solve_type): Type of solution (solving).
         @param[in] collect_dynamic (bool): If True - returns whole dynamic of oscillatory network, otherwise returns only last values of dynamics.
+        @param[in] recorder (dynamic_recorder): Recorder of output dynamic, see simulate_static().
         
         @return (hysteresis_dynamic) Dynamic of oscillatory network. If argument 'collect_dynamic' = True, than return dynamic for the whole simulation time,
                 otherwise returns only last values (last step of simulation) of dynamic.
         """
                 
-        return self.simulate_static(steps, time, solution, collect_dynamic);
+        return self.simulate_static(steps, time, solution, collect_dynamic, recorder);
     
     
-    def simulate_static(self, steps, time, solution = solve_type.RK4, collect_dynamic = False):
+    def simulate_static(self, steps, time, solution = solve_type.RK4, collect_dynamic = False, recorder = None):
         """!
         @brief Performs static simulation of hysteresis oscillatory network.
         
@@ -303,6 +296,8 @@ class hysteresis_network(network):
         @param[in] time (double): Time of simulation.
         @param[in] solution (solve_type): Type of solution (solving).
         @param[in] collect_dynamic (bool): If True - returns whole dynamic of oscillatory network, otherwise returns only last values of dynamics.
+        @param[in] recorder (dynamic_recorder): Recorder of output dynamic (decimation, subset of oscillators, single precision,
+                    memory-mapped file), if it is specified then 'collect_dynamic' is ignored.
         
         @return (hysteresis_dynamic) Dynamic of oscillatory network. If argument 'collect_dynamic' = True, than return dynamic for the whole simulation time,
                 otherwise returns only last values (last step of simulation) of dynamic.
@@ -315,15 +310,11 @@ class hysteresis_network(network):
         elif (solution == solve_type.RKF45):
             raise NameError("Solver RKF45 is not support in python version.");
 
-        dyn_state = None;
-        dyn_time = None;
+        if ( (recorder is None) and (collect_dynamic == True) ):
+            recorder = dynamic_recorder(self._num_osc);
         
-        if (collect_dynamic == True):
-            dyn_state = [];
-            dyn_time = [];
-            
-            dyn_state.append(self._states);
-            dyn_time.append(0);
+        if (recorder is not None):
+            recorder.record(0, self._states);
         
         step = time / steps;
         int_step = step / 10.0;
@@ -333,15 +324,13 @@ class hysteresis_network(network):
             self._states = self._calculate_states(solution, t, step, int_step);
             
             # update states of oscillators
-            if (collect_dynamic is True):
-                dyn_state.append(self._states);
-                dyn_time.append(t);
+            if (recorder is not None):
+                recorder.record(t, self._states);
         
-        if (collect_dynamic is False):
-            dyn_state.append(self._states);
-            dyn_time.append(time);
+        if (recorder is None):
+            return hysteresis_dynamic([ self._states ], [ time ]);
         
-        return hysteresis_dynamic(dyn_state, dyn_time);
+        return hysteresis_dynamic(recorder.output, recorder.time);
 
 
     def _calculate_states(self, solution, t, step, int_step):
@@ -360,7 +349,7 @@ class hysteresis_network(network):
         next_states = [0] * self._num_osc;
         
         for index in range (0, self._num_osc, 1):            
-            result = odeint(self._neuron_states, self._states[index], numpy.arange(t - step, t, int_step), (index , ));
+            result = integrate.odeint(self._neuron_states, self._states[index], numpy.arange(t - step, t, int_step), (index , ));
             next_states[index] = result[len(result) - 1][0];
         
         self._outputs = [val for val in self._outputs_buffer];
@@ -32,10 +32,11 @@ import pyclustering.core.legion_wrapper as wrapper
 from pyclustering.core.wrapper import ccore_library
 
 from pyclustering.nnet import *
+from pyclustering.nnet.dynamic_recorder import dynamic_recorder
 
 from pyclustering.utils import heaviside, allocate_sync_ensembles
 
-from scipy.integrate import odeint
+from pyclustering.utils.integrate import rk4, rkf45
 
 
 class legion_parameters:
@@ -122,7 +123,7 @@ class legion_dynamic:
         
         """
         if (self.__ccore_legion_dynamic_pointer is not None):
-            return wrapper.legion_dynamic_get_output(self.__ccore_legion_dynamic_pointer);
+            return numpy.array(wrapper.legion_dynamic_get_output(self.__ccore_legion_dynamic_pointer));
             
         return self.__output;
     
@@ -135,7 +136,7 @@ class legion_dynamic:
         """
         
         if (self.__ccore_legion_dynamic_pointer is not None):
-            return wrapper.legion_dynamic_get_inhibitory_output(self.__ccore_legion_dynamic_pointer);
+            return numpy.array(wrapper.legion_dynamic_get_inhibitory_output(self.__ccore_legion_dynamic_pointer));
             
         return self.__inhibitor;
     
@@ -243,7 +244,7 @@ class legion_network(network):
         @param[in] num_osc (uint): Number of oscillators in the network.
         @param[in] parameters (legion_parameters): Parameters of the network that are defined by structure 'legion_parameters'.
         @param[in] type_conn (conn_type): Type of connection between oscillators in the network.
-        @param[in] type_conn_represent (conn_represent): Internal representation of connection in the network: matrix or list.
+        @param[in] type_conn_represent (conn_represent): Internal representation of connection in the network: matrix, list or CSR.
         @param[in] ccore (bool): If True then all interaction with object will be performed via CCORE library (C++ implementation of pyclustering).
         
         """
@@ -264,20 +265,20 @@ class legion_network(network):
             super().__init__(num_osc, type_conn, type_conn_represent);
                 
             # initial states
-            self._excitatory = [ random.random() for _ in range(self._num_osc) ];
-            self._inhibitory = [0.0] * self._num_osc;
-            self._potential = [0.0] * self._num_osc;
+            self._excitatory = numpy.array([ random.random() for _ in range(self._num_osc) ]);
+            self._inhibitory = numpy.zeros(self._num_osc);
+            self._potential = numpy.zeros(self._num_osc);
             
             self._coupling_term = None;      # coupling term of each oscillator
             self._global_inhibitor = 0;      # value of global inhibitory
             self._stimulus = None;           # stimulus of each oscillator
             
-            self._dynamic_coupling = None;   # dynamic connection between oscillators
-            self._coupling_term = [0.0] * self._num_osc;
-            self._buffer_coupling_term = [0.0] * self._num_osc;
+            self._dynamic_coupling = None;   # dynamic weight of connections of each oscillator
+            self._coupling_term = numpy.zeros(self._num_osc);
+            self._lateral_potential = numpy.zeros(self._num_osc);
                 
             # generate first noises
-            self._noise = [random.random() * self._params.ro for i in range(self._num_osc)];
+            self._noise = numpy.array([ random.random() for _ in range(self._num_osc) ]) * self._params.ro;
 
 
     def __del__(self):
@@ -313,41 +314,30 @@ class legion_network(network):
         if (len(stimulus) != self._num_osc):
             raise NameError("Number of stimulus should be equal number of oscillators in the network.");
         else:
-            self._stimulus = [];
-             
-            for val in stimulus:
-                if (val > 0): self._stimulus.append(self._params.I);
-                else: self._stimulus.append(0);
+            self._stimulus = numpy.where(numpy.array(stimulus) > 0, self._params.I, 0.0);
     
     
     def __create_dynamic_connections(self):
         """!
         @brief Create dynamic connection in line with input stimulus.
+        @details Weight of dynamic connection depends only on oscillator that receives influence, therefore
+                  weights are stored as a vector where each value is applied to all connections of the oscillator.
         
         """
         
         if (self._stimulus is None):
             raise NameError("Stimulus should initialed before creation of the dynamic connections in the network.");
         
-        self._dynamic_coupling = [ [0] * self._num_osc for i in range(self._num_osc)];
+        stimulated = self._stimulus > 0;
+        number_stimulated_neighbors = self.get_connectivity().dot(stimulated.astype(float));
         
-        for i in range(self._num_osc):
-            neighbors = self.get_neighbors(i);
-            
-            if ( (len(neighbors) > 0) and (self._stimulus[i] > 0) ):
-                number_stimulated_neighbors = 0.0;
-                for j in neighbors:
-                    if (self._stimulus[j] > 0):
-                        number_stimulated_neighbors += 1.0;
-                
-                if (number_stimulated_neighbors > 0):
-                    dynamic_weight = self._params.Wt / number_stimulated_neighbors;
-                    
-                    for j in neighbors:
-                        self._dynamic_coupling[i][j] = dynamic_weight;
+        self._dynamic_coupling = numpy.zeros(self._num_osc);
+        
+        coupled = stimulated & (number_stimulated_neighbors > 0);
+        self._dynamic_coupling[coupled] = self._params.Wt / number_stimulated_neighbors[coupled];
     
     
-    def simulate(self, steps, time, stimulus, solution = solve_type.RK4, collect_dynamic = True):
+    def simulate(self, steps, time, stimulus, solution = solve_type.RK4, collect_dynamic = True, recorder = None):
         """!
         @brief Performs static simulation of LEGION oscillatory network.
         
@@ -357,6 +347,8 @@ class legion_network(network):
                    example of stimulus for 5 oscillators [0, 0, 1, 1, 0], value of stimulus is defined by parameter 'I'.
         @param[in] solution (solve_type): Method that is used for differential equation.
         @param[in] collect_dynamic (bool): If True - returns whole dynamic of oscillatory network, otherwise returns only last values of dynamics.
+        @param[in] recorder (dynamic_recorder): Recorder of excitatory dynamic (decimation, subset of oscillators, single precision,
+                    memory-mapped file), if it is specified then 'collect_dynamic' is ignored, it is not supported by CCORE.
         
         @return (list) Dynamic of oscillatory network. If argument 'collect_dynamic' = True, than return dynamic for the whole simulation time,
                 otherwise returns only last values (last step of simulation) of dynamic.
@@ -371,9 +363,6 @@ class legion_network(network):
         if (solution == solve_type.FAST):
             raise NameError("Solver FAST is not support due to low accuracy that leads to huge error.");
         
-        elif (solution == solve_type.RKF45):
-            raise NameError("Solver RKF45 is not support in python version. RKF45 is supported in CCORE implementation.");
-        
         # set stimulus
         self.__create_stimulus(stimulus);
             
@@ -385,10 +374,11 @@ class legion_network(network):
         dyn_ginh = None;
         
         # Store only excitatory of the oscillator
-        if (collect_dynamic == True):
-            dyn_exc = [];
-            dyn_time = [];
-            dyn_ginh = [];
+        if ( (recorder is None) and (collect_dynamic == True) ):
+            recorder = dynamic_recorder(self._num_osc);
+        
+        if (recorder is not None):
+            inhibitor_recorder = recorder.companion(1);
             
         step = time / steps;
         int_step = step / 10.0;
@@ -398,21 +388,25 @@ class legion_network(network):
             self._calculate_states(solution, t, step, int_step);
             
             # update states of oscillators
-            if (collect_dynamic == True):
-                dyn_exc.append(self._excitatory);
-                dyn_time.append(t);
-                dyn_ginh.append(self._global_inhibitor);
+            if (recorder is not None):
+                recorder.record(t, self._excitatory);
+                inhibitor_recorder.record(t, [ self._global_inhibitor ]);
             else:
-                dyn_exc = self._excitatory;
+                dyn_exc = self._excitatory.tolist();
                 dyn_time = t;
                 dyn_ginh = self._global_inhibitor;
         
+        if (recorder is not None):
+            (dyn_exc, dyn_ginh, dyn_time) = (recorder.output, inhibitor_recorder.output[:, 0], recorder.time);
+        
         return legion_dynamic(dyn_exc, dyn_ginh, dyn_time); 
     
     
     def _calculate_states(self, solution, t, step, int_step):
         """!
         @brief Calculates new state of each oscillator in the network.
+        @details States of all oscillators are integrated at once, influence of neighbors is calculated using sparse
+                  connectivity of the network and it is considered as a constant during the step.
         
         @param[in] solution (solve_type): Type solver of the differential equation.
         @param[in] t (double): Current time of simulation.
@@ -421,44 +415,53 @@ class legion_network(network):
         
         """
         
-        next_excitatory = [0.0] * self._num_osc;
-        next_inhibitory = [0.0] * self._num_osc;
-        
-        next_potential = [];
-        if (self._params.ENABLE_POTENTIONAL is True):
-            next_potential = [0.0] * self._num_osc;
+        # Amount of active neighbors of each oscillator
+        active_neighbors = self.get_connectivity().dot(numpy.heaviside(self._excitatory - self._params.teta_x, 0.0));
+        self._lateral_potential = self._params.T * active_neighbors;
         
         # Update states of oscillators
-        for index in range (0, self._num_osc, 1):
-            if (self._params.ENABLE_POTENTIONAL is True):
-                result = odeint(self._legion_state, [self._excitatory[index], self._inhibitory[index], self._potential[index]], numpy.arange(t - step, t, int_step), (index , ));
-                [ next_excitatory[index], next_inhibitory[index], next_potential[index] ] = result[len(result) - 1][0:3];
-                
-            else:
-                result = odeint(self._legion_state_simplify, [self._excitatory[index], self._inhibitory[index] ], numpy.arange(t - step, t, int_step), (index , ));
-                [ next_excitatory[index], next_inhibitory[index] ] = result[len(result) - 1][0:2];
-            
-            # Update coupling term
-            neighbors = self.get_neighbors(index);
-            
-            coupling = 0
-            for index_neighbor in neighbors:
-                coupling += self._dynamic_coupling[index][index_neighbor] * heaviside(self._excitatory[index_neighbor] - self._params.teta_x);
+        if (self._params.ENABLE_POTENTIONAL is True):
+            states = numpy.array([self._excitatory, self._inhibitory, self._potential]);
+            [ next_excitatory, next_inhibitory, next_potential ] = self.__integrate(self._legion_state, states, solution, t, step, int_step);
             
-            self._buffer_coupling_term[index] = coupling - self._params.Wz * heaviside(self._global_inhibitor - self._params.teta_xz);
+        else:
+            states = numpy.array([self._excitatory, self._inhibitory]);
+            [ next_excitatory, next_inhibitory ] = self.__integrate(self._legion_state_simplify, states, solution, t, step, int_step);
+        
+        # Update coupling term
+        coupling_term = self._dynamic_coupling * active_neighbors - self._params.Wz * heaviside(self._global_inhibitor - self._params.teta_xz);
         
         # Update state of global inhibitory
-        result = odeint(self._global_inhibitor_state, self._global_inhibitor, numpy.arange(t - step, t, int_step), (None, ));
-        self._global_inhibitor = result[len(result) - 1][0];
+        self._global_inhibitor = self.__integrate(self._global_inhibitor_state, [ self._global_inhibitor ], solution, t, step, int_step)[0];
         
-        self._noise = [random.random() * self._params.ro for i in range(self._num_osc)];
-        self._coupling_term = self._buffer_coupling_term[:];
-        self._inhibitory = next_inhibitory[:];
-        self._excitatory = next_excitatory[:];
+        self._noise = numpy.array([ random.random() for _ in range(self._num_osc) ]) * self._params.ro;
+        self._coupling_term = coupling_term;
+        self._inhibitory = next_inhibitory;
+        self._excitatory = next_excitatory;
         
         if (self._params.ENABLE_POTENTIONAL is True):
-            self._potential = next_potential[:];
-            
+            self._potential = next_potential;
+    
+    
+    def __integrate(self, function, states, solution, t, step, int_step):
+        """!
+        @brief Integrates states of oscillators during the step using specified solver.
+        
+        @param[in] function (callable): Right-hand side of the differential equations 'function(states, t, argv)'.
+        @param[in] states (array_like): Current states of oscillators.
+        @param[in] solution (solve_type): Type solver of the differential equation.
+        @param[in] t (double): Current time of simulation.
+        @param[in] step (double): Step of solution at the end of which states of oscillators should be calculated.
+        @param[in] int_step (double): Step differentiation that is used for solving differential equation.
+        
+        @return (numpy.array) States of oscillators at the end of the step.
+        
+        """
+        
+        if (solution == solve_type.RKF45):
+            return rkf45(lambda states, time: function(states, time, None), states, t - step, t, step = int_step);
+        
+        return rk4(lambda states, time: function(states, time, None), states, t - step, t, max(1, int(round(step / int_step))));
     
     
     def _global_inhibitor_state(self, z, t, argv):
@@ -475,73 +478,57 @@ class legion_network(network):
         
         sigma = 0.0;
         
-        for x in self._excitatory:
-            if (x > self._params.teta_zx):
-                sigma = 1.0;
-                break;
+        if (numpy.any(self._excitatory > self._params.teta_zx)):
+            sigma = 1.0;
         
         return self._params.fi * (sigma - z);
     
     
     def _legion_state_simplify(self, inputs, t, argv):
         """!
-        @brief Returns new values of excitatory and inhibitory parts of oscillator of oscillator.
+        @brief Returns new values of excitatory and inhibitory parts of oscillators.
         @details Simplify model doesn't consider oscillator potential.
         
-        @param[in] inputs (list): Initial values (current) of oscillator [excitatory, inhibitory].
+        @param[in] inputs (array_like): Initial values (current) of oscillators [excitatory, inhibitory], where each
+                    row contains values of all oscillators.
         @param[in] t (double): Current time of simulation.
-        @param[in] argv (uint): Extra arguments that are not used for integration - index of oscillator.
+        @param[in] argv (uint): Extra arguments that are not used for integration.
         
-        @return (list) New values of excitatoty and inhibitory part of oscillator (not assign).
+        @return (numpy.array) New values of excitatoty and inhibitory part of oscillators (not assign).
         
         """
         
-        index = argv;
-        
         x = inputs[0];  # excitatory
         y = inputs[1];  # inhibitory
         
-        dx = 3.0 * x - x ** 3.0 + 2.0 - y + self._stimulus[index] + self._coupling_term[index] + self._noise[index];
-        dy = self._params.eps * (self._params.gamma * (1.0 + math.tanh(x / self._params.betta)) - y);
-        
-        neighbors = self.get_neighbors(index);
-        potential = 0.0;
+        dx = 3.0 * x - x ** 3.0 + 2.0 - y + self._stimulus + self._coupling_term + self._noise;
+        dy = self._params.eps * (self._params.gamma * (1.0 + numpy.tanh(x / self._params.betta)) - y);
         
-        for index_neighbor in neighbors:
-            potential += self._params.T * heaviside(self._excitatory[index_neighbor] - self._params.teta_x);
-        
-        return [dx, dy];    
+        return numpy.array([dx, dy]);
     
     
     def _legion_state(self, inputs, t, argv):
         """!
-        @brief Returns new values of excitatory and inhibitory parts of oscillator and potential of oscillator.
+        @brief Returns new values of excitatory and inhibitory parts of oscillators and potential of oscillators.
         
-        @param[in] inputs (list): Initial values (current) of oscillator [excitatory, inhibitory, potential].
+        @param[in] inputs (array_like): Initial values (current) of oscillators [excitatory, inhibitory, potential],
+                    where each row contains values of all oscillators.
         @param[in] t (double): Current time of simulation.
-        @param[in] argv (uint): Extra arguments that are not used for integration - index of oscillator.
+        @param[in] argv (uint): Extra arguments that are not used for integration.
         
-        @return (list) New values of excitatoty and inhibitory part of oscillator and new value of potential (not assign).
+        @return (numpy.array) New values of excitatoty and inhibitory part of oscillators and new values of potential (not assign).
         
         """
         
-        index = argv;
-        
         x = inputs[0];  # excitatory
         y = inputs[1];  # inhibitory
         p = inputs[2];  # potential
         
-        potential_influence = heaviside(p + math.exp(-self._params.alpha * t) - self._params.teta);
-        
-        dx = 3.0 * x - x ** 3.0 + 2.0 - y + self._stimulus[index] * potential_influence + self._coupling_term[index] + self._noise[index];
-        dy = self._params.eps * (self._params.gamma * (1.0 + math.tanh(x / self._params.betta)) - y);
-        
-        neighbors = self.get_neighbors(index);
-        potential = 0.0;
+        potential_influence = numpy.heaviside(p + math.exp(-self._params.alpha * t) - self._params.teta, 0.0);
         
-        for index_neighbor in neighbors:
-            potential += self._params.T * heaviside(self._excitatory[index_neighbor] - self._params.teta_x);
+        dx = 3.0 * x - x ** 3.0 + 2.0 - y + self._stimulus * potential_influence + self._coupling_term + self._noise;
+        dy = self._params.eps * (self._params.gamma * (1.0 + numpy.tanh(x / self._params.betta)) - y);
         
-        dp = self._params.lamda * (1.0 - p) * heaviside(potential - self._params.teta_p) - self._params.mu * p;
+        dp = self._params.lamda * (1.0 - p) * numpy.heaviside(self._lateral_potential - self._params.teta_p, 0.0) - self._params.mu * p;
         
-        return [dx, dy, dp];
\ No newline at end of file
+        return numpy.array([dx, dy, dp]);
@@ -26,20 +26,13 @@
 
 import random
 import numpy
-import warnings
 
-try:
-    import matplotlib.pyplot as plt
-    import matplotlib.animation as animation
-except Exception as error_instance:
-    warnings.warn("Impossible to import matplotlib (please, install 'matplotlib'), pyclustering's visualization "
-                  "functionality is partially not available (details: '%s')." % str(error_instance))
+from pyclustering.utils.lazy_import import lazy_module
 
-try:
-    from PIL import Image
-except Exception as error_instance:
-    warnings.warn("Impossible to import PIL (please, install 'PIL'), pyclustering's visualization "
-                  "functionality is partially not available (details: '%s')." % str(error_instance))
+plt = lazy_module('matplotlib.pyplot')
+animation = lazy_module('matplotlib.animation')
+
+Image = lazy_module('PIL.Image')
 
 from pyclustering.nnet import *
 
@@ -111,8 +104,11 @@ class pcnn_dynamic:
         """
         if self.__ccore_pcnn_dynamic_pointer is not None:
             return wrapper.pcnn_dynamic_get_output(self.__ccore_pcnn_dynamic_pointer)
-            
-        return self.__dynamic
+        
+        if self.__output is None:
+            self.__output = self.__dynamic.tolist()
+        
+        return self.__output
     
     
     @property
@@ -131,14 +127,17 @@ class pcnn_dynamic:
         """!
         @brief Constructor of PCNN dynamic.
         
-        @param[in] dynamic (list): Dynamic of oscillators on each step of simulation. If ccore pointer is specified than it can be ignored.
+        @param[in] dynamic (array_like): Dynamic of oscillators on each step of simulation (steps x oscillators). If ccore pointer is specified than it can be ignored.
         @param[in] ccore (ctypes.pointer): Pointer to CCORE pcnn_dynamic instance in memory.
         
         """
         self.__OUTPUT_TRUE = 1    # fire value for oscillators.
         self.__OUTPUT_FALSE = 0   # rest value for oscillators.
         
-        self.__dynamic = dynamic
+        self.__dynamic = None
+        self.__output = None
+        if dynamic is not None:
+            self.__dynamic = numpy.asarray(dynamic)
         self.__ccore_pcnn_dynamic_pointer = ccore
     
     
@@ -176,18 +175,13 @@ class pcnn_dynamic:
             return wrapper.pcnn_dynamic_allocate_sync_ensembles(self.__ccore_pcnn_dynamic_pointer)
         
         sync_ensembles = []
-        traverse_oscillators = set()
-        
-        number_oscillators = len(self.__dynamic[0])
+        traverse_oscillators = numpy.zeros(self.__dynamic.shape[1], dtype=bool)
         
         for t in range(len(self.__dynamic) - 1, 0, -1):
-            sync_ensemble = []
-            for i in range(number_oscillators):
-                if self.__dynamic[t][i] == self.__OUTPUT_TRUE:
-                    if i not in traverse_oscillators:
-                        sync_ensemble.append(i)
-                        traverse_oscillators.add(i)
+            fired_oscillators = (self.__dynamic[t] == self.__OUTPUT_TRUE) & ~traverse_oscillators
+            traverse_oscillators |= fired_oscillators
             
+            sync_ensemble = numpy.flatnonzero(fired_oscillators).tolist()
             if sync_ensemble != []:
                 sync_ensembles.append(sync_ensemble)
         
@@ -207,14 +201,9 @@ class pcnn_dynamic:
             return wrapper.pcnn_dynamic_allocate_spike_ensembles(self.__ccore_pcnn_dynamic_pointer)
         
         spike_ensembles = []
-        number_oscillators = len(self.__dynamic[0])
         
         for t in range(len(self.__dynamic)):
-            spike_ensemble = []
-            
-            for index in range(number_oscillators):
-                if self.__dynamic[t][index] == self.__OUTPUT_TRUE:
-                    spike_ensemble.append(index)
+            spike_ensemble = numpy.flatnonzero(self.__dynamic[t] == self.__OUTPUT_TRUE).tolist()
             
             if len(spike_ensemble) > 0:
                 spike_ensembles.append(spike_ensemble)
@@ -233,11 +222,7 @@ class pcnn_dynamic:
         if self.__ccore_pcnn_dynamic_pointer is not None:
             return wrapper.pcnn_dynamic_allocate_time_signal(self.__ccore_pcnn_dynamic_pointer)
         
-        signal_vector_information = []
-        for t in range(0, len(self.__dynamic)):
-            signal_vector_information.append(sum(self.__dynamic[t]))
-        
-        return signal_vector_information
+        return numpy.sum(self.__dynamic, axis=1).tolist()
 
 
 class pcnn_visualizer:
@@ -358,7 +343,7 @@ class pcnn_network(network):
         @param[in] num_osc (uint): Number of oscillators in the network.
         @param[in] parameters (pcnn_parameters): Parameters of the network.
         @param[in] type_conn (conn_type): Type of connection between oscillators in the network (all-to-all, grid, bidirectional list, etc.).
-        @param[in] type_conn_represent (conn_represent): Internal representation of connection in the network: matrix or list.
+        @param[in] type_conn_represent (conn_represent): Internal representation of connection in the network: matrix, list or CSR.
         @param[in] height (uint): Number of oscillators in column of the network, this argument is used 
                     only for network with grid structure (GRID_FOUR, GRID_EIGHT), for other types this argument is ignored.
         @param[in] width (uint): Number of oscillotors in row of the network, this argument is used only 
@@ -367,7 +352,7 @@ class pcnn_network(network):
         
         """
         
-        self._outputs = None            # list of outputs of oscillators.
+        self._outputs = None            # outputs of oscillators.
     
         self._feeding = None            # feeding compartment of each oscillator.
         self._linking = None            # linking compartment of each oscillator.
@@ -376,6 +361,7 @@ class pcnn_network(network):
         self._params = None
         
         self.__ccore_pcnn_pointer = None
+        self.__ccore_structure = None
         
         # set parameters of the network
         if parameters is not None:
@@ -399,15 +385,16 @@ class pcnn_network(network):
                 network_height = 0
                 network_width = 0
                 
+            self.__ccore_structure = (num_osc, type_conn, network_height, network_width)
             self.__ccore_pcnn_pointer = wrapper.pcnn_create(num_osc, type_conn, network_height, network_width, self._params)
         else:
             super().__init__(num_osc, type_conn, type_conn_represent, height, width)
             
-            self._outputs = [0.0] * self._num_osc
+            self._outputs = numpy.zeros(self._num_osc, dtype=int)
             
-            self._feeding = [0.0] * self._num_osc
-            self._linking = [0.0] * self._num_osc
-            self._threshold = [ random.random() for i in range(self._num_osc) ]
+            self._feeding = numpy.zeros(self._num_osc)
+            self._linking = numpy.zeros(self._num_osc)
+            self._threshold = numpy.array([ random.random() for i in range(self._num_osc) ])
     
     
     def __del__(self):
@@ -450,101 +437,131 @@ class pcnn_network(network):
             ccore_instance_dynamic = wrapper.pcnn_simulate(self.__ccore_pcnn_pointer, steps, stimulus)
             return pcnn_dynamic(None, ccore_instance_dynamic)
         
-        dynamic = []
-        dynamic.append(self._outputs)
+        dynamic = numpy.zeros((max(steps, 1), self._num_osc), dtype=numpy.uint8)
+        dynamic[0] = self._outputs
         
         for step in range(1, steps, 1):
             self._outputs = self._calculate_states(stimulus)
             
-            dynamic.append(self._outputs)
+            dynamic[step] = self._outputs
         
         return pcnn_dynamic(dynamic)
     
     
+    def simulate_batch(self, steps, stimuli):
+        """!
+        @brief Performs static simulation of pulse coupled neural network for several stimuli (for example, images) at once.
+        @details Simulation for each stimulus starts from the current state of the network and it is performed
+                  independently from other stimuli, the state of the network is not changed. In case of CCORE the
+                  state of the network is not accessible, therefore each stimulus is simulated by a new network with
+                  the same parameters and structure.
+        
+        @param[in] steps (uint): Number steps of simulations during simulation.
+        @param[in] stimuli (array_like): Stimuli for oscillators (amount of stimuli x amount of oscillators).
+        
+        @return (list) Dynamic of oscillatory network (pcnn_dynamic) for each stimulus.
+        
+        """
+        
+        stimuli = numpy.array(stimuli, dtype=float, ndmin=2)
+        if stimuli.shape[1] != len(self):
+            raise NameError('Number of stimulus should be equal to number of oscillators. Each stimulus corresponds to only one oscillators.')
+        
+        if self.__ccore_pcnn_pointer is not None:
+            dynamics = []
+            for stimulus in stimuli:
+                network_pointer = wrapper.pcnn_create(*self.__ccore_structure, self._params)
+                dynamics.append(pcnn_dynamic(None, wrapper.pcnn_simulate(network_pointer, steps, stimulus.tolist())))
+                wrapper.pcnn_destroy(network_pointer)
+            
+            return dynamics
+        
+        amount_stimuli = len(stimuli)
+        
+        outputs = numpy.tile(self._outputs, (amount_stimuli, 1))
+        feeding = numpy.tile(self._feeding, (amount_stimuli, 1))
+        linking = numpy.tile(self._linking, (amount_stimuli, 1))
+        threshold = numpy.tile(self._threshold, (amount_stimuli, 1))
+        
+        dynamic = numpy.zeros((amount_stimuli, max(steps, 1), self._num_osc), dtype=numpy.uint8)
+        dynamic[:, 0, :] = outputs
+        
+        for step in range(1, steps, 1):
+            outputs, feeding, linking, threshold = self.__calculate_step(stimuli, outputs, feeding, linking, threshold)
+            dynamic[:, step, :] = outputs
+        
+        return [ pcnn_dynamic(dynamic[index]) for index in range(amount_stimuli) ]
+    
+    
     def _calculate_states(self, stimulus):
         """!
         @brief Calculates states of oscillators in the network for current step and stored them except outputs of oscillators.
         
         @param[in] stimulus (list): Stimulus for oscillators, number of stimulus should be equal to number of oscillators.
         
-        @return (list) New outputs for oscillators (do not stored it).
+        @return (array_like) New outputs for oscillators (do not stored it).
         
         """
         
-        feeding = [0.0] * self._num_osc
-        linking = [0.0] * self._num_osc
-        outputs = [0.0] * self._num_osc
-        threshold = [0.0] * self._num_osc
+        outputs, self._feeding, self._linking, self._threshold = self.__calculate_step(numpy.asarray(stimulus, dtype=float),
+            self._outputs, self._feeding, self._linking, self._threshold)
+        
+        return outputs
+    
+    
+    def __calculate_neighbor_influence(self, outputs):
+        """!
+        @brief Calculates sum of outputs of neighbors for each oscillator.
+        
+        @param[in] outputs (array_like): Outputs of oscillators, it might be a matrix where each row is a separate state of the network.
+        
+        @return (array_like) Sum of neighbor outputs for each oscillator.
+        
+        """
+        
+        return self.get_connectivity().dot(outputs.T).T
+    
+    
+    def __calculate_step(self, stimulus, outputs, feeding, linking, threshold):
+        """!
+        @brief Calculates states of oscillators for the next step.
+        @details States are represented by arrays, each of them might be a matrix where each row is a separate state of
+                  the network, in this case several simulations are performed at once.
+        
+        @param[in] stimulus (array_like): Stimulus for oscillators.
+        @param[in] outputs (array_like): Current outputs of oscillators.
+        @param[in] feeding (array_like): Current feeding compartments of oscillators.
+        @param[in] linking (array_like): Current linking compartments of oscillators.
+        @param[in] threshold (array_like): Current thresholds of oscillators.
+        
+        @return (tuple) New outputs, feeding compartments, linking compartments and thresholds.
+        
+        """
+        
+        neighbor_outputs = self.__calculate_neighbor_influence(outputs)
+        
+        feeding = self._params.AF * feeding + stimulus + neighbor_outputs * self._params.M * self._params.VF
+        linking = self._params.AL * linking + neighbor_outputs * self._params.W * self._params.VL
+        
+        # calculate internal activity and output of oscillators
+        internal_activity = feeding * (1.0 + self._params.B * linking)
+        outputs = numpy.where(internal_activity > threshold, self.__OUTPUT_TRUE, self.__OUTPUT_FALSE)
         
-        for index in range(0, self._num_osc, 1):
-            neighbors = self.get_neighbors(index)
-            
-            feeding_influence = 0.0
-            linking_influence = 0.0
-            
-            for index_neighbour in neighbors:
-                feeding_influence += self._outputs[index_neighbour] * self._params.M
-                linking_influence += self._outputs[index_neighbour] * self._params.W
-            
-            feeding_influence *= self._params.VF
-            linking_influence *= self._params.VL
-            
-            feeding[index] = self._params.AF * self._feeding[index] + stimulus[index] + feeding_influence
-            linking[index] = self._params.AL * self._linking[index] + linking_influence
-            
-            # calculate internal activity
-            internal_activity = feeding[index] * (1.0 + self._params.B * linking[index])
-            
-            # calculate output of the oscillator
-            if internal_activity > self._threshold[index]:
-                outputs[index] = self.__OUTPUT_TRUE
-            else:
-                outputs[index] = self.__OUTPUT_FALSE
-            
-            # In case of Fast Linking we should calculate threshold until output is changed.
-            if self._params.FAST_LINKING is not True:
-                threshold[index] = self._params.AT * self._threshold[index] + self._params.VT * outputs[index]
-
         # In case of Fast Linking we need to wait until output is changed.
         if self._params.FAST_LINKING is True:
             output_change = True    # Set it True for the for the first iteration.
-            previous_outputs = outputs[:]
-
+            previous_outputs = outputs
+            
             while output_change is True:
-                current_output_change = False
-
-                for index in range(0, self._num_osc, 1):
-                    linking_influence = 0.0
-
-                    neighbors = self.get_neighbors(index)
-                    for index_neighbour in neighbors:
-                        linking_influence += previous_outputs[index_neighbour] * self._params.W
-                    
-                    linking_influence *= self._params.VL
-                    linking[index] = linking_influence
-                    
-                    internal_activity = feeding[index] * (1.0 + self._params.B * linking[index])
-                    
-                    # calculate output of the oscillator
-                    if internal_activity > self._threshold[index]:
-                        outputs[index] = self.__OUTPUT_TRUE
-                    else:
-                        outputs[index] = self.__OUTPUT_FALSE
-
-                    current_output_change |= (outputs[index] != previous_outputs[index])
+                linking = self.__calculate_neighbor_influence(previous_outputs) * self._params.W * self._params.VL
                 
-                output_change = current_output_change
+                internal_activity = feeding * (1.0 + self._params.B * linking)
+                outputs = numpy.where(internal_activity > threshold, self.__OUTPUT_TRUE, self.__OUTPUT_FALSE)
                 
-                if output_change is True:
-                    previous_outputs = outputs[:]
+                output_change = bool(numpy.any(outputs != previous_outputs))
+                previous_outputs = outputs
         
         # In case of Fast Linking threshold should be calculated after fast linking.
-        if self._params.FAST_LINKING is True:
-            for index in range(0, self._num_osc, 1):
-                threshold[index] = self._params.AT * self._threshold[index] + self._params.VT * outputs[index]
-        
-        self._feeding = feeding[:]
-        self._linking = linking[:]
-        self._threshold = threshold[:]
+        threshold = self._params.AT * threshold + self._params.VT * outputs
         
-        return outputs
+        return outputs, feeding, linking, threshold
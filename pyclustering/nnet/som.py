@@ -26,14 +26,14 @@
 
 
 import math
+import numpy
 import random
-import warnings
 
-try:
-    import matplotlib.pyplot as plt
-except Exception as error_instance:
-    warnings.warn("Impossible to import matplotlib (please, install 'matplotlib'), pyclustering's visualization "
-                  "functionality is not available (details: '%s')." % str(error_instance))
+from concurrent.futures import ThreadPoolExecutor
+
+from pyclustering.utils.lazy_import import lazy_module
+
+plt = lazy_module('matplotlib.pyplot', 'mpl_toolkits.mplot3d')
 
 import pyclustering.core.som_wrapper as wrapper
 
@@ -198,7 +198,8 @@ class som:
         """!
         @brief Return weight of each neuron.
 
-        @return (list) Weights of each neuron.
+        @return (list|numpy.ndarray) Weights of each neuron, Python implementation stores weights as an array where
+                each row corresponds to neuron.
         
         """
         
@@ -271,6 +272,8 @@ class som:
         self._learn_rate = 0.0
         
         self.__ccore_som_pointer = None
+        
+        self.__initialize_matrix_cache()
 
         if parameters is not None:
             self._params = parameters
@@ -288,7 +291,7 @@ class som:
             self._location = self.__initialize_locations(rows, cols)
             
             # default weights
-            self._weights = [ [0.0] ] * self._size
+            self._weights = numpy.zeros((self._size, 1))
             
             # awards
             self._award = [0] * self._size
@@ -298,6 +301,9 @@ class som:
             
             # distances - calculate and store them only during training
             self._sqrt_distances = None
+            
+            # influence of each neuron-winner on neurons for the current radius
+            self._influence = None
         
             # connections
             if conn_type != type_conn.func_neighbor:
@@ -342,12 +348,25 @@ class som:
         @brief Set state of SOM network that can be used to load network.
 
         """
+        self.__initialize_matrix_cache()
+
         if som_state['ccore'] is True and ccore_library.workable():
             self.__upload_dump_to_ccore(som_state['state'])
         else:
             self.__upload_dump_to_python(som_state['state'])
 
 
+    def __initialize_matrix_cache(self):
+        """!
+        @brief Initializes version of weights and cache of matrices (U-matrix, P-matrix) that depend on weights.
+        
+        """
+        
+        self._weights_version = 0
+        self.__cache_version = 0
+        self.__matrix_cache = {}
+
+
     def __initialize_initial_radius(self, rows, cols):
         """!
         @brief Initialize initial radius using map sizes.
@@ -395,17 +414,50 @@ class som:
         @param[in] size (uint): Amount of neurons in the network.
         @param[in] location (list): List of coordinates of each neuron in the network.
         
-        @return (list) Distance matrix between neurons in the network.
+        @return (numpy.ndarray) Distance matrix between neurons in the network.
+        
+        """
+        location = numpy.array(location, dtype=float).reshape(size, -1)
+        differences = location[:, numpy.newaxis, :] - location[numpy.newaxis, :, :]
+        
+        return numpy.sum(differences ** 2, axis=2)
+
+
+    def _create_influence_matrix(self):
+        """!
+        @brief Calculates influence of each neuron-winner on each neuron in the network for the current radius.
+        @details Winner is always adapted with influence 1.0, other neurons are adapted only if they are connected to
+                  winner (or any neuron in case of function neighbor) and distance to winner is less than current radius.
+        
+        @return (numpy.ndarray) Matrix where row corresponds to neuron-winner and column to adapted neuron.
+        
+        """
+        
+        covered = self._sqrt_distances < self._local_radius
+        if self._conn_type != type_conn.func_neighbor:
+            covered &= self._connections
+        
+        influence = numpy.where(covered, numpy.exp(-(self._sqrt_distances / (2.0 * self._local_radius))), 0.0)
+        numpy.fill_diagonal(influence, 1.0)
+        
+        return influence
+
+
+    def _update_learning_parameters(self, epoch, epochs):
+        """!
+        @brief Updates radius of neighborhood, learning rate and influence of winners in line with learning epoch.
+        
+        @param[in] epoch (uint): Current epoch of learning.
+        @param[in] epochs (uint): Total number of epochs.
         
         """
-        sqrt_distances = [ [ [] for i in range(size) ] for j in range(size) ]
-        for i in range(size):
-            for j in range(i, size, 1):
-                dist = euclidean_distance_square(location[i], location[j])
-                sqrt_distances[i][j] = dist
-                sqrt_distances[j][i] = dist
         
-        return sqrt_distances
+        # Depression term of coupling
+        self._local_radius = (self._params.init_radius * math.exp(-(epoch / epochs))) ** 2
+        self._learn_rate = self._params.init_learn_rate * math.exp(-(epoch / epochs))
+        
+        self._influence = self._create_influence_matrix()
+        self._influence_neurons = [ numpy.flatnonzero(row) for row in self._influence ]
 
 
     def _create_initial_weights(self, init_type):
@@ -432,35 +484,26 @@ class som:
         # Uniform grid.
         if init_type == type_init.uniform_grid:
             # Predefined weights in line with input data.
-            self._weights = [ [ [] for i in range(dim_info.get_dimensions()) ] for j in range(self._size)]
-            for i in range(self._size):
-                location = self._location[i]
-                for dim in range(dim_info.get_dimensions()):
-                    if dim == 0:
-                        if self._rows > 1:
-                            self._weights[i][dim] = dim_info.get_minimum_coordinate()[dim] + step_x * location[dim]
-                        else:
-                            self._weights[i][dim] = dim_info.get_center()[dim]
-                            
-                    elif dim == 1:
-                        if self._cols > 1:
-                            self._weights[i][dim] = dim_info.get_minimum_coordinate()[dim] + step_y * location[dim]
-                        else:
-                            self._weights[i][dim] = dim_info.get_center()[dim]
-                    else:
-                        self._weights[i][dim] = dim_info.get_center()[dim]
+            location = numpy.array(self._location)
+            
+            self._weights = numpy.tile(numpy.array(dim_info.get_center(), dtype=float), (self._size, 1))
+            if self._rows > 1:
+                self._weights[:, 0] = dim_info.get_minimum_coordinate()[0] + step_x * location[:, 0]
+            
+            if (dim_info.get_dimensions() > 1) and (self._cols > 1):
+                self._weights[:, 1] = dim_info.get_minimum_coordinate()[1] + step_y * location[:, 1]
         
         elif init_type == type_init.random_surface:
             # Random weights at the full surface.
-            self._weights = [[random.uniform(dim_info.get_minimum_coordinate()[i], dim_info.get_maximum_coordinate()[i]) for i in range(dim_info.get_dimensions())] for _ in range(self._size)]
+            self._weights = numpy.array([[random.uniform(dim_info.get_minimum_coordinate()[i], dim_info.get_maximum_coordinate()[i]) for i in range(dim_info.get_dimensions())] for _ in range(self._size)])
         
         elif init_type == type_init.random_centroid:
             # Random weights at the center of input data.
-            self._weights = [[(random.random() + dim_info.get_center()[i])  for i in range(dim_info.get_dimensions())] for _ in range(self._size)]
+            self._weights = numpy.array([[(random.random() + dim_info.get_center()[i])  for i in range(dim_info.get_dimensions())] for _ in range(self._size)])
         
         else:
             # Random weights of input data.
-            self._weights = [[random.random() for i in range(dim_info.get_dimensions())] for _ in range(self._size)]
+            self._weights = numpy.array([[random.random() for i in range(dim_info.get_dimensions())] for _ in range(self._size)])
 
 
     def _create_connections(self, conn_type):
@@ -543,6 +586,10 @@ class som:
                     
                 if (lower_right_index < self._size) and (math.floor(lower_right_index / self._cols) == lower_row_index):
                     self._neighbors[index].append(lower_right_index)
+        
+        self._connections = numpy.zeros((self._size, self._size), dtype=bool)
+        for index in range(self._size):
+            self._connections[index, self._neighbors[index]] = True
     
     
     def _competition(self, x):
@@ -555,16 +602,42 @@ class som:
         
         """
         
-        index = 0
-        minimum = euclidean_distance_square(self._weights[0], x)
+        return int(numpy.argmin(numpy.sum((self._weights - x) ** 2, axis=1)))
+    
+    
+    def _competition_batch(self, data, chunk_size=1024, weights=None):
+        """!
+        @brief Calculates neurons-winners for each input pattern from the data.
+        @details Distances are calculated for chunks of the input data using matrix product, therefore required memory
+                  is limited by chunk size and does not depend on amount of input patterns.
+        
+        @param[in] data (array_like): Input patterns, for example, coordinates of points.
+        @param[in] chunk_size (uint): Amount of input patterns that are processed at once.
+        @param[in] weights (numpy.ndarray): Weights of neurons, if they are not specified then weights of the network are used.
+        
+        @return (numpy.ndarray) Indexes of neurons-winners for each input pattern.
+        
+        """
+        
+        if weights is None:
+            weights = self._weights
+        
+        data = numpy.asarray(data, dtype=float)
+        winners = numpy.empty(len(data), dtype=int)
         
-        for i in range(1, self._size, 1):
-            candidate = euclidean_distance_square(self._weights[i], x)
-            if candidate < minimum:
-                index = i
-                minimum = candidate
+        weight_norms = numpy.sum(weights ** 2, axis=1)
+        weight_factors = -2.0 * weights.T
+        buffer = numpy.empty((min(chunk_size, len(data)), len(weights)))
+        
+        for start in range(0, len(data), chunk_size):
+            chunk = data[start:start + chunk_size]
+            distances = buffer[:len(chunk)]
+            
+            numpy.dot(chunk, weight_factors, out=distances)
+            distances += weight_norms
+            winners[start:start + chunk_size] = numpy.argmin(distances, axis=1)
         
-        return index
+        return winners
     
     
     def _adaptation(self, index, x):
@@ -576,81 +649,117 @@ class som:
         
         """
         
-        dimension = len(self._weights[0])
+        neurons = self._influence_neurons[index]
+        influence = self._influence[index, neurons]
         
-        if self._conn_type == type_conn.func_neighbor:
-            for neuron_index in range(self._size):
-                distance = self._sqrt_distances[index][neuron_index]
-                
-                if distance < self._local_radius:
-                    influence = math.exp(-(distance / (2.0 * self._local_radius)))
-                    
-                    for i in range(dimension):
-                        self._weights[neuron_index][i] = self._weights[neuron_index][i] + self._learn_rate * influence * (x[i] - self._weights[neuron_index][i])
-                    
-        else:
-            for i in range(dimension):
-                self._weights[index][i] = self._weights[index][i] + self._learn_rate * (x[i] - self._weights[index][i])
-                
-            for neighbor_index in self._neighbors[index]: 
-                distance = self._sqrt_distances[index][neighbor_index]
-                if distance < self._local_radius:
-                    influence = math.exp(-(distance / (2.0 * self._local_radius)))
-                    
-                    for i in range(dimension):       
-                        self._weights[neighbor_index][i] = self._weights[neighbor_index][i] + self._learn_rate * influence * (x[i] - self._weights[neighbor_index][i])
+        self._weights[neurons] += (self._learn_rate * influence)[:, numpy.newaxis] * (x - self._weights[neurons])
 
 
-    def train(self, data, epochs, autostop=False):
+    def _batch_adaptation(self, data, winners):
+        """!
+        @brief Changes weights of neurons using batch learning rule: each weight is replaced by average of input
+                patterns weighted by influence of their neurons-winners.
+        
+        @param[in] data (numpy.ndarray): Input patterns.
+        @param[in] winners (numpy.ndarray): Indexes of neurons-winners for each input pattern.
+        
+        """
+        
+        counts = numpy.bincount(winners, minlength=self._size).astype(float)
+        sums = numpy.zeros(self._weights.shape)
+        numpy.add.at(sums, winners, data)
+        
+        numerator = numpy.dot(self._influence.T, sums)
+        denominator = numpy.dot(self._influence.T, counts)
+        
+        adapted = denominator > 0.0
+        self._weights[adapted] = numerator[adapted] / denominator[adapted, numpy.newaxis]
+
+
+    def __reset_statistics(self):
+        """!
+        @brief Clears amount of captured objects and captured objects by each neuron.
+        
+        """
+        
+        self._award = [0] * self._size
+        self._capture_objects = [ [] for _ in range(self._size) ]
+
+
+    def __update_statistics(self, winners):
+        """!
+        @brief Stores amount of captured objects and captured objects by each neuron using neurons-winners.
+        
+        @param[in] winners (array_like): Indexes of neurons-winners for each input pattern.
+        
+        """
+        
+        winners = numpy.asarray(winners, dtype=int)
+        
+        self._award = numpy.bincount(winners, minlength=self._size).tolist()
+        
+        order = numpy.argsort(winners, kind='stable')
+        bounds = numpy.cumsum(self._award)[:-1]
+        self._capture_objects = [ objects.tolist() for objects in numpy.split(order, bounds) ]
+
+
+    def train(self, data, epochs, autostop=False, batch=False):
         """!
         @brief Trains self-organized feature map (SOM).
+        @details In case of batch learning each epoch consists of search of neurons-winners for the whole input data
+                  and a single update of weights where each weight is replaced by average of input patterns weighted by
+                  influence of their neurons-winners. Batch learning does not use learning rate and it is supported
+                  only by Python implementation, therefore CCORE network is replaced by Python network in this case.
 
         @param[in] data (list): Input data - list of points where each point is represented by list of features, for example coordinates.
         @param[in] epochs (uint): Number of epochs for training.        
         @param[in] autostop (bool): Automatic termination of learining process when adaptation is not occurred.
+        @param[in] batch (bool): If True then batch learning is used instead of online (sample by sample) learning.
         
         @return (uint) Number of learining iterations.
         
         """
         
+        if (self.__ccore_som_pointer is not None) and (batch is True):
+            self.__switch_to_python()
+        
         self._data = data
+        self._weights_version += 1
         
         if self.__ccore_som_pointer is not None:
             return wrapper.som_train(self.__ccore_som_pointer, data, epochs, autostop)
 
         self._sqrt_distances = self.__initialize_distances(self._size, self._location)
-
-        for i in range(self._size):
-            self._award[i] = 0
-            self._capture_objects[i].clear()
+        self.__reset_statistics()
         
         # weights
         self._create_initial_weights(self._params.init_type)
         
+        samples = numpy.asarray(self._data, dtype=float)
         previous_weights = None
         
         for epoch in range(1, epochs + 1):
-            # Depression term of coupling
-            self._local_radius = (self._params.init_radius * math.exp(-(epoch / epochs))) ** 2
-            self._learn_rate = self._params.init_learn_rate * math.exp(-(epoch / epochs))
+            self._update_learning_parameters(epoch, epochs)
             
-            # Clear statistics
-            if autostop:
-                for i in range(self._size):
-                    self._award[i] = 0
-                    self._capture_objects[i].clear()
-            
-            for i in range(len(self._data)):
-                # Step 1: Competition:
-                index = self._competition(self._data[i])
+            if batch is True:
+                winners = self._competition_batch(samples)
+                self._batch_adaptation(samples, winners)
+                
+            else:
+                winners = numpy.empty(len(samples), dtype=int)
+                for i in range(len(samples)):
+                    # Step 1: Competition:
+                    winners[i] = self._competition(samples[i])
                     
-                # Step 2: Adaptation:   
-                self._adaptation(index, self._data[i])
+                    # Step 2: Adaptation:
+                    self._adaptation(winners[i], samples[i])
+            
+            # Update statistics
+            if (autostop is True) or (epoch == epochs):
+                if batch is True:
+                    winners = self._competition_batch(samples)
                 
-                # Update statistics
-                if (autostop == True) or (epoch == epochs):
-                    self._award[index] += 1
-                    self._capture_objects[index].append(i)
+                self.__update_statistics(winners)
             
             # Check requirement of stopping
             if autostop:
@@ -659,11 +768,62 @@ class som:
                     if maximal_adaptation < self._params.adaptation_threshold:
                         return epoch
             
-                previous_weights = [item[:] for item in self._weights]
+                previous_weights = self._weights.copy()
         
         return epochs
 
 
+    def partial_train(self, data):
+        """!
+        @brief Performs online learning of self-organized feature map (SOM) using chunk of input data.
+        @details Learning rate and radius of neighborhood are not changed, they are defined by the last epoch of
+                  previous training. If the map has not been trained yet, then weights are initialized using the chunk
+                  and initial learning rate and radius are used. Captured objects are related to the chunk.
+                  Partial learning is supported only by Python implementation, therefore CCORE network is replaced by
+                  Python network with the same weights.
+        
+        @param[in] data (list): Chunk of input data - list of points where each point is represented by list of features.
+        
+        @return (list) Indexes of neurons-winners for each point from the chunk.
+        
+        """
+        
+        if self.__ccore_som_pointer is not None:
+            trained = self._data is not None
+            self.__switch_to_python()
+            
+            if trained:
+                # learning parameters of the last epoch of the training that has been performed by CCORE
+                self._sqrt_distances = self.__initialize_distances(self._size, self._location)
+                self._update_learning_parameters(1, 1)
+        
+        samples = numpy.asarray(data, dtype=float)
+        self._data = data
+        self._weights_version += 1
+        
+        if self._sqrt_distances is None:
+            self._sqrt_distances = self.__initialize_distances(self._size, self._location)
+        
+        if self._learn_rate == 0.0:
+            self._create_initial_weights(self._params.init_type)
+            
+            self._local_radius = self._params.init_radius ** 2
+            self._learn_rate = self._params.init_learn_rate
+            self._influence = None
+        
+        if self._influence is None:
+            self._influence = self._create_influence_matrix()
+            self._influence_neurons = [ numpy.flatnonzero(row) for row in self._influence ]
+        
+        winners = numpy.empty(len(samples), dtype=int)
+        for i in range(len(samples)):
+            winners[i] = self._competition(samples[i])
+            self._adaptation(winners[i], samples[i])
+        
+        self.__update_statistics(winners)
+        return winners.tolist()
+
+
     def simulate(self, input_pattern):
         """!
         @brief Processes input pattern (no learining) and returns index of neuron-winner.
@@ -683,6 +843,97 @@ class som:
         return self._competition(input_pattern)
 
 
+    def simulate_batch(self, data, quantization_error=False, statistics=False, capture=False, offset=0, chunk_size=65536, workers=None):
+        """!
+        @brief Processes input patterns (no learning) and returns indexes of neurons-winners for each of them.
+        @details Input patterns are processed by chunks, therefore memory that is required for processing does not
+                  depend on amount of patterns and memory-mapped arrays (numpy.memmap) can be used as an input. Chunks
+                  are processed concurrently by a pool of threads.
+        
+        @param[in] data (array_like): Input patterns, for example, numpy array or memory-mapped array where each row is a pattern.
+        @param[in] quantization_error (bool): If True then euclidean distance between each pattern and weight of its
+                    neuron-winner is returned too.
+        @param[in] statistics (bool): If True then amount of captured objects by each neuron (awards) is increased in line
+                    with neurons-winners.
+        @param[in] capture (bool): If True then indexes of patterns are appended to captured objects of their neurons-winners,
+                    this option requires 'statistics'.
+        @param[in] offset (uint): Shift of indexes of patterns that are appended to captured objects, it allows to process
+                    stream of data by consecutive calls.
+        @param[in] chunk_size (uint): Amount of patterns in a chunk that is processed by a thread.
+        @param[in] workers (uint): Amount of threads that process chunks, if it is not specified then it is defined
+                    by 'ThreadPoolExecutor'.
+        
+        @return (numpy.ndarray|tuple) Indexes of neurons-winners, if 'quantization_error' is True then tuple
+                 (winners, errors) is returned.
+        
+        @see simulate()
+        @see awards
+        @see capture_objects
+        
+        """
+        
+        if capture and not statistics:
+            raise ValueError("Captured objects can be collected only with statistics ('statistics' should be True).")
+        
+        if self.__ccore_som_pointer is not None:
+            weights = numpy.array(wrapper.som_get_weights(self.__ccore_som_pointer), dtype=float)
+            
+            if statistics:
+                # statistics are collected by Python code and loaded back to CCORE network
+                self._award = wrapper.som_get_awards(self.__ccore_som_pointer) or [0] * self._size
+                self._capture_objects = wrapper.som_get_capture_objects(self.__ccore_som_pointer) or [ [] for _ in range(self._size) ]
+        else:
+            weights = self._weights
+        
+        length = len(data)
+        winners = numpy.empty(length, dtype=int)
+        errors = numpy.empty(length) if quantization_error else None
+        
+        def process_chunk(start):
+            chunk = numpy.asarray(data[start:start + chunk_size], dtype=float)
+            chunk_winners = self._competition_batch(chunk, weights=weights)
+            
+            winners[start:start + len(chunk)] = chunk_winners
+            if quantization_error:
+                errors[start:start + len(chunk)] = numpy.sqrt(numpy.sum((chunk - weights[chunk_winners]) ** 2, axis=1))
+            
+            return start, chunk_winners
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for start, chunk_winners in executor.map(process_chunk, range(0, length, chunk_size)):
+                if statistics:
+                    self.__append_statistics(chunk_winners, offset + start, capture)
+        
+        if statistics and (self.__ccore_som_pointer is not None):
+            wrapper.som_load(self.__ccore_som_pointer, weights.tolist(), self._award, self._capture_objects)
+        
+        if quantization_error:
+            return winners, errors
+        
+        return winners
+
+
+    def __append_statistics(self, winners, offset, capture):
+        """!
+        @brief Increases amount of captured objects by each neuron and optionally appends captured objects.
+        
+        @param[in] winners (numpy.ndarray): Indexes of neurons-winners for a chunk of input patterns.
+        @param[in] offset (uint): Index of the first pattern in the chunk.
+        @param[in] capture (bool): If True then indexes of patterns are appended to captured objects.
+        
+        """
+        
+        counts = numpy.bincount(winners, minlength=self._size)
+        self._award = (numpy.asarray(self._award) + counts).tolist()
+        
+        if capture:
+            order = numpy.argsort(winners, kind='stable')
+            bounds = numpy.concatenate(([0], numpy.cumsum(counts)))
+            
+            for index_neuron in numpy.flatnonzero(counts):
+                self._capture_objects[index_neuron] += (order[bounds[index_neuron]:bounds[index_neuron + 1]] + offset).tolist()
+
+
     def _get_maximal_adaptation(self, previous_weights):
         """!
         @brief Calculates maximum changes of weight in line with comparison between previous weights and current weights.
@@ -693,20 +944,7 @@ class som:
         
         """
         
-        dimension = len(self._data[0])
-        maximal_adaptation = 0.0
-        
-        for neuron_index in range(self._size):
-            for dim in range(dimension):
-                current_adaptation = previous_weights[neuron_index][dim] - self._weights[neuron_index][dim]
-                        
-                if current_adaptation < 0:
-                    current_adaptation = -current_adaptation
-                        
-                if maximal_adaptation < current_adaptation:
-                    maximal_adaptation = current_adaptation
-                    
-        return maximal_adaptation
+        return numpy.max(numpy.abs(numpy.asarray(previous_weights) - self._weights))
 
 
     def get_winner_number(self):
@@ -747,6 +985,7 @@ class som:
         """!
         @brief Calculates distance matrix (U-matrix).
         @details The U-Matrix visualizes based on the distance in input space between a weight vector and its neighbors on map.
+                  Matrix is cached until weights of neurons are changed.
         
         @return (list) Distance matrix (U-matrix).
         
@@ -754,39 +993,51 @@ class som:
         @see get_density_matrix()
         
         """
+        
+        return self.__get_cached_matrix('distance', self.__calculate_distance_matrix).tolist()
+
+
+    def __calculate_distance_matrix(self):
+        """!
+        @brief Calculates distance matrix (U-matrix) as an average squared euclidean distance between weight of each
+                neuron and weights of its neighbors (grid eight neighbors are used in case of function neighbor).
+        
+        @return (numpy.ndarray) Distance matrix (U-matrix).
+        
+        """
+        
         if self.__ccore_som_pointer is not None:
             self._weights = wrapper.som_get_weights(self.__ccore_som_pointer)
             
             if self._conn_type != type_conn.func_neighbor:
                 self._neighbors = wrapper.som_get_neighbors(self.__ccore_som_pointer)
-            
-        distance_matrix = [[0.0] * self._cols for i in range(self._rows)]
         
-        for i in range(self._rows):
-            for j in range(self._cols):
-                neuron_index = i * self._cols + j
-                
-                if self._conn_type == type_conn.func_neighbor:
-                    self._create_connections(type_conn.grid_eight)
-                
-                for neighbor_index in self._neighbors[neuron_index]:
-                    distance_matrix[i][j] += euclidean_distance_square(self._weights[neuron_index], self._weights[neighbor_index])
-                    
-                distance_matrix[i][j] /= len(self._neighbors[neuron_index])
-    
-        return distance_matrix
+        if self._conn_type == type_conn.func_neighbor and self._neighbors is None:
+            self._create_connections(type_conn.grid_eight)
+        
+        weights = numpy.asarray(self._weights, dtype=float)
+        
+        neurons = numpy.repeat(numpy.arange(self._size), [ len(neighbors) for neighbors in self._neighbors ])
+        neighbors = numpy.concatenate([ numpy.asarray(neighbors, dtype=int) for neighbors in self._neighbors ])
+        
+        distances = numpy.sum((weights[neurons] - weights[neighbors]) ** 2, axis=1)
+        distance_matrix = numpy.bincount(neurons, weights=distances, minlength=self._size) / numpy.bincount(neurons, minlength=self._size)
+        
+        return distance_matrix.reshape(self._rows, self._cols)
 
 
-    def show_density_matrix(self, surface_divider = 20.0):
+    def show_density_matrix(self, surface_divider = 20.0, data = None):
         """!
         @brief Show density matrix (P-matrix) using kernel density estimation.
         
         @param[in] surface_divider (double): Divider in each dimension that affect radius for density measurement.
+        @param[in] data (array_like|iterable): Input data or iterable of chunks of input data, if it is not specified
+                    then data that was used for training is used.
         
         @see show_distance_matrix()
         
         """
-        density_matrix = self.get_density_matrix(surface_divider)
+        density_matrix = self.get_density_matrix(surface_divider, data)
         
         plt.imshow(density_matrix, cmap = plt.get_cmap('hot'), interpolation='kaiser')
         plt.title("P-Matrix")
@@ -794,11 +1045,16 @@ class som:
         plt.show()
 
 
-    def get_density_matrix(self, surface_divider = 20.0):
+    def get_density_matrix(self, surface_divider = 20.0, data = None):
         """!
         @brief Calculates density matrix (P-Matrix).
+        @details Density of each neuron is amount of points that are covered by hyper-rectangle around its weight. Data
+                  can be processed by chunks, for example, from a generator that reads data from a file. Matrix that is
+                  calculated using training data is cached until weights of neurons are changed.
         
         @param[in] surface_divider (double): Divider in each dimension that affect radius for density measurement.
+        @param[in] data (array_like|iterable): Input data or iterable of chunks of input data (each chunk is an array
+                    of points), if it is not specified then data that was used for training is used.
         
         @return (list) Density matrix (P-Matrix).
         
@@ -806,44 +1062,111 @@ class som:
         
         """
         
+        if data is None:
+            calculator = lambda: self.__calculate_density_matrix(surface_divider, [ self._data ])
+            return self.__get_cached_matrix(('density', surface_divider), calculator).tolist()
+        
+        return self.__calculate_density_matrix(surface_divider, self.__get_chunks(data)).tolist()
+
+
+    def __calculate_density_matrix(self, surface_divider, chunks, block_size = 1048576):
+        """!
+        @brief Calculates density matrix (P-Matrix) using chunks of input data.
+        
+        @param[in] surface_divider (double): Divider in each dimension that affect radius for density measurement.
+        @param[in] chunks (iterable): Chunks of input data.
+        @param[in] block_size (uint): Maximum amount of point-neuron pairs that are processed at once.
+        
+        @return (numpy.ndarray) Density matrix (P-Matrix).
+        
+        """
+        
         if self.__ccore_som_pointer is not None:
             self._weights = wrapper.som_get_weights(self.__ccore_som_pointer)
         
-        density_matrix = [[0] * self._cols for i in range(self._rows)]
-        dimension = len(self._weights[0])
+        weights = numpy.asarray(self._weights, dtype=float)
+        radius = (numpy.max(weights, axis=0) - numpy.min(weights, axis=0)) / surface_divider
         
-        dim_max = [ float('-Inf') ] * dimension
-        dim_min = [ float('Inf') ] * dimension
+        density = numpy.zeros(self._size, dtype=int)
+        step = max(1, block_size // self._size)
         
-        for weight in self._weights:
-            for index_dim in range(dimension):
-                if weight[index_dim] > dim_max[index_dim]:
-                    dim_max[index_dim] = weight[index_dim]
+        for chunk in chunks:
+            chunk = numpy.asarray(chunk, dtype=float)
+            
+            for start in range(0, len(chunk), step):
+                points = chunk[start:start + step]
+                
+                covered = numpy.ones((len(points), self._size), dtype=bool)
+                for index_dim in range(weights.shape[1]):
+                    covered &= numpy.abs(points[:, index_dim, numpy.newaxis] - weights[:, index_dim]) <= radius[index_dim]
                 
-                if weight[index_dim] < dim_min[index_dim]:
-                    dim_min[index_dim] = weight[index_dim]
+                density += numpy.sum(covered, axis=0)
         
-        radius = [0.0] * len(self._weights[0])
-        for index_dim in range(dimension):
-            radius[index_dim] = ( dim_max[index_dim] - dim_min[index_dim] ) / surface_divider
+        return density.reshape(self._rows, self._cols)
 
-        ## TODO: do not use data
-        for point in self._data:
-            for index_neuron in range(len(self)):
-                point_covered = True
-                
-                for index_dim in range(dimension):
-                    if abs(point[index_dim] - self._weights[index_neuron][index_dim]) > radius[index_dim]:
-                        point_covered = False
-                        break
-                
-                row = int(math.floor(index_neuron / self._cols))
-                col = index_neuron - row * self._cols
-                
-                if point_covered is True:
-                    density_matrix[row][col] += 1
+
+    def get_hit_histogram(self, data = None):
+        """!
+        @brief Calculates hit histogram where each element corresponds to neuron and value represents amount of won objects.
+        @details If data is not specified then amount of captured objects by each neuron (awards) is used, therefore
+                  data that was used for training is not required.
+        
+        @param[in] data (array_like|iterable): Input data or iterable of chunks of input data that should be mapped by the network.
+        
+        @return (list) Hit histogram (matrix rows x cols).
         
-        return density_matrix
+        @see show_winner_matrix()
+        
+        """
+        
+        if data is None:
+            return numpy.array(self.awards, dtype=int).reshape(self._rows, self._cols).tolist()
+        
+        hits = numpy.zeros(self._size, dtype=int)
+        for chunk in self.__get_chunks(data):
+            hits += numpy.bincount(self.simulate_batch(chunk), minlength=self._size)
+        
+        return hits.reshape(self._rows, self._cols).tolist()
+
+
+    def __get_chunks(self, data):
+        """!
+        @brief Returns iterable of chunks of input data.
+        
+        @param[in] data (array_like|iterable): Input data (array or list of points) or iterable of chunks of input data.
+        
+        @return (iterable) Chunks of input data.
+        
+        """
+        
+        if isinstance(data, numpy.ndarray):
+            return [ data ]
+        
+        if isinstance(data, list) and (len(data) > 0) and (numpy.ndim(data[0]) == 1):
+            return [ data ]
+        
+        return data
+
+
+    def __get_cached_matrix(self, key, calculator):
+        """!
+        @brief Returns matrix from cache or calculates it if weights of neurons have been changed since it was cached.
+        
+        @param[in] key (object): Key of matrix in cache.
+        @param[in] calculator (callable): Function that calculates matrix.
+        
+        @return (numpy.ndarray) Cached matrix.
+        
+        """
+        
+        if self.__cache_version != self._weights_version:
+            self.__matrix_cache = {}
+            self.__cache_version = self._weights_version
+        
+        if key not in self.__matrix_cache:
+            self.__matrix_cache[key] = calculator()
+        
+        return self.__matrix_cache[key]
 
 
     def show_winner_matrix(self):
@@ -855,17 +1178,11 @@ class som:
         
         """
         
-        if self.__ccore_som_pointer is not None:
-            self._award = wrapper.som_get_awards(self.__ccore_som_pointer)
-        
         (fig, ax) = plt.subplots()
-        winner_matrix = [[0] * self._cols for i in range(self._rows)]
+        winner_matrix = self.get_hit_histogram()
         
         for i in range(self._rows):
             for j in range(self._cols):
-                neuron_index = i * self._cols + j
-                
-                winner_matrix[i][j] = self._award[neuron_index]
                 ax.text(i, j, str(winner_matrix[i][j]), va='center', ha='center')
         
         ax.imshow(winner_matrix, cmap = plt.get_cmap('cool'), interpolation='none')
@@ -984,11 +1301,24 @@ class som:
                              'learn_rate': self._learn_rate,
                              'params': self._params,
                              'location': self._location,
-                             'weights': self._weights,
+                             'weights': numpy.asarray(self._weights).tolist(),
                              'award': self._award,
                              'capture_objects': self._capture_objects } }
 
 
+    def __switch_to_python(self):
+        """!
+        @brief Replaces CCORE network by Python network with the same weights and statistics, CCORE network is destroyed.
+        
+        """
+        
+        self.__download_dump_from_ccore()
+        state_dump = self.__get_dump_from_python(False)['state']
+        
+        wrapper.som_destroy(self.__ccore_som_pointer)
+        self.__upload_dump_to_python(state_dump)
+
+
     def __download_dump_from_ccore(self):
         self._location = self.__initialize_locations(self._rows, self._cols)
         self._weights = wrapper.som_get_weights(self.__ccore_som_pointer)
@@ -1014,10 +1344,14 @@ class som:
         self.__upload_common_part(state_dump)
 
         self._location = state_dump['location']
-        self._weights = state_dump['weights']
+        self._weights = numpy.array(state_dump['weights'])
         self._award = state_dump['award']
         self._capture_objects = state_dump['capture_objects']
 
+        self._data = None
+        self._sqrt_distances = None
+        self._influence = None
+
         self._location = self.__initialize_locations(self._rows, self._cols)
         self._create_connections(self._conn_type)
 
@@ -27,22 +27,22 @@
 import math
 import numpy
 import random
-import warnings
 
-try:
-    import matplotlib.pyplot as plt
-    import matplotlib.animation as animation
-except Exception as error_instance:
-    warnings.warn("Impossible to import matplotlib (please, install 'matplotlib'), pyclustering's visualization "
-                  "functionality is not available (details: '%s')." % str(error_instance))
+from pyclustering.utils.lazy_import import lazy_module
+
+plt = lazy_module('matplotlib.pyplot')
+animation = lazy_module('matplotlib.animation')
+
+integrate = lazy_module('scipy.integrate')
+sparse = lazy_module('scipy.sparse')
 
 import pyclustering.core.sync_wrapper as wrapper
 
 from pyclustering.core.wrapper import ccore_library
 
-from scipy.integrate import odeint
 
 from pyclustering.nnet import network, conn_represent, conn_type, initial_type, solve_type
+from pyclustering.nnet.dynamic_recorder import dynamic_recorder
 from pyclustering.utils import pi, draw_dynamics, draw_dynamics_set, set_ax_param
 
 
@@ -64,20 +64,32 @@ class order_estimator:
         @return (double) Level of global synchronization (order parameter).
         
         @see calculate_order_parameter()
+        @see calculate_sync_order_evolution()
         
         """
         
-        exp_amount = 0.0;
-        average_phase = 0.0;
+        return float(order_estimator.calculate_sync_order_evolution([ oscillator_phases ])[0]);
+
 
-        for phase in oscillator_phases:
-            exp_amount += math.expm1( abs(1j * phase) );
-            average_phase += phase;
+    @staticmethod
+    def calculate_sync_order_evolution(dynamic):
+        """!
+        @brief Calculates level of global synchronization (order parameter) for each state of the output dynamic at once.
+        
+        @param[in] dynamic (array_like): Phases of oscillators on each step of simulation (steps x oscillators).
+        
+        @return (numpy.array) Level of global synchronization on each step.
+        
+        @see calculate_sync_order()
+        
+        """
         
-        exp_amount /= len(oscillator_phases);
-        average_phase = math.expm1( abs(1j * (average_phase / len(oscillator_phases))) );
+        phases = numpy.asarray(dynamic, dtype = float);
         
-        return abs(average_phase) / abs(exp_amount);
+        exp_amount = numpy.mean(numpy.expm1(numpy.abs(phases)), axis = 1);
+        average_phase = numpy.expm1(numpy.abs(numpy.mean(phases, axis = 1)));
+        
+        return numpy.abs(average_phase) / numpy.abs(exp_amount);
 
 
     @staticmethod
@@ -92,21 +104,49 @@ class order_estimator:
         
         @return (double) Level of local synchronization (local order parameter).
         
+        @see calculate_local_sync_order_evolution()
+        
         """
         
-        exp_amount = 0.0;
-        num_neigh = 0.0;
+        return float(order_estimator.calculate_local_sync_order_evolution([ oscillator_phases ], oscillatory_network)[0]);
+
+
+    @staticmethod
+    def calculate_local_sync_order_evolution(dynamic, oscillatory_network):
+        """!
+        @brief Calculates level of local synchronization (local order parameter) for each state of the output dynamic at once.
+        @details Phase differences are calculated only for existing connections that are taken from sparse connectivity
+                  of the network, therefore complexity of each step is O(E), where E is an amount of connections.
+        
+        @param[in] dynamic (array_like): Phases of oscillators on each step of simulation (steps x oscillators).
+        @param[in] oscillatory_network (sync): Instance of oscillatory network whose connections are required for calculation.
         
-        for i in range(0, len(oscillatory_network), 1):
-            for j in range(0, len(oscillatory_network), 1):
-                if (oscillatory_network.has_connection(i, j) == True):
-                    exp_amount += math.exp(-abs(oscillator_phases[j] - oscillator_phases[i]));
-                    num_neigh += 1.0;
+        @return (numpy.array) Level of local synchronization on each step.
         
-        if (num_neigh == 0):
-            num_neigh = 1.0;
+        @see calculate_local_sync_order()
+        
+        """
         
-        return exp_amount / num_neigh;
+        phases = numpy.asarray(dynamic, dtype = float);
+        
+        connectivity = oscillatory_network.get_connectivity();
+        number_connections = len(connectivity.indices);
+        
+        sequence_local_order = numpy.zeros(len(phases));
+        if (number_connections == 0):
+            return sequence_local_order;
+        
+        rows = numpy.repeat(numpy.arange(connectivity.shape[0]), numpy.diff(connectivity.indptr));
+        columns = connectivity.indices;
+        
+        # steps are processed by blocks to restrict size of temporary matrix of phase differences.
+        block_size = max(1, 1000000 // number_connections);
+        for start in range(0, len(phases), block_size):
+            block = phases[start:start + block_size];
+            differences = numpy.abs(block[:, columns] - block[:, rows]);
+            sequence_local_order[start:start + block_size] = numpy.sum(numpy.exp(-differences), axis = 1) / number_connections;
+        
+        return sequence_local_order;
 
 
 
@@ -123,7 +163,7 @@ class sync_dynamic:
         
         """
         if ( (self._ccore_sync_dynamic_pointer is not None) and ( (self._dynamic is None) or (len(self._dynamic) == 0) ) ):
-            self._dynamic = wrapper.sync_dynamic_get_output(self._ccore_sync_dynamic_pointer);
+            self._dynamic = numpy.array(wrapper.sync_dynamic_get_output(self._ccore_sync_dynamic_pointer));
         
         return self._dynamic;
     
@@ -135,7 +175,7 @@ class sync_dynamic:
         
         """
         if ( (self._ccore_sync_dynamic_pointer is not None) and ( (self._time is None) or (len(self._time) == 0) ) ):
-            self._time = wrapper.sync_dynamic_get_time(self._ccore_sync_dynamic_pointer);
+            self._time = numpy.array(wrapper.sync_dynamic_get_time(self._ccore_sync_dynamic_pointer));
         
         return self._time;
     
@@ -217,40 +257,97 @@ class sync_dynamic:
         if ( (self._dynamic is None) or (len(self._dynamic) == 0) ):
             return [];
         
-        number_oscillators = len(self._dynamic[0]);
-        last_state = None;
-        
         if (iteration is None):
-            last_state = self._dynamic[len(self._dynamic) - 1];
+            last_state = numpy.asarray(self._dynamic[len(self._dynamic) - 1], dtype = float);
         else:
-            last_state = self._dynamic[iteration];
+            last_state = numpy.asarray(self._dynamic[iteration], dtype = float);
+        
+        clusters = self.__allocate_sorted_ensembles(last_state, tolerance);
+        if (clusters is None):
+            clusters = self.__allocate_greedy_ensembles(last_state, tolerance);
+        
+        if (indexes is not None):
+            clusters = [ [ indexes[index] for index in cluster ] for cluster in clusters ];
+        
+        return clusters;
+    
+    
+    def __allocate_sorted_ensembles(self, phases, tolerance):
+        """!
+        @brief Allocates synchronous ensembles by sorting phases and splitting them by gaps that are not less than tolerance.
+        @details Result is equal to greedy allocation only when each group of phases is compact (all phases of the group are
+                  within tolerance of each other) and shifted phases do not link different groups, otherwise 'None' is returned.
+        
+        @param[in] phases (numpy.array): Phases of oscillators.
+        @param[in] tolerance (double): Maximum error for allocation of synchronous ensemble oscillators.
+        
+        @return (list) Groups of indexes of synchronous oscillators or 'None' if greedy allocation is required.
+        
+        """
+        
+        if (len(phases) == 0):
+            return [];
+        
+        order = numpy.argsort(phases, kind = 'stable');
+        sorted_phases = phases[order];
+        
+        # neighbors can't be allocated to the same ensemble in both directions of comparison
+        gaps = (sorted_phases[1:] >= sorted_phases[:-1] + tolerance) & (sorted_phases[1:] - tolerance >= sorted_phases[:-1]);
+        
+        borders = numpy.concatenate(([0], numpy.flatnonzero(gaps) + 1, [len(phases)]));
+        groups = numpy.repeat(numpy.arange(len(borders) - 1), numpy.diff(borders));
+        
+        group_minimum = sorted_phases[borders[:-1]];
+        group_maximum = sorted_phases[borders[1:] - 1];
+        
+        if (not numpy.all((group_maximum < group_minimum + tolerance) & (group_minimum > group_maximum - tolerance))):
+            return None;
+        
+        shifted_phases = numpy.abs(sorted_phases - 2 * pi);
+        left = numpy.searchsorted(sorted_phases, numpy.nextafter(shifted_phases - tolerance, -numpy.inf), side = 'left');
+        right = numpy.searchsorted(sorted_phases, numpy.nextafter(shifted_phases + tolerance, numpy.inf), side = 'right');
+        
+        candidates = left < right;
+        if (numpy.any(groups[left[candidates]] != groups[candidates]) or numpy.any(groups[right[candidates] - 1] != groups[candidates])):
+            return None;
+        
+        clusters = [ numpy.sort(order[borders[index]:borders[index + 1]]) for index in range(len(borders) - 1) ];
+        clusters.sort(key = lambda cluster: cluster[0]);
+        
+        return [ cluster.tolist() for cluster in clusters ];
+    
+    
+    def __allocate_greedy_ensembles(self, phases, tolerance):
+        """!
+        @brief Allocates synchronous ensembles where each oscillator is placed to the first ensemble that contains
+                an oscillator with close phase.
+        
+        @param[in] phases (numpy.array): Phases of oscillators.
+        @param[in] tolerance (double): Maximum error for allocation of synchronous ensemble oscillators.
+        
+        @return (list) Groups of indexes of synchronous oscillators.
+        
+        """
         
         clusters = [];
-        if (number_oscillators > 0):
-            clusters.append([0]);
-        
-        for i in range(1, number_oscillators, 1):
-            cluster_allocated = False;
-            for cluster in clusters:
-                for neuron_index in cluster:
-                    last_state_shifted = abs(last_state[i] - 2 * pi);
-                    
-                    if ( ( (last_state[i] < (last_state[neuron_index] + tolerance)) and (last_state[i] > (last_state[neuron_index] - tolerance)) ) or
-                         ( (last_state_shifted < (last_state[neuron_index] + tolerance)) and (last_state_shifted > (last_state[neuron_index] - tolerance)) ) ):
-                        cluster_allocated = True;
-                        
-                        real_index = i;
-                        if (indexes is not None):
-                            real_index = indexes[i];
-                        
-                        cluster.append(real_index);
-                        break;
+        cluster_phases = [];
+        
+        for index in range(len(phases)):
+            phase = phases[index];
+            phase_shifted = abs(phase - 2 * pi);
+            
+            for cluster_index in range(len(clusters)):
+                members = cluster_phases[cluster_index];
                 
-                if (cluster_allocated == True):
+                if ( numpy.any( ((phase < members + tolerance) & (phase > members - tolerance)) |
+                                ((phase_shifted < members + tolerance) & (phase_shifted > members - tolerance)) ) ):
+                    clusters[cluster_index].append(index);
+                    cluster_phases[cluster_index] = numpy.append(members, phase);
                     break;
             
-            if (cluster_allocated == False):
-                clusters.append([i]);
+            else:
+                clusters.append([index]);
+                cluster_phases.append(numpy.array([phase]));
         
         return clusters;
     
@@ -371,11 +468,7 @@ class sync_dynamic:
         if (self._ccore_sync_dynamic_pointer is not None):
             return wrapper.sync_dynamic_calculate_order(self._ccore_sync_dynamic_pointer, start_iteration, stop_iteration);
         
-        sequence_order = [];
-        for index in range(start_iteration, stop_iteration):
-            sequence_order.append(order_estimator.calculate_sync_order(self.output[index]));
-        
-        return sequence_order;
+        return order_estimator.calculate_sync_order_evolution(self.output[start_iteration:stop_iteration]).tolist();
 
 
     def calculate_local_order_parameter(self, oscillatory_network, start_iteration = None, stop_iteration = None):
@@ -403,11 +496,7 @@ class sync_dynamic:
             network_pointer = oscillatory_network._ccore_network_pointer;
             return wrapper.sync_dynamic_calculate_local_order(self._ccore_sync_dynamic_pointer, network_pointer, start_iteration, stop_iteration);
         
-        sequence_local_order = [];
-        for index in range(start_iteration, stop_iteration):
-            sequence_local_order.append(order_estimator.calculate_local_sync_order(self.output[index], oscillatory_network));
-        
-        return sequence_local_order;
+        return order_estimator.calculate_local_sync_order_evolution(self.output[start_iteration:stop_iteration], oscillatory_network).tolist();
 
 
     def __get_start_stop_iterations(self, start_iteration, stop_iteration):
@@ -735,7 +824,7 @@ class sync_network(network):
         @param[in] weight (double): Coupling strength of the links between oscillators.
         @param[in] frequency (double): Multiplier of internal frequency of the oscillators.
         @param[in] type_conn (conn_type): Type of connection between oscillators in the network (all-to-all, grid, bidirectional list, etc.).
-        @param[in] representation (conn_represent): Internal representation of connection in the network: matrix or list.
+        @param[in] representation (conn_represent): Internal representation of connection in the network: matrix, list or CSR.
         @param[in] initial_phases (initial_type): Type of initialization of initial phases of oscillators (random, uniformly distributed, etc.).
         @param[in] ccore (bool): If True simulation is performed by CCORE library (C++ implementation of pyclustering).
         
@@ -841,14 +930,13 @@ class sync_network(network):
         
         index = argv;
         phase = 0;
-        for k in range(0, self._num_osc):
-            if (self.has_connection(index, k) == True):
-                phase += math.sin(self._phases[k] - teta);
+        for k in self.get_neighbors(index):
+            phase += math.sin(self._phases[k] - teta);
             
         return ( self._freq[index] + (phase * self._weight / self._num_osc) );
 
 
-    def simulate(self, steps, time, solution = solve_type.FAST, collect_dynamic = True):
+    def simulate(self, steps, time, solution = solve_type.FAST, collect_dynamic = True, recorder = None):
         """!
         @brief Performs static simulation of Sync oscillatory network.
         
@@ -856,6 +944,7 @@ class sync_network(network):
         @param[in] time (double): Time of simulation.
         @param[in] solution (solve_type): Type of solution (solving).
         @param[in] collect_dynamic (bool): If True - returns whole dynamic of oscillatory network, otherwise returns only last values of dynamics.
+        @param[in] recorder (dynamic_recorder): Recorder of output dynamic, see simulate_static().
         
         @return (list) Dynamic of oscillatory network. If argument 'collect_dynamic' = True, than return dynamic for the whole simulation time,
                 otherwise returns only last values (last step of simulation) of dynamic.
@@ -865,10 +954,10 @@ class sync_network(network):
         
         """
         
-        return self.simulate_static(steps, time, solution, collect_dynamic);
+        return self.simulate_static(steps, time, solution, collect_dynamic, recorder);
 
 
-    def simulate_dynamic(self, order = 0.998, solution = solve_type.FAST, collect_dynamic = False, step = 0.1, int_step = 0.01, threshold_changes = 0.0000001):
+    def simulate_dynamic(self, order = 0.998, solution = solve_type.FAST, collect_dynamic = False, step = 0.1, int_step = 0.01, threshold_changes = 0.0000001, recorder = None):
         """!
         @brief Performs dynamic simulation of the network until stop condition is not reached. Stop condition is defined by input argument 'order'.
         
@@ -878,6 +967,7 @@ class sync_network(network):
         @param[in] step (double): Time step of one iteration of simulation.
         @param[in] int_step (double): Integration step, should be less than step.
         @param[in] threshold_changes (double): Additional stop condition that helps prevent infinite simulation, defines limit of changes of oscillators between current and previous steps.
+        @param[in] recorder (dynamic_recorder): Recorder of output dynamic, see simulate_static().
         
         @return (list) Dynamic of oscillatory network. If argument 'collect_dynamic' = True, than return dynamic for the whole simulation time,
                 otherwise returns only last values (last step of simulation) of dynamic.
@@ -899,11 +989,11 @@ class sync_network(network):
         current_order = self.sync_local_order();
         
         # If requested input dynamics
-        dyn_phase = [];
-        dyn_time = [];
-        if (collect_dynamic == True):
-            dyn_phase.append(self._phases);
-            dyn_time.append(0);
+        if ( (recorder is None) and (collect_dynamic == True) ):
+            recorder = dynamic_recorder(self._num_osc);
+        
+        if (recorder is not None):
+            recorder.record(0, self._phases);
         
         # Execute until sync state will be reached
         while (current_order < order):
@@ -914,9 +1004,8 @@ class sync_network(network):
             time_counter += step;
             
             # if requested input dynamic
-            if (collect_dynamic == True):
-                dyn_phase.append(self._phases);
-                dyn_time.append(time_counter);
+            if (recorder is not None):
+                recorder.record(time_counter, self._phases);
                 
             # update orders
             previous_order = current_order;
@@ -927,22 +1016,25 @@ class sync_network(network):
                 # print("Warning: sync_network::simulate_dynamic - simulation is aborted due to low level of convergence rate (order = " + str(current_order) + ").");
                 break;
             
-        if (collect_dynamic != True):
-            dyn_phase.append(self._phases);
-            dyn_time.append(time_counter);
+        if (recorder is None):
+            return sync_dynamic([ self._phases ], [ time_counter ], None);
 
-        output_sync_dynamic = sync_dynamic(dyn_phase, dyn_time, None);
+        output_sync_dynamic = sync_dynamic(recorder.output, recorder.time, None);
         return output_sync_dynamic;
 
 
-    def simulate_static(self, steps, time, solution = solve_type.FAST, collect_dynamic = False):
+    def simulate_static(self, steps, time, solution = solve_type.FAST, collect_dynamic = False, recorder = None):
         """!
         @brief Performs static simulation of oscillatory network.
+        @details Output dynamic is stored by recorder into preallocated numpy array, by default each state of each oscillator
+                  is stored in double precision. Custom recorder can be used to store only each k-th state, only selected
+                  oscillators, in single precision or to a memory-mapped file, in this case 'collect_dynamic' is ignored.
         
         @param[in] steps (uint): Number steps of simulations during simulation.
         @param[in] time (double): Time of simulation.
         @param[in] solution (solve_type): Type of solution.
         @param[in] collect_dynamic (bool): If True - returns whole dynamic of oscillatory network, otherwise returns only last values of dynamics.
+        @param[in] recorder (dynamic_recorder): Recorder of output dynamic, it is not supported by CCORE.
         
         @return (list) Dynamic of oscillatory network. If argument 'collect_dynamic' = True, than return dynamic for the whole simulation time,
                 otherwise returns only last values (last step of simulation) of dynamic.
@@ -956,12 +1048,11 @@ class sync_network(network):
             ccore_instance_dynamic = wrapper.sync_simulate_static(self._ccore_network_pointer, steps, time, solution, collect_dynamic);
             return sync_dynamic(None, None, ccore_instance_dynamic);
         
-        dyn_phase = [];
-        dyn_time = [];
+        if ( (recorder is None) and (collect_dynamic == True) ):
+            recorder = dynamic_recorder(self._num_osc);
         
-        if (collect_dynamic == True):
-            dyn_phase.append(self._phases);
-            dyn_time.append(0);
+        if (recorder is not None):
+            recorder.record(0, self._phases);
         
         step = time / steps;
         int_step = step / 10.0;
@@ -971,15 +1062,13 @@ class sync_network(network):
             self._phases = self._calculate_phases(solution, t, step, int_step);
             
             # update states of oscillators
-            if (collect_dynamic == True):
-                dyn_phase.append(self._phases);
-                dyn_time.append(t);
+            if (recorder is not None):
+                recorder.record(t, self._phases);
         
-        if (collect_dynamic != True):
-            dyn_phase.append(self._phases);
-            dyn_time.append(time);
+        if (recorder is None):
+            return sync_dynamic([ self._phases ], [ time ]);
                         
-        output_sync_dynamic = sync_dynamic(dyn_phase, dyn_time);
+        output_sync_dynamic = sync_dynamic(recorder.output, recorder.time);
         return output_sync_dynamic;
 
 
@@ -1004,7 +1093,7 @@ class sync_network(network):
                 next_phases[index] = self._phase_normalization(result);
                 
             elif ( (solution == solve_type.RK4) or (solution == solve_type.RKF45) ):
-                result = odeint(self._phase_kuramoto, self._phases[index], numpy.arange(t - step, t, int_step), (index , ));
+                result = integrate.odeint(self._phase_kuramoto, self._phases[index], numpy.arange(t - step, t, int_step), (index , ));
                 next_phases[index] = self._phase_normalization(result[len(result) - 1][0]);
             
             else:
@@ -1061,4 +1150,22 @@ class sync_network(network):
         if ( (self._ccore_network_pointer is not None) and (self._osc_conn is None) ):
             self._osc_conn = wrapper.sync_connectivity_matrix(self._ccore_network_pointer);
         
-        return super().has_connection(i, j);
\ No newline at end of file
+        return super().has_connection(i, j);
+
+
+    def get_connectivity(self):
+        """!
+        @brief Returns connections between oscillators as a sparse matrix in CSR format.
+        @details In case of CCORE the matrix is created from connections that are obtained from CCORE once.
+        
+        @return (csr_matrix) Sparse matrix NxN of connections, where N is number of oscillators.
+        
+        """
+        
+        if (self._ccore_network_pointer is not None):
+            if (self._osc_conn is None):
+                self._osc_conn = wrapper.sync_connectivity_matrix(self._ccore_network_pointer);
+            
+            return sparse.csr_matrix(numpy.array(self._osc_conn, dtype = float));
+        
+        return super().get_connectivity();
\ No newline at end of file
@@ -24,17 +24,15 @@
 
 """
 
-import warnings
+import numpy
 
-from math import floor
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
-try:
-    from PIL import Image
-except Exception as error_instance:
-    warnings.warn("Impossible to import PIL (please, install 'PIL'), pyclustering's visualization "
-                  "functionality is partially not available (details: '%s')." % str(error_instance))
+from pyclustering.utils.lazy_import import lazy_module
 
-from pyclustering.cluster.syncnet import syncnet
+Image = lazy_module('PIL.Image')
+
+from pyclustering.cluster.syncnet import syncnet, syncnet_analyser
 
 from pyclustering.nnet import solve_type, initial_type
 from pyclustering.nnet.sync import sync_visualizer
@@ -181,7 +179,7 @@ class syncsegm:
     
     """
     
-    def __init__(self, color_radius, object_radius, noise_size = 0, ccore = True):
+    def __init__(self, color_radius, object_radius, noise_size = 0, ccore = True, processes = 1):
         """!
         @brief Contructor of the oscillatory network SYNC for cluster analysis.
         
@@ -190,6 +188,8 @@ class syncsegm:
                    if 'None' then object segmentation is not performed (only color segmentation).
         @param[in] noise_size (double): Size of segment that should be considered as a noise and ignored by the second layer.
         @param[in] ccore (bool): If 'True' then C/C++ implementation is used to increase performance.
+        @param[in] processes (uint): Amount of processes that perform object segmentation of color segments by the second layer,
+                   if 'None' then it is defined by 'ProcessPoolExecutor', if '1' then segments are processed by the current process.
         
         """
         
@@ -202,9 +202,10 @@ class syncsegm:
         
         self.__network  = None;
         self.__ccore    = ccore;
+        self.__processes = processes;
     
     
-    def process(self, image_source, collect_dynamic = False, order_color = 0.9995, order_object = 0.999):
+    def process(self, image_source, collect_dynamic = False, order_color = 0.9995, order_object = 0.999, collect_object_dynamic = None):
         """!
         @brief Performs image segmentation.
         
@@ -212,6 +213,8 @@ class syncsegm:
         @param[in] collect_dynamic (bool): If 'True' then whole dynamic of each layer of the network is collected.
         @param[in] order_color (double): Local synchronization order for the first layer - coloring segmentation.
         @param[in] order_object (double): Local synchronization order for the second layer - object segmentation.
+        @param[in] collect_object_dynamic (bool): If specified then defines whether whole dynamic of the second layer is collected
+                   instead of 'collect_dynamic', if 'False' then only the last state of each object segment is stored.
         
         @return (syncsegm_analyser) Analyser of segmentation results by the network.
         
@@ -226,7 +229,10 @@ class syncsegm:
         if self.__object_radius is None:
             return syncsegm_analyser(color_analyser, None)
     
-        object_segment_analysers = self.__analyse_objects(image_source, color_analyser, collect_dynamic)
+        if collect_object_dynamic is None:
+            collect_object_dynamic = collect_dynamic
+    
+        object_segment_analysers = self.__analyse_objects(image_source, color_analyser, collect_object_dynamic)
         return syncsegm_analyser(color_analyser, object_segment_analysers)
     
     
@@ -253,7 +259,7 @@ class syncsegm:
         
         @param[in] image_source (string): Path to image file that should be processed.
         @param[in] color_analyser (syncnet_analyser): Analyser of color segmentation results.
-        @param[in] collect_dynamic (bool): If 'True' then whole dynamic of the first layer of the network is collected.
+        @param[in] collect_dynamic (bool): If 'True' then whole dynamic of the second layer of the network is collected.
         
         @return (map) Analysers of object segments.
         
@@ -262,58 +268,76 @@ class syncsegm:
         # continue analysis
         pointer_image = Image.open(image_source);
         image_size = pointer_image.size;
+        pointer_image.close();
         
-        object_analysers = [];
+        color_segments = [ segment for segment in color_analyser.allocate_clusters() if len(segment) >= self.__noise_size ];
+        object_analysers = [ None ] * len(color_segments);
         
-        color_segments = color_analyser.allocate_clusters();
+        if (self.__processes == 1):
+            for index in range(len(color_segments)):
+                object_analysers[index] = _analyse_color_segment(image_size, color_segments[index], self.__object_radius,
+                                                                 self.__order_object, collect_dynamic);
         
-        for segment in color_segments:
-            object_analyser = self.__analyse_color_segment(image_size, segment, collect_dynamic);
-            if (object_analyser is not None):
-                object_analysers.append( { 'color_segment': segment, 'analyser': object_analyser } );
+        else:
+            # the largest segments are the longest ones to process, so they are dispatched first.
+            order = sorted(range(len(color_segments)), key = lambda index: len(color_segments[index]), reverse = True);
+            
+            with ProcessPoolExecutor(max_workers = self.__processes) as executor:
+                futures = { executor.submit(_analyse_color_segment_detached, image_size, color_segments[index], self.__object_radius,
+                                            self.__order_object, collect_dynamic): index for index in order };
+                
+                for future in as_completed(futures):
+                    object_analysers[futures[future]] = future.result();
+        
+        return [ { 'color_segment': color_segments[index], 'analyser': object_analysers[index] } for index in range(len(color_segments)) ];
+
+
+def _analyse_color_segment(image_size, color_segment, object_radius, order_object, collect_dynamic):
+    """!
+    @brief Performs object segmentation of separate segment by the second layer.
     
-        pointer_image.close();
-        return object_analysers;
+    @param[in] image_size (list): Image size presented as a [width x height].
+    @param[in] color_segment (list): Image segment that should be processed.
+    @param[in] object_radius (double): Radius of object connectivity (object similarity) for the second layer.
+    @param[in] order_object (double): Local synchronization order for the second layer - object segmentation.
+    @param[in] collect_dynamic (bool): If 'True' then whole dynamic of the second layer of the network is collected.
     
+    @return (syncnet_analyser) Analyser of object segmentation results of the second layer.
     
-    def __analyse_color_segment(self, image_size, color_segment, collect_dynamic):
-        """!
-        @brief Performs object segmentation of separate segment.
-        
-        @param[in] image_size (list): Image size presented as a [width x height].
-        @param[in] color_segment (list): Image segment that should be processed.
-        @param[in] collect_dynamic (bool): If 'True' then whole dynamic of the second layer of the network is collected.
-        
-        @return (syncnet_analyser) Analyser of object segmentation results of the second layer.
-        
-        """
-        coordinates = self.__extract_location_coordinates(image_size, color_segment);
-        
-        if (len(coordinates) < self.__noise_size):
-            return None;
-        
-        network = syncnet(coordinates, self.__object_radius, initial_phases = initial_type.EQUIPARTITION, ccore = True);
-        analyser = network.process(self.__order_object, solve_type.FAST, collect_dynamic);
-        
-        return analyser;
+    """
     
+    coordinates = _extract_location_coordinates(image_size, color_segment);
     
-    def __extract_location_coordinates(self, image_size, color_segment):
-        """!
-        @brief Extracts coordinates of specified image segment.
-        
-        @param[in] image_size (list): Image size presented as a [width x height].
-        @param[in] color_segment (list): Image segment whose coordinates should be extracted.
-        
-        @return (list) Coordinates of each pixel.
-        
-        """
-        coordinates = [];
-        for index in color_segment:
-            y = floor(index / image_size[0]);
-            x = index - y * image_size[0];
-            
-            coordinates.append([x, y]);
-        
-        return coordinates;
+    network = syncnet(coordinates, object_radius, initial_phases = initial_type.EQUIPARTITION, ccore = True);
+    return network.process(order_object, solve_type.FAST, collect_dynamic);
+
+
+def _analyse_color_segment_detached(image_size, color_segment, object_radius, order_object, collect_dynamic):
+    """!
+    @brief Performs object segmentation of separate segment in a worker process.
+    @details Returned analyser does not refer to CCORE, because pointers can't be passed between processes.
+    
+    @return (syncnet_analyser) Analyser of object segmentation results of the second layer.
+    
+    @see _analyse_color_segment
+    
+    """
+    
+    analyser = _analyse_color_segment(image_size, color_segment, object_radius, order_object, collect_dynamic);
+    return syncnet_analyser(analyser.output, analyser.time, None);
+
+
+def _extract_location_coordinates(image_size, color_segment):
+    """!
+    @brief Extracts coordinates of specified image segment.
+    
+    @param[in] image_size (list): Image size presented as a [width x height].
+    @param[in] color_segment (list): Image segment whose coordinates should be extracted.
+    
+    @return (list) Coordinates [x, y] of each pixel.
+    
+    """
+    
+    (y, x) = numpy.unravel_index(numpy.asarray(color_segment, dtype = numpy.int64), (image_size[1], image_size[0]));
+    return numpy.column_stack((x, y)).tolist();
         
\ No newline at end of file
@@ -25,16 +25,17 @@
 
 
 from pyclustering.nnet.hhn import hhn_network;
+from pyclustering.nnet import solve_type;
 
 
 class HhnTestTemplates:
     @staticmethod
-    def templateSyncEnsembleAllocation(stimulus, params, sim_steps, sim_time, expected_clusters, ccore):
+    def templateSyncEnsembleAllocation(stimulus, params, sim_steps, sim_time, expected_clusters, ccore, solution = solve_type.RK4):
         result_testing = False;
 
         for _ in range(0, 5, 1):
             net = hhn_network(len(stimulus), stimulus, params, ccore=ccore);
-            (t, dyn_p, dyn_c) = net.simulate(sim_steps, sim_time);
+            (t, dyn_p, dyn_c) = net.simulate(sim_steps, sim_time, solution);
 
             assert t is not None;
             assert dyn_p is not None;
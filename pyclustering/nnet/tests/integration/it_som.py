@@ -140,6 +140,27 @@ class SomIntegrationTest(unittest.TestCase):
         SomTestTemplates.templateTestWinners(True)
 
 
+    def testBatchTwoNeuronsTwoClustersByCore(self):
+        SomTestTemplates.templateTestAwardNeurons(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, 1, 2, 100, [5, 5], False, True, batch=True)
+        SomTestTemplates.templateTestAwardNeurons(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, 2, 1, 100, [5, 5], False, True, batch=True)
+
+    def testBatchAutostopFourNeuronsFourClustersByCore(self):
+        SomTestTemplates.templateTestAwardNeurons(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 2, 2, 100, [10, 10, 10, 30], True, True, batch=True)
+
+    def testPartialTrainTwoNeuronsTwoClustersByCore(self):
+        SomTestTemplates.templateTestPartialTrain(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, 1, 2, 20, [5, 5], ccore=True)
+
+    def testPartialTrainAfterTrainByCore(self):
+        SomTestTemplates.templateTestPartialTrainAfterTrain(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 2, 2, True)
+
+
+    def testSimulateBatchStatisticsByCore(self):
+        SomTestTemplates.templateTestSimulateBatchStatistics(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, type_conn.grid_four, 65536, True)
+
+    def testSimulateBatchStatisticsSmallChunksByCore(self):
+        SomTestTemplates.templateTestSimulateBatchStatistics(SIMPLE_SAMPLES.SAMPLE_SIMPLE2, type_conn.grid_eight, 4, True)
+
+
     def testSomVisualizationByCore(self):
         sample = read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE4)
         
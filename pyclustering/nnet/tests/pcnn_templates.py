@@ -25,7 +25,9 @@
 
 
 from pyclustering.nnet.pcnn import pcnn_network, pcnn_parameters, pcnn_visualizer;
-from pyclustering.nnet import conn_represent;
+from pyclustering.nnet import conn_type, conn_represent;
+
+import random;
 
 
 class PcnnTestTemplates:
@@ -118,6 +120,50 @@ class PcnnTestTemplates:
         assert steps == len(dynamic.allocate_time_signal());
 
 
+    @staticmethod
+    def templateBatchSimulation(num_osc, steps, type_conn, stimuli, fast_linking, ccore):
+        params = pcnn_parameters();
+        params.FAST_LINKING = fast_linking;
+        
+        random.seed(1000);
+        net = pcnn_network(num_osc, params, type_conn, conn_represent.MATRIX, None, None, ccore);
+        dynamics = net.simulate_batch(steps, stimuli);
+        
+        assert len(stimuli) == len(dynamics);
+        
+        for index_stimulus in range(len(stimuli)):
+            random.seed(1000);
+            net = pcnn_network(num_osc, params, type_conn, conn_represent.MATRIX, None, None, ccore);
+            dynamic = net.simulate(steps, stimuli[index_stimulus]);
+            
+            assert steps == len(dynamics[index_stimulus]);
+            assert dynamic.output == dynamics[index_stimulus].output;
+            assert dynamic.allocate_sync_ensembles() == dynamics[index_stimulus].allocate_sync_ensembles();
+
+
+    @staticmethod
+    def templateBatchSimulationOrder(num_osc, steps, ccore):
+        stimuli = [ [1] * num_osc, [0] * num_osc ];
+        
+        net = pcnn_network(num_osc, None, conn_type.ALL_TO_ALL, conn_represent.MATRIX, None, None, ccore);
+        dynamics = net.simulate_batch(steps, stimuli);
+        reversed_dynamics = net.simulate_batch(steps, stimuli[::-1]);
+        
+        assert 2 == len(dynamics);
+        assert 2 == len(reversed_dynamics);
+        
+        assert [ list(range(num_osc)) ] == [ sorted(ensemble) for ensemble in dynamics[0].allocate_sync_ensembles() ];
+        assert [] == dynamics[1].allocate_sync_ensembles();
+        
+        assert dynamics[0].allocate_sync_ensembles() == reversed_dynamics[1].allocate_sync_ensembles();
+        assert dynamics[1].allocate_sync_ensembles() == reversed_dynamics[0].allocate_sync_ensembles();
+        
+        for dynamic in dynamics + reversed_dynamics:
+            assert steps == len(dynamic);
+            assert num_osc == len(dynamic.output[0]);
+            assert all(isinstance(value, int) for value in dynamic.output[-1]);
+
+
     @staticmethod
     def visualize(num_osc, steps, type_conn, repr_type, stimulus, height, width, ccore):
         net = pcnn_network(num_osc, None, type_conn, repr_type, None, None, ccore);
@@ -23,14 +23,18 @@
 
 """
 
+import os
 import pickle
+import tempfile
+
+import numpy
 
 import matplotlib
 matplotlib.use('Agg')
 
 from pyclustering.nnet.som import som, type_conn, som_parameters
 
-from pyclustering.utils import read_sample
+from pyclustering.utils import read_sample, euclidean_distance_square
 
 from pyclustering.samples.definitions import SIMPLE_SAMPLES
 
@@ -39,6 +43,7 @@ class SomTestTemplates:
     @staticmethod
     def templateTestAwardNeurons(file, rows, cols, time, expected_result, autostop, ccore_flag, parameters = None, **kwargs):
         store_load = kwargs.get('store_load', False)
+        batch = kwargs.get('batch', False)
 
         types = [type_conn.func_neighbor, type_conn.grid_eight, type_conn.grid_four, type_conn.honeycomb]
         sample = read_sample(file)
@@ -52,7 +57,7 @@ class SomTestTemplates:
                 dump_network = pickle.dumps(network)
                 network = pickle.loads(dump_network)
 
-            network.train(sample, time, autostop)
+            network.train(sample, time, autostop, batch)
             
             winners = network.get_winner_number()
             assert winners == len(expected_result)
@@ -93,6 +98,149 @@ class SomTestTemplates:
                 assert points[i] == i
 
 
+    @staticmethod
+    def templateTestPartialTrain(file, rows, cols, passes, expected_result, **kwargs):
+        store_load = kwargs.get('store_load', False)
+        ccore_flag = kwargs.get('ccore', False)
+
+        types = [type_conn.func_neighbor, type_conn.grid_eight, type_conn.grid_four, type_conn.honeycomb]
+        sample = read_sample(file)
+
+        for structure in types:
+            network = som(rows, cols, structure, ccore=ccore_flag)
+
+            chunk_size = len(sample) // 2 + 1
+            for _ in range(passes):
+                for start in range(0, len(sample), chunk_size):
+                    if store_load:
+                        network = pickle.loads(pickle.dumps(network))
+
+                    winners = network.partial_train(sample[start:start + chunk_size])
+
+                    assert len(winners) == len(sample[start:start + chunk_size])
+                    assert sum(network.awards) == len(winners)
+
+            winners = network.partial_train(sample)
+            assert sorted(network.awards) == expected_result
+
+            for index_neuron in range(len(network)):
+                for index_object in network.capture_objects[index_neuron]:
+                    assert winners[index_object] == index_neuron
+
+
+    @staticmethod
+    def templateTestSimulateBatch(file, connections, ccore_flag, **kwargs):
+        chunk_size = kwargs.get('chunk_size', 65536)
+        memmap = kwargs.get('memmap', False)
+
+        sample = read_sample(file)
+
+        network = som(3, 3, connections, ccore = ccore_flag)
+        network.train(sample, 100)
+
+        data = numpy.array(sample)
+        if memmap:
+            handle, filename = tempfile.mkstemp()
+            os.close(handle)
+
+            data = numpy.memmap(filename, dtype=float, mode='w+', shape=data.shape)
+            data[:] = sample
+
+        winners, errors = network.simulate_batch(data, quantization_error=True, chunk_size=chunk_size, workers=2)
+
+        assert len(winners) == len(sample)
+        assert len(errors) == len(sample)
+
+        weights = numpy.array(network.weights)
+        for index in range(len(sample)):
+            assert winners[index] == network.simulate(sample[index])
+            assert abs(errors[index] - numpy.linalg.norm(weights[winners[index]] - sample[index])) < 0.0000001
+
+        if memmap:
+            del data
+            os.remove(filename)
+
+
+    @staticmethod
+    def templateTestPartialTrainAfterTrain(file, rows, cols, ccore_flag):
+        sample = read_sample(file)
+
+        network = som(rows, cols, type_conn.grid_four, ccore=ccore_flag)
+        network.train(sample, 100)
+        awards = sorted(network.awards)
+
+        network.partial_train(sample)
+        assert sorted(network.awards) == awards
+
+
+    @staticmethod
+    def templateTestSimulateBatchStatistics(file, connections, chunk_size, ccore_flag = False):
+        sample = read_sample(file)
+
+        network = som(2, 2, connections, ccore = ccore_flag)
+        network.train(sample, 100)
+
+        awards = network.awards[:]
+        capture_objects = [ objects[:] for objects in network.capture_objects ]
+
+        winners = network.simulate_batch(sample, statistics=True, capture=True, offset=len(sample), chunk_size=chunk_size)
+
+        for index_neuron in range(len(network)):
+            expected_objects = [ index + len(sample) for index in range(len(sample)) if winners[index] == index_neuron ]
+
+            assert network.awards[index_neuron] == awards[index_neuron] + len(expected_objects)
+            assert network.capture_objects[index_neuron] == capture_objects[index_neuron] + expected_objects
+
+        network.simulate_batch(sample, statistics=True, chunk_size=chunk_size)
+
+        assert sum(network.awards) == 3 * len(sample)
+        assert sum([ len(objects) for objects in network.capture_objects ]) == 2 * len(sample)
+
+
+    @staticmethod
+    def templateTestMatrices(file, connections, ccore_flag):
+        sample = read_sample(file)
+
+        network = som(3, 4, connections, ccore = ccore_flag)
+        network.train(sample, 50)
+
+        for _ in range(2):
+            weights = network.weights
+            neighbors = network._neighbors
+            if connections == type_conn.func_neighbor:
+                neighbors = som(3, 4, type_conn.grid_eight, ccore = False)._neighbors
+
+            distance_matrix = network.get_distance_matrix()
+            density_matrix = network.get_density_matrix(10.0)
+
+            dimension = len(sample[0])
+            radius = [ (max([ w[i] for w in weights ]) - min([ w[i] for w in weights ])) / 10.0 for i in range(dimension) ]
+
+            for index_neuron in range(len(network)):
+                row, col = index_neuron // 4, index_neuron % 4
+
+                expected_distance = sum([ euclidean_distance_square(weights[index_neuron], weights[index_neighbor]) for index_neighbor in neighbors[index_neuron] ]) / len(neighbors[index_neuron])
+                assert abs(distance_matrix[row][col] - expected_distance) < 0.0000001
+
+                expected_density = len([ point for point in sample if all([ abs(point[i] - weights[index_neuron][i]) <= radius[i] for i in range(dimension) ]) ])
+                assert density_matrix[row][col] == expected_density
+
+            chunks = (sample[start:start + 7] for start in range(0, len(sample), 7))
+            assert network.get_density_matrix(10.0, chunks) == density_matrix
+            assert network.get_density_matrix(10.0, numpy.array(sample)) == density_matrix
+
+            assert network.get_hit_histogram() == [ network.awards[index:index + 4] for index in range(0, len(network), 4) ]
+
+            winners = [ network.simulate(point) for point in sample ]
+            assert network.get_hit_histogram(sample) == [ [ winners.count(row * 4 + col) for col in range(4) ] for row in range(3) ]
+
+            if ccore_flag:
+                break
+
+            # weights are changed - matrices should be recalculated
+            network.partial_train(sample[::-1])
+
+
     @staticmethod
     def templateTestSimulate(connections, ccore_flag, **kwargs):
         store_load = kwargs.get('store_load', False)
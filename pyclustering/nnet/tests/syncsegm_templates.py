@@ -37,12 +37,12 @@ from pyclustering.utils import draw_image_mask_segments
 
 class SyncsegmTestTemplates:
     @staticmethod
-    def templateSyncsegmSegmentation(image_source, radius_color, radius_object, noise_size, expected_color_segments, expected_object_segments, collect_dynamic, ccore_flag):
+    def templateSyncsegmSegmentation(image_source, radius_color, radius_object, noise_size, expected_color_segments, expected_object_segments, collect_dynamic, ccore_flag, processes=1):
         result_testing = False
         color_segments, object_segments = [], []
 
         for _ in range(0, 10, 1):
-            algorithm = syncsegm(radius_color, radius_object, noise_size, ccore=ccore_flag)
+            algorithm = syncsegm(radius_color, radius_object, noise_size, ccore=ccore_flag, processes=processes)
             analyser = algorithm.process(image_source, collect_dynamic, 0.9995, 0.9995)
             
             color_segments = analyser.allocate_colors()
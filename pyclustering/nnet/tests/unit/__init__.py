@@ -32,6 +32,7 @@ import matplotlib;
 matplotlib.use('Agg');
 
 from pyclustering.nnet.tests.unit        import ut_cnn                  as nnet_cnn_unit_tests;
+from pyclustering.nnet.tests.unit        import ut_dynamic_recorder     as nnet_dynamic_recorder_unit_tests;
 from pyclustering.nnet.tests.unit        import ut_dynamic_visualizer   as nnet_dynamic_visualizer_unit_tests;
 from pyclustering.nnet.tests.unit        import ut_fsync                as nnet_fsync_unit_tests;
 from pyclustering.nnet.tests.unit        import ut_hhn                  as nnet_hhn_unit_tests;
@@ -53,6 +54,7 @@ class nnet_unit_tests(suite_holder):
     @staticmethod
     def fill_suite(unit_nnet_suite):
         unit_nnet_suite.addTests(unittest.TestLoader().loadTestsFromModule(nnet_cnn_unit_tests));
+        unit_nnet_suite.addTests(unittest.TestLoader().loadTestsFromModule(nnet_dynamic_recorder_unit_tests));
         unit_nnet_suite.addTests(unittest.TestLoader().loadTestsFromModule(nnet_dynamic_visualizer_unit_tests));
         unit_nnet_suite.addTests(unittest.TestLoader().loadTestsFromModule(nnet_fsync_unit_tests));
         unit_nnet_suite.addTests(unittest.TestLoader().loadTestsFromModule(nnet_hhn_unit_tests));
@@ -25,6 +25,8 @@
 
 
 import unittest;
+import numpy;
+import random;
 
 # Generate images without having a window appear.
 import matplotlib;
@@ -100,6 +102,36 @@ class CnnUnitTest(unittest.TestCase):
         stimulus = read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE5);
         self.templateSyncEnsembleAllocation(stimulus, 100, type_conn.ALL_TO_ALL, 5, 10, [15, 15, 15, 15]);
 
+    def testOutputDynamicStorage(self):
+        stimulus = read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE2);
+        
+        for connection in [type_conn.ALL_TO_ALL, type_conn.TRIANGULATION_DELAUNAY]:
+            network_instance = cnn_network(len(stimulus), connection, 3);
+            output_dynamic = network_instance.simulate(50, stimulus);
+            
+            assert output_dynamic.output.shape == (50, len(stimulus));
+            assert output_dynamic.output.dtype == numpy.float32;
+            assert output_dynamic.time == list(range(50));
+            assert len(output_dynamic) == 50;
+            
+            observation_matrix = output_dynamic.allocate_observation_matrix();
+            assert len(observation_matrix) == 50;
+            assert observation_matrix[-1] == [ (1.0 if value > 0.0 else 0.0) for value in output_dynamic.output[-1] ];
+
+    def testDelaunayTriangulationLargeNetwork(self):
+        stimulus = [ [ random.random(), random.random() ] for _ in range(5000) ];
+        
+        network_instance = cnn_network(len(stimulus), type_conn.TRIANGULATION_DELAUNAY, 3);
+        output_dynamic = network_instance.simulate(50, stimulus);
+        
+        ensembles = output_dynamic.allocate_sync_ensembles(10);
+        assert sorted(sum(ensembles, [])) == list(range(len(stimulus)));
+        
+        for ensemble in ensembles:
+            assert ensemble == sorted(ensemble);
+        
+        assert [ ensemble[0] for ensemble in ensembles ] == sorted([ ensemble[0] for ensemble in ensembles ]);
+
     def testChaoticNeuralNetwork2DVisualization(self):
         stimulus = read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE1);
         network_instance = cnn_network(len(stimulus));
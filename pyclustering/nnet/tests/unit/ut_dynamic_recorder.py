@@ -0,0 +1,199 @@
+"""!
+
+@brief Unit-tests for recorder of output dynamic of oscillatory networks.
+
+@authors Andrei Novikov (pyclustering@yandex.ru)
+@date 2014-2019
+@copyright GNU Public License
+
+@cond GNU_PUBLIC_LICENSE
+    PyClustering is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PyClustering is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+@endcond
+
+"""
+
+
+import os
+import numpy
+import tempfile
+import unittest
+
+# Generate images without having a window appear.
+import matplotlib
+matplotlib.use('Agg')
+
+from pyclustering.nnet.dynamic_recorder import dynamic_recorder
+from pyclustering.nnet.hysteresis import hysteresis_network
+from pyclustering.nnet.legion import legion_network
+from pyclustering.nnet.sync import sync_network, sync_visualizer
+from pyclustering.nnet import solve_type
+
+from pyclustering.utils import draw_dynamics
+
+
+class DynamicRecorderUnitTest(unittest.TestCase):
+    def templateRecord(self, recorder, size, steps):
+        for t in range(steps):
+            recorder.record(t, [ t * size + index for index in range(size) ])
+
+        return recorder.time, recorder.output
+
+
+    def testRecordWithGrowth(self):
+        time, output = self.templateRecord(dynamic_recorder(3, chunk_size=2), 3, 7)
+
+        self.assertIsInstance(output, numpy.ndarray)
+        self.assertEqual((7, 3), output.shape)
+        self.assertEqual(list(range(7)), time.tolist())
+        self.assertEqual([18, 19, 20], output[-1].tolist())
+
+
+    def testRecordDecimationAndIndexes(self):
+        recorder = dynamic_recorder(3, decimation=3, indexes=[0, 2])
+        time, output = self.templateRecord(recorder, 3, 8)
+
+        self.assertEqual([0, 3, 6, 7], time.tolist())
+        self.assertEqual([[0, 2], [9, 11], [18, 20], [21, 23]], output.tolist())
+        self.assertEqual(4, len(recorder))
+
+
+    def testRecordRingBuffer(self):
+        recorder = dynamic_recorder(2, capacity=3)
+        time, output = self.templateRecord(recorder, 2, 10)
+
+        self.assertEqual([7, 8, 9], time.tolist())
+        self.assertEqual([[14, 15], [16, 17], [18, 19]], output.tolist())
+
+        recorder.record(10, [20, 21])
+        self.assertEqual([8, 9, 10], recorder.time.tolist())
+        self.assertEqual([[16, 17], [18, 19], [20, 21]], recorder.output.tolist())
+
+
+    def testRecordSinglePrecision(self):
+        time, output = self.templateRecord(dynamic_recorder(4, numpy.float32), 4, 5)
+
+        self.assertEqual(numpy.float32, output.dtype)
+        self.assertEqual((5, 4), output.shape)
+
+
+    def testRecordMemoryMappedFile(self):
+        (descriptor, filename) = tempfile.mkstemp()
+        os.close(descriptor)
+
+        try:
+            recorder = dynamic_recorder(3, numpy.float32, filename=filename, chunk_size=2)
+            time, output = self.templateRecord(recorder, 3, 5)
+
+            self.assertIsInstance(output, numpy.memmap)
+            self.assertEqual((5, 3), output.shape)
+            self.assertEqual(list(range(5)), time.tolist())
+            self.assertEqual([12, 13, 14], output[-1].tolist())
+            self.assertRaises(RuntimeError, recorder.record, 5, [0, 0, 0])
+
+            del output, recorder
+
+        finally:
+            os.remove(filename)
+
+
+    def testRecordMemoryMappedFileAfterTime(self):
+        (descriptor, filename) = tempfile.mkstemp()
+        os.close(descriptor)
+
+        try:
+            recorder = dynamic_recorder(2, filename=filename, decimation=2)
+            time, output = self.templateRecord(recorder, 2, 5)
+
+            self.assertEqual([0, 2, 4], recorder.time.tolist())
+            self.assertRaises(RuntimeError, recorder.record, 5, [0, 0])
+
+            self.assertEqual([0, 2, 4], recorder.time.tolist())
+            self.assertEqual([[0, 1], [4, 5], [8, 9]], recorder.output.tolist())
+
+            del output, recorder
+
+        finally:
+            os.remove(filename)
+
+
+    def testRecordAfterRead(self):
+        recorder = dynamic_recorder(2, decimation=2)
+        time, output = self.templateRecord(recorder, 2, 4)
+        self.assertEqual([0, 2, 3], time.tolist())
+
+        recorder.record(4, [8, 9])
+        self.assertEqual([0, 2, 3, 4], recorder.time.tolist())
+        self.assertEqual([[0, 1], [4, 5], [6, 7], [8, 9]], recorder.output.tolist())
+
+
+    def testRecorderCompanion(self):
+        recorder = dynamic_recorder(4, decimation=2, capacity=5)
+        companion = recorder.companion(1)
+
+        self.assertEqual(2, companion.decimation)
+        self.assertEqual(5, companion.capacity)
+
+
+    def testIncorrectArguments(self):
+        self.assertRaises(ValueError, dynamic_recorder, 3, decimation=0)
+        self.assertRaises(ValueError, dynamic_recorder, 3, capacity=0)
+        self.assertRaises(ValueError, dynamic_recorder, 3, capacity=10, filename="dynamic.bin")
+
+
+    def testSyncStaticSimulation(self):
+        network = sync_network(10, ccore=False)
+        recorder = dynamic_recorder(len(network), numpy.float32, decimation=10, indexes=range(5))
+
+        dynamic = network.simulate_static(25, 5, solution=solve_type.FAST, recorder=recorder)
+
+        self.assertEqual((4, 5), dynamic.output.shape)
+        self.assertEqual(numpy.float32, dynamic.output.dtype)
+        self.assertEqual(0, dynamic.time[0])
+        self.assertAlmostEqual(5.0, dynamic.time[-1])
+
+
+    def testSyncDynamicSimulation(self):
+        network = sync_network(10, ccore=False)
+        dynamic = network.simulate_dynamic(collect_dynamic=False, recorder=dynamic_recorder(len(network), capacity=2))
+
+        self.assertEqual((2, 10), dynamic.output.shape)
+        self.assertGreater(len(dynamic.allocate_sync_ensembles(0.1)), 0)
+
+
+    def testSyncDefaultRecorder(self):
+        network = sync_network(10, ccore=False)
+        dynamic = network.simulate_static(10, 1, solution=solve_type.FAST, collect_dynamic=True)
+
+        self.assertIsInstance(dynamic.output, numpy.ndarray)
+        self.assertEqual((11, 10), dynamic.output.shape)
+
+        draw_dynamics(dynamic.time, dynamic.output, separate=True)
+        sync_visualizer.show_output_dynamic(dynamic)
+
+
+    def testLegionSimulation(self):
+        network = legion_network(5, ccore=False)
+        dynamic = network.simulate(20, 10, [1, 1, 1, 0, 0], solution=solve_type.RK4,
+                                   recorder=dynamic_recorder(5, decimation=4))
+
+        self.assertEqual((6, 5), dynamic.output.shape)
+        self.assertEqual(6, len(dynamic.inhibitor))
+
+
+    def testHysteresisSimulation(self):
+        network = hysteresis_network(4)
+        dynamic = network.simulate(100, 10, recorder=dynamic_recorder(4, capacity=10))
+
+        self.assertEqual((10, 4), dynamic.output.shape)
+        self.assertAlmostEqual(10.0, dynamic.time[-1])
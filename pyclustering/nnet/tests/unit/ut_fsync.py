@@ -30,6 +30,8 @@ import matplotlib;
 matplotlib.use('Agg');
 
 
+import numpy;
+
 from pyclustering.nnet import conn_type, conn_represent;
 from pyclustering.nnet.fsync import fsync_network, fsync_visualizer;
 
@@ -164,5 +166,35 @@ class FsyncUnitTest(unittest.TestCase):
         fsync_visualizer.show_output_dynamics([output_dynamic_1, output_dynamic_2]);
 
 
+    def templateSynchronizationMechanismRepresentation(self, size, connections):
+        matrix_network = fsync_network(size, type_conn = connections, representation = conn_represent.MATRIX);
+        csr_network = fsync_network(size, type_conn = connections, representation = conn_represent.CSR);
+        
+        # the same amplitudes are required for comparison, synchronization influence is checked without integration.
+        amplitudes = [ complex(0.1 * index, 1.0 - 0.05 * index) for index in range(size) ];
+        matrix_network._fsync_network__amplitude = amplitudes;
+        csr_network._fsync_network__amplitude = amplitudes;
+        
+        for index in range(size):
+            amplitude = numpy.array(amplitudes[index], dtype = numpy.complex128, ndmin = 1);
+            
+            matrix_influence = matrix_network._fsync_network__synchronization_mechanism(amplitude, index);
+            csr_influence = csr_network._fsync_network__synchronization_mechanism(amplitude, index);
+            
+            assert numpy.allclose(matrix_influence, csr_influence);
+
+    def testSynchronizationMechanismCsrAllToAll(self):
+        self.templateSynchronizationMechanismRepresentation(16, conn_type.ALL_TO_ALL);
+
+    def testSynchronizationMechanismCsrGridFour(self):
+        self.templateSynchronizationMechanismRepresentation(16, conn_type.GRID_FOUR);
+
+    def testSynchronizationMechanismCsrGridEight(self):
+        self.templateSynchronizationMechanismRepresentation(16, conn_type.GRID_EIGHT);
+
+    def testSynchronizationMechanismCsrBidir(self):
+        self.templateSynchronizationMechanismRepresentation(16, conn_type.LIST_BIDIR);
+
+
 if __name__ == "__main__":
     unittest.main();
\ No newline at end of file
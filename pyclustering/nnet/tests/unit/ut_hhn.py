@@ -28,6 +28,8 @@ import unittest;
 
 from pyclustering.nnet.tests.hhn_templates import HhnTestTemplates;
 
+from pyclustering.nnet import solve_type;
+
 
 class HhnUnitTest(unittest.TestCase):
     def testGlobalSyncWithSameStimulus(self):
@@ -39,6 +41,12 @@ class HhnUnitTest(unittest.TestCase):
     def testPartialSync(self):
         HhnTestTemplates.templateSyncEnsembleAllocation([25, 25, 50, 50], None, 800, 200, [[0, 1], [2, 3]], False);
 
+    def testGlobalSyncWithSameStimulusRKF45Solver(self):
+        HhnTestTemplates.templateSyncEnsembleAllocation([27, 27, 27], None, 600, 50, [[0, 1, 2]], False, solve_type.RKF45);
+
+    def testPartialSyncRKF45Solver(self):
+        HhnTestTemplates.templateSyncEnsembleAllocation([25, 25, 50, 50], None, 800, 200, [[0, 1], [2, 3]], False, solve_type.RKF45);
+
 
 if __name__ == "__main__":
     unittest.main();
\ No newline at end of file
@@ -26,7 +26,7 @@
 
 import unittest;
 
-from pyclustering.nnet.hysteresis import hysteresis_network;
+from pyclustering.nnet.hysteresis import hysteresis_network, hysteresis_dynamic;
 from pyclustering.nnet import *;
 
 from pyclustering.utils import extract_number_oscillations;
@@ -100,6 +100,20 @@ class HysteresisUnitTest(unittest.TestCase):
     def testTwoSyncEnsemblesAllocation(self):
         self.templateSynchronousEnsemblesAllocation(2, -4, -1, 1000, 10, [1, 0], [1, 1], [1, 1]);
 
+    def testSyncEnsemblesAllocationSeveralEnsembles(self):
+        output_dynamic = hysteresis_dynamic([ [1.0, -1.0, 0.9, -0.95, 0.0], [0.5, -0.5, 0.45, -0.55, 0.0] ], [0, 1]);
+        
+        assert output_dynamic.allocate_sync_ensembles(0.2, 2) == [ [0, 2], [1, 3], [4] ];
+        assert output_dynamic.allocate_sync_ensembles(0.2, 1) == [ [0, 2], [1, 3], [4] ];
+        assert output_dynamic.allocate_sync_ensembles(0.6, 1) == [ [0, 2, 4], [1, 3] ];
+
+    def testSimulationWithoutDynamicCollection(self):
+        network = hysteresis_network(2, -4, -1);
+        output_dynamic = network.simulate(100, 10, collect_dynamic = False);
+        
+        assert len(output_dynamic) == 1;
+        assert len(output_dynamic.time) == 1;
+
 
 if __name__ == "__main__":
     unittest.main();
\ No newline at end of file
@@ -29,7 +29,7 @@ import unittest;
 from pyclustering.nnet.tests.legion_templates import LegionTestTemplates;
 
 from pyclustering.nnet.legion import legion_network, legion_parameters;
-from pyclustering.nnet import conn_type, conn_represent;
+from pyclustering.nnet import conn_type, conn_represent, solve_type;
 
 from pyclustering.utils import extract_number_oscillations;
 
@@ -124,5 +124,35 @@ class LegionUnitTest(unittest.TestCase):
         LegionTestTemplates.templateOutputDynamicInformation([1, 0, 1], legion_parameters(), conn_type.LIST_BIDIR, 100, 100, False);
 
 
+    def testStimulatedOscillatorRKF45Solver(self):
+        params = legion_parameters();
+        params.teta = 0;    # because no neighbors at all
+        
+        net = legion_network(1, type_conn = conn_type.NONE, parameters = params, ccore = False);
+        dynamic = net.simulate(2000, 400, [1], solution = solve_type.RKF45);
+        
+        assert extract_number_oscillations(dynamic.output) > 1;
+
+
+    def testSyncEnsembleAllocationThreeStimulatedOscillatorsRKF45Solver(self):
+        for _ in range(0, 3):
+            net = legion_network(3, type_conn = conn_type.LIST_BIDIR, ccore = False);
+            dynamic = net.simulate(1500, 1500, [1, 1, 1], solution = solve_type.RKF45);
+            
+            if (dynamic.allocate_sync_ensembles(0.1) == [[0, 1, 2]]):
+                return;
+        
+        assert False;
+
+
+    def testSimulationGridFourStructureCsrRepresentation(self):
+        net = legion_network(25, type_conn = conn_type.GRID_FOUR, type_conn_represent = conn_represent.CSR, ccore = False);
+        dynamic = net.simulate(500, 1000, [1] * 25);
+        
+        assert len(dynamic.output) == 500;
+        assert len(dynamic.output[0]) == 25;
+        assert extract_number_oscillations(dynamic.output, 0) > 1;
+
+
 if __name__ == "__main__":
     unittest.main();
\ No newline at end of file
@@ -69,6 +69,14 @@ class NnetUnitTest(unittest.TestCase):
         net = network(25, type_conn = conn_type.ALL_TO_ALL, conn_repr = conn_represent.LIST);
         self.templateAllToAllConnectionsTest(net);
 
+    def testAllToAll1ConnectionsCsrRepresentation(self):
+        net = network(1, type_conn = conn_type.ALL_TO_ALL, conn_repr = conn_represent.CSR);
+        self.templateAllToAllConnectionsTest(net);
+
+    def testAllToAll25ConnectionsCsrRepresentation(self):
+        net = network(25, type_conn = conn_type.ALL_TO_ALL, conn_repr = conn_represent.CSR);
+        self.templateAllToAllConnectionsTest(net);
+
 
     # None connection suite
     def templateNoneConnectionsTest(self, network):
@@ -87,6 +95,10 @@ class NnetUnitTest(unittest.TestCase):
         net = network(10, type_conn = conn_type.NONE, conn_repr = conn_represent.LIST);
         self.templateNoneConnectionsTest(net);
 
+    def testNoneConnectionsCsrRepresentation(self):
+        net = network(10, type_conn = conn_type.NONE, conn_repr = conn_represent.CSR);
+        self.templateNoneConnectionsTest(net);
+
     
     # Bidirectional list connection suite
     def templateBidirListConnectionsTest(self, network):
@@ -109,6 +121,10 @@ class NnetUnitTest(unittest.TestCase):
         net = network(10, type_conn = conn_type.LIST_BIDIR, conn_repr = conn_represent.LIST);
         self.templateBidirListConnectionsTest(net);     
 
+    def testBidirListConnectionsCsrRepresentation(self):
+        net = network(10, type_conn = conn_type.LIST_BIDIR, conn_repr = conn_represent.CSR);
+        self.templateBidirListConnectionsTest(net);
+
 
     # Grid four connection suite
     def templateGridFourConnectionsTest(self, network):
@@ -153,6 +169,17 @@ class NnetUnitTest(unittest.TestCase):
         net = network(1, type_conn = conn_type.GRID_FOUR, conn_repr = conn_represent.LIST);
         self.templateGridFourConnectionsTest(net);
 
+    def testGridFourConnectionsCsrRepresentation(self):
+        net = network(25, type_conn = conn_type.GRID_FOUR, conn_repr = conn_represent.CSR);
+        self.templateGridFourConnectionsTest(net);
+
+    def testGridFourConnectionsRectangeCsr40Representation(self):
+        net = network(40, type_conn = conn_type.GRID_FOUR, conn_repr = conn_represent.CSR, height = 4, width = 10);
+        self.templateGridFourConnectionsTest(net);
+        
+        net = network(40, type_conn = conn_type.GRID_FOUR, conn_repr = conn_represent.CSR, height = 10, width = 4);
+        self.templateGridFourConnectionsTest(net);
+
     def testGridFourConnectionsRectange40MatrixRepresentation(self):
         net = network(40, type_conn = conn_type.GRID_FOUR, conn_repr = conn_represent.MATRIX, height = 4, width = 10);
         self.templateGridFourConnectionsTest(net);
@@ -266,6 +293,17 @@ class NnetUnitTest(unittest.TestCase):
         net = network(1, type_conn = conn_type.GRID_EIGHT, conn_repr = conn_represent.LIST);
         self.templateGridEightConnectionsTest(net);
 
+    def testGridEightConnectionsCsrRepresentation(self):
+        net = network(25, type_conn = conn_type.GRID_EIGHT, conn_repr = conn_represent.CSR);
+        self.templateGridEightConnectionsTest(net);
+
+    def testGridEightConnectionsRectangeCsr40Representation(self):
+        net = network(40, type_conn = conn_type.GRID_EIGHT, conn_repr = conn_represent.CSR, height = 4, width = 10);
+        self.templateGridEightConnectionsTest(net);
+        
+        net = network(40, type_conn = conn_type.GRID_EIGHT, conn_repr = conn_represent.CSR, height = 10, width = 4);
+        self.templateGridEightConnectionsTest(net);
+
     def testGridEightConnectionsRectange40MatrixRepresentation(self):
         net = network(40, type_conn = conn_type.GRID_EIGHT, conn_repr = conn_represent.MATRIX, height = 4, width = 10);
         self.templateGridEightConnectionsTest(net);
@@ -329,6 +367,65 @@ class NnetUnitTest(unittest.TestCase):
         assert(net.height == 20);
         assert(net.width == 2);
     
+    def templateSameConnectionsTest(self, size, type_conn, height = None, width = None):
+        matrix_network = network(size, type_conn, conn_represent.MATRIX, height, width);
+        csr_network = network(size, type_conn, conn_represent.CSR, height, width);
+        
+        for index in range(size):
+            assert sorted(matrix_network.get_neighbors(index)) == list(csr_network.get_neighbors(index));
+        
+        assert (matrix_network.get_connectivity() != csr_network.get_connectivity()).nnz == 0;
+    
+    def testCsrSameConnections(self):
+        self.templateSameConnectionsTest(36, conn_type.ALL_TO_ALL);
+        self.templateSameConnectionsTest(36, conn_type.LIST_BIDIR);
+        self.templateSameConnectionsTest(36, conn_type.GRID_FOUR);
+        self.templateSameConnectionsTest(36, conn_type.GRID_EIGHT);
+        self.templateSameConnectionsTest(40, conn_type.GRID_FOUR, 5, 8);
+        self.templateSameConnectionsTest(40, conn_type.GRID_EIGHT, 8, 5);
+    
+    def testCsrDynamicConnections(self):
+        net = network(5, type_conn = conn_type.DYNAMIC, conn_repr = conn_represent.CSR);
+        net.set_connection(0, 3);
+        net.set_connection(3, 1);
+        net.set_connection(0, 3);
+        
+        assert list(net.get_neighbors(0)) == [3];
+        assert list(net.get_neighbors(3)) == [0, 1];
+        assert net.has_connection(1, 3) == True;
+        assert net.has_connection(1, 2) == False;
+    
+    def testCsrInterleavedDynamicConnections(self):
+        matrix_network = network(50, type_conn = conn_type.DYNAMIC, conn_repr = conn_represent.MATRIX);
+        csr_network = network(50, type_conn = conn_type.DYNAMIC, conn_repr = conn_represent.CSR);
+        
+        for index in range(200):
+            i, j = (index * 7) % 50, (index * 13 + 1) % 50;
+            if (i == j):
+                continue;
+            
+            matrix_network.set_connection(i, j);
+            csr_network.set_connection(i, j);
+            
+            assert csr_network.has_connection(i, j) == True;
+            assert csr_network.has_connection(j, i) == True;
+            assert sorted(matrix_network.get_neighbors(i)) == list(csr_network.get_neighbors(i));
+        
+        for index in range(50):
+            assert sorted(matrix_network.get_neighbors(index)) == list(csr_network.get_neighbors(index));
+        
+        assert (matrix_network.get_connectivity() != csr_network.get_connectivity()).nnz == 0;
+    
+    def testConnectivityAfterDynamicConnections(self):
+        for representation in [conn_represent.MATRIX, conn_represent.LIST, conn_represent.CSR]:
+            net = network(3, type_conn = conn_type.DYNAMIC, conn_repr = representation);
+            assert net.get_connectivity().nnz == 0;
+            
+            net.set_connection(0, 1);
+            net.set_connection(1, 2);
+            
+            assert net.get_connectivity().toarray().tolist() == [[0, 1, 0], [1, 0, 1], [0, 1, 0]];
+    
     def templateAssertRaises(self, size, type_conn, height, width):
         try:
             network(size, type_conn, height, width);
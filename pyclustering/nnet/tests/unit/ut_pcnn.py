@@ -29,6 +29,7 @@ import unittest
 from pyclustering.nnet.tests.pcnn_templates import PcnnTestTemplates
 
 from pyclustering.nnet import conn_type, conn_represent
+from pyclustering.nnet.pcnn import pcnn_network
 
 
 class PcnnUnitTest(unittest.TestCase):
@@ -68,6 +69,13 @@ class PcnnUnitTest(unittest.TestCase):
         PcnnTestTemplates.templateDynamicLength(25, 30, conn_type.GRID_FOUR, conn_represent.LIST, [0] * 25, False)
         PcnnTestTemplates.templateDynamicLength(25, 30, conn_type.LIST_BIDIR, conn_represent.LIST, [0] * 25, False)
         PcnnTestTemplates.templateDynamicLength(25, 30, conn_type.ALL_TO_ALL, conn_represent.LIST, [0] * 25, False)
+
+    def testDynamicLengthCsrRepresentation(self):
+        PcnnTestTemplates.templateDynamicLength(25, 30, conn_type.NONE, conn_represent.CSR, [0] * 25, False)
+        PcnnTestTemplates.templateDynamicLength(25, 30, conn_type.GRID_EIGHT, conn_represent.CSR, [0] * 25, False)
+        PcnnTestTemplates.templateDynamicLength(25, 30, conn_type.GRID_FOUR, conn_represent.CSR, [0] * 25, False)
+        PcnnTestTemplates.templateDynamicLength(25, 30, conn_type.LIST_BIDIR, conn_represent.CSR, [0] * 25, False)
+        PcnnTestTemplates.templateDynamicLength(25, 30, conn_type.ALL_TO_ALL, conn_represent.CSR, [0] * 25, False)
     
     
     def testDynamicLengthGridRectangle25FourConnection(self):
@@ -106,6 +114,33 @@ class PcnnUnitTest(unittest.TestCase):
     def testAllocationInRectangleEightStructure(self):
         PcnnTestTemplates.templateAllocationInRectangleStructure(30, 6, 5, 20, conn_type.GRID_EIGHT, conn_represent.MATRIX, [0] * 30, False)
 
+    def testBatchSimulation(self):
+        stimuli = [ [1] * 25, [0] * 25, ([0] * 5) + ([1] * 5) + ([0] * 5) + ([1] * 5) + ([0] * 5) ]
+        PcnnTestTemplates.templateBatchSimulation(25, 20, conn_type.ALL_TO_ALL, stimuli, False, False)
+        PcnnTestTemplates.templateBatchSimulation(25, 20, conn_type.GRID_FOUR, stimuli, False, False)
+
+    def testBatchSimulationFastLinking(self):
+        stimuli = [ [20] * 25, [1] * 25 ]
+        PcnnTestTemplates.templateBatchSimulation(25, 20, conn_type.ALL_TO_ALL, stimuli, True, False)
+        PcnnTestTemplates.templateBatchSimulation(25, 20, conn_type.GRID_FOUR, stimuli, True, False)
+
+    def testBatchSimulationOrder(self):
+        PcnnTestTemplates.templateBatchSimulationOrder(25, 20, False)
+
+    def testDynamicConnectionsAfterCreation(self):
+        net = pcnn_network(3, None, conn_type.DYNAMIC, conn_represent.MATRIX, ccore=False)
+        net.set_connection(0, 1)
+        net.set_connection(1, 2)
+        
+        dynamic = net.simulate(8, [1, 0, 0])
+        spike_ensembles = dynamic.allocate_spike_ensembles()
+        
+        fired_oscillators = set()
+        for ensemble in spike_ensembles:
+            fired_oscillators.update(ensemble)
+        
+        assert fired_oscillators == {0, 1, 2}
+
     def testVisualizerNoFailure(self):
         stimulus = [ 5, 5, 5, 5, 10, 10, 10, 10, 15, 15, 15, 15, 20, 20, 20, 20 ]
         PcnnTestTemplates.visualize(16, 20, conn_type.ALL_TO_ALL, conn_represent.MATRIX, stimulus, 4, 4, False)
@@ -164,6 +164,69 @@ class SomUnitTest(unittest.TestCase):
         assert total_capture_points == len(sample)
 
 
+    def testBatchTwoNeuronsTwoClusters(self):
+        SomTestTemplates.templateTestAwardNeurons(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, 1, 2, 100, [5, 5], False, False, batch=True)
+        SomTestTemplates.templateTestAwardNeurons(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, 2, 1, 100, [5, 5], False, False, batch=True)
+
+
+    def testBatchAutostopThreeNeuronsThreeClusters(self):
+        SomTestTemplates.templateTestAwardNeurons(SIMPLE_SAMPLES.SAMPLE_SIMPLE2, 1, 3, 100, [5, 8, 10], True, False, batch=True)
+        SomTestTemplates.templateTestAwardNeurons(SIMPLE_SAMPLES.SAMPLE_SIMPLE2, 3, 1, 100, [5, 8, 10], True, False, batch=True)
+
+
+    def testBatchFourNeuronsFourClusters(self):
+        SomTestTemplates.templateTestAwardNeurons(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 1, 4, 100, [10, 10, 10, 30], False, False, batch=True)
+        SomTestTemplates.templateTestAwardNeurons(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 2, 2, 100, [10, 10, 10, 30], False, False, batch=True)
+
+
+    def testPartialTrainTwoNeuronsTwoClusters(self):
+        SomTestTemplates.templateTestPartialTrain(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, 1, 2, 20, [5, 5])
+
+
+    def testPartialTrainStoreLoad(self):
+        SomTestTemplates.templateTestPartialTrain(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, 1, 2, 20, [5, 5], store_load=True)
+
+
+    def testPartialTrainAfterTrain(self):
+        SomTestTemplates.templateTestPartialTrainAfterTrain(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 2, 2, False)
+
+
+    def testSimulateBatch(self):
+        SomTestTemplates.templateTestSimulateBatch(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, type_conn.grid_four, False)
+        SomTestTemplates.templateTestSimulateBatch(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, type_conn.func_neighbor, False)
+
+    def testSimulateBatchSmallChunks(self):
+        SomTestTemplates.templateTestSimulateBatch(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, type_conn.grid_eight, False, chunk_size=7)
+
+    def testSimulateBatchMemoryMapped(self):
+        SomTestTemplates.templateTestSimulateBatch(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, type_conn.honeycomb, False, chunk_size=16, memmap=True)
+
+    def testSimulateBatchStatistics(self):
+        SomTestTemplates.templateTestSimulateBatchStatistics(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, type_conn.grid_four, 65536)
+
+    def testSimulateBatchStatisticsSmallChunks(self):
+        SomTestTemplates.templateTestSimulateBatchStatistics(SIMPLE_SAMPLES.SAMPLE_SIMPLE2, type_conn.grid_eight, 4)
+
+    def testSimulateBatchCaptureWithoutStatistics(self):
+        network = som(2, 2, type_conn.grid_four, ccore=False)
+        network.train(read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE1), 10)
+
+        self.assertRaises(ValueError, network.simulate_batch, [[0.0, 0.0]], capture=True)
+
+
+    def testMatricesFuncNeighbor(self):
+        SomTestTemplates.templateTestMatrices(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, type_conn.func_neighbor, False)
+
+    def testMatricesGridFour(self):
+        SomTestTemplates.templateTestMatrices(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, type_conn.grid_four, False)
+
+    def testMatricesGridEight(self):
+        SomTestTemplates.templateTestMatrices(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, type_conn.grid_eight, False)
+
+    def testMatricesHoneycomb(self):
+        SomTestTemplates.templateTestMatrices(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, type_conn.honeycomb, False)
+
+
     def testSimulateCheckWinnerFuncNeighbor(self):
         SomTestTemplates.templateTestSimulate(type_conn.func_neighbor, False)
 
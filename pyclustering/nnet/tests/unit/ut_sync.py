@@ -23,6 +23,7 @@
 
 """
 
+import math;
 import unittest;
 
 # Generate images without having a window appear.
@@ -31,8 +32,8 @@ matplotlib.use('Agg');
 
 from pyclustering.nnet.tests.sync_templates import SyncTestTemplates;
 
-from pyclustering.nnet import solve_type, conn_type;
-from pyclustering.nnet.sync import sync_network, sync_dynamic, sync_visualizer;
+from pyclustering.nnet import solve_type, conn_type, conn_represent, initial_type;
+from pyclustering.nnet.sync import sync_network, sync_dynamic, sync_visualizer, order_estimator;
 from pyclustering.utils import pi;
 
 
@@ -112,6 +113,30 @@ class SyncUnitTest(unittest.TestCase):
         assert len(output_sync_dynamic.allocate_sync_ensembles(3.0)) == 1;
         assert len(output_sync_dynamic.allocate_sync_ensembles(2.0)) == 1;
 
+    def testAllocateEnsemblesChainOfPhases(self):
+        # oscillator is allocated to the first ensemble that contains close oscillator
+        output_sync_dynamic = sync_dynamic([ [0.0, 0.5, 0.25, 1.0, 3.0] ], [ 10.0 ], None);
+        
+        assert output_sync_dynamic.allocate_sync_ensembles(0.3) == [ [0, 2], [1], [3], [4] ];
+        assert output_sync_dynamic.allocate_sync_ensembles(0.6) == [ [0, 1, 2, 3], [4] ];
+
+    def testAllocateEnsemblesWithIndexes(self):
+        output_sync_dynamic = sync_dynamic([ [1.0, 3.0, 1.05, 3.02, 6.28] ], [ 10.0 ], None);
+        
+        assert output_sync_dynamic.allocate_sync_ensembles(0.1) == [ [0, 2], [1, 3], [4] ];
+        assert output_sync_dynamic.allocate_sync_ensembles(0.1, [7, 5, 3, 1, 0]) == [ [7, 3], [5, 1], [0] ];
+
+    def testAllocateEnsemblesLargeAmountOscillators(self):
+        centers = [ 0.5, 2.0, 3.5, 5.0 ];
+        phases = [ centers[index % len(centers)] + 0.001 * (index % 7) for index in range(20000) ];
+        
+        output_sync_dynamic = sync_dynamic([ phases ], [ 10.0 ], None);
+        ensembles = output_sync_dynamic.allocate_sync_ensembles(0.1);
+        
+        assert len(ensembles) == len(centers);
+        for index in range(len(centers)):
+            assert ensembles[index] == list(range(index, len(phases), len(centers)));
+
 
     def testDynamicSimulationAllToAll(self):
         SyncTestTemplates.templateDynamicSimulationConnectionTypeTest(10, 1, conn_type.ALL_TO_ALL, False);
@@ -125,6 +150,17 @@ class SyncUnitTest(unittest.TestCase):
         SyncTestTemplates.templateDynamicSimulationConnectionTypeTest(9, 1, conn_type.GRID_FOUR, False);
         SyncTestTemplates.templateDynamicSimulationConnectionTypeTest(25, 1, conn_type.GRID_FOUR, False);
    
+    def testDynamicSimulationCsrRepresentation(self):
+        for connection_type in [conn_type.ALL_TO_ALL, conn_type.GRID_FOUR, conn_type.GRID_EIGHT, conn_type.LIST_BIDIR]:
+            network_matrix = sync_network(16, 1, type_conn = connection_type, representation = conn_represent.MATRIX, initial_phases = initial_type.EQUIPARTITION, ccore = False);
+            network_csr = sync_network(16, 1, type_conn = connection_type, representation = conn_represent.CSR, initial_phases = initial_type.EQUIPARTITION, ccore = False);
+            
+            dynamic_matrix = network_matrix.simulate_static(10, 1, collect_dynamic = False);
+            dynamic_csr = network_csr.simulate_static(10, 1, collect_dynamic = False);
+            
+            for index in range(16):
+                self.assertAlmostEqual(dynamic_matrix.output[-1][index], dynamic_csr.output[-1][index]);
+
     def testDynamicSimulationBidir(self):
         SyncTestTemplates.templateDynamicSimulationConnectionTypeTest(5, 1, conn_type.LIST_BIDIR, False);
         SyncTestTemplates.templateDynamicSimulationConnectionTypeTest(10, 1, conn_type.LIST_BIDIR, False);
@@ -196,6 +232,49 @@ class SyncUnitTest(unittest.TestCase):
         SyncTestTemplates.templateOutputDynamicCalculateLocalOrderParameter(False);
 
 
+    def templateOrderEvolution(self, type_conn, representation):
+        net = sync_network(9, type_conn = type_conn, representation = representation, ccore = False);
+        output_dynamic = net.simulate_static(20, 10, solution = solve_type.FAST, collect_dynamic = True);
+        
+        order = output_dynamic.calculate_order_parameter(0, len(output_dynamic));
+        local_order = output_dynamic.calculate_local_order_parameter(net, 0, len(output_dynamic));
+        
+        self.assertEqual(len(output_dynamic), len(order));
+        self.assertEqual(len(output_dynamic), len(local_order));
+        
+        for index in range(len(output_dynamic)):
+            phases = output_dynamic.output[index];
+            
+            exp_amount = sum([ math.expm1(phase) for phase in phases ]) / len(phases);
+            average_phase = math.expm1(sum(phases) / len(phases));
+            self.assertAlmostEqual(average_phase / exp_amount, order[index]);
+            
+            local_exp_amount, number_neighbors = 0.0, 0;
+            for i in range(len(net)):
+                for j in net.get_neighbors(i):
+                    local_exp_amount += math.exp(-abs(phases[j] - phases[i]));
+                    number_neighbors += 1;
+            
+            self.assertAlmostEqual(local_exp_amount / max(1, number_neighbors), local_order[index]);
+            self.assertAlmostEqual(local_order[index], order_estimator.calculate_local_sync_order(phases, net));
+
+
+    def testOrderEvolutionAllToAll(self):
+        self.templateOrderEvolution(conn_type.ALL_TO_ALL, conn_represent.MATRIX);
+
+
+    def testOrderEvolutionGridFourList(self):
+        self.templateOrderEvolution(conn_type.GRID_FOUR, conn_represent.LIST);
+
+
+    def testOrderEvolutionBidirCsr(self):
+        self.templateOrderEvolution(conn_type.LIST_BIDIR, conn_represent.CSR);
+
+
+    def testOrderEvolutionNoConnections(self):
+        self.templateOrderEvolution(conn_type.NONE, conn_represent.MATRIX);
+
+
     def testVisualizerOrderParameterNoFailures(self):
         net = sync_network(10, ccore = False);
         output_dynamic = net.simulate_static(20, 10, solution = solve_type.FAST, collect_dynamic = True);
@@ -32,6 +32,8 @@ matplotlib.use('Agg');
 
 from pyclustering.nnet.tests.syncsegm_templates import SyncsegmTestTemplates;
 
+from pyclustering.nnet.syncsegm import syncsegm, _extract_location_coordinates;
+
 from pyclustering.samples.definitions import IMAGE_SIMPLE_SAMPLES;
 
 
@@ -54,6 +56,23 @@ class SyncsegmUnitTest(unittest.TestCase):
     def testImageSegmentationSimple18OneColorDetection(self):
         SyncsegmTestTemplates.templateSyncsegmSegmentation(IMAGE_SIMPLE_SAMPLES.IMAGE_SIMPLE18, float('Inf'), 2, 0, 1, 1, False, False);
 
+    def testImageSegmentationSimple17ProcessPool(self):
+        SyncsegmTestTemplates.templateSyncsegmSegmentation(IMAGE_SIMPLE_SAMPLES.IMAGE_SIMPLE17, 225, 1, 0, 3, 3, False, False, 2);
+
+    def testImageSegmentationSimple18ProcessPool(self):
+        SyncsegmTestTemplates.templateSyncsegmSegmentation(IMAGE_SIMPLE_SAMPLES.IMAGE_SIMPLE18, 225, 1, 0, 2, 3, True, False, None);
+
+    def testSecondLayerWithoutDynamic(self):
+        algorithm = syncsegm(225, 1, 0, ccore = False);
+        analyser = algorithm.process(IMAGE_SIMPLE_SAMPLES.IMAGE_SIMPLE17, True, 0.9995, 0.9995, collect_object_dynamic = False);
+        
+        assert len(analyser.get_first_layer_analyser()) > 1;
+        for object_segment_analyser in analyser.get_second_layer_analysers():
+            assert len(object_segment_analyser['analyser']) == 1;
+
+    def testExtractLocationCoordinates(self):
+        assert _extract_location_coordinates([3, 2], [0, 2, 3, 5]) == [ [0, 0], [2, 0], [0, 1], [2, 1] ];
+
     def testVisualizeSimple17NoFailure(self):
         SyncsegmTestTemplates.templateSyncsegmSegmentation(IMAGE_SIMPLE_SAMPLES.IMAGE_SIMPLE17, 225, 1, 0, 3, 3, False, False);
 
@@ -25,22 +25,14 @@
 
 import time
 import numpy
-import warnings
 
 from numpy import array
 
-try:
-    from PIL import Image
-except Exception as error_instance:
-    warnings.warn("Impossible to import PIL (please, install 'PIL'), pyclustering's visualization "
-                  "functionality is partially not available (details: '%s')." % str(error_instance))
+from pyclustering.utils.lazy_import import lazy_module
 
-try:
-    import matplotlib.pyplot as plt
-    from mpl_toolkits.mplot3d import Axes3D
-except Exception as error_instance:
-    warnings.warn("Impossible to import matplotlib (please, install 'matplotlib'), pyclustering's visualization "
-                  "functionality is not available (details: '%s')." % str(error_instance))
+Image = lazy_module('PIL.Image')
+
+plt = lazy_module('matplotlib.pyplot', 'mpl_toolkits.mplot3d')
 
 from sys import platform as _platform
 
@@ -212,22 +204,13 @@ def average_neighbor_distance(points, num_neigh):
     if num_neigh > len(points) - 1:
         raise NameError('Impossible to calculate average distance to neighbors when number of object is less than number of neighbors.');
     
-    dist_matrix = [ [ 0.0 for i in range(len(points)) ] for j in range(len(points)) ];
-    for i in range(0, len(points), 1):
-        for j in range(i + 1, len(points), 1):
-            distance = euclidean_distance(points[i], points[j]);
-            dist_matrix[i][j] = distance;
-            dist_matrix[j][i] = distance;
-            
-        dist_matrix[i] = sorted(dist_matrix[i]);
+    from scipy.spatial import cKDTree;
 
-    total_distance = 0;
-    for i in range(0, len(points), 1):
-        # start from 0 - first element is distance to itself.
-        for j in range(0, num_neigh, 1):
-            total_distance += dist_matrix[i][j + 1];
-            
-    return ( total_distance / (num_neigh * len(points)) );
+    # the nearest neighbor of each point is the point itself - it is skipped.
+    tree = cKDTree(numpy.array(points, dtype = float));
+    distances, _ = tree.query(tree.data, k = list(range(2, num_neigh + 2)));
+    
+    return ( numpy.sum(distances) / (num_neigh * len(points)) );
 
 
 def median(data, indexes = None, **kwargs):
@@ -246,38 +229,32 @@ def median(data, indexes = None, **kwargs):
     
     """
     
-    index_median = None;
-    distance = float('Inf');
-
-    metric = kwargs.get('metric', type_metric.EUCLIDEAN_SQUARE);
+    metric = kwargs.get('metric', distance_metric(type_metric.EUCLIDEAN_SQUARE));
     data_type = kwargs.get('data_type', 'points');
 
+    if indexes is None:
+        range_points = list(range(len(data)));
+    else:
+        range_points = list(indexes);
+
     if data_type == 'points':
-        calculator = lambda index1, index2: metric(data[index1], data[index2]);
+        points = [data[index] for index in range_points];
+        calculator = lambda block: metric.pairwise(points[block], points);
     elif data_type == 'distance_matrix':
-        if isinstance(data, numpy.matrix):
-            calculator = lambda index1, index2: data.item(index1, index2);
-
-        else:
-            calculator = lambda index1, index2: data[index1][index2];
+        matrix = numpy.asarray(data);
+        calculator = lambda block: matrix[numpy.ix_(range_points[block], range_points)];
     else:
         raise TypeError("Unknown type of data is specified '%s'." % data_type);
 
-    if indexes is None:
-        range_points = range(len(data));
-    else:
-        range_points = indexes;
-    
-    for index_candidate in range_points:
-        distance_candidate = 0.0;
-        for index in range_points:
-            distance_candidate += calculator(index_candidate, index);
-        
-        if distance_candidate < distance:
-            distance = distance_candidate;
-            index_median = index_candidate;
-    
-    return index_median;
+    if len(range_points) == 0:
+        return None;
+
+    # Sum of distances is calculated by blocks of candidates to avoid full distance matrix between points.
+    block_size = max(1, 2 ** 20 // len(range_points));
+    distances = numpy.concatenate([ numpy.sum(calculator(slice(index, index + block_size)), axis=1)
+                                    for index in range(0, len(range_points), block_size) ]);
+
+    return range_points[int(numpy.argmin(distances))];
 
 
 def euclidean_distance(a, b):
@@ -662,85 +639,87 @@ def allocate_sync_ensembles(dynamic, tolerance = 0.1, threshold = 1.0, ignore =
             
     """
     
-    descriptors = [ [] for _ in range(len(dynamic[0])) ];
+    dynamic = numpy.asarray(dynamic);
+    number_oscillators = dynamic.shape[1];
     
-    # Check from the end for obtaining result
-    for index_dyn in range(0, len(dynamic[0]), 1):
-        if ((ignore is not None) and (index_dyn in ignore)):
-            continue;
-        
-        time_stop_simulation = len(dynamic) - 1;
-        active_state = False;
-        
-        if (dynamic[time_stop_simulation][index_dyn] > threshold):
-            active_state = True;
-            
-        # if active state is detected, it means we don't have whole oscillatory period for the considered oscillator, should be skipped.
-        if (active_state is True):
-            while ( (dynamic[time_stop_simulation][index_dyn] > threshold) and (time_stop_simulation > 0) ):
-                time_stop_simulation -= 1;
-            
-            # if there are no any oscillation than let's consider it like noise
-            if (time_stop_simulation == 0):
-                continue;
-            
-            # reset
-            active_state = False;
-        
-        desc = [0, 0, 0]; # end, start, average time of oscillation
-        for t in range(time_stop_simulation, 0, -1):
-            if ( (dynamic[t][index_dyn] > threshold) and (active_state is False) ):
-                desc[0] = t;
-                active_state = True;
-            elif ( (dynamic[t][index_dyn] < threshold) and (active_state is True) ):
-                desc[1] = t;
-                active_state = False;
-                
-                break;
-        
-        if (desc == [0, 0, 0]):
-            continue;
+    centers = numpy.full(number_oscillators, numpy.nan);
+    lengths = numpy.zeros(number_oscillators);
+    
+    # Descriptors of the last oscillation (end, start, average time) are calculated for block of oscillators at once.
+    block_size = max(1, 4194304 // max(1, len(dynamic)));
+    for start in range(0, number_oscillators, block_size):
+        (block_centers, block_lengths) = __calculate_oscillation_descriptors(dynamic[:, start:start + block_size], threshold);
         
-        desc[2] = desc[1] + (desc[0] - desc[1]) / 2.0;
-        descriptors[index_dyn] = desc;
+        centers[start:start + block_size] = block_centers;
+        lengths[start:start + block_size] = block_lengths;
     
+    if (ignore is not None):
+        centers[list(ignore)] = numpy.nan;
     
-    # Cluster allocation
+    # Cluster allocation: each ensemble is defined by the first oscillator and captures oscillators whose average
+    # time of the last oscillation is inside its window.
     sync_ensembles = [];
-    desc_sync_ensembles = [];
+    remaining = numpy.flatnonzero(~numpy.isnan(centers));
     
-    for index_desc in range(0, len(descriptors), 1):
-        if (descriptors[index_desc] == []):
-            continue;
+    while (len(remaining) > 0):
+        creator = remaining[0];
+        reducer = lengths[creator] * tolerance;
         
-        if (len(sync_ensembles) == 0):
-            desc_ensemble = descriptors[index_desc];
-            reducer = (desc_ensemble[0] - desc_ensemble[1]) * tolerance;
-            
-            desc_ensemble[0] = desc_ensemble[2] + reducer;
-            desc_ensemble[1] = desc_ensemble[2] - reducer;
-            
-            desc_sync_ensembles.append(desc_ensemble);
-            sync_ensembles.append([ index_desc ]);
-        else:
-            oscillator_captured = False;
-            for index_ensemble in range(0, len(sync_ensembles), 1):
-                if ( (desc_sync_ensembles[index_ensemble][0] > descriptors[index_desc][2]) and (desc_sync_ensembles[index_ensemble][1] < descriptors[index_desc][2])):
-                    sync_ensembles[index_ensemble].append(index_desc);
-                    oscillator_captured = True;
-                    break;
-                
-            if (oscillator_captured is False):
-                desc_ensemble = descriptors[index_desc];
-                reducer = (desc_ensemble[0] - desc_ensemble[1]) * tolerance;
-        
-                desc_ensemble[0] = desc_ensemble[2] + reducer;
-                desc_ensemble[1] = desc_ensemble[2] - reducer;
+        captured = (centers[remaining] < centers[creator] + reducer) & (centers[remaining] > centers[creator] - reducer);
+        captured[0] = True;
         
-                desc_sync_ensembles.append(desc_ensemble);
-                sync_ensembles.append([ index_desc ]);
+        sync_ensembles.append(remaining[captured].tolist());
+        remaining = remaining[~captured];
     
     return sync_ensembles;
+
+
+def __calculate_oscillation_descriptors(dynamic, threshold):
+    """!
+    @brief Calculates descriptors of the last whole oscillation of each oscillator.
+    @details Oscillation is a period when amplitude is greater than threshold, if oscillator is active at the end
+              of simulation then its current oscillation is not considered.
+    
+    @param[in] dynamic (numpy.array): Dynamic of oscillators (time x oscillators).
+    @param[in] threshold (double): Amlitude trigger when spike is taken into account.
+    
+    @return (tuple) Average times of the last oscillations ('nan' if there is no oscillation) and lengths of them.
+    
+    """
+    
+    if (len(dynamic) < 2):
+        return (numpy.full(dynamic.shape[1], numpy.nan), numpy.zeros(dynamic.shape[1]));
+    
+    time = numpy.arange(len(dynamic))[:, numpy.newaxis];
+    
+    # the first moment of simulation is never considered as a part of oscillation
+    active = (dynamic > threshold)[1:];
+    inactive = (dynamic < threshold)[1:];
+    
+    last_not_active = numpy.maximum.accumulate(numpy.where(active, 0, time[1:]), axis = 0);
+    last_active = numpy.maximum.accumulate(numpy.where(active, time[1:], 0), axis = 0);
+    last_inactive = numpy.maximum.accumulate(numpy.where(inactive, time[1:], 0), axis = 0);
+    
+    columns = numpy.arange(dynamic.shape[1]);
+    
+    # if active state is detected at the end, it means we don't have whole oscillatory period, should be skipped.
+    time_stop = numpy.full(dynamic.shape[1], len(dynamic) - 1);
+    active_end = dynamic[-1] > threshold;
+    time_stop[active_end] = last_not_active[-1, active_end];
+    
+    oscillation_end = numpy.zeros(dynamic.shape[1], dtype = int);
+    oscillation_start = numpy.zeros(dynamic.shape[1], dtype = int);
+    
+    valid = time_stop > 0;
+    oscillation_end[valid] = last_active[time_stop[valid] - 1, columns[valid]];
+    
+    valid &= oscillation_end > 1;
+    oscillation_start[valid] = last_inactive[oscillation_end[valid] - 2, columns[valid]];
+    
+    centers = oscillation_start + (oscillation_end - oscillation_start) / 2.0;
+    centers[oscillation_end == 0] = numpy.nan;
+    
+    return (centers, oscillation_end - oscillation_start);
     
     
 def draw_clusters(data, clusters, noise = [], marker_descr = '.', hide_axes = False, axes = None, display_result = True):
@@ -874,7 +853,7 @@ def draw_dynamics(t, dyn, x_title = None, y_title = None, x_lim = None, y_lim =
         stage_xlim = [0, t[len(t) - 1]];
     
     if ( (isinstance(separate, bool) is True) and (separate is True) ):
-        if (isinstance(dyn[0], list) is True):
+        if (numpy.ndim(dyn[0]) > 0):
             number_lines = len(dyn[0]);
         else:
             number_lines = 1;
@@ -891,7 +870,7 @@ def draw_dynamics(t, dyn, x_title = None, y_title = None, x_lim = None, y_lim =
         (fig, axes) = plt.subplots(number_lines, 1);
     
     # Check if we have more than one dynamic
-    if (isinstance(dyn[0], list) is True):
+    if (numpy.ndim(dyn[0]) > 0):
         num_items = len(dyn[0]);
         for index in range(0, num_items, 1):
             y = [item[index] for item in dyn];
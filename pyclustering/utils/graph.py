@@ -23,14 +23,11 @@
 
 """
 
-import warnings
 
-try:
-    import matplotlib.pyplot as plt
-    from matplotlib import colors
-except Exception as error_instance:
-    warnings.warn("Impossible to import matplotlib (please, install 'matplotlib'), pyclustering's visualization "
-                  "functionality is not available (details: '%s')." % str(error_instance))
+from pyclustering.utils.lazy_import import lazy_module
+
+plt = lazy_module('matplotlib.pyplot')
+colors = lazy_module('matplotlib.colors')
 
 from enum import IntEnum
 
@@ -135,11 +132,13 @@ class graph:
         return self.__type_graph;
     
     
-def read_graph(filename):
+def read_graph(filename, sparse = False):
     """!
     @brief Read graph from file in GRPR format.
     
     @param[in] filename (string): Path to file with graph in GRPR format.
+    @param[in] sparse (bool): If 'True' then graph that is described by edges is represented by vector representation
+                (lists of neighbors) instead of matrix, it is recommended for large sparse graphs.
     
     @return (graph) Graph that is read from file.
     
@@ -204,7 +203,11 @@ def read_graph(filename):
             raise NameError('Invalid format of file with graph description');
     
     # In case of edge representation result should be copied.
-    if (data_type == 'e'):
+    if ( (data_type == 'e') and (sparse is True) ):
+        for index in range(len(map_data_repr)):
+            data.append(sorted(set(index_neighbour - 1 for index_neighbour in map_data_repr[index + 1])));
+    
+    elif (data_type == 'e'):
         for index in range(len(map_data_repr)):
             data.append([0] * len(map_data_repr));
             
@@ -217,6 +220,7 @@ def read_graph(filename):
     graph_descr = None;
     if (data_type == 'm'): graph_descr = type_graph_descr.GRAPH_MATRIX_DESCR;
     elif (data_type == 'v'): graph_descr = type_graph_descr.GRAPH_VECTOR_DESCR;
+    elif (data_type == 'e' and sparse is True): graph_descr = type_graph_descr.GRAPH_VECTOR_DESCR;
     elif (data_type == 'e'): graph_descr = type_graph_descr.GRAPH_MATRIX_DESCR;
     else:
         raise NameError('Invalid format of file with graph description');
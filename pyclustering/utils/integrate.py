@@ -0,0 +1,113 @@
+"""!
+
+@brief Module provides solvers of ordinary differential equations that process the whole state of a system at once.
+
+@authors Andrei Novikov (pyclustering@yandex.ru)
+@date 2014-2019
+@copyright GNU Public License
+
+@cond GNU_PUBLIC_LICENSE
+    PyClustering is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PyClustering is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+@endcond
+
+"""
+
+
+import numpy
+
+
+def rk4(function, initial, time_start, time_end, steps):
+    """!
+    @brief Solves system of ordinary differential equations using classical fourth-order Runge-Kutta method with fixed step.
+    @details Right-hand side of the system is called for the whole state at once, therefore it should be vectorized,
+              for example, state of an oscillatory network can be represented by matrix where each column corresponds
+              to an oscillator.
+
+    @param[in] function (callable): Right-hand side of the system 'function(state, t)' that returns derivatives of the
+                state (array_like with the same shape as the state).
+    @param[in] initial (array_like): Initial state of the system.
+    @param[in] time_start (double): Time that corresponds to the initial state.
+    @param[in] time_end (double): Time at which the state of the system should be calculated.
+    @param[in] steps (uint): Amount of integration steps between 'time_start' and 'time_end'.
+
+    @return (numpy.array) State of the system at time 'time_end'.
+
+    """
+    state = numpy.array(initial, dtype=float)
+    step = (time_end - time_start) / steps
+
+    for index_step in range(steps):
+        t = time_start + index_step * step
+
+        k1 = numpy.asarray(function(state, t))
+        k2 = numpy.asarray(function(state + 0.5 * step * k1, t + 0.5 * step))
+        k3 = numpy.asarray(function(state + 0.5 * step * k2, t + 0.5 * step))
+        k4 = numpy.asarray(function(state + step * k3, t + step))
+
+        state = state + step / 6.0 * (k1 + 2.0 * k2 + 2.0 * k3 + k4)
+
+    return state
+
+
+def rkf45(function, initial, time_start, time_end, tolerance=0.00001, step=None):
+    """!
+    @brief Solves system of ordinary differential equations using Runge-Kutta-Fehlberg method with adaptive step.
+    @details Right-hand side of the system is called for the whole state at once, therefore it should be vectorized.
+              Step is adjusted in line with the maximum local error among all components of the state.
+
+    @param[in] function (callable): Right-hand side of the system 'function(state, t)' that returns derivatives of the
+                state (array_like with the same shape as the state).
+    @param[in] initial (array_like): Initial state of the system.
+    @param[in] time_start (double): Time that corresponds to the initial state.
+    @param[in] time_end (double): Time at which the state of the system should be calculated.
+    @param[in] tolerance (double): Maximum allowable local error of integration step.
+    @param[in] step (double): Initial integration step, if it is not specified then whole interval is used.
+
+    @return (numpy.array) State of the system at time 'time_end'.
+
+    """
+    state = numpy.array(initial, dtype=float)
+
+    t = time_start
+    interval = time_end - time_start
+    step = interval if step is None else min(step, interval)
+    minimum_step = interval * 1e-10
+
+    while time_end - t > minimum_step:
+        step = min(step, time_end - t)
+
+        k1 = numpy.asarray(function(state, t))
+        k2 = numpy.asarray(function(state + step * (k1 / 4.0), t + step / 4.0))
+        k3 = numpy.asarray(function(state + step * (3.0 / 32.0 * k1 + 9.0 / 32.0 * k2), t + 3.0 / 8.0 * step))
+        k4 = numpy.asarray(function(state + step * (1932.0 / 2197.0 * k1 - 7200.0 / 2197.0 * k2 + 7296.0 / 2197.0 * k3), t + 12.0 / 13.0 * step))
+        k5 = numpy.asarray(function(state + step * (439.0 / 216.0 * k1 - 8.0 * k2 + 3680.0 / 513.0 * k3 - 845.0 / 4104.0 * k4), t + step))
+        k6 = numpy.asarray(function(state + step * (-8.0 / 27.0 * k1 + 2.0 * k2 - 3544.0 / 2565.0 * k3 + 1859.0 / 4104.0 * k4 - 11.0 / 40.0 * k5), t + step / 2.0))
+
+        increment4 = 25.0 / 216.0 * k1 + 1408.0 / 2565.0 * k3 + 2197.0 / 4104.0 * k4 - 1.0 / 5.0 * k5
+        increment5 = 16.0 / 135.0 * k1 + 6656.0 / 12825.0 * k3 + 28561.0 / 56430.0 * k4 - 9.0 / 50.0 * k5 + 2.0 / 55.0 * k6
+
+        error = step * numpy.max(numpy.abs(increment5 - increment4)) if state.size > 0 else 0.0
+
+        if (error <= tolerance) or (step <= minimum_step):
+            t += step
+            state = state + step * increment4
+
+        if error == 0.0:
+            step *= 4.0
+        else:
+            step *= min(4.0, max(0.1, 0.84 * (tolerance / error) ** 0.25))
+
+        step = max(step, minimum_step)
+
+    return state
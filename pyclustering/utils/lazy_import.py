@@ -0,0 +1,107 @@
+"""!
+
+@brief Lazy import of optional dependencies that are heavy to load (for example, matplotlib or PIL).
+
+@authors Andrei Novikov (pyclustering@yandex.ru)
+@date 2014-2019
+@copyright GNU Public License
+
+@cond GNU_PUBLIC_LICENSE
+    PyClustering is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    
+    PyClustering is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+    
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+@endcond
+
+"""
+
+
+import importlib
+
+
+class lazy_module:
+    """!
+    @brief Proxy of a module that is imported on the first access to its attributes.
+    @details Visualizers of pyclustering use matplotlib and PIL that take significant time to import, therefore they are
+              imported only when they are really used, for example:
+    @code
+        plt = lazy_module('matplotlib.pyplot')
+
+        def show():
+            plt.show()    # 'matplotlib.pyplot' is imported here
+    @endcode
+
+    """
+
+    def __init__(self, name, *dependencies):
+        """!
+        @brief Creates proxy of the module that is not imported until it is used.
+
+        @param[in] name (string): Full name of the module, for example, 'matplotlib.pyplot'.
+        @param[in] *dependencies (string): Modules that should be imported together with the module, for example,
+                    'mpl_toolkits.mplot3d' that registers 3D projection for 'matplotlib.pyplot'.
+
+        """
+        self.__name = name
+        self.__dependencies = dependencies
+        self.__module = None
+
+
+    def __getattr__(self, attribute):
+        """!
+        @brief Returns attribute of the module, the module is imported if it has not been imported yet.
+
+        @param[in] attribute (string): Name of the attribute.
+
+        @return (object) Attribute of the module.
+
+        """
+        if self.__module is None:
+            self.__module = self.__import()
+
+        return getattr(self.__module, attribute)
+
+
+    def __repr__(self):
+        """!
+        @brief Returns representation of the proxy.
+
+        """
+        state = "imported" if self.__module is not None else "not imported"
+        return "<lazy module '%s' (%s)>" % (self.__name, state)
+
+
+    def is_imported(self):
+        """!
+        @brief Returns True if the module has been already imported.
+
+        """
+        return self.__module is not None
+
+
+    def __import(self):
+        """!
+        @brief Imports the module and its dependencies.
+
+        @return (module) Imported module.
+
+        """
+        try:
+            module = importlib.import_module(self.__name)
+            for dependency in self.__dependencies:
+                importlib.import_module(dependency)
+
+        except ImportError as error_instance:
+            package = self.__name.split('.')[0]
+            raise ImportError("Impossible to import '%s' (please, install '%s'), corresponding pyclustering's "
+                              "functionality is not available (details: '%s')." % (self.__name, package, str(error_instance)))
+
+        return module
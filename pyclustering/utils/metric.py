@@ -56,6 +56,12 @@ class type_metric(IntEnum):
     ## Chi square distance, for more information see function 'chi_square_distance'.
     CHI_SQUARE = 6
 
+    ## Weighted Minkowski distance, for more information see function 'weighted_minkowski_distance'.
+    WEIGHTED_MINKOWSKI = 7
+
+    ## Mahalanobis distance, for more information see function 'mahalanobis_distance'.
+    MAHALANOBIS = 8
+
     ## User defined function for distance calculation between two points.
     USER_DEFINED = 1000
 
@@ -87,6 +93,17 @@ class distance_metric:
         distance = metric([4.0, 9.2, 1.0], [3.4, 2.5, 6.2])
     @endcode
 
+    Weighted Minkowski and Mahalanobis distances are parameterized by weights of dimensions and by inverse covariance
+     matrix correspondingly. They are calculated natively by the C++ pyclustering library, therefore they should be
+     preferred to user-defined function if the required distance can be expressed by them:
+    @code
+        weighted_metric = distance_metric(type_metric.WEIGHTED_MINKOWSKI, degree=2, weights=[1.0, 0.5])
+        distance = weighted_metric([4.0, 9.2], [3.4, 2.5])
+
+        mahalanobis_metric = distance_metric(type_metric.MAHALANOBIS, matrix=[[2.0, 1.0], [1.0, 2.0]])
+        distance = mahalanobis_metric([4.0, 9.2], [3.4, 2.5])
+    @endcode
+
     User may define its own function for distance calculation:
     @code
         user_function = lambda point1, point2: point1[0] + point2[0] + 2
@@ -94,27 +111,66 @@ class distance_metric:
         distance = metric([2.0, 3.0], [1.0, 3.0])
     @endcode
 
+    User-defined metric is called for each pair of points by default, that is slow for big data. Vectorized versions
+     of the function can be provided in addition to make its performance comparable with built-in metrics:
+    @code
+        user_function = lambda point1, point2: numpy.sum(numpy.abs(point1 - point2))
+
+        # distances between set of points (array N x D) and one point (array D)
+        user_function_numpy = lambda points, point: numpy.sum(numpy.abs(points - point), axis=1)
+
+        # distances between two sets of points (arrays N x D and M x D), result is N x M matrix
+        user_function_pairwise = lambda points1, points2: \
+            numpy.sum(numpy.abs(points1[:, numpy.newaxis, :] - points2[numpy.newaxis, :, :]), axis=2)
+
+        metric = distance_metric(type_metric.USER_DEFINED, func=user_function, func_numpy=user_function_numpy,
+                                 func_pairwise=user_function_pairwise)
+
+        # matrix 3 x 2 of distances between each point of the first set and each point of the second set
+        distances = metric.pairwise([[0.0, 0.0], [1.0, 1.0], [2.0, 3.0]], [[1.0, 2.0], [4.0, 1.0]])
+    @endcode
+
+    Method 'pairwise' is available for all types of metrics and calculates distances by blocks of points, therefore
+     amount of required memory is bounded even for big sets of points.
+
     """
     def __init__(self, metric_type, **kwargs):
         """!
         @brief Creates distance metric instance for calculation distance between two points.
 
         @param[in] metric_type (type_metric):
-        @param[in] **kwargs: Arbitrary keyword arguments (available arguments: 'numpy_usage' 'func' and corresponding additional argument for
-                    for specific metric types).
+        @param[in] **kwargs: Arbitrary keyword arguments (available arguments: 'numpy_usage' 'func', 'func_numpy',
+                    'func_pairwise' and corresponding additional argument for for specific metric types).
 
         <b>Keyword Args:</b><br>
             - func (callable): Callable object with two arguments (point #1 and point #2) or (object #1 and object #2) in case of numpy usage.
                                 This argument is used only if metric is 'type_metric.USER_DEFINED'.
-            - degree (numeric): Only for 'type_metric.MINKOWSKI' - degree of Minkowski equation.
+            - func_numpy (callable): Vectorized version of 'func' with two arguments (array of points N x D and point)
+                                that returns array of N distances. It is used instead of 'func' in case of numpy usage
+                                and by 'pairwise'. This argument is used only if metric is 'type_metric.USER_DEFINED'.
+            - func_pairwise (callable): Vectorized version of 'func' with two arguments (array of points N x D and array
+                                of points M x D) that returns N x M matrix of distances. It is used by 'pairwise'.
+                                This argument is used only if metric is 'type_metric.USER_DEFINED'.
+            - degree (numeric): Only for 'type_metric.MINKOWSKI' and 'type_metric.WEIGHTED_MINKOWSKI' - degree of
+                                 Minkowski equation.
+            - weights (array_like): Only for 'type_metric.WEIGHTED_MINKOWSKI' - weight of each dimension.
+            - matrix (array_like): Only for 'type_metric.MAHALANOBIS' - inverse covariance matrix (dimension x dimension).
             - numpy_usage (bool): If True then numpy is used for calculation (by default is False).
 
         """
         self.__type = metric_type
         self.__args = kwargs
         self.__func = self.__args.get('func', None)
+        self.__func_numpy = self.__args.get('func_numpy', None)
+        self.__func_pairwise = self.__args.get('func_pairwise', None)
         self.__numpy = self.__args.get('numpy_usage', False)
 
+        if (self.__type == type_metric.WEIGHTED_MINKOWSKI) and (self.__args.get('weights', None) is None):
+            raise ValueError("Weights of dimensions ('weights') should be specified for weighted Minkowski distance.")
+
+        if (self.__type == type_metric.MAHALANOBIS) and (self.__args.get('matrix', None) is None):
+            raise ValueError("Inverse covariance matrix ('matrix') should be specified for Mahalanobis distance.")
+
         self.__calculator = self.__create_distance_calculator()
 
 
@@ -131,6 +187,50 @@ class distance_metric:
         return self.__calculator(point1, point2)
 
 
+    def pairwise(self, points1, points2=None, out=None, block_size=None):
+        """!
+        @brief Calculates distances between each point of the first set and each point of the second set.
+        @details Distances are calculated by blocks of points from the first set to bound amount of memory that is
+                  used for intermediate results. Built-in metrics are calculated using numpy. User-defined metric uses
+                  the fastest of provided functions: 'func_pairwise', 'func_numpy' or 'func'.
+
+        @param[in] points1 (array_like): The first set of points.
+        @param[in] points2 (array_like): The second set of points, if it is not specified then the first set is used.
+        @param[in] out (numpy.ndarray): Output array (len(points1) x len(points2)) for distances, if it is not
+                    specified then new array is allocated.
+        @param[in] block_size (uint): Amount of points from the first set that are processed at once, by default it is
+                    chosen to keep intermediate arrays about 2^20 elements.
+
+        @return (numpy.ndarray) Matrix of distances where element [i, j] is a distance between point 'i' from the first
+                 set and point 'j' from the second set.
+
+        """
+        if (self.__type != type_metric.USER_DEFINED) or (self.__func_pairwise is not None) or (self.__func_numpy is not None):
+            points1 = numpy.asarray(points1)
+            points2 = points1 if points2 is None else numpy.asarray(points2)
+        elif points2 is None:
+            points2 = points1
+
+        if out is None:
+            out = numpy.empty((len(points1), len(points2)))
+        elif out.shape != (len(points1), len(points2)):
+            raise ValueError("Output array shape '%s' should be equal to '(%d, %d)'." %
+                             (str(out.shape), len(points1), len(points2)))
+
+        if (len(points1) == 0) or (len(points2) == 0):
+            return out
+
+        if block_size is None:
+            dimension = len(points2[0]) if hasattr(points2[0], '__len__') else 1
+            block_size = max(1, 2 ** 20 // (len(points2) * max(1, dimension)))
+
+        for index_begin in range(0, len(points1), block_size):
+            index_end = min(index_begin + block_size, len(points1))
+            out[index_begin:index_end] = self.__calculate_pairwise_block(points1[index_begin:index_end], points2)
+
+        return out
+
+
     def get_type(self):
         """!
         @brief Return type of distance metric that is used.
@@ -164,11 +264,12 @@ class distance_metric:
     def enable_numpy_usage(self):
         """!
         @brief Start numpy for distance calculation.
-        @details Useful in case matrices to increase performance. No effect in case of type_metric.USER_DEFINED type.
+        @details Useful in case matrices to increase performance. No effect in case of type_metric.USER_DEFINED type
+                  if vectorized function 'func_numpy' is not specified.
 
         """
         self.__numpy = True
-        if self.__type != type_metric.USER_DEFINED:
+        if (self.__type != type_metric.USER_DEFINED) or (self.__func_numpy is not None):
             self.__calculator = self.__create_distance_calculator()
 
 
@@ -224,6 +325,14 @@ class distance_metric:
         elif self.__type == type_metric.CHI_SQUARE:
             return chi_square_distance
 
+        elif self.__type == type_metric.WEIGHTED_MINKOWSKI:
+            weights, degree = self.__args['weights'], self.__args.get('degree', 2)
+            return lambda point1, point2: weighted_minkowski_distance(point1, point2, weights, degree)
+
+        elif self.__type == type_metric.MAHALANOBIS:
+            matrix = self.__args['matrix']
+            return lambda point1, point2: mahalanobis_distance(point1, point2, matrix)
+
         elif self.__type == type_metric.USER_DEFINED:
             return self.__func
 
@@ -259,13 +368,79 @@ class distance_metric:
         elif self.__type == type_metric.CHI_SQUARE:
             return chi_square_distance_numpy
 
+        elif self.__type == type_metric.WEIGHTED_MINKOWSKI:
+            weights, degree = numpy.array(self.__args['weights'], dtype=float), self.__args.get('degree', 2)
+            return lambda object1, object2: weighted_minkowski_distance_numpy(object1, object2, weights, degree)
+
+        elif self.__type == type_metric.MAHALANOBIS:
+            matrix = numpy.array(self.__args['matrix'], dtype=float)
+            return lambda object1, object2: mahalanobis_distance_numpy(object1, object2, matrix)
+
         elif self.__type == type_metric.USER_DEFINED:
+            if self.__func_numpy is not None:
+                return self.__func_numpy
+
             return self.__func
 
         else:
             raise ValueError("Unknown type of metric: '%d'", self.__type)
 
 
+    def __calculate_pairwise_block(self, points1, points2):
+        """!
+        @brief Calculates distances between each point of the first set and each point of the second set at once.
+
+        @param[in] points1 (array_like): The first set of points (block of points).
+        @param[in] points2 (array_like): The second set of points.
+
+        @return (numpy.ndarray) Matrix of distances between points of the sets.
+
+        """
+        if self.__type == type_metric.USER_DEFINED:
+            if self.__func_pairwise is not None:
+                return self.__func_pairwise(points1, points2)
+
+            elif self.__func_numpy is not None:
+                return numpy.array([self.__func_numpy(points1, point) for point in points2]).T
+
+            return [[self.__func(point1, point2) for point2 in points2] for point1 in points1]
+
+        elif self.__type in (type_metric.WEIGHTED_MINKOWSKI, type_metric.MAHALANOBIS):
+            calculator = self.__create_distance_calculator_numpy()
+            return calculator(points1[:, numpy.newaxis, :], points2[numpy.newaxis, :, :])
+
+        difference = points1[:, numpy.newaxis, :] - points2[numpy.newaxis, :, :]
+
+        if self.__type == type_metric.EUCLIDEAN:
+            return numpy.sqrt(numpy.sum(numpy.square(difference), axis=2))
+
+        elif self.__type == type_metric.EUCLIDEAN_SQUARE:
+            return numpy.sum(numpy.square(difference), axis=2)
+
+        elif self.__type == type_metric.MANHATTAN:
+            return numpy.sum(numpy.absolute(difference), axis=2)
+
+        elif self.__type == type_metric.CHEBYSHEV:
+            return numpy.max(numpy.absolute(difference), axis=2)
+
+        elif self.__type == type_metric.MINKOWSKI:
+            degree = self.__args.get('degree', 2)
+            return numpy.power(numpy.sum(numpy.power(difference, degree), axis=2), 1.0 / degree)
+
+        elif self.__type in (type_metric.CANBERRA, type_metric.CHI_SQUARE):
+            divider = numpy.abs(points1)[:, numpy.newaxis, :] + numpy.abs(points2)[numpy.newaxis, :, :]
+            if self.__type == type_metric.CANBERRA:
+                difference = numpy.abs(difference)
+            else:
+                difference = numpy.power(difference, 2)
+
+            with numpy.errstate(divide='ignore', invalid='ignore'):
+                return numpy.sum(numpy.nan_to_num(numpy.divide(difference, divider)), axis=2)
+
+        else:
+            raise ValueError("Unknown type of metric: '%d'", self.__type)
+
+
 
 def euclidean_distance(point1, point2):
     """!
@@ -300,7 +475,7 @@ def euclidean_distance_numpy(object1, object2):
     @return (double) Euclidean distance between two objects.
 
     """
-    return numpy.sum(numpy.sqrt(numpy.square(object1 - object2)), axis=1).T
+    return numpy.sqrt(numpy.sum(numpy.square(object1 - object2), axis=1)).T
 
 
 def euclidean_distance_square(point1, point2):
@@ -450,7 +625,87 @@ def minkowski_distance_numpy(object1, object2, degree=2):
     @return (double) Minkowski distance between two object.
 
     """
-    return numpy.sum(numpy.power(numpy.power(object1 - object2, degree), 1/degree), axis=1).T
+    return numpy.power(numpy.sum(numpy.power(object1 - object2, degree), axis=1), 1/degree).T
+
+
+def weighted_minkowski_distance(point1, point2, weights, degree=2):
+    """!
+    @brief Calculate weighted Minkowski distance between two vectors.
+
+    \f[
+    dist(a, b) = \sqrt[p]{ \sum_{i=0}^{N}w_{i}\left | a_{i} - b_{i} \right |^{p} };
+    \f]
+
+    @param[in] point1 (array_like): The first vector.
+    @param[in] point2 (array_like): The second vector.
+    @param[in] weights (array_like): Weight of each dimension.
+    @param[in] degree (numeric): Degree of that is used for Minkowski distance.
+
+    @return (double) Weighted Minkowski distance between two vectors.
+
+    @see minkowski_distance
+
+    """
+    distance = 0.0
+    for i in range(len(point1)):
+        distance += weights[i] * abs(point1[i] - point2[i]) ** degree
+
+    return distance ** (1.0 / degree)
+
+
+def weighted_minkowski_distance_numpy(object1, object2, weights, degree=2):
+    """!
+    @brief Calculate weighted Minkowski distance between objects using numpy.
+
+    @param[in] object1 (array_like): The first array_like object.
+    @param[in] object2 (array_like): The second array_like object.
+    @param[in] weights (array_like): Weight of each dimension.
+    @param[in] degree (numeric): Degree of that is used for Minkowski distance.
+
+    @return (double) Weighted Minkowski distance between two objects.
+
+    """
+    return numpy.power(numpy.sum(weights * numpy.power(numpy.absolute(object1 - object2), degree), axis=-1), 1.0 / degree)
+
+
+def mahalanobis_distance(point1, point2, matrix):
+    """!
+    @brief Calculate Mahalanobis distance between two vectors.
+
+    \f[
+    dist(a, b) = \sqrt{ (a - b)^{T} S^{-1} (a - b) };
+    \f]
+
+    @param[in] point1 (array_like): The first vector.
+    @param[in] point2 (array_like): The second vector.
+    @param[in] matrix (array_like): Inverse covariance matrix (dimension x dimension).
+
+    @return (double) Mahalanobis distance between two vectors.
+
+    """
+    difference = [point1[i] - point2[i] for i in range(len(point1))]
+
+    distance = 0.0
+    for i in range(len(difference)):
+        for j in range(len(difference)):
+            distance += difference[i] * matrix[i][j] * difference[j]
+
+    return max(distance, 0.0) ** 0.5
+
+
+def mahalanobis_distance_numpy(object1, object2, matrix):
+    """!
+    @brief Calculate Mahalanobis distance between objects using numpy.
+
+    @param[in] object1 (array_like): The first array_like object.
+    @param[in] object2 (array_like): The second array_like object.
+    @param[in] matrix (array_like): Inverse covariance matrix (dimension x dimension).
+
+    @return (double) Mahalanobis distance between two objects.
+
+    """
+    difference = object1 - object2
+    return numpy.sqrt(numpy.maximum(numpy.sum(numpy.dot(difference, matrix) * difference, axis=-1), 0.0))
 
 
 def canberra_distance(point1, point2):
@@ -0,0 +1,215 @@
+"""!
+
+@brief Loaders of data samples to numpy arrays: text parser, binary memory-mapped format and chunk iterator.
+
+@authors Andrei Novikov (pyclustering@yandex.ru)
+@date 2014-2019
+@copyright GNU Public License
+
+@cond GNU_PUBLIC_LICENSE
+    PyClustering is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PyClustering is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+@endcond
+
+"""
+
+
+import itertools
+import numpy
+
+
+## Default amount of points in a chunk that is read from a file at once.
+DEFAULT_CHUNK_SIZE = 65536
+
+
+def read_sample_array(filename, dtype = numpy.float64):
+    """!
+    @brief Returns data sample from simple text file as two-dimensional array.
+    @details The file has the same format as for function 'pyclustering.utils.read_sample()': each non-empty line
+              contains coordinates of one point that are separated by whitespaces. Text is parsed directly to an array
+              without creation of Python lists, therefore it is much faster and requires less memory.
+
+    @param[in] filename (string): Path to file with data.
+    @param[in] dtype (numpy.dtype): Type of coordinates, for example, 'numpy.float32' halves required memory.
+
+    @return (numpy.ndarray) Points where each row represents a point.
+
+    @see read_sample_binary()
+    @see iterate_sample()
+
+    """
+
+    chunks = list(iterate_sample(filename, DEFAULT_CHUNK_SIZE, dtype))
+    if len(chunks) == 0:
+        return numpy.empty((0, 0), dtype=dtype)
+
+    return numpy.concatenate(chunks)
+
+
+def write_sample_binary(filename, data, dtype = None):
+    """!
+    @brief Writes data sample to binary file that can be memory-mapped.
+    @details The file has '.npy' format: small header that describes type and shape of the data and coordinates of
+              points in row-major order.
+
+    @param[in] filename (string): Path to output file, extension is not added to the path.
+    @param[in] data (array_like): Points where each point is represented by list of coordinates.
+    @param[in] dtype (numpy.dtype): Type of coordinates in the file, by default type of the data is used.
+
+    @see read_sample_binary()
+    @see convert_sample_binary()
+
+    """
+
+    data = numpy.asarray(data, dtype=dtype)
+    if data.ndim != 2:
+        raise ValueError("Incorrect data shape '%s'. Data should be represented by two-dimensional array." % str(data.shape))
+
+    with open(filename, 'wb') as file:
+        numpy.lib.format.write_array(file, data)
+
+
+def convert_sample_binary(source, destination, dtype = numpy.float64, chunk_size = DEFAULT_CHUNK_SIZE):
+    """!
+    @brief Converts data sample from text file to binary file that can be memory-mapped.
+    @details The text file is processed by chunks, therefore data sample that does not fit into memory can be converted.
+
+    Example of conversion of a sample and clustering of the converted sample without loading it to memory:
+    @code
+        convert_sample_binary(FCPS_SAMPLES.SAMPLE_TARGET, "target.npy")
+
+        sample = read_sample_binary("target.npy")
+        kmeans_instance = kmeans(sample, initial_centers, ccore=False)
+        kmeans_instance.process()
+    @endcode
+
+    @param[in] source (string): Path to text file with data.
+    @param[in] destination (string): Path to output binary file.
+    @param[in] dtype (numpy.dtype): Type of coordinates in the output file.
+    @param[in] chunk_size (uint): Amount of points that are processed at once.
+
+    @see read_sample_binary()
+
+    """
+
+    amount_points, dimension = 0, 0
+    for chunk in iterate_sample(source, chunk_size, dtype):
+        amount_points += len(chunk)
+        dimension = chunk.shape[1]
+
+    output = numpy.lib.format.open_memmap(destination, mode='w+', dtype=dtype, shape=(amount_points, dimension))
+
+    position = 0
+    for chunk in iterate_sample(source, chunk_size, dtype):
+        output[position:position + len(chunk)] = chunk
+        position += len(chunk)
+
+    output.flush()
+    del output
+
+
+def read_sample_binary(filename, memory_map = True):
+    """!
+    @brief Returns data sample from binary file that has been created by 'write_sample_binary()' or
+            'convert_sample_binary()'.
+
+    @param[in] filename (string): Path to binary file with data.
+    @param[in] memory_map (bool): If True then data is not loaded to memory, read-only memory-mapped array is returned.
+
+    @return (numpy.ndarray) Points where each row represents a point.
+
+    """
+
+    return numpy.load(filename, mmap_mode='r' if memory_map else None, allow_pickle=False)
+
+
+def load_sample(filename, dtype = numpy.float64, memory_map = True):
+    """!
+    @brief Returns data sample from text or binary file, format of the file is recognized by its content.
+
+    @param[in] filename (string): Path to file with data.
+    @param[in] dtype (numpy.dtype): Type of coordinates that is used for text file.
+    @param[in] memory_map (bool): If True then binary file is memory-mapped instead of loading to memory.
+
+    @return (numpy.ndarray) Points where each row represents a point.
+
+    """
+
+    if is_sample_binary(filename):
+        return read_sample_binary(filename, memory_map)
+
+    return read_sample_array(filename, dtype)
+
+
+def is_sample_binary(filename):
+    """!
+    @brief Checks whether file contains data sample in binary format.
+
+    @param[in] filename (string): Path to file.
+
+    @return (bool) True if the file has binary format.
+
+    """
+
+    with open(filename, 'rb') as file:
+        return file.read(len(numpy.lib.format.MAGIC_PREFIX)) == numpy.lib.format.MAGIC_PREFIX
+
+
+def iterate_sample(filename, chunk_size = DEFAULT_CHUNK_SIZE, dtype = numpy.float64):
+    """!
+    @brief Returns iterator over chunks of points of data sample from text or binary file.
+    @details Only one chunk is kept in memory, therefore streaming algorithms can process data sample of any size.
+
+    @param[in] filename (string): Path to file with data.
+    @param[in] chunk_size (uint): Maximum amount of points in a chunk.
+    @param[in] dtype (numpy.dtype): Type of coordinates in chunks.
+
+    @return (iterator) Chunks where each chunk is two-dimensional array whose rows represent points.
+
+    """
+
+    if chunk_size <= 0:
+        raise ValueError("Incorrect chunk size '%d'. Chunk size should be greater than 0." % chunk_size)
+
+    if is_sample_binary(filename):
+        return __iterate_binary_sample(filename, chunk_size, dtype)
+
+    return __iterate_text_sample(filename, chunk_size, dtype)
+
+
+def __iterate_binary_sample(filename, chunk_size, dtype):
+    """!
+    @brief Returns iterator over chunks of points of memory-mapped binary file.
+
+    """
+
+    sample = read_sample_binary(filename)
+    for position in range(0, len(sample), chunk_size):
+        yield numpy.array(sample[position:position + chunk_size], dtype=dtype)
+
+
+def __iterate_text_sample(filename, chunk_size, dtype):
+    """!
+    @brief Returns iterator over chunks of points of text file, empty lines are ignored.
+
+    """
+
+    with open(filename, 'r') as file:
+        while True:
+            lines = list(itertools.islice(file, chunk_size))
+            if len(lines) == 0:
+                return
+
+            lines = [ line for line in lines if not line.isspace() ]
+            if len(lines) > 0:
+                yield numpy.loadtxt(lines, dtype=dtype, ndmin=2)
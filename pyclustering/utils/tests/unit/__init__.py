@@ -32,7 +32,10 @@ matplotlib.use('Agg');
 from pyclustering.tests.suite_holder import suite_holder;
 
 from pyclustering.utils.tests.unit                   import ut_dimension    as dimension_unit_tests;
+from pyclustering.utils.tests.unit                   import ut_integrate    as integrate_unit_tests;
+from pyclustering.utils.tests.unit                   import ut_lazy_import  as lazy_import_unit_tests;
 from pyclustering.utils.tests.unit                   import ut_metric       as metric_unit_tests;
+from pyclustering.utils.tests.unit                   import ut_sample_loader as sample_loader_unit_tests;
 from pyclustering.utils.tests.unit                   import ut_utils        as utils_general_unit_tests;
 
 
@@ -45,7 +48,10 @@ class utils_unit_tests(suite_holder):
     @staticmethod
     def fill_suite(utils_suite):
         utils_suite.addTests(unittest.TestLoader().loadTestsFromModule(dimension_unit_tests));
+        utils_suite.addTests(unittest.TestLoader().loadTestsFromModule(integrate_unit_tests));
+        utils_suite.addTests(unittest.TestLoader().loadTestsFromModule(lazy_import_unit_tests));
         utils_suite.addTests(unittest.TestLoader().loadTestsFromModule(metric_unit_tests));
+        utils_suite.addTests(unittest.TestLoader().loadTestsFromModule(sample_loader_unit_tests));
         utils_suite.addTests(unittest.TestLoader().loadTestsFromModule(utils_general_unit_tests));
 
 
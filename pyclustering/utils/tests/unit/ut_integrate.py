@@ -0,0 +1,74 @@
+"""!
+
+Unit-tests for solvers of differential equations.
+
+@authors Andrei Novikov (pyclustering@yandex.ru)
+@date 2014-2019
+@copyright GNU Public License
+
+pyclustering is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+pyclustering is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+
+import unittest
+
+import numpy
+
+from pyclustering.tests.assertion import assertion
+
+from pyclustering.utils.integrate import rk4, rkf45
+
+
+class IntegrateUnitTest(unittest.TestCase):
+    def templateExponentialDecay(self, solver, **kwargs):
+        rates = numpy.array([0.5, 1.0, 2.0])
+        initial = numpy.array([1.0, 2.0, 3.0])
+
+        result = solver(lambda state, t: -rates * state, initial, 0.0, 2.0, **kwargs)
+        expected = initial * numpy.exp(-rates * 2.0)
+
+        assertion.eq(initial.shape, result.shape)
+        assertion.true(numpy.allclose(expected, result, atol=0.0001))
+
+    def testRk4ExponentialDecay(self):
+        self.templateExponentialDecay(rk4, steps=100)
+
+    def testRkf45ExponentialDecay(self):
+        self.templateExponentialDecay(rkf45, tolerance=0.000001)
+
+
+    def templateHarmonicOscillator(self, solver, **kwargs):
+        # state is a matrix, the first row - positions, the second - velocities of independent oscillators.
+        initial = numpy.array([[1.0, 0.0, 2.0], [0.0, 1.0, 0.0]])
+        result = solver(lambda state, t: numpy.array([state[1], -state[0]]), initial, 0.0, numpy.pi, **kwargs)
+
+        assertion.true(numpy.allclose(-initial, result, atol=0.0001))
+
+    def testRk4HarmonicOscillator(self):
+        self.templateHarmonicOscillator(rk4, steps=200)
+
+    def testRkf45HarmonicOscillator(self):
+        self.templateHarmonicOscillator(rkf45, tolerance=0.0000001)
+
+
+    def templateTimeDependentFunction(self, solver, **kwargs):
+        result = solver(lambda state, t: numpy.full(state.shape, 2.0 * t), [0.0], 1.0, 3.0, **kwargs)
+        assertion.true(numpy.allclose([8.0], result))
+
+    def testRk4TimeDependentFunction(self):
+        self.templateTimeDependentFunction(rk4, steps=10)
+
+    def testRkf45TimeDependentFunction(self):
+        self.templateTimeDependentFunction(rkf45)
@@ -0,0 +1,97 @@
+"""!
+
+@brief Unit-tests for lazy import of optional dependencies and import time of pyclustering modules.
+
+@authors Andrei Novikov (pyclustering@yandex.ru)
+@date 2014-2019
+@copyright GNU Public License
+
+@cond GNU_PUBLIC_LICENSE
+    PyClustering is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    
+    PyClustering is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+    
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+@endcond
+
+"""
+
+
+import os
+import subprocess
+import sys
+import unittest
+
+from pyclustering.utils.lazy_import import lazy_module
+
+
+class LazyImportUnitTest(unittest.TestCase):
+    def testModuleIsImportedOnAccess(self):
+        module = lazy_module('json')
+        self.assertFalse(module.is_imported())
+
+        self.assertEqual('[1, 2]', module.dumps([1, 2]))
+        self.assertTrue(module.is_imported())
+
+    def testModuleDependencies(self):
+        module = lazy_module('json', 'json.decoder')
+        self.assertIsNotNone(module.loads)
+        self.assertIn('json.decoder', sys.modules)
+
+    def testNonExistentModule(self):
+        module = lazy_module('pyclustering_nonexistent_module')
+        self.assertRaises(ImportError, getattr, module, 'attribute')
+
+
+    def templateImportInCleanInterpreter(self, module_name):
+        script = "import sys\n" \
+                 "import %s\n" \
+                 "heavy = [name for name in ('matplotlib', 'PIL', 'scipy') if name in sys.modules]\n" \
+                 "print(','.join(heavy))\n" % module_name
+
+        environment = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        output = subprocess.check_output([sys.executable, '-W', 'ignore', '-c', script], env=environment).decode('utf-8').split()
+        heavy_modules = output[0].split(',') if len(output) > 0 else []
+
+        self.assertEqual([], heavy_modules)
+
+    def testHeavyModulesAreNotImportedCluster(self):
+        self.templateImportInCleanInterpreter('pyclustering.cluster')
+
+    def testHeavyModulesAreNotImportedKmeans(self):
+        self.templateImportInCleanInterpreter('pyclustering.cluster.kmeans')
+
+    def testHeavyModulesAreNotImportedOptics(self):
+        self.templateImportInCleanInterpreter('pyclustering.cluster.optics')
+
+    def testHeavyModulesAreNotImportedBsas(self):
+        self.templateImportInCleanInterpreter('pyclustering.cluster.bsas')
+
+    def testHeavyModulesAreNotImportedClique(self):
+        self.templateImportInCleanInterpreter('pyclustering.cluster.clique')
+
+    def testHeavyModulesAreNotImportedEma(self):
+        self.templateImportInCleanInterpreter('pyclustering.cluster.ema')
+
+    def testHeavyModulesAreNotImportedGa(self):
+        self.templateImportInCleanInterpreter('pyclustering.cluster.ga')
+
+    def testHeavyModulesAreNotImportedSync(self):
+        self.templateImportInCleanInterpreter('pyclustering.nnet.sync')
+
+    def testHeavyModulesAreNotImportedSom(self):
+        self.templateImportInCleanInterpreter('pyclustering.nnet.som')
+
+    def testHeavyModulesAreNotImportedUtils(self):
+        self.templateImportInCleanInterpreter('pyclustering.utils')
+
+
+if __name__ == "__main__":
+    unittest.main()
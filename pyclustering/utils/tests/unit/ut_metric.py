@@ -56,6 +56,10 @@ class MetricUnitTest(unittest.TestCase):
         assertion.eq(2.0, metric.euclidean_distance([3.0, 3.0], [5.0, 3.0]))
         assertion.eq(2.0, metric.euclidean_distance([-3.0, -3.0], [-5.0, -3.0]))
 
+    def testEuclideanDistanceNumpy(self):
+        points = numpy.array([[0.0, 0.0], [3.0, 4.0], [-3.0, -4.0]])
+        numpy.testing.assert_array_almost_equal([5.0, 0.0, 10.0], metric.euclidean_distance_numpy(points, numpy.array([3.0, 4.0])))
+
 
     def testEuclideanDistanceSquare(self):
         assertion.eq(0.0, metric.euclidean_distance_square([0], [0]))
@@ -117,5 +121,97 @@ class MetricUnitTest(unittest.TestCase):
         assertion.eq(0.4, metric.chi_square_distance_numpy(numpy.array([-2.0, -2.0]), numpy.array([-3.0, -3.0])))
 
 
+    def testWeightedMinkowskiDistance(self):
+        assertion.eq(5.0, metric.weighted_minkowski_distance([0.0, 0.0], [3.0, 2.0], [1.0, 4.0]))
+        assertion.eq(5.0, metric.weighted_minkowski_distance([0.0, 0.0], [-3.0, -2.0], [1.0, 4.0]))
+        assertion.eq(5.0, metric.weighted_minkowski_distance([1.0, 1.0], [-1.0, 3.0], [0.5, 2.0], 1))
+
+        points = numpy.array([[0.0, 0.0], [-3.0, 1.0]])
+        numpy.testing.assert_array_almost_equal([5.0, 2.0], metric.weighted_minkowski_distance_numpy(points, numpy.array([-3.0, 2.0]), numpy.array([1.0, 4.0]), 2))
+
+        weighted_metric = metric.distance_metric(metric.type_metric.WEIGHTED_MINKOWSKI, weights=[1.0, 4.0])
+        assertion.eq(5.0, weighted_metric([0.0, 0.0], [3.0, 2.0]))
+
+        self.assertRaises(ValueError, metric.distance_metric, metric.type_metric.WEIGHTED_MINKOWSKI)
+
+    def testMahalanobisDistance(self):
+        assertion.eq(5.0, metric.mahalanobis_distance([0.0, 0.0], [3.0, 4.0], [[1.0, 0.0], [0.0, 1.0]]))
+        self.assertAlmostEqual(6.0 ** 0.5, metric.mahalanobis_distance([0.0, 0.0], [1.0, 1.0], [[2.0, 1.0], [1.0, 2.0]]))
+        self.assertAlmostEqual(2.0 ** 0.5, metric.mahalanobis_distance([0.0, 0.0], [1.0, -1.0], [[2.0, 1.0], [1.0, 2.0]]))
+
+        points = numpy.array([[1.0, 1.0], [-1.0, 1.0]])
+        numpy.testing.assert_array_almost_equal([6.0 ** 0.5, 2.0 ** 0.5], metric.mahalanobis_distance_numpy(points, numpy.array([0.0, 0.0]), numpy.array([[2.0, 1.0], [1.0, 2.0]])))
+
+        mahalanobis_metric = metric.distance_metric(metric.type_metric.MAHALANOBIS, matrix=[[2.0, 1.0], [1.0, 2.0]])
+        self.assertAlmostEqual(6.0 ** 0.5, mahalanobis_metric([0.0, 0.0], [1.0, 1.0]))
+
+        mahalanobis_metric.enable_numpy_usage()
+        numpy.testing.assert_array_almost_equal([6.0 ** 0.5, 2.0 ** 0.5], mahalanobis_metric(points, numpy.array([0.0, 0.0])))
+
+        self.assertRaises(ValueError, metric.distance_metric, metric.type_metric.MAHALANOBIS)
+
+    def templatePairwise(self, distance_metric, points1, points2, block_size=None):
+        expected = [[distance_metric(point1, point2) for point2 in points2] for point1 in points1]
+        actual = distance_metric.pairwise(points1, points2, block_size=block_size)
+
+        assertion.eq((len(points1), len(points2)), actual.shape)
+        numpy.testing.assert_array_almost_equal(expected, actual)
+
+    def testPairwiseBuiltInMetrics(self):
+        points1 = [[0.0, 0.0], [1.0, -2.0], [0.5, 3.0], [-1.5, 2.5], [4.0, 1.0]]
+        points2 = [[0.0, 0.0], [2.0, 1.0], [-3.0, 0.5]]
+
+        for metric_type in [metric.type_metric.EUCLIDEAN, metric.type_metric.EUCLIDEAN_SQUARE, metric.type_metric.MANHATTAN,
+                            metric.type_metric.CHEBYSHEV, metric.type_metric.CANBERRA, metric.type_metric.CHI_SQUARE]:
+            self.templatePairwise(metric.distance_metric(metric_type), points1, points2)
+            self.templatePairwise(metric.distance_metric(metric_type), points1, points2, block_size=2)
+
+        self.templatePairwise(metric.distance_metric(metric.type_metric.MINKOWSKI, degree=4), points1, points2, block_size=1)
+        self.templatePairwise(metric.distance_metric(metric.type_metric.WEIGHTED_MINKOWSKI, degree=3, weights=[0.5, 2.0]), points1, points2, block_size=2)
+        self.templatePairwise(metric.distance_metric(metric.type_metric.MAHALANOBIS, matrix=[[2.0, 0.5], [0.5, 1.0]]), points1, points2, block_size=2)
+
+    def testPairwiseUserDefined(self):
+        points1 = numpy.array([[0.0, 0.0], [1.0, -2.0], [0.5, 3.0], [-1.5, 2.5]])
+        points2 = numpy.array([[2.0, 1.0], [-3.0, 0.5]])
+
+        user_function = lambda point1, point2: numpy.sum(numpy.abs(point1 - point2)) + point1[0]
+        user_function_numpy = lambda points, point: numpy.sum(numpy.abs(points - point), axis=1) + points[:, 0]
+        user_function_pairwise = lambda points1, points2: \
+            numpy.sum(numpy.abs(points1[:, numpy.newaxis, :] - points2[numpy.newaxis, :, :]), axis=2) + points1[:, 0:1]
+
+        for arguments in [{}, {'func_numpy': user_function_numpy}, {'func_pairwise': user_function_pairwise}]:
+            user_metric = metric.distance_metric(metric.type_metric.USER_DEFINED, func=user_function, **arguments)
+            self.templatePairwise(user_metric, points1, points2)
+            self.templatePairwise(user_metric, points1, points2, block_size=3)
+
+    def testPairwiseSameSet(self):
+        points = [[0.0, 1.0], [2.0, 3.0], [4.0, 4.0]]
+        distances = metric.distance_metric(metric.type_metric.EUCLIDEAN_SQUARE).pairwise(points)
+
+        numpy.testing.assert_array_almost_equal([[0.0, 8.0, 25.0], [8.0, 0.0, 5.0], [25.0, 5.0, 0.0]], distances)
+
+    def testPairwiseOutput(self):
+        output = numpy.zeros((2, 3))
+        result = metric.distance_metric(metric.type_metric.MANHATTAN).pairwise([[0.0], [1.0]], [[1.0], [2.0], [3.0]], out=output)
+
+        assertion.true(result is output)
+        numpy.testing.assert_array_almost_equal([[1.0, 2.0, 3.0], [0.0, 1.0, 2.0]], output)
+
+        self.assertRaises(ValueError, metric.distance_metric(metric.type_metric.MANHATTAN).pairwise, [[0.0]], [[1.0]], out=output)
+
+    def testPairwiseEmpty(self):
+        distances = metric.distance_metric(metric.type_metric.EUCLIDEAN).pairwise([], [[1.0, 2.0]])
+        assertion.eq((0, 1), distances.shape)
+
+    def testUserDefinedNumpyUsage(self):
+        user_metric = metric.distance_metric(metric.type_metric.USER_DEFINED, func=lambda p1, p2: abs(p1[0] - p2[0]),
+                                             func_numpy=lambda points, point: numpy.abs(points[:, 0] - point[0]))
+
+        assertion.eq(2.0, user_metric([1.0], [3.0]))
+
+        user_metric.enable_numpy_usage()
+        numpy.testing.assert_array_almost_equal([2.0, 0.0], user_metric(numpy.array([[1.0], [3.0]]), numpy.array([3.0])))
+
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,174 @@
+"""!
+
+@brief Unit-tests for loaders of data samples.
+
+@authors Andrei Novikov (pyclustering@yandex.ru)
+@date 2014-2019
+@copyright GNU Public License
+
+@cond GNU_PUBLIC_LICENSE
+    PyClustering is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PyClustering is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+@endcond
+
+"""
+
+
+import os
+import numpy
+import tempfile
+import unittest
+
+from pyclustering.samples.definitions import SIMPLE_SAMPLES, FCPS_SAMPLES
+
+from pyclustering.cluster.kmeans import kmeans
+
+from pyclustering.utils import read_sample
+from pyclustering.utils.sample_loader import read_sample_array, write_sample_binary, convert_sample_binary, \
+    read_sample_binary, load_sample, is_sample_binary, iterate_sample
+
+
+class SampleLoaderUnitTest(unittest.TestCase):
+    def setUp(self):
+        (descriptor, self.filename) = tempfile.mkstemp()
+        os.close(descriptor)
+
+
+    def tearDown(self):
+        os.remove(self.filename)
+
+
+    def templateReadSampleArray(self, path, dtype):
+        sample = read_sample_array(path, dtype)
+        expected = numpy.array(read_sample(path), dtype=dtype)
+
+        self.assertIsInstance(sample, numpy.ndarray)
+        self.assertEqual(dtype, sample.dtype)
+        self.assertTrue(numpy.array_equal(expected, sample))
+
+
+    def testReadSampleArraySimple1(self):
+        self.templateReadSampleArray(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, numpy.float64)
+
+    def testReadSampleArrayOneDimension(self):
+        self.templateReadSampleArray(SIMPLE_SAMPLES.SAMPLE_SIMPLE7, numpy.float64)
+
+    def testReadSampleArrayHepta(self):
+        self.templateReadSampleArray(FCPS_SAMPLES.SAMPLE_HEPTA, numpy.float64)
+
+    def testReadSampleArraySinglePrecision(self):
+        self.templateReadSampleArray(FCPS_SAMPLES.SAMPLE_TARGET, numpy.float32)
+
+
+    def testReadSampleArrayEmptyLines(self):
+        with open(self.filename, 'w') as file:
+            file.write("\n1.0 2.0\n   \n3.0\t4.0\n\n5.0 6.0")
+
+        self.assertEqual([[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]], read_sample_array(self.filename).tolist())
+
+
+    def testReadSampleArrayEmptyFile(self):
+        self.assertEqual((0, 0), read_sample_array(self.filename).shape)
+
+
+    def testReadSampleArrayIncorrectFormat(self):
+        with open(self.filename, 'w') as file:
+            file.write("1.0 2.0\n3.0\n")
+
+        self.assertRaises(ValueError, read_sample_array, self.filename)
+
+
+    def testWriteReadSampleBinary(self):
+        sample = read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE3)
+        write_sample_binary(self.filename, sample, numpy.float32)
+
+        self.assertTrue(is_sample_binary(self.filename))
+
+        loaded_sample = read_sample_binary(self.filename)
+        self.assertIsInstance(loaded_sample, numpy.memmap)
+        self.assertFalse(loaded_sample.flags.writeable)
+        self.assertEqual(numpy.float32, loaded_sample.dtype)
+        self.assertTrue(numpy.array_equal(numpy.array(sample, dtype=numpy.float32), loaded_sample))
+        del loaded_sample
+
+        loaded_sample = read_sample_binary(self.filename, memory_map=False)
+        self.assertNotIsInstance(loaded_sample, numpy.memmap)
+        self.assertEqual((60, 2), loaded_sample.shape)
+
+
+    def testWriteSampleBinaryIncorrectShape(self):
+        self.assertRaises(ValueError, write_sample_binary, self.filename, [1.0, 2.0, 3.0])
+
+
+    def testConvertSampleBinary(self):
+        convert_sample_binary(FCPS_SAMPLES.SAMPLE_LSUN, self.filename, chunk_size=50)
+
+        sample = read_sample_binary(self.filename)
+        self.assertTrue(numpy.array_equal(numpy.array(read_sample(FCPS_SAMPLES.SAMPLE_LSUN)), sample))
+        del sample
+
+
+    def testLoadSample(self):
+        self.assertFalse(is_sample_binary(SIMPLE_SAMPLES.SAMPLE_SIMPLE2))
+        self.assertNotIsInstance(load_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE2), numpy.memmap)
+
+        convert_sample_binary(SIMPLE_SAMPLES.SAMPLE_SIMPLE2, self.filename)
+
+        sample = load_sample(self.filename)
+        self.assertIsInstance(sample, numpy.memmap)
+        self.assertTrue(numpy.array_equal(load_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE2), sample))
+        del sample
+
+
+    def templateIterateSample(self, path, chunk_size, expected_sizes):
+        chunks = list(iterate_sample(path, chunk_size, numpy.float32))
+
+        self.assertEqual(expected_sizes, [ len(chunk) for chunk in chunks ])
+        for chunk in chunks:
+            self.assertEqual(numpy.float32, chunk.dtype)
+            self.assertEqual(2, chunk.ndim)
+
+        expected = numpy.array(read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE3), dtype=numpy.float32)
+        self.assertTrue(numpy.array_equal(expected, numpy.concatenate(chunks)))
+
+
+    def testIterateTextSample(self):
+        self.templateIterateSample(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 25, [25, 25, 10])
+
+    def testIterateBinarySample(self):
+        convert_sample_binary(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, self.filename)
+        self.templateIterateSample(self.filename, 25, [25, 25, 10])
+
+    def testIterateSampleOneChunk(self):
+        self.templateIterateSample(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 1000, [60])
+
+
+    def testIterateSampleIncorrectChunkSize(self):
+        self.assertRaises(ValueError, iterate_sample, SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 0)
+
+
+    def testClusteringMemoryMappedSample(self):
+        convert_sample_binary(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, self.filename)
+        sample = read_sample_binary(self.filename)
+
+        initial_centers = [[0.2, 0.1], [4.0, 1.0], [2.0, 2.0], [2.3, 3.9]]
+        kmeans_instance = kmeans(sample, initial_centers, ccore=False).process()
+
+        expected_instance = kmeans(read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE3), initial_centers, ccore=False).process()
+        self.assertEqual(sorted(expected_instance.get_clusters()), sorted(kmeans_instance.get_clusters()))
+
+        del kmeans_instance, sample
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -212,5 +212,26 @@ class Test(unittest.TestCase):
         matrix = utils.calculate_distance_matrix(data);
         assert matrix == [ [0.0, 2.0, 4.0], [2.0, 0.0, 2.0], [4.0, 2.0, 0.0] ];
 
+    def testAllocateSyncEnsembles(self):
+        dynamic = [ [0.0, 0.0, 0.0, 1.0],
+                    [0.0, 0.0, 0.0, 1.0],
+                    [1.0, 1.0, 0.0, 1.0],
+                    [1.0, 1.0, 0.0, 1.0],
+                    [0.0, 0.0, 0.0, 1.0],
+                    [0.0, 0.0, 1.0, 1.0],
+                    [0.0, 0.0, 1.0, 1.0],
+                    [0.0, 0.0, 0.0, 1.0] ];
+        
+        assert utils.allocate_sync_ensembles(dynamic, 0.1, 0.5) == [ [0, 1], [2] ];
+        assert utils.allocate_sync_ensembles(dynamic, 0.1, 0.5, { 1 }) == [ [0], [2] ];
+        assert utils.allocate_sync_ensembles(dynamic, 0.1, 2.0) == [ ];
+        assert utils.allocate_sync_ensembles(dynamic[:1], 0.1, 0.5) == [ ];
+
+    def testAllocateSyncEnsemblesLargeAmountOscillators(self):
+        dynamic = [ [ 1.0 if (time + index % 3) % 6 < 3 else 0.0 for index in range(3000) ] for time in range(20) ];
+        ensembles = utils.allocate_sync_ensembles(dynamic, 0.1, 0.5);
+        
+        assert ensembles == [ list(range(shift, 3000, 3)) for shift in range(3) ];
+
 if __name__ == "__main__":
     unittest.main();
\ No newline at end of file